@@ -36,27 +36,42 @@ from nipcbatt.pcbatt_analysis.common.common_types import (
     WaveformTone,
 )
 from nipcbatt.pcbatt_analysis.waveform_analysis.amplitude_and_levels_analysis import (
+    AmplitudeAndLevelsMultipleWaveformsProcessingResult,
+    AmplitudeAndLevelsProcessingBackend,
     AmplitudeAndLevelsProcessingMethod,
     AmplitudeAndLevelsProcessingResult,
+    AmplitudeAndLevelsWaveformsHistograms,
     LabViewAmplitudeAndLevels,
 )
+from nipcbatt.pcbatt_analysis.waveform_analysis.cross_correlation_analysis import (
+    CrossCorrelationMultipleWaveformsProcessingResult,
+    WaveformsCrossCorrelation,
+)
 from nipcbatt.pcbatt_analysis.waveform_analysis.dc_rms_analysis import (
+    DcRmsMultipleWaveformsProcessingResult,
+    DcRmsProcessingBackend,
     DcRmsProcessingResult,
     DcRmsProcessingWindow,
+    DcRmsStreamingAccumulator,
     LabViewBasicDcRms,
 )
 from nipcbatt.pcbatt_analysis.waveform_analysis.frequency_domain_analysis import (
+    FrequencyDomainProcessingBackend,
+    FrequencyResponseMultipleWaveformsProcessingResult,
     LabViewFftSpectrumAmplitudePhase,
     LabViewFftSpectrumWindow,
     LabViewFrequencyDomainProcessing,
     LabViewMultipleTonesMeasurement,
     LabViewTonesSortingMode,
+    MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult,
     MultipleTonesAmplitudePhaseSpectrumProcessingResult,
     MultipleTonesProcessingResult,
 )
 from nipcbatt.pcbatt_analysis.waveform_analysis.pulse_analog_analysis import (
     LabViewPulseAnalogMeasurements,
     PulseAnalogMeasurementPercentLevelsSettings,
+    PulseAnalogMultipleWaveformsProcessingResult,
+    PulseAnalogProcessingBackend,
     PulseAnalogProcessingExportMode,
     PulseAnalogProcessingPolarity,
     PulseAnalogProcessingReferenceLevels,
@@ -88,6 +103,7 @@ from nipcbatt.pcbatt_library.common.common_data_types import (
     MeasurementData,
     MeasurementExecutionType,
     MeasurementOptions,
+    RawMeasurementData,
     SampleClockTimingParameters,
     SampleTimingEngine,
     StartTriggerType,
@@ -31,23 +31,23 @@ def get_labview_analysis_traces_folder_path_impl() -> str:
     """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
     # Create native code DLL call
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_GetTracesFolderPath.restype = c_int
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_GetTracesFolderPath.argtypes = [
-            # char* path output
-            c_char_p,
-            # size_t path length
-            c_size_t,
-        ]
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_GetTracesFolderPath",
+            restype=c_int,
+            argtypes=[
+                # char* path output
+                c_char_p,
+                # size_t path length
+                c_size_t,
+            ],
+        )
 
         string_buffer_length = 1024
         string_buffer = create_string_buffer(string_buffer_length)
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_GetTracesFolderPath(
-            string_buffer, c_size_t(string_buffer_length)
-        )
+        res_status = native_function(string_buffer, c_size_t(string_buffer_length))
 
         if res_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -74,11 +74,12 @@ def call_interop_api_labview_analysis_enable_traces(traces_status: bool) -> None
         'NI_PCBATT_InteropApi_LabVIEW_Analysis_EnableTraces' fails for some reason.
     """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_EnableTraces.restype = c_int
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_EnableTraces.argtypes = [c_int]
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_EnableTraces",
+            restype=c_int,
+            argtypes=[c_int],
+        )
 
         # call native code
         traces_status_in = c_int()
@@ -88,9 +89,7 @@ def call_interop_api_labview_analysis_enable_traces(traces_status: bool) -> None
         else:
             traces_status_in = c_int(0)
 
-        return_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_EnableTraces(
-            traces_status_in
-        )
+        return_status = native_function(traces_status_in)
 
         if return_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -114,20 +113,17 @@ def call_interop_api_labview_analysis_are_traces_enabled() -> bool:
         'NI_PCBATT_InteropApi_LabVIEW_Analysis_AreTracesEnabled' fails for some reason.
     """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_AreTracesEnabled.restype = c_int
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_AreTracesEnabled.argtypes = [
-            POINTER(c_int)
-        ]
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_AreTracesEnabled",
+            restype=c_int,
+            argtypes=[POINTER(c_int)],
+        )
 
         # call native code
         traces_status_out = c_int()
 
-        return_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_AreTracesEnabled(
-            byref(traces_status_out)
-        )
+        return_status = native_function(byref(traces_status_out))
 
         if return_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -153,14 +149,15 @@ def call_interop_api_labview_analysis_lv_runtime_available():
     """  # noqa: D202, D205, D415, W505 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (283 > 100 characters) (auto-generated noqa)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_IsLvRuntimeAvailable.restype = c_int
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_IsLvRuntimeAvailable.argtypes = []
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_IsLvRuntimeAvailable",
+            restype=c_int,
+            argtypes=[],
+        )
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_IsLvRuntimeAvailable()
+        res_status = native_function()
 
         return res_status == 0
     except Exception as e:
@@ -182,16 +179,17 @@ def call_interop_api_labview_analysis_get_library_version():
         tuple[Any, int, int, int, int]: status code and library version numbers.
     """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_GetLibraryVersion.restype = c_int
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_GetLibraryVersion.argtypes = [
-            POINTER(c_int),
-            POINTER(c_int),
-            POINTER(c_int),
-            POINTER(c_int),
-        ]
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_GetLibraryVersion",
+            restype=c_int,
+            argtypes=[
+                POINTER(c_int),
+                POINTER(c_int),
+                POINTER(c_int),
+                POINTER(c_int),
+            ],
+        )
 
         # call native code
         major_number_out = c_int()
@@ -199,7 +197,7 @@ def call_interop_api_labview_analysis_get_library_version():
         patch_number_out = c_int()
         build_number_out = c_int()
 
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_GetLibraryVersion(
+        res_status = native_function(
             byref(major_number_out),
             byref(minor_number_out),
             byref(patch_number_out),
@@ -1,10 +1,14 @@
 """Provides a set of function helpers for native interop usage."""
 
+import itertools
 import os
 import platform
+import threading
 from ctypes import CDLL
 from pathlib import Path
+from typing import Any, Callable, Sequence
 
+import numpy
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis._pcbatt_analysis_internal import _analysis_library_interop
@@ -14,8 +18,23 @@ from nipcbatt.pcbatt_analysis.analysis_library_exceptions import (
 from nipcbatt.pcbatt_analysis.analysis_library_messages import (
     AnalysisLibraryExceptionMessage,
 )
+from nipcbatt.pcbatt_analysis.common.base_types import AnalysisLibraryElement
 from nipcbatt.pcbatt_utilities import platform_utilities
 
+# Interop api library entries and bound functions are shared by all analysis calls,
+# they are created once and protected by the lock when first created.
+_interop_api_lock = threading.Lock()
+_interop_api_library_entries: CDLL = None
+_interop_api_bound_functions: dict[str, "_InteropApiBoundFunction"] = {}
+_interop_api_binds_count = 0
+
+# Output buffers of native functions are owned by the calling thread, so that concurrent
+# calls never share them, and are reused by the following calls of the same thread.
+_interop_api_output_buffers = threading.local()
+
+# Maximum number of output buffers kept by each thread, least recently used ones are released.
+INTEROP_API_OUTPUT_BUFFERS_MAX_COUNT = 32
+
 
 def get_native_libraries_folder_name_for_windows() -> str:
     """Gets the name of folder containing native libraries when running
@@ -40,15 +59,214 @@ def get_native_libraries_folder_name_for_windows() -> str:
     )
 
 
+class InteropApiFunctionsBindingStatistics(AnalysisLibraryElement):
+    """Defines statistics about binding and calls of interop api native functions."""
+
+    def __init__(self, binds_count: int, calls_count: int, bound_functions_count: int) -> None:
+        """Initialize an instance of `InteropApiFunctionsBindingStatistics`.
+
+        Args:
+            binds_count (int): number of times a native function signature was bound.
+            calls_count (int): number of times a bound native function was called.
+            bound_functions_count (int): number of native functions currently bound.
+        """
+        self._binds_count = binds_count
+        self._calls_count = calls_count
+        self._bound_functions_count = bound_functions_count
+
+    @property
+    def binds_count(self) -> int:
+        """Gets the number of times a native function signature was bound.
+
+        Returns:
+            int: binds count.
+        """
+        return self._binds_count
+
+    @property
+    def calls_count(self) -> int:
+        """Gets the number of times a bound native function was called.
+
+        Returns:
+            int: calls count.
+        """
+        return self._calls_count
+
+    @property
+    def bound_functions_count(self) -> int:
+        """Gets the number of native functions currently bound.
+
+        Returns:
+            int: bound functions count.
+        """
+        return self._bound_functions_count
+
+
+class _InteropApiBoundFunction:
+    """Holds a native function of interop api whose signature is bound,
+    and counts the calls performed through it."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    __slots__ = ("_native_function", "_calls_counter", "_calls_counter_reads_count")
+
+    def __init__(self, native_function: Callable) -> None:
+        self._native_function = native_function
+        self.reset_calls_count()
+
+    def __call__(self, *args: Any) -> Any:
+        # next() of itertools.count is atomic, so that concurrent analysis workers
+        # count their calls without taking a lock
+        next(self._calls_counter)
+        return self._native_function(*args)
+
+    @property
+    def calls_count(self) -> int:
+        # reading the counter advances it, values taken by previous reads are not calls
+        with _interop_api_lock:
+            counter_value = next(self._calls_counter)
+            calls_count = counter_value - self._calls_counter_reads_count
+            self._calls_counter_reads_count += 1
+        return calls_count
+
+    def reset_calls_count(self) -> None:
+        self._calls_counter = itertools.count()
+        self._calls_counter_reads_count = 0
+
+
 def load_interop_api_library_entries() -> CDLL:
     """Loads content of 'NI.PCBATT.InteropApi.dll' into a CDLL object
        that can be used to perform dynamic function invokation.
+       The library is loaded once, next calls return the same CDLL object.
 
     Raises:
         PCBATTAnalysisLoadNativeLibraryFailedException:
         occurs when loading interop api entries fails for some reason.
     """  # noqa: D202, D205, D415, W505 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (283 > 100 characters) (auto-generated noqa)
 
+    global _interop_api_library_entries
+
+    if _interop_api_library_entries is not None:
+        return _interop_api_library_entries
+
+    with _interop_api_lock:
+        if _interop_api_library_entries is None:
+            _interop_api_library_entries = _load_interop_api_library_entries_from_files()
+
+    return _interop_api_library_entries
+
+
+def get_interop_api_function(function_name: str, restype: Any, argtypes: Sequence[Any]) -> Callable:
+    """Gets a ready to call native function of 'NI.PCBATT.InteropApi.dll'.
+       The function is resolved and its signature is bound only the first time it is requested.
+
+    Args:
+        function_name (str): name of the native function, for example
+        'NI_PCBATT_InteropApi_LabVIEW_Analysis_GetLibraryVersion'.
+        restype (Any): ctypes type returned by the native function.
+        argtypes (Sequence[Any]): ctypes types of the native function arguments.
+
+    Raises:
+        PCBATTAnalysisLoadNativeLibraryFailedException:
+        occurs when loading interop api entries fails for some reason.
+
+    Returns:
+        Callable: native function with its signature bound.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
+    global _interop_api_binds_count
+
+    bound_function = _interop_api_bound_functions.get(function_name)
+    if bound_function is not None:
+        return bound_function
+
+    dll_entries = load_interop_api_library_entries()
+
+    with _interop_api_lock:
+        bound_function = _interop_api_bound_functions.get(function_name)
+        if bound_function is None:
+            native_function = getattr(dll_entries, function_name)
+            native_function.restype = restype
+            native_function.argtypes = list(argtypes)
+            bound_function = _InteropApiBoundFunction(native_function)
+            _interop_api_bound_functions[function_name] = bound_function
+            _interop_api_binds_count += 1
+
+    return bound_function
+
+
+def get_interop_api_functions_binding_statistics() -> InteropApiFunctionsBindingStatistics:
+    """Gets statistics about binding and calls of interop api native functions.
+
+    Returns:
+        InteropApiFunctionsBindingStatistics: binds count, calls count and bound functions count.
+    """
+    bound_functions = list(_interop_api_bound_functions.values())
+    return InteropApiFunctionsBindingStatistics(
+        binds_count=_interop_api_binds_count,
+        calls_count=sum(bound_function.calls_count for bound_function in bound_functions),
+        bound_functions_count=len(bound_functions),
+    )
+
+
+def reset_interop_api_functions_binding_statistics() -> None:
+    """Resets binds count and calls count of interop api native functions,
+    bound functions are kept."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    global _interop_api_binds_count
+
+    with _interop_api_lock:
+        _interop_api_binds_count = 0
+        for bound_function in _interop_api_bound_functions.values():
+            bound_function.reset_calls_count()
+
+
+def get_interop_api_output_buffer(
+    function_name: str, buffer_name: str, length: int
+) -> numpy.ndarray[numpy.float64]:
+    """Gets a float64 buffer receiving an output array of a native function, the buffer
+    of the calling thread for this function, output and length is reused by each call.
+
+    The returned buffer must be held in a variable for the whole native call, its content
+    is overwritten by the next call of the thread, so values kept after the call are copied.
+
+    Args:
+        function_name (str): name of the native function writing the buffer.
+        buffer_name (str): name of the output argument of the native function.
+        length (int): number of float64 values of the buffer.
+
+    Returns:
+        numpy.ndarray[numpy.float64]: contiguous buffer of `length` values, initial content
+        is undefined, as for `numpy.empty`.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    thread_output_buffers: dict[tuple[str, str, int], numpy.ndarray] = getattr(
+        _interop_api_output_buffers, "buffers", None
+    )
+    if thread_output_buffers is None:
+        thread_output_buffers = {}
+        _interop_api_output_buffers.buffers = thread_output_buffers
+
+    buffer_key = (function_name, buffer_name, length)
+    output_buffer = thread_output_buffers.pop(buffer_key, None)
+    if output_buffer is None:
+        output_buffer = numpy.empty(length, dtype=numpy.float64)
+        if len(thread_output_buffers) >= INTEROP_API_OUTPUT_BUFFERS_MAX_COUNT:
+            # buffers are kept in use order, the first one is the least recently used
+            del thread_output_buffers[next(iter(thread_output_buffers))]
+
+    thread_output_buffers[buffer_key] = output_buffer
+    return output_buffer
+
+
+def release_interop_api_output_buffers() -> None:
+    """Releases output buffers of native functions kept by the calling thread."""
+    _interop_api_output_buffers.buffers = {}
+
+
+def _load_interop_api_library_entries_from_files() -> CDLL:
+    """Checks native libraries files and loads content of 'NI.PCBATT.InteropApi.dll'.
+
+    Raises:
+        PCBATTAnalysisLoadNativeLibraryFailedException:
+        occurs when loading interop api entries fails for some reason.
+    """  # noqa: D202 - No blank lines allowed after function docstring (auto-generated noqa)
+
     native_libraries_folder_name = get_native_libraries_folder_name_for_windows()
 
     # entry point DLL
@@ -16,6 +16,14 @@ class AnalysisLibraryExceptionMessage:
 
     DC_RMS_PROCESSING_FAILED_FOR_SOME_REASON = "DC-RMS processing failed for some reason!"
 
+    DC_RMS_STREAMING_ACCUMULATOR_HAS_NO_SAMPLES = (
+        "DC-RMS streaming accumulator has not accumulated any sample!"
+    )
+
+    DC_RMS_STREAMING_ACCUMULATOR_CHANNELS_COUNT_MISMATCH = (
+        "Number of waveforms of the chunk is not the number of channels of the accumulator!"
+    )
+
     AMPLITUDE_AND_LEVELS_PROCESSING_FAILED_FOR_SOME_REASON = (
         "Amplitude and levels processing failed for some reason!"
     )
@@ -32,10 +40,20 @@ class AnalysisLibraryExceptionMessage:
         "Multiple tones processing failed for some reason!"
     )
 
+    CROSS_CORRELATION_PROCESSING_FAILED_FOR_SOME_REASON = (
+        "Cross-correlation processing failed for some reason!"
+    )
+
+    ALIGNED_WAVEFORMS_DO_NOT_OVERLAP = "Waveforms shifted by their lags do not share any sample!"
+
     PULSE_MEASUREMENTS_PROCESSING_FAILED_FOR_SOME_REASON = (
         "Pulse measurements processing failed for some reason!"
     )
 
+    PULSE_MEASUREMENTS_PROCESSING_PULSE_IS_NOT_FOUND = (
+        "Pulse measurements processing did not find requested pulse in waveform!"
+    )
+
     PULSE_MEASUREMENTS_PROCESSING_REFERENCE_LEVELS_UNIT_IS_NOT_SUPPORTED = (
         "Pulse measurements processing does not support selected reference levels unit!"
     )
@@ -54,6 +72,14 @@ class AnalysisLibraryExceptionMessage:
         "Multi-tones waveform creation failed for some reason!"
     )
 
+    WAVEFORM_SAMPLES_TYPE_IS_NOT_SUPPORTED = (
+        "Waveform samples type is not supported, use float32 or float64!"
+    )
+
+    WAVEFORM_OUTPUT_BUFFER_SIZE_IS_NOT_SAMPLES_COUNT = (
+        "Waveform output buffer must be a 1-D array holding samples count elements!"
+    )
+
     SCALE_OFFSET_WAVEFORM_TRANSFORMATION_FAILED_FOR_SOME_REASON = (
         "Scale and offset waveform transformations failed for some reason!"
     )
@@ -20,6 +20,13 @@ from nipcbatt.pcbatt_analysis.analysis_library_exceptions import (
 from nipcbatt.pcbatt_analysis.analysis_library_messages import (
     AnalysisLibraryExceptionMessage,
 )
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._parallel_processing import (
+    process_waveforms_indexes_ranges,
+)
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._waveform_samples import (
+    labview_as_native_samples_impl,
+    numpy_as_analysis_samples_impl,
+)
 
 
 def labview_get_last_error_message_impl() -> str:
@@ -39,25 +46,23 @@ def labview_get_last_error_message_impl() -> str:
     # size_t output_error_message_length)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement_GetLastErrorMessage.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement_GetLastErrorMessage",
+            restype=c_int,
+            argtypes=[
+                # char* output_error_message
+                c_char_p,
+                # size_t output_error_message_length
+                c_size_t,
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement_GetLastErrorMessage.argtypes = [
-            # char* output_error_message
-            c_char_p,
-            # size_t output_error_message_length
-            c_size_t,
-        ]
 
         string_buffer_length = 1024
         string_buffer = create_string_buffer(string_buffer_length)
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement_GetLastErrorMessage(
-            string_buffer, c_size_t(string_buffer_length)
-        )
+        res_status = native_function(string_buffer, c_size_t(string_buffer_length))
 
         if res_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -101,29 +106,7 @@ def labview_process_single_waveform_amplitude_and_levels_impl(
     # double* outputProcessedLowStateLevelValue)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement.restype = (
-            c_int
-        )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement.argtypes = [
-            # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod
-            c_int,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # int histogramSize
-            c_int,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double* outputProcessedAmplitudeValue
-            POINTER(c_double),
-            # double* outputProcessedHighStateLevelValue
-            POINTER(c_double),
-            # double* outputProcessedLowStateLevelValue
-            POINTER(c_double),
-        ]
+        native_function = _get_process_single_waveform_amplitude_and_levels_native_function()
 
         # call native code
         amplitude_value_out = c_double()
@@ -134,10 +117,12 @@ def labview_process_single_waveform_amplitude_and_levels_impl(
 
         waveform_sampling_period_in = c_double(waveform_sampling_period_seconds)
         waveform_length_in = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         waveform_samples_array_in = waveform_samples.ctypes.data_as(POINTER(c_double))
         histogram_size_in = c_int(histogram_size)
 
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement(
+        res_status = native_function(
             amplitude_and_levels_processing_method_in,
             waveform_sampling_period_in,
             waveform_length_in,
@@ -166,3 +151,267 @@ def labview_process_single_waveform_amplitude_and_levels_impl(
             message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
             + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement"
         ) from e
+
+
+def _get_process_single_waveform_amplitude_and_levels_native_function():
+    """Gets native function processing amplitude and levels, with its signature bound."""
+    # int NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement(
+    # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod,
+    # double inputWaveformSamplingPeriod,
+    # size_t inputWaveformSamplesArrayLength,
+    # int histogramSize,
+    # const double* inputWaveformSamplesArray,
+    # double* outputProcessedAmplitudeValue,
+    # double* outputProcessedHighStateLevelValue,
+    # double* outputProcessedLowStateLevelValue)
+    return analysis_library_interop.get_interop_api_function(
+        function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement",
+        restype=c_int,
+        argtypes=[
+            # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod
+            c_int,
+            # double inputWaveformSamplingPeriod
+            c_double,
+            # size_t inputWaveformSamplesArrayLength
+            c_size_t,
+            # int histogramSize
+            c_int,
+            # const double* inputWaveformSamplesArray
+            POINTER(c_double),
+            # double* outputProcessedAmplitudeValue
+            POINTER(c_double),
+            # double* outputProcessedHighStateLevelValue
+            POINTER(c_double),
+            # double* outputProcessedLowStateLevelValue
+            POINTER(c_double),
+        ],
+    )
+
+
+def labview_process_multiple_waveforms_amplitude_and_levels_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    amplitude_and_levels_processing_method: int,
+    histogram_size: int,
+    workers_count: int = 1,
+) -> tuple[
+    numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]
+]:
+    """Invokes native library Amplitude and Levels processing LabVIEW VI on each waveform
+    of a 2-D block of samples (one waveform per row), with a single binding of native function,
+    waveforms are shared by `workers_count` threads.
+
+    Raises:
+        PCBATTAnalysisCallNativeLibraryFailedException: Occurs when native dll call fails for some reason.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+        Tuple gathering amplitudes, high state levels and low state levels, one value per waveform.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (106 > 100 characters) (auto-generated noqa)
+    try:
+        native_function = _get_process_single_waveform_amplitude_and_levels_native_function()
+
+        samples = numpy.ascontiguousarray(numpy.atleast_2d(waveforms_samples), dtype=numpy.float64)
+        waveforms_count = samples.shape[0]
+
+        amplitudes = numpy.zeros(waveforms_count, dtype=numpy.float64)
+        high_state_levels = numpy.zeros(waveforms_count, dtype=numpy.float64)
+        low_state_levels = numpy.zeros(waveforms_count, dtype=numpy.float64)
+
+        # inputs shared by all native calls
+        amplitude_and_levels_processing_method_in = c_int(amplitude_and_levels_processing_method)
+        waveform_sampling_period_in = c_double(waveforms_sampling_period_seconds)
+        waveform_length_in = c_size_t(samples.shape[1])
+        histogram_size_in = c_int(histogram_size)
+
+        def process_waveforms_range(start_index: int, stop_index: int):
+            # outputs shared by native calls of the range
+            amplitude_value_out = c_double()
+            high_state_level_value_out = c_double()
+            low_state_level_value_out = c_double()
+
+            for waveform_index in range(start_index, stop_index):
+                res_status = native_function(
+                    amplitude_and_levels_processing_method_in,
+                    waveform_sampling_period_in,
+                    waveform_length_in,
+                    histogram_size_in,
+                    samples[waveform_index].ctypes.data_as(POINTER(c_double)),
+                    byref(amplitude_value_out),
+                    byref(high_state_level_value_out),
+                    byref(low_state_level_value_out),
+                )
+
+                if res_status != 0:
+                    error_message = labview_get_last_error_message_impl()
+                    raise PCBATTAnalysisCallNativeLibraryFailedException(
+                        message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
+                        + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement"
+                        + f" status = {res_status}, error = {error_message}"
+                    )
+
+                amplitudes[waveform_index] = amplitude_value_out.value
+                high_state_levels[waveform_index] = high_state_level_value_out.value
+                low_state_levels[waveform_index] = low_state_level_value_out.value
+
+        process_waveforms_indexes_ranges(
+            waveforms_count=waveforms_count,
+            workers_count=workers_count,
+            process_waveforms_range=process_waveforms_range,
+        )
+
+        return (amplitudes, high_state_levels, low_state_levels)
+    except Exception as e:
+        raise PCBATTAnalysisCallNativeLibraryFailedException(
+            message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
+            + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudeAndLevelsMeasurement"
+        ) from e
+
+
+# Minimum ratio of the samples of an histogram half held by its most populated bin,
+# below that ratio the half holds no dominant state and auto select uses peak method.
+_HISTOGRAM_STATE_MINIMUM_SAMPLES_RATIO = 0.05
+
+
+def numpy_process_waveforms_histograms_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    histogram_size: int,
+) -> tuple[
+    numpy.ndarray[numpy.int64],
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+]:
+    """Bins samples of one or several waveforms, each waveform is binned once,
+    all waveforms in a single pass, in `histogram_size` bins spanning its minimum to maximum.
+
+    Args:
+        waveforms_samples (numpy.ndarray[numpy.float64]): 1-D array of a single waveform
+        or 2-D array of waveforms sharing the same length (one waveform per row).
+        histogram_size (int): number of bins of each histogram.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.int64], numpy.ndarray[numpy.float64],
+        numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+        samples counts and samples sums of each bin (one row per waveform),
+        minimums and maximums of waveforms gathered in a tuple.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    waveforms_count = samples.shape[0]
+
+    minimums = samples.min(axis=1).astype(numpy.float64)
+    maximums = samples.max(axis=1).astype(numpy.float64)
+    spans = maximums - minimums
+    # constant waveforms have all their samples in the first bin
+    bins_per_unit = numpy.divide(
+        histogram_size, spans, out=numpy.zeros_like(spans), where=spans > 0
+    )
+
+    # samples are binned in their own precision, float32 samples are not promoted to float64
+    bins_indexes = (
+        (samples - minimums.astype(samples.dtype)[:, numpy.newaxis])
+        * bins_per_unit.astype(samples.dtype)[:, numpy.newaxis]
+    ).astype(numpy.int64)
+    numpy.clip(bins_indexes, 0, histogram_size - 1, out=bins_indexes)
+    # offset bins of each waveform so that all histograms are built by a single bincount
+    bins_indexes += (
+        histogram_size * numpy.arange(waveforms_count, dtype=numpy.int64)[:, numpy.newaxis]
+    )
+
+    bins_counts = numpy.bincount(
+        bins_indexes.ravel(), minlength=waveforms_count * histogram_size
+    ).reshape(waveforms_count, histogram_size)
+    bins_sums = numpy.bincount(
+        bins_indexes.ravel(), weights=samples.ravel(), minlength=waveforms_count * histogram_size
+    ).reshape(waveforms_count, histogram_size)
+
+    return (bins_counts, bins_sums, minimums, maximums)
+
+
+def numpy_process_waveforms_amplitude_and_levels_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    amplitude_and_levels_processing_method: int,
+    histogram_size: int,
+    waveforms_histograms: tuple = None,
+) -> tuple[
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    tuple,
+]:
+    """Processes amplitude and levels of one or several waveforms using numpy.
+
+    Peak method uses maximum and minimum of each waveform as high and low state levels.
+    Histogram method splits histogram of each waveform in two halves, the state level of a half
+    is the mean of the samples of its most populated bin. Auto select uses histogram method,
+    except for waveforms having an histogram half without dominant state, which use peak method.
+
+    Args:
+        waveforms_samples (numpy.ndarray[numpy.float64]): 1-D array of a single waveform
+        or 2-D array of waveforms sharing the same length (one waveform per row).
+        amplitude_and_levels_processing_method (int): 0 for Histogram, 1 for Peak,
+        2 for Auto select.
+        histogram_size (int): number of bins of each histogram.
+        waveforms_histograms (tuple, optional): histograms of waveforms already returned by
+        `numpy_process_waveforms_histograms_impl`, when None they are built if required.
+        Defaults to None.
+
+    Raises:
+        ValueError: occurs when the processing method is not supported.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64],
+        numpy.ndarray[numpy.float64], tuple]: amplitudes, high state levels,
+        low state levels (one per waveform) and histograms of waveforms (None with peak method)
+        gathered in a tuple.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
+    if amplitude_and_levels_processing_method not in (0, 1, 2):
+        raise ValueError(
+            "Amplitude and levels processing method "
+            + f"{amplitude_and_levels_processing_method} is not supported"
+        )
+
+    if amplitude_and_levels_processing_method == 1:
+        samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+        high_state_levels = samples.max(axis=1).astype(numpy.float64)
+        low_state_levels = samples.min(axis=1).astype(numpy.float64)
+        return (high_state_levels - low_state_levels, high_state_levels, low_state_levels, None)
+
+    if waveforms_histograms is None:
+        waveforms_histograms = numpy_process_waveforms_histograms_impl(
+            waveforms_samples, histogram_size
+        )
+    bins_counts, bins_sums, minimums, maximums = waveforms_histograms
+
+    # lower half bins hold low state, upper half bins hold high state
+    half_size = max(bins_counts.shape[1] // 2, 1)
+    rows = numpy.arange(bins_counts.shape[0])
+
+    low_state_bins = numpy.argmax(bins_counts[:, :half_size], axis=1)
+    high_state_bins = half_size + numpy.argmax(bins_counts[:, half_size:], axis=1)
+    low_state_counts = bins_counts[rows, low_state_bins]
+    high_state_counts = bins_counts[rows, high_state_bins]
+
+    # constant waveforms have an empty upper half, both states are the unique value
+    high_state_levels = numpy.where(
+        high_state_counts > 0,
+        bins_sums[rows, high_state_bins] / numpy.maximum(high_state_counts, 1),
+        maximums,
+    )
+    low_state_levels = bins_sums[rows, low_state_bins] / numpy.maximum(low_state_counts, 1)
+
+    if amplitude_and_levels_processing_method == 2:
+        lower_half_counts = bins_counts[:, :half_size].sum(axis=1)
+        upper_half_counts = bins_counts[:, half_size:].sum(axis=1)
+        use_peak_method = (
+            low_state_counts < _HISTOGRAM_STATE_MINIMUM_SAMPLES_RATIO * lower_half_counts
+        ) | (high_state_counts < _HISTOGRAM_STATE_MINIMUM_SAMPLES_RATIO * upper_half_counts)
+        high_state_levels = numpy.where(use_peak_method, maximums, high_state_levels)
+        low_state_levels = numpy.where(use_peak_method, minimums, low_state_levels)
+
+    return (
+        high_state_levels - low_state_levels,
+        high_state_levels,
+        low_state_levels,
+        waveforms_histograms,
+    )
@@ -0,0 +1,110 @@
+"""Private module that provides a set of helper functions
+   for nipcbatt.pcbatt_analysis.cross_correlation_analysis module."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (351 > 100 characters) (auto-generated noqa)
+
+import numpy
+import scipy.fft
+
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._waveform_samples import (
+    numpy_as_analysis_samples_impl,
+)
+
+
+def numpy_get_cross_correlation_fft_length_impl(samples_count: int) -> int:
+    """Gets the length of FFT used to compute linear (not circular) cross-correlations
+    of waveforms of `samples_count` samples, the smallest power of 2 holding
+    `2 * samples_count - 1` samples."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    return 1 << max(0, int(2 * samples_count - 2).bit_length())
+
+
+def numpy_process_waveforms_cross_correlation_lags_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    reference_waveform_index: int,
+    max_lag_samples_count: int = None,
+) -> tuple[numpy.ndarray[numpy.int64], numpy.ndarray[numpy.float64]]:
+    """Processes the lag of each waveform of a block relative to the reference waveform of
+    the block, as the position of the maximum of their cross-correlation computed by FFT.
+
+    Mean of each waveform is removed, spectrums of all waveforms are computed in one batched
+    real FFT, multiplied by the conjugate spectrum of the reference and transformed back,
+    in O(N.log(N)) per waveform instead of O(N^2) for a direct cross-correlation.
+
+    Args:
+        waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms sharing
+        the same length and sampling clock (one waveform per row).
+        reference_waveform_index (`int`): row of the reference waveform in `waveforms_samples`.
+        max_lag_samples_count (`int`, optional): largest absolute lag searched, in samples,
+        when None all lags of overlapping waveforms are searched. Defaults to None.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.int64], numpy.ndarray[numpy.float64]]: lags in samples,
+        positive when the waveform is delayed relative to the reference, and normalized
+        cross-correlation coefficients at these lags, one per waveform.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    samples_count = samples.shape[1]
+    max_lag = samples_count - 1
+    if max_lag_samples_count is not None:
+        max_lag = min(max_lag, max_lag_samples_count)
+
+    centered_samples = samples - samples.mean(axis=1, keepdims=True, dtype=numpy.float64).astype(
+        samples.dtype
+    )
+    fft_length = numpy_get_cross_correlation_fft_length_impl(samples_count)
+
+    # correlation[i, k] = sum(x_i[n + k] * x_ref[n]), lag k is stored at k modulo fft_length,
+    # FFTs are computed in the precision of samples
+    spectrums = scipy.fft.rfft(centered_samples, n=fft_length, axis=1)
+    spectrums *= numpy.conj(spectrums[reference_waveform_index])
+    correlations = scipy.fft.irfft(spectrums, n=fft_length, axis=1)
+
+    searched_lags = numpy.arange(-max_lag, max_lag + 1)
+    searched_correlations = correlations[:, searched_lags % fft_length]
+    peaks_indexes = numpy.argmax(searched_correlations, axis=1)
+    lags = searched_lags[peaks_indexes]
+
+    # correlation at lag is normalized by the energies of the waveform and of the reference
+    energies = numpy.einsum("ij,ij->i", centered_samples, centered_samples, dtype=numpy.float64)
+    normalization = numpy.sqrt(energies * energies[reference_waveform_index])
+    peaks_correlations = numpy.take_along_axis(
+        searched_correlations, peaks_indexes[:, numpy.newaxis], axis=1
+    )[:, 0].astype(numpy.float64)
+    coefficients = numpy.divide(
+        peaks_correlations,
+        normalization,
+        out=numpy.zeros_like(peaks_correlations),
+        where=normalization > 0,
+    )
+
+    return (lags, coefficients)
+
+
+def numpy_get_aligned_waveforms_views_impl(
+    waveforms_samples: numpy.ndarray,
+    lags_samples_counts: numpy.ndarray[numpy.int64],
+) -> list[numpy.ndarray]:
+    """Gets views, without copy, of the samples of waveforms shifted by their lags so that
+    they are aligned, restricted to the samples range shared by all shifted waveforms.
+
+    Sample `n` of all views holds samples acquired at the same time, relative to the delays,
+    sample `n` of view `i` is sample `first + n + lags[i]` of waveform `i`.
+
+    Args:
+        waveforms_samples (`numpy.ndarray`): 2-D array of waveforms (one waveform per row).
+        lags_samples_counts (`numpy.ndarray[numpy.int64]`): lag of each waveform in samples.
+
+    Returns:
+        list[numpy.ndarray]: 1-D views of the same length, one per waveform, empty
+        when shifted waveforms do not overlap.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(waveforms_samples)
+    samples_count = samples.shape[1]
+    lags = numpy.asarray(lags_samples_counts, dtype=numpy.int64)
+
+    first_aligned_index = max(0, -int(lags.min()))
+    last_aligned_index = min(samples_count, samples_count - int(lags.max()))
+    aligned_length = max(0, last_aligned_index - first_aligned_index)
+
+    return [
+        waveform_samples[first_aligned_index + lag : first_aligned_index + lag + aligned_length]
+        for waveform_samples, lag in zip(samples, lags.tolist())
+    ]
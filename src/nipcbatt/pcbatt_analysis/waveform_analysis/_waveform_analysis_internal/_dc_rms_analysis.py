@@ -20,6 +20,13 @@ from nipcbatt.pcbatt_analysis.analysis_library_exceptions import (
 from nipcbatt.pcbatt_analysis.analysis_library_messages import (
     AnalysisLibraryExceptionMessage,
 )
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._parallel_processing import (
+    process_waveforms_indexes_ranges,
+)
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._waveform_samples import (
+    labview_as_native_samples_impl,
+    numpy_as_analysis_samples_impl,
+)
 
 
 def labview_get_last_error_message_impl() -> str:
@@ -38,25 +45,23 @@ def labview_get_last_error_message_impl() -> str:
     # size_t output_error_message_length)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement_GetLastErrorMessage.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement_GetLastErrorMessage",
+            restype=c_int,
+            argtypes=[
+                # char* output_error_message
+                c_char_p,
+                # size_t output_error_message_length
+                c_size_t,
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement_GetLastErrorMessage.argtypes = [
-            # char* output_error_message
-            c_char_p,
-            # size_t output_error_message_length
-            c_size_t,
-        ]
 
         string_buffer_length = 1024
         string_buffer = create_string_buffer(string_buffer_length)
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement_GetLastErrorMessage(
-            string_buffer, c_size_t(string_buffer_length)
-        )
+        res_status = native_function(string_buffer, c_size_t(string_buffer_length))
 
         if res_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -101,25 +106,7 @@ def labview_process_single_waveform_dc_rms_impl(
     # double* outputProcessedRmsValue)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement.restype = (
-            c_int
-        )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement.argtypes = [
-            # DcRmsProcessingWindowEnum inputDcRmsProcessingWindow
-            c_int,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double* outputProcessedDcValue
-            POINTER(c_double),
-            # double* outputProcessedRmsValue
-            POINTER(c_double),
-        ]
+        native_function = _get_process_single_waveform_dc_rms_native_function()
 
         # call native code
         dc_value_out = c_double()
@@ -128,17 +115,17 @@ def labview_process_single_waveform_dc_rms_impl(
         dc_rms_processing_window_in = c_int(dc_rms_processing_window)
         waveform_sampling_period_in = c_double(waveform_sampling_period_seconds)
         waveform_length_in = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         waveform_samples_array_in = waveform_samples.ctypes.data_as(POINTER(c_double))
 
-        res_status = (
-            dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement(
-                dc_rms_processing_window_in,
-                waveform_sampling_period_in,
-                waveform_length_in,
-                waveform_samples_array_in,
-                byref(dc_value_out),
-                byref(rms_value_out),
-            )
+        res_status = native_function(
+            dc_rms_processing_window_in,
+            waveform_sampling_period_in,
+            waveform_length_in,
+            waveform_samples_array_in,
+            byref(dc_value_out),
+            byref(rms_value_out),
         )
 
         if res_status != 0:
@@ -155,3 +142,258 @@ def labview_process_single_waveform_dc_rms_impl(
             message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
             + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement"
         ) from e
+
+
+def _get_process_single_waveform_dc_rms_native_function():
+    """Gets native function processing DC-RMS, with its signature bound."""
+    # int PCBATT_INTEROP_API __cdecl
+    # NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement(
+    # DcRmsProcessingWindowEnum inputDcRmsProcessingWindow,
+    # double inputWaveformSamplingPeriod,
+    # size_t inputWaveformSamplesArrayLength,
+    # const double* inputWaveformSamplesArray,
+    # double* outputProcessedDcValue,
+    # double* outputProcessedRmsValue)
+    return analysis_library_interop.get_interop_api_function(
+        function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement",
+        restype=c_int,
+        argtypes=[
+            # DcRmsProcessingWindowEnum inputDcRmsProcessingWindow
+            c_int,
+            # double inputWaveformSamplingPeriod
+            c_double,
+            # size_t inputWaveformSamplesArrayLength
+            c_size_t,
+            # const double* inputWaveformSamplesArray
+            POINTER(c_double),
+            # double* outputProcessedDcValue
+            POINTER(c_double),
+            # double* outputProcessedRmsValue
+            POINTER(c_double),
+        ],
+    )
+
+
+def labview_process_multiple_waveforms_dc_rms_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    dc_rms_processing_window: int,
+    workers_count: int = 1,
+) -> tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+    """Invokes native library DC-RMS processing LabVIEW VI on each waveform
+    of a 2-D block of samples (one waveform per row), with a single binding of native function.
+
+    Args:
+        waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+        waveforms_sampling_period_seconds (float): Sampling period of all waveforms.
+        dc_rms_processing_window (int): 0 for Rectangular, 1 for Hann or 2 for LowSideLobe.
+        workers_count (int): number of threads sharing the waveforms, defaults to 1.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+        DC values and RMS values (one per waveform) gathered in a tuple.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    try:
+        native_function = _get_process_single_waveform_dc_rms_native_function()
+
+        samples = numpy.ascontiguousarray(numpy.atleast_2d(waveforms_samples), dtype=numpy.float64)
+        waveforms_count = samples.shape[0]
+
+        dc_values = numpy.zeros(waveforms_count, dtype=numpy.float64)
+        rms_values = numpy.zeros(waveforms_count, dtype=numpy.float64)
+
+        # inputs shared by all native calls
+        dc_rms_processing_window_in = c_int(dc_rms_processing_window)
+        waveform_sampling_period_in = c_double(waveforms_sampling_period_seconds)
+        waveform_length_in = c_size_t(samples.shape[1])
+
+        def process_waveforms_range(start_index: int, stop_index: int):
+            # outputs shared by native calls of the range
+            dc_value_out = c_double()
+            rms_value_out = c_double()
+
+            for waveform_index in range(start_index, stop_index):
+                res_status = native_function(
+                    dc_rms_processing_window_in,
+                    waveform_sampling_period_in,
+                    waveform_length_in,
+                    samples[waveform_index].ctypes.data_as(POINTER(c_double)),
+                    byref(dc_value_out),
+                    byref(rms_value_out),
+                )
+
+                if res_status != 0:
+                    error_message = labview_get_last_error_message_impl()
+                    raise PCBATTAnalysisCallNativeLibraryFailedException(
+                        message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
+                        + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement"
+                        + f" status = {res_status}, error = {error_message}"
+                    )
+
+                dc_values[waveform_index] = dc_value_out.value
+                rms_values[waveform_index] = rms_value_out.value
+
+        process_waveforms_indexes_ranges(
+            waveforms_count=waveforms_count,
+            workers_count=workers_count,
+            process_waveforms_range=process_waveforms_range,
+        )
+
+        return (dc_values, rms_values)
+    except Exception as e:
+        raise PCBATTAnalysisCallNativeLibraryFailedException(
+            message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
+            + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformDcRmsMeasurement"
+        ) from e
+
+
+# Coefficients of the cosine sum windows used by LabVIEW Basic DC-RMS VI,
+# w[n] = sum(a[k] * cos(2 * pi * k * n / N)), indexed by DC-RMS processing window.
+_DC_RMS_WINDOWS_COSINE_SUM_COEFFICIENTS = {
+    # Rectangular
+    0: (1.0,),
+    # Hann
+    1: (0.5, -0.5),
+    # Low side lobe
+    2: (0.323215218, -0.471492057, 0.17553428, -0.028497078, 0.001261367),
+}
+
+
+def numpy_create_dc_rms_window_impl(
+    samples_count: int, dc_rms_processing_window: int
+) -> tuple[numpy.ndarray[numpy.float64], float, float]:
+    """Creates the weighting window used by DC-RMS processing.
+
+    Args:
+        samples_count (int): number of samples of the window.
+        dc_rms_processing_window (int): 0 for Rectangular, 1 for Hann or 2 for LowSideLobe.
+
+    Raises:
+        ValueError: occurs when the processing window is not supported.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], float, float]: weighting window samples,
+        DC normalization factor and RMS normalization factor gathered in a tuple.
+    """
+    if dc_rms_processing_window not in _DC_RMS_WINDOWS_COSINE_SUM_COEFFICIENTS:
+        raise ValueError(f"DC-RMS processing window {dc_rms_processing_window} is not supported")
+
+    coefficients = _DC_RMS_WINDOWS_COSINE_SUM_COEFFICIENTS[dc_rms_processing_window]
+    angles = (2.0 * numpy.pi / samples_count) * numpy.arange(samples_count, dtype=numpy.float64)
+
+    window = numpy.full(samples_count, coefficients[0], dtype=numpy.float64)
+    for harmonic, coefficient in enumerate(coefficients[1:], start=1):
+        window += coefficient * numpy.cos(harmonic * angles)
+
+    # LabVIEW normalizes by the coherent gain and the power of the window,
+    # both are computed from the window samples so that they are exact for any samples count.
+    dc_normalization_factor = window.sum()
+    rms_normalization_factor = numpy.square(window).sum()
+
+    return (window, dc_normalization_factor, rms_normalization_factor)
+
+
+def numpy_process_waveforms_dc_rms_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    dc_rms_processing_window: int,
+) -> tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+    """Processes DC-RMS of one or several waveforms using numpy, the same way LabVIEW
+    Basic DC-RMS VI does (window weighted mean and window weighted root mean square).
+
+    Args:
+        waveforms_samples (numpy.ndarray[numpy.float64]): 1-D array of a single waveform
+        or 2-D array of waveforms sharing the same length (one waveform per row).
+        dc_rms_processing_window (int): 0 for Rectangular, 1 for Hann or 2 for LowSideLobe.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+        DC values and RMS values (one per waveform) gathered in a tuple.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    window, dc_normalization_factor, rms_normalization_factor = numpy_create_dc_rms_window_impl(
+        samples.shape[-1], dc_rms_processing_window
+    )
+
+    # window is cast to the type of samples, float32 samples are not promoted to float64
+    window = window.astype(samples.dtype, copy=False)
+    dc_values = (samples @ window).astype(numpy.float64) / dc_normalization_factor
+    rms_values = numpy.sqrt(
+        (numpy.square(samples) @ numpy.square(window)).astype(numpy.float64)
+        / rms_normalization_factor
+    )
+
+    return (dc_values, rms_values)
+
+
+def numpy_accumulate_waveforms_dc_rms_impl(
+    waveforms_samples: numpy.ndarray,
+    samples_count: int,
+    means: numpy.ndarray[numpy.float64],
+    squared_deviations_sums: numpy.ndarray[numpy.float64],
+    minimums: numpy.ndarray[numpy.float64],
+    maximums: numpy.ndarray[numpy.float64],
+) -> int:
+    """Accumulates a chunk of samples of one or several waveforms into running statistics,
+    updated in place, one value per waveform.
+
+    Statistics of the chunk are computed in two passes, then combined with the running ones
+    through the pairwise update of Chan et al, which keeps the sum of squared deviations
+    from the mean accurate whatever the DC offset and the number of accumulated chunks.
+
+    Args:
+        waveforms_samples (numpy.ndarray): 1-D array of a single waveform chunk
+        or 2-D array of waveforms chunks sharing the same length (one waveform per row).
+        samples_count (int): number of samples per waveform accumulated so far.
+        means (numpy.ndarray[numpy.float64]): running means of waveforms.
+        squared_deviations_sums (numpy.ndarray[numpy.float64]): running sums of squared
+        deviations of samples from the means of waveforms.
+        minimums (numpy.ndarray[numpy.float64]): running minimums of waveforms.
+        maximums (numpy.ndarray[numpy.float64]): running maximums of waveforms.
+
+    Returns:
+        int: number of samples per waveform accumulated, chunk included.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    chunk_samples_count = samples.shape[-1]
+    if chunk_samples_count == 0:
+        return samples_count
+
+    # deviations are computed in the type of samples, their sums are accumulated in float64
+    chunk_means = samples.mean(axis=-1, dtype=numpy.float64)
+    chunk_squared_deviations_sums = numpy.square(
+        samples - chunk_means.astype(samples.dtype)[:, numpy.newaxis]
+    ).sum(axis=-1, dtype=numpy.float64)
+    numpy.minimum(minimums, samples.min(axis=-1), out=minimums)
+    numpy.maximum(maximums, samples.max(axis=-1), out=maximums)
+
+    accumulated_samples_count = samples_count + chunk_samples_count
+    means_deltas = chunk_means - means
+    squared_deviations_sums += chunk_squared_deviations_sums + numpy.square(means_deltas) * (
+        samples_count * chunk_samples_count / accumulated_samples_count
+    )
+    means += means_deltas * (chunk_samples_count / accumulated_samples_count)
+
+    return accumulated_samples_count
+
+
+def numpy_get_accumulated_dc_rms_impl(
+    samples_count: int,
+    means: numpy.ndarray[numpy.float64],
+    squared_deviations_sums: numpy.ndarray[numpy.float64],
+) -> tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+    """Gets DC values and RMS values of waveforms from their running statistics,
+    the same values Basic DC-RMS VI returns with a rectangular window.
+
+    Args:
+        samples_count (int): number of samples per waveform accumulated so far.
+        means (numpy.ndarray[numpy.float64]): running means of waveforms.
+        squared_deviations_sums (numpy.ndarray[numpy.float64]): running sums of squared
+        deviations of samples from the means of waveforms.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+        DC values and RMS values (one per waveform) gathered in a tuple.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    # mean of squares is the variance plus the square of the mean
+    rms_values = numpy.sqrt(numpy.square(means) + squared_deviations_sums / samples_count)
+    return (means.copy(), rms_values)
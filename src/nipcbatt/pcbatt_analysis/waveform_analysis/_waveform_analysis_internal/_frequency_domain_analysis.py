@@ -1,7 +1,9 @@
 """Private module that provides a set of helper functions 
    for nipcbatt.pcbatt_analysis.frequency_domain_analysis module."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (361 > 100 characters) (auto-generated noqa)
 
+import functools
 import math
+import warnings
 from ctypes import (
     POINTER,
     byref,
@@ -29,6 +31,14 @@ from nipcbatt.pcbatt_analysis.common.common_types import (
     SpectrumPhaseUnit,
     WaveformTone,
 )
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._parallel_processing import (
+    process_waveforms_indexes_ranges,
+)
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._waveform_samples import (
+    labview_as_native_samples_impl,
+    numpy_as_analysis_samples_impl,
+    numpy_rfft_impl,
+)
 from nipcbatt.pcbatt_analysis.waveform_transformation import scale_and_offset_waveform
 
 
@@ -41,25 +51,23 @@ def labview_multiple_tones_measurement_get_last_error_message_impl() -> str:
     # size_t output_error_message_length)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement_GetLastErrorMessage.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement_GetLastErrorMessage",
+            restype=c_int,
+            argtypes=[
+                # char* output_error_message
+                c_char_p,
+                # size_t output_error_message_length
+                c_size_t,
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement_GetLastErrorMessage.argtypes = [
-            # char* output_error_message
-            c_char_p,
-            # size_t output_error_message_length
-            c_size_t,
-        ]
 
         string_buffer_length = 1024
         string_buffer = create_string_buffer(string_buffer_length)
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement_GetLastErrorMessage(
-            string_buffer, c_size_t(string_buffer_length)
-        )
+        res_status = native_function(string_buffer, c_size_t(string_buffer_length))
 
         if res_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -86,25 +94,23 @@ def labview_fft_spectrum_amplitude_phase_get_last_error_message_impl() -> str:
     # size_t output_error_message_length)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement_GetLastErrorMessage.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement_GetLastErrorMessage",
+            restype=c_int,
+            argtypes=[
+                # char* output_error_message
+                c_char_p,
+                # size_t output_error_message_length
+                c_size_t,
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement_GetLastErrorMessage.argtypes = [
-            # char* output_error_message
-            c_char_p,
-            # size_t output_error_message_length
-            c_size_t,
-        ]
 
         string_buffer_length = 1024
         string_buffer = create_string_buffer(string_buffer_length)
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement_GetLastErrorMessage(
-            string_buffer, c_size_t(string_buffer_length)
-        )
+        res_status = native_function(string_buffer, c_size_t(string_buffer_length))
 
         if res_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -130,6 +136,8 @@ def labview_process_single_waveform_amplitude_phase_spectrum_impl(
     spectrum_phase_unit: SpectrumPhaseUnit,
     fft_spectrum_window: int,
     fft_spectrum_window_advanced_parameter: float = None,
+    output_spectrum_amplitudes: numpy.ndarray[numpy.float64] = None,
+    output_spectrum_phases: numpy.ndarray[numpy.float64] = None,
 ) -> AmplitudePhaseSpectrum:
     """Processes amplitude phase spectrum of a given waveform samples using LabVIEW VI
 
@@ -143,6 +151,12 @@ def labview_process_single_waveform_amplitude_phase_spectrum_impl(
         fft_spectrum_window (`FftSpectrumWindow`): fft processing window.
         fft_spectrum_window_advanced_parameter (`float`): advanced parameter value,
         only used when selected window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`.
+        output_spectrum_amplitudes (`numpy.ndarray[numpy.float64]`): contiguous array of
+        `ceil(waveform_samples.size / 2)` values the spectrum amplitudes are written to,
+        a new array is allocated when not set.
+        output_spectrum_phases (`numpy.ndarray[numpy.float64]`): contiguous array of
+        `ceil(waveform_samples.size / 2)` values the spectrum phases are written to,
+        a new array is allocated when not set.
 
     Raises:
         PCBATTAnalysisException:
@@ -167,41 +181,41 @@ def labview_process_single_waveform_amplitude_phase_spectrum_impl(
     # double* outputSpectrumEndFrequency,
     # double* outputSpectrumMagnitudesArray,
     # double* outputSpectrumPhasesArray);
+    native_function_name = "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement"
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name=native_function_name,
+            restype=c_int,
+            argtypes=[
+                # FftSpectrumWindowEnum inputFftWindow
+                c_int,
+                # bool inputViewSettingsAmplitudeUnitIsdDb
+                c_bool,
+                # inputViewSettingsPhaseMustUnwrap
+                c_bool,
+                # bool inputViewSettingsPhaseUnitIsDegree
+                c_bool,
+                # double inputAdvancedFftWindowParameter
+                c_double,
+                # double inputWaveformSamplingPeriod
+                c_double,
+                # size_t inputWaveformSamplesArrayLength
+                c_size_t,
+                # const double* inputWaveformSamplesArray
+                POINTER(c_double),
+                # double* outputSpectrumResolution,
+                POINTER(c_double),
+                # double* outputSpectrumStartFrequency,
+                POINTER(c_double),
+                # double* outputSpectrumEndFrequency,
+                POINTER(c_double),
+                # double* outputSpectrumMagnitudesArray,
+                POINTER(c_double),
+                # double* outputSpectrumPhasesArray
+                POINTER(c_double),
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement.argtypes = [
-            # FftSpectrumWindowEnum inputFftWindow
-            c_int,
-            # bool inputViewSettingsAmplitudeUnitIsdDb
-            c_bool,
-            # inputViewSettingsPhaseMustUnwrap
-            c_bool,
-            # bool inputViewSettingsPhaseUnitIsDegree
-            c_bool,
-            # double inputAdvancedFftWindowParameter
-            c_double,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double* outputSpectrumResolution,
-            POINTER(c_double),
-            # double* outputSpectrumStartFrequency,
-            POINTER(c_double),
-            # double* outputSpectrumEndFrequency,
-            POINTER(c_double),
-            # double* outputSpectrumMagnitudesArray,
-            POINTER(c_double),
-            # double* outputSpectrumPhasesArray
-            POINTER(c_double),
-        ]
 
         # fill function arguements
         input_fft_window = c_int(fft_spectrum_window)
@@ -216,23 +230,29 @@ def labview_process_single_waveform_amplitude_phase_spectrum_impl(
 
         waveform_sampling_period_in = c_double(waveform_sampling_period_seconds)
         waveform_length_in = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         waveform_samples_array_in = waveform_samples.ctypes.data_as(POINTER(c_double))
 
         output_spectrum_resolution = c_double(0)
         output_spectrum_start_frequency = c_double(0)
         output_spectrum_end_frequency = c_double(0)
 
+        # native code writes the spectrum into the output arrays, which are returned
+        # as results, so that they are never copied
         fft_spectrum_size = math.ceil(waveform_samples.size / 2)
-        output_spectrum_magnitudes_array = numpy.zeros(
-            fft_spectrum_size, dtype=numpy.float64
-        ).ctypes.data_as(POINTER(c_double))
+        if output_spectrum_amplitudes is None:
+            output_spectrum_amplitudes = numpy.empty(fft_spectrum_size, dtype=numpy.float64)
+        output_spectrum_magnitudes_array = output_spectrum_amplitudes.ctypes.data_as(
+            POINTER(c_double)
+        )
 
-        output_spectrum_phases_array = numpy.zeros(
-            fft_spectrum_size, dtype=numpy.float64
-        ).ctypes.data_as(POINTER(c_double))
+        if output_spectrum_phases is None:
+            output_spectrum_phases = numpy.empty(fft_spectrum_size, dtype=numpy.float64)
+        output_spectrum_phases_array = output_spectrum_phases.ctypes.data_as(POINTER(c_double))
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformAmplitudePhaseSpectrumMeasurement(
+        res_status = native_function(
             input_fft_window,
             input_view_settings_amplitude_unit_isd_db,
             input_view_settings_phase_must_unwrap,
@@ -256,25 +276,19 @@ def labview_process_single_waveform_amplitude_phase_spectrum_impl(
                 + f" status = {res_status}, error = {error_message}"
             )
 
-        frequencies_amplitudes_result = numpy.ctypeslib.as_array(
-            obj=output_spectrum_magnitudes_array, shape=(fft_spectrum_size,)
-        )
-
         if spectrum_amplitude_type == SpectrumAmplitudeType.PEAK:
             scale_and_offset_waveform.scale_inplace(
-                waveform_samples=frequencies_amplitudes_result,
+                waveform_samples=output_spectrum_amplitudes,
                 scale_factor=math.sqrt(2),
             )
 
         spectrum_final_result = AmplitudePhaseSpectrum(
             f0=output_spectrum_start_frequency.value,
             df=output_spectrum_resolution.value,
-            frequencies_amplitudes=frequencies_amplitudes_result,
+            frequencies_amplitudes=output_spectrum_amplitudes,
             spectrum_amplitude_type=spectrum_amplitude_type,
             spectrum_amplitude_unit_is_db=spectrum_amplitude_must_be_db,
-            frequencies_phases=numpy.ctypeslib.as_array(
-                obj=output_spectrum_phases_array, shape=(fft_spectrum_size,)
-            ),
+            frequencies_phases=output_spectrum_phases,
             spectrum_phase_unit=spectrum_phase_unit,
         )
 
@@ -322,34 +336,37 @@ def labview_process_single_waveform_multiple_tones_impl(
     # double* outputTonesFrequenciesArray,
     # double* outputTonesPeakAmplitudesArray,
     # double* outputTonesPhasesDegreeArray);
+    native_function_name = (
+        "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement"
+    )
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name=native_function_name,
+            restype=c_int,
+            argtypes=[
+                # TonesSortingModeEnum inputTonesSortingMode
+                c_int,
+                # size_t inputTonesResultsMaxCount
+                c_size_t,
+                # double inputTonesSelectionAmplitudeThreshold
+                c_double,
+                # double inputWaveformSamplingPeriod
+                c_double,
+                # size_t inputWaveformSamplesArrayLength
+                c_size_t,
+                # const double* inputWaveformSamplesArray
+                POINTER(c_double),
+                # size_t* outputTonesResultActualCount
+                POINTER(c_size_t),
+                # double* outputTonesFrequenciesArray
+                POINTER(c_double),
+                # outputTonesPeakAmplitudesArray
+                POINTER(c_double),
+                # outputTonesPhasesDegreeArray
+                POINTER(c_double),
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement.argtypes = [
-            # TonesSortingModeEnum inputTonesSortingMode
-            c_int,
-            # size_t inputTonesResultsMaxCount
-            c_size_t,
-            # double inputTonesSelectionAmplitudeThreshold
-            c_double,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # size_t* outputTonesResultActualCount
-            POINTER(c_size_t),
-            # double* outputTonesFrequenciesArray
-            POINTER(c_double),
-            # outputTonesPeakAmplitudesArray
-            POINTER(c_double),
-            # outputTonesPhasesDegreeArray
-            POINTER(c_double),
-        ]
 
         # call native code
         input_tones_sorting_mode = c_int(tones_sorting_mode)
@@ -358,35 +375,48 @@ def labview_process_single_waveform_multiple_tones_impl(
 
         waveform_sampling_period_in = c_double(waveform_sampling_period_seconds)
         waveform_length_in = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         waveform_samples_array_in = waveform_samples.ctypes.data_as(POINTER(c_double))
 
+        # output arrays are buffers of the calling thread, reused by each call,
+        # they are held by variables until tones are built from their values
         output_tones_result_actual_count = c_size_t(0)
-        output_tones_frequencies_array = numpy.zeros(
-            tones_max_count, dtype=numpy.float64
-        ).ctypes.data_as(POINTER(c_double))
+        output_tones_frequencies_buffer = analysis_library_interop.get_interop_api_output_buffer(
+            native_function_name, "outputTonesFrequenciesArray", tones_max_count
+        )
+        output_tones_frequencies_array = output_tones_frequencies_buffer.ctypes.data_as(
+            POINTER(c_double)
+        )
 
-        output_tones_peak_amplitudes_array = numpy.zeros(
-            tones_max_count, dtype=numpy.float64
-        ).ctypes.data_as(POINTER(c_double))
+        output_tones_peak_amplitudes_buffer = (
+            analysis_library_interop.get_interop_api_output_buffer(
+                native_function_name, "outputTonesPeakAmplitudesArray", tones_max_count
+            )
+        )
+        output_tones_peak_amplitudes_array = output_tones_peak_amplitudes_buffer.ctypes.data_as(
+            POINTER(c_double)
+        )
 
-        output_tones_phases_degree_array = numpy.zeros(
-            tones_max_count, dtype=numpy.float64
-        ).ctypes.data_as(POINTER(c_double))
+        output_tones_phases_degree_buffer = analysis_library_interop.get_interop_api_output_buffer(
+            native_function_name, "outputTonesPhasesDegreeArray", tones_max_count
+        )
+        output_tones_phases_degree_array = output_tones_phases_degree_buffer.ctypes.data_as(
+            POINTER(c_double)
+        )
 
         # labview returns phases in degree, amplitudes are peak amplitudes
-        res_status = (
-            dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformTonesMeasurement(
-                input_tones_sorting_mode,
-                input_tones_results_max_count,
-                input_tones_selection_amplitude_threshold,
-                waveform_sampling_period_in,
-                waveform_length_in,
-                waveform_samples_array_in,
-                byref(output_tones_result_actual_count),
-                output_tones_frequencies_array,
-                output_tones_peak_amplitudes_array,
-                output_tones_phases_degree_array,
-            )
+        res_status = native_function(
+            input_tones_sorting_mode,
+            input_tones_results_max_count,
+            input_tones_selection_amplitude_threshold,
+            waveform_sampling_period_in,
+            waveform_length_in,
+            waveform_samples_array_in,
+            byref(output_tones_result_actual_count),
+            output_tones_frequencies_array,
+            output_tones_peak_amplitudes_array,
+            output_tones_phases_degree_array,
         )
 
         if res_status != 0:
@@ -431,6 +461,8 @@ def labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_
     tones_selection_threshold_peak_amplitude: float,
     tones_max_count: int = None,
     fft_spectrum_window_advanced_parameter: float = None,
+    output_spectrum_amplitudes: numpy.ndarray[numpy.float64] = None,
+    output_spectrum_phases: numpy.ndarray[numpy.float64] = None,
 ):
     """Processes amplitude phase spectrum of a given waveform samples using LabVIEW VI
 
@@ -446,6 +478,10 @@ def labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_
         tones_selection_threshold_peak_amplitude (`float`): minimum amplitude peak of tone to be selected.
         tones_max_count (`int`): maximum tones count to extract from analyzed waveform,
         when not set, all tones will be extracted.
+        output_spectrum_amplitudes (`numpy.ndarray[numpy.float64]`): array the spectrum
+        amplitudes are written to, a new array is allocated when not set.
+        output_spectrum_phases (`numpy.ndarray[numpy.float64]`): array the spectrum
+        phases are written to, a new array is allocated when not set.
 
     Raises:
         PCBATTAnalysisException:
@@ -465,6 +501,8 @@ def labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_
         spectrum_phase_unit,
         fft_spectrum_window,
         fft_spectrum_window_advanced_parameter,
+        output_spectrum_amplitudes,
+        output_spectrum_phases,
     )
 
     # if tones_max_count is not provided,
@@ -511,3 +549,698 @@ def labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_
         multiple_tones_result = [], SpectrumAmplitudeType.PEAK
 
     return rms_spectrum_result, multiple_tones_result[0], multiple_tones_result[1]
+
+
+def labview_process_multiple_waveforms_multiple_tones_and_amplitude_phase_spectrum_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    spectrum_amplitude_must_be_db: bool,
+    spectrum_phase_unit: SpectrumPhaseUnit,
+    fft_spectrum_window: int,
+    tones_sorting_mode: int,
+    tones_selection_threshold_peak_amplitude: float,
+    tones_max_count: int = None,
+    fft_spectrum_window_advanced_parameter: float = None,
+    workers_count: int = 1,
+) -> tuple[
+    AmplitudePhaseSpectrum,
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    list[list[WaveformTone]],
+    SpectrumAmplitudeType,
+]:
+    """Processes amplitude phase spectrum and multiple tones of each waveform of a 2-D block
+    of samples (one waveform per row), spectrums are gathered into 2-D arrays.
+
+    Args:
+        waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms samples.
+        waveforms_sampling_period_seconds (`float`): sampling period of all waveforms.
+        (see `labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_impl`
+        for other arguments)
+        workers_count (`int`): number of threads sharing the waveforms, defaults to 1.
+
+    Returns:
+        tuple: spectrum of first waveform (holds frequency axis and units), 2-D array of
+        spectrums amplitudes, 2-D array of spectrums phases, list of detected tones of
+        each waveform and amplitude type of the tones.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.ascontiguousarray(numpy.atleast_2d(waveforms_samples), dtype=numpy.float64)
+    waveforms_count = samples.shape[0]
+    results_per_waveform = [None] * waveforms_count
+
+    # native code writes the spectrum of each waveform into its row of the result arrays
+    spectrum_shape = (waveforms_count, math.ceil(samples.shape[1] / 2))
+    spectrums_amplitudes = numpy.empty(spectrum_shape, dtype=numpy.float64)
+    spectrums_phases = numpy.empty(spectrum_shape, dtype=numpy.float64)
+
+    def process_waveforms_range(start_index: int, stop_index: int):
+        for waveform_index in range(start_index, stop_index):
+            results_per_waveform[waveform_index] = (
+                labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_impl(
+                    samples[waveform_index],
+                    waveforms_sampling_period_seconds,
+                    spectrum_amplitude_must_be_db,
+                    spectrum_phase_unit,
+                    fft_spectrum_window,
+                    tones_sorting_mode,
+                    tones_selection_threshold_peak_amplitude,
+                    tones_max_count,
+                    fft_spectrum_window_advanced_parameter,
+                    spectrums_amplitudes[waveform_index],
+                    spectrums_phases[waveform_index],
+                )
+            )
+
+    process_waveforms_indexes_ranges(
+        waveforms_count=waveforms_count,
+        workers_count=workers_count,
+        process_waveforms_range=process_waveforms_range,
+    )
+
+    first_spectrum_result, _, tones_amplitude_type = results_per_waveform[0]
+    detected_tones_per_waveform: list[list[WaveformTone]] = [
+        detected_tones for _, detected_tones, _ in results_per_waveform
+    ]
+
+    return (
+        first_spectrum_result,
+        spectrums_amplitudes,
+        spectrums_phases,
+        detected_tones_per_waveform,
+        tones_amplitude_type,
+    )
+
+
+# Coefficients of the cosine sum windows used by LabVIEW FFT spectrum VIs,
+# w[n] = sum(a[k] * cos(2 * pi * k * n / N)), indexed by FFT spectrum window.
+_FFT_SPECTRUM_WINDOWS_COSINE_SUM_COEFFICIENTS = {
+    # Rectangle
+    0: (1.0,),
+    # Hanning
+    1: (0.5, -0.5),
+    # Hamming
+    2: (0.54, -0.46),
+    # Blackman-Harris
+    3: (0.42323, -0.49755, 0.07922),
+    # Exact Blackman
+    4: (7938.0 / 18608.0, -9240.0 / 18608.0, 1430.0 / 18608.0),
+    # Blackman
+    5: (0.42, -0.5, 0.08),
+    # Flat top
+    6: (0.21557895, -0.41663158, 0.277263158, -0.083578947, 0.006947368),
+    # 4 terms Blackman-Harris
+    7: (0.35875, -0.48829, 0.14128, -0.01168),
+    # 7 terms Blackman-Harris
+    8: (
+        0.27105140069342,
+        -0.43329793923448,
+        0.21812299954311,
+        -0.06592544638803,
+        0.01081174209837,
+        -0.00077658482522,
+        0.00001388721735,
+    ),
+    # Low side lobe
+    9: (0.323215218, -0.471492057, 0.17553428, -0.028497078, 0.001261367),
+    # Blackman-Nuttall
+    11: (0.3635819, -0.4891775, 0.1365995, -0.0106411),
+}
+
+# Windows using the advanced parameter, and the value LabVIEW uses when it is not set:
+# Kaiser beta, Dolph-Chebyshev main lobe to side lobe ratio and Gaussian standard deviation.
+_FFT_SPECTRUM_WINDOWS_ADVANCED_PARAMETER_DEFAULT_VALUES = {60: 0.0, 61: 100.0, 62: 0.2}
+
+# Half width, in bins, of the main lobe of windows that are not cosine sum windows.
+_FFT_SPECTRUM_WINDOW_DEFAULT_MAIN_LOBE_HALF_WIDTH = 2
+
+# Maximum number of windows kept by the windows cache, one per (window, length, parameter).
+_FFT_SPECTRUM_WINDOWS_CACHE_SIZE = 32
+
+# Number of samples processed at once when targeted tones are evaluated,
+# bounds the size of the complex exponentials evaluated for all tones.
+_TARGETED_TONES_SAMPLES_CHUNK_SIZE = 65536
+
+
+def numpy_get_fft_spectrum_window_impl(
+    samples_count: int,
+    fft_spectrum_window: int,
+    fft_spectrum_window_advanced_parameter: float = None,
+) -> tuple[numpy.ndarray[numpy.float64], float, float, int]:
+    """Gets the window applied to waveforms before their FFT, windows are cached by
+    window, samples count and advanced parameter, so that they are only created once.
+
+    Args:
+        samples_count (int): number of samples of the window.
+        fft_spectrum_window (int): FFT spectrum window, see `LabViewFftSpectrumWindow`.
+        fft_spectrum_window_advanced_parameter (float, optional): advanced parameter value,
+        only used when window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`. Defaults to None.
+
+    Raises:
+        ValueError: occurs when the FFT spectrum window is not supported.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], float, float, int]: read-only window samples,
+        sum of window samples (coherent gain times samples count), equivalent noise bandwidth
+        of the window in bins and half width of its main lobe in bins, gathered in a tuple.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    fft_spectrum_window = int(fft_spectrum_window)
+    if fft_spectrum_window in _FFT_SPECTRUM_WINDOWS_ADVANCED_PARAMETER_DEFAULT_VALUES:
+        if fft_spectrum_window_advanced_parameter is None:
+            fft_spectrum_window_advanced_parameter = (
+                _FFT_SPECTRUM_WINDOWS_ADVANCED_PARAMETER_DEFAULT_VALUES[fft_spectrum_window]
+            )
+        fft_spectrum_window_advanced_parameter = float(fft_spectrum_window_advanced_parameter)
+    else:
+        # parameter is ignored, it must not split cache entries
+        fft_spectrum_window_advanced_parameter = None
+
+    return _numpy_create_fft_spectrum_window_impl(
+        samples_count, fft_spectrum_window, fft_spectrum_window_advanced_parameter
+    )
+
+
+@functools.lru_cache(maxsize=_FFT_SPECTRUM_WINDOWS_CACHE_SIZE)
+def _numpy_create_fft_spectrum_window_impl(
+    samples_count: int,
+    fft_spectrum_window: int,
+    fft_spectrum_window_advanced_parameter: float,
+) -> tuple[numpy.ndarray[numpy.float64], float, float, int]:
+    """Creates the window applied to waveforms before their FFT,
+    see `numpy_get_fft_spectrum_window_impl`."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    # windows are periodic (DFT-even), as the windows of LabVIEW FFT spectrum VIs
+    indexes = numpy.arange(samples_count, dtype=numpy.float64)
+    # position of each sample relative to the center of the window, in [-1, 1)
+    centered_positions = (indexes - samples_count / 2.0) / (samples_count / 2.0)
+    main_lobe_half_width = _FFT_SPECTRUM_WINDOW_DEFAULT_MAIN_LOBE_HALF_WIDTH
+
+    if fft_spectrum_window in _FFT_SPECTRUM_WINDOWS_COSINE_SUM_COEFFICIENTS:
+        coefficients = _FFT_SPECTRUM_WINDOWS_COSINE_SUM_COEFFICIENTS[fft_spectrum_window]
+        angles = (2.0 * numpy.pi / samples_count) * indexes
+        window = numpy.full(samples_count, coefficients[0], dtype=numpy.float64)
+        for harmonic, coefficient in enumerate(coefficients[1:], start=1):
+            window += coefficient * numpy.cos(harmonic * angles)
+        main_lobe_half_width = max(1, len(coefficients) - 1)
+    elif fft_spectrum_window == 30:
+        # Triangle
+        window = 1.0 - numpy.abs(centered_positions)
+    elif fft_spectrum_window == 31:
+        # Bartlett-Hanning
+        window = (
+            0.62
+            - 0.24 * numpy.abs(centered_positions)
+            + 0.38 * numpy.cos(numpy.pi * centered_positions)
+        )
+    elif fft_spectrum_window == 32:
+        # Bohman
+        absolute_positions = numpy.abs(centered_positions)
+        window = (1.0 - absolute_positions) * numpy.cos(numpy.pi * absolute_positions) + numpy.sin(
+            numpy.pi * absolute_positions
+        ) / numpy.pi
+    elif fft_spectrum_window == 33:
+        # Parzen
+        absolute_positions = numpy.abs(centered_positions)
+        window = numpy.where(
+            absolute_positions <= 0.5,
+            1.0 - 6.0 * absolute_positions**2 + 6.0 * absolute_positions**3,
+            2.0 * (1.0 - absolute_positions) ** 3,
+        )
+    elif fft_spectrum_window == 34:
+        # Welch
+        window = 1.0 - centered_positions**2
+    elif fft_spectrum_window == 60:
+        # Kaiser, periodic window is the symmetric window one sample longer, truncated
+        window = numpy.kaiser(samples_count + 1, fft_spectrum_window_advanced_parameter)[:-1]
+    elif fft_spectrum_window == 61:
+        # Dolph-Chebyshev, parameter is the main lobe to side lobe ratio
+        # scipy warns about ratios below 45 dB, LabVIEW default ratio (100) is 40 dB
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            window = scipy.signal.windows.chebwin(
+                samples_count,
+                at=20.0 * math.log10(fft_spectrum_window_advanced_parameter),
+                sym=False,
+            )
+    elif fft_spectrum_window == 62:
+        # Gaussian, parameter is the standard deviation relative to the window length
+        window = numpy.exp(
+            -0.5
+            * (
+                (indexes - samples_count / 2.0)
+                / (fft_spectrum_window_advanced_parameter * samples_count)
+            )
+            ** 2
+        )
+    else:
+        raise ValueError(f"FFT spectrum window {fft_spectrum_window} is not supported")
+
+    window = numpy.ascontiguousarray(window, dtype=numpy.float64)
+    window.flags.writeable = False
+
+    window_sum = float(window.sum())
+    equivalent_noise_bandwidth_bins = (
+        samples_count * float(numpy.dot(window, window)) / (window_sum**2)
+    )
+
+    return (window, window_sum, equivalent_noise_bandwidth_bins, main_lobe_half_width)
+
+
+def numpy_process_waveforms_multiple_tones_and_amplitude_phase_spectrum_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    spectrum_amplitude_must_be_db: bool,
+    spectrum_phase_unit: SpectrumPhaseUnit,
+    fft_spectrum_window: int,
+    tones_sorting_mode: int,
+    tones_selection_threshold_peak_amplitude: float,
+    tones_max_count: int = None,
+    fft_spectrum_window_advanced_parameter: float = None,
+) -> tuple[
+    AmplitudePhaseSpectrum,
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    list[list[WaveformTone]],
+    SpectrumAmplitudeType,
+]:
+    """Processes `RMS` amplitude phase spectrum and multiple tones of one or several waveforms
+    using numpy, all results are derived from a single windowed FFT of each waveform,
+    computed at once for all waveforms.
+
+    Spectrum holds the `ceil(N / 2)` first bins of the FFT, as LabVIEW FFT spectrum VIs do,
+    amplitudes are scaled by the coherent gain of the window. Tones are the local maxima of the
+    spectrum, their peak amplitude and frequency are estimated from the power of the bins of
+    the window main lobe, and their phase is the phase of the maximum bin.
+
+    Args:
+        waveforms_samples (`numpy.ndarray[numpy.float64]`): 1-D array of a single waveform
+        or 2-D array of waveforms sharing the same length (one waveform per row).
+        waveforms_sampling_period_seconds (`float`): sampling period of all waveforms.
+        (see `labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_impl`
+        for other arguments)
+
+    Returns:
+        tuple: spectrum of first waveform (holds frequency axis and units), 2-D array of
+        spectrums amplitudes, 2-D array of spectrums phases, list of detected tones of
+        each waveform and amplitude type of the tones.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    samples_count = samples.shape[1]
+    spectrum_size = math.ceil(samples_count / 2)
+    frequency_resolution = 1.0 / (samples_count * waveforms_sampling_period_seconds)
+
+    (
+        window,
+        window_sum,
+        equivalent_noise_bandwidth_bins,
+        main_lobe_half_width,
+    ) = numpy_get_fft_spectrum_window_impl(
+        samples_count, fft_spectrum_window, fft_spectrum_window_advanced_parameter
+    )
+
+    # single FFT of all windowed waveforms, in the precision of samples
+    spectrums = numpy_rfft_impl(samples * window.astype(samples.dtype), axis=1)[:, :spectrum_size]
+    spectrums_powers = numpy.square(spectrums.real, dtype=numpy.float64)
+    spectrums_powers += numpy.square(spectrums.imag, dtype=numpy.float64)
+
+    return _numpy_build_spectrums_and_tones_results_impl(
+        spectrums_powers,
+        numpy.angle(spectrums).astype(numpy.float64, copy=False),
+        frequency_resolution,
+        window_sum,
+        equivalent_noise_bandwidth_bins,
+        main_lobe_half_width,
+        spectrum_amplitude_must_be_db,
+        spectrum_phase_unit,
+        tones_sorting_mode,
+        tones_selection_threshold_peak_amplitude,
+        tones_max_count,
+    )
+
+
+def numpy_process_waveforms_averaged_multiple_tones_and_amplitude_spectrum_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    spectrum_amplitude_must_be_db: bool,
+    spectrum_phase_unit: SpectrumPhaseUnit,
+    fft_spectrum_window: int,
+    tones_sorting_mode: int,
+    tones_selection_threshold_peak_amplitude: float,
+    segment_samples_count: int,
+    segment_overlap_percent: float,
+    averages_count: int = None,
+    tones_max_count: int = None,
+    fft_spectrum_window_advanced_parameter: float = None,
+) -> tuple[
+    AmplitudePhaseSpectrum,
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    list[list[WaveformTone]],
+    SpectrumAmplitudeType,
+]:
+    """Processes `RMS` averaged amplitude spectrum and multiple tones of one or several
+    waveforms using numpy, following Welch method: waveforms are split in overlapping segments,
+    each windowed segment is transformed, and powers of FFT bins are averaged over segments.
+
+    Segments are processed one after the other, for all waveforms at once, so that FFT working
+    memory is bounded by the size of one segment whatever the waveforms length.
+    Phases of power averaged spectrums are not defined, they are all set to zero.
+
+    Args:
+        waveforms_samples (`numpy.ndarray[numpy.float64]`): 1-D array of a single waveform
+        or 2-D array of waveforms sharing the same length (one waveform per row).
+        waveforms_sampling_period_seconds (`float`): sampling period of all waveforms.
+        segment_samples_count (`int`): number of samples of each segment, sets the frequency
+        resolution of spectrums.
+        segment_overlap_percent (`float`): overlap of successive segments, in percent
+        of the segment samples count.
+        averages_count (`int`, optional): maximum number of averaged segments, when None,
+        all segments fitting in waveforms are averaged. Defaults to None.
+        (see `labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_impl`
+        for other arguments)
+
+    Raises:
+        ValueError: occurs when waveforms are shorter than one segment.
+
+    Returns:
+        tuple: spectrum of first waveform (holds frequency axis and units), 2-D array of
+        spectrums amplitudes, 2-D array of spectrums phases, list of detected tones of
+        each waveform and amplitude type of the tones.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    waveforms_count, samples_count = samples.shape
+    if segment_samples_count > samples_count:
+        raise ValueError(
+            f"Segment samples count {segment_samples_count} is greater"
+            + f" than waveforms samples count {samples_count}"
+        )
+
+    spectrum_size = math.ceil(segment_samples_count / 2)
+    frequency_resolution = 1.0 / (segment_samples_count * waveforms_sampling_period_seconds)
+    segments_step = max(
+        1, segment_samples_count - math.floor(segment_samples_count * segment_overlap_percent / 100)
+    )
+    segments_starts = range(0, samples_count - segment_samples_count + 1, segments_step)
+    if averages_count is not None:
+        segments_starts = segments_starts[:averages_count]
+
+    (
+        window,
+        window_sum,
+        equivalent_noise_bandwidth_bins,
+        main_lobe_half_width,
+    ) = numpy_get_fft_spectrum_window_impl(
+        segment_samples_count, fft_spectrum_window, fft_spectrum_window_advanced_parameter
+    )
+
+    # buffers are reused by all segments, segments are windowed in the precision of samples
+    window = window.astype(samples.dtype)
+    windowed_segments = numpy.empty((waveforms_count, segment_samples_count), dtype=samples.dtype)
+    spectrums_powers = numpy.zeros((waveforms_count, spectrum_size), dtype=numpy.float64)
+
+    for segment_start in segments_starts:
+        numpy.multiply(
+            samples[:, segment_start : segment_start + segment_samples_count],
+            window,
+            out=windowed_segments,
+        )
+        segments_spectrums = numpy_rfft_impl(windowed_segments, axis=1)[:, :spectrum_size]
+        spectrums_powers += numpy.square(segments_spectrums.real, dtype=numpy.float64)
+        spectrums_powers += numpy.square(segments_spectrums.imag, dtype=numpy.float64)
+
+    spectrums_powers /= len(segments_starts)
+
+    return _numpy_build_spectrums_and_tones_results_impl(
+        spectrums_powers,
+        numpy.zeros(spectrums_powers.shape, dtype=numpy.float64),
+        frequency_resolution,
+        window_sum,
+        equivalent_noise_bandwidth_bins,
+        main_lobe_half_width,
+        spectrum_amplitude_must_be_db,
+        spectrum_phase_unit,
+        tones_sorting_mode,
+        tones_selection_threshold_peak_amplitude,
+        tones_max_count,
+    )
+
+
+def numpy_process_waveforms_targeted_tones_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    tones_frequencies: numpy.ndarray[numpy.float64],
+    fft_spectrum_window: int,
+    fft_spectrum_window_advanced_parameter: float = None,
+) -> tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+    """Processes peak amplitude and phase of tones of known frequencies in one or several
+    waveforms using numpy, evaluating the windowed discrete time Fourier transform of waveforms
+    at the frequencies of the tones only, in O(N.k) instead of building whole spectrums.
+
+    Transform is evaluated by chunks of samples, for all waveforms and all tones at once,
+    as a product of windowed samples by complex exponentials of the tones.
+
+    Args:
+        waveforms_samples (`numpy.ndarray[numpy.float64]`): 1-D array of a single waveform
+        or 2-D array of waveforms sharing the same length (one waveform per row).
+        waveforms_sampling_period_seconds (`float`): sampling period of all waveforms.
+        tones_frequencies (`numpy.ndarray[numpy.float64]`): frequencies of the tones, in Hertz.
+        fft_spectrum_window (`int`): window applied to waveforms, see `LabViewFftSpectrumWindow`.
+        fft_spectrum_window_advanced_parameter (`float`, optional): advanced parameter value,
+        only used when window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`. Defaults to None.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]: peak amplitudes and
+        phases in radians of tones, 2-D arrays with one row per waveform and one column per tone.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    waveforms_count, samples_count = samples.shape
+    tones_frequencies = numpy.atleast_1d(numpy.asarray(tones_frequencies, dtype=numpy.float64))
+    tones_pulsations = (2.0 * numpy.pi * waveforms_sampling_period_seconds) * tones_frequencies
+
+    window, window_sum, _, _ = numpy_get_fft_spectrum_window_impl(
+        samples_count, fft_spectrum_window, fft_spectrum_window_advanced_parameter
+    )
+    window = window.astype(samples.dtype, copy=False)
+
+    tones_transforms = numpy.zeros(
+        (waveforms_count, tones_frequencies.size), dtype=numpy.complex128
+    )
+    for chunk_start in range(0, samples_count, _TARGETED_TONES_SAMPLES_CHUNK_SIZE):
+        chunk_stop = min(chunk_start + _TARGETED_TONES_SAMPLES_CHUNK_SIZE, samples_count)
+        chunk_indexes = numpy.arange(chunk_start, chunk_stop, dtype=numpy.float64)
+        tones_exponentials = numpy.exp(-1j * numpy.outer(chunk_indexes, tones_pulsations))
+        tones_transforms += (
+            samples[:, chunk_start:chunk_stop] * window[chunk_start:chunk_stop]
+        ) @ tones_exponentials
+
+    # a tone of peak amplitude A holds A * window_sum / 2, DC holds its whole amplitude
+    tones_amplitudes = numpy.abs(tones_transforms) / window_sum
+    tones_amplitudes[:, tones_frequencies != 0] *= 2.0
+
+    return (tones_amplitudes, numpy.angle(tones_transforms))
+
+
+def numpy_process_waveforms_frequency_response_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    tones_frequencies: numpy.ndarray[numpy.float64],
+    stimulus_waveform_index: int,
+    fft_spectrum_window: int,
+    fft_spectrum_window_advanced_parameter: float = None,
+) -> tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]:
+    """Processes gain and phase shift, at the frequencies of the tones of a stimulus, of all
+    waveforms of a block relative to the stimulus waveform of the same block, using numpy.
+
+    Tones of all waveforms, stimulus included, are measured in one batched evaluation of the
+    windowed discrete time Fourier transform, see `numpy_process_waveforms_targeted_tones_impl`.
+
+    Args:
+        waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms sharing
+        the same length and sampling clock (one waveform per row).
+        waveforms_sampling_period_seconds (`float`): sampling period of all waveforms.
+        tones_frequencies (`numpy.ndarray[numpy.float64]`): frequencies of the tones, in Hertz.
+        stimulus_waveform_index (`int`): row of the stimulus waveform in `waveforms_samples`.
+        fft_spectrum_window (`int`): window applied to waveforms, see `LabViewFftSpectrumWindow`.
+        fft_spectrum_window_advanced_parameter (`float`, optional): advanced parameter value,
+        only used when window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`. Defaults to None.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]: gains and phase
+        shifts in radians, wrapped to [-PI, PI], 2-D arrays with one row per waveform and one
+        column per tone. Gain is NaN for tones of zero amplitude in the stimulus waveform.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    tones_amplitudes, tones_phases = numpy_process_waveforms_targeted_tones_impl(
+        waveforms_samples,
+        waveforms_sampling_period_seconds,
+        tones_frequencies,
+        fft_spectrum_window,
+        fft_spectrum_window_advanced_parameter,
+    )
+    stimulus_amplitudes = tones_amplitudes[stimulus_waveform_index]
+    stimulus_phases = tones_phases[stimulus_waveform_index]
+
+    gains = numpy.full_like(tones_amplitudes, numpy.nan)
+    numpy.divide(tones_amplitudes, stimulus_amplitudes, out=gains, where=stimulus_amplitudes > 0)
+
+    # phase shift is wrapped through the angle of the unit complex holding it
+    phases_shifts = numpy.angle(numpy.exp(1j * (tones_phases - stimulus_phases)))
+
+    return (gains, phases_shifts)
+
+
+def _numpy_build_spectrums_and_tones_results_impl(
+    spectrums_powers: numpy.ndarray[numpy.float64],
+    spectrums_phases_radians: numpy.ndarray[numpy.float64],
+    frequency_resolution: float,
+    window_sum: float,
+    equivalent_noise_bandwidth_bins: float,
+    main_lobe_half_width: int,
+    spectrum_amplitude_must_be_db: bool,
+    spectrum_phase_unit: SpectrumPhaseUnit,
+    tones_sorting_mode: int,
+    tones_selection_threshold_peak_amplitude: float,
+    tones_max_count: int = None,
+) -> tuple[
+    AmplitudePhaseSpectrum,
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    list[list[WaveformTone]],
+    SpectrumAmplitudeType,
+]:
+    """Builds `RMS` amplitude phase spectrums and detected tones of waveforms from the powers
+    and phases of their windowed FFT bins, see
+    `numpy_process_waveforms_multiple_tones_and_amplitude_phase_spectrum_impl`."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    # RMS amplitudes, DC bin is not scaled by sqrt(2)
+    spectrums_amplitudes = numpy.sqrt(spectrums_powers)
+    spectrums_amplitudes *= math.sqrt(2) / window_sum
+    spectrums_amplitudes[:, 0] /= math.sqrt(2)
+
+    detected_tones_per_waveform = _numpy_extract_waveforms_tones_impl(
+        spectrums_powers,
+        spectrums_phases_radians,
+        frequency_resolution,
+        window_sum,
+        equivalent_noise_bandwidth_bins,
+        main_lobe_half_width,
+        tones_sorting_mode,
+        tones_selection_threshold_peak_amplitude,
+        tones_max_count,
+    )
+
+    spectrums_phases = (
+        numpy.degrees(spectrums_phases_radians)
+        if spectrum_phase_unit == SpectrumPhaseUnit.DEGREE
+        else spectrums_phases_radians
+    )
+
+    if spectrum_amplitude_must_be_db:
+        spectrums_amplitudes = 20.0 * numpy.log10(
+            numpy.maximum(spectrums_amplitudes, numpy.finfo(numpy.float64).tiny)
+        )
+
+    first_spectrum_result = AmplitudePhaseSpectrum(
+        f0=0.0,
+        df=frequency_resolution,
+        frequencies_amplitudes=spectrums_amplitudes[0],
+        spectrum_amplitude_type=SpectrumAmplitudeType.RMS,
+        spectrum_amplitude_unit_is_db=spectrum_amplitude_must_be_db,
+        frequencies_phases=spectrums_phases[0],
+        spectrum_phase_unit=spectrum_phase_unit,
+    )
+
+    return (
+        first_spectrum_result,
+        spectrums_amplitudes,
+        spectrums_phases,
+        detected_tones_per_waveform,
+        SpectrumAmplitudeType.PEAK,
+    )
+
+
+def _numpy_extract_waveforms_tones_impl(
+    spectrums_powers: numpy.ndarray[numpy.float64],
+    spectrums_phases_radians: numpy.ndarray[numpy.float64],
+    frequency_resolution: float,
+    window_sum: float,
+    equivalent_noise_bandwidth_bins: float,
+    main_lobe_half_width: int,
+    tones_sorting_mode: int,
+    tones_selection_threshold_peak_amplitude: float,
+    tones_max_count: int = None,
+) -> list[list[WaveformTone]]:
+    """Extracts tones of each waveform from the powers and phases of its windowed FFT bins,
+    peaks of all waveforms are located at once, tones lists are then built per waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    waveforms_count, spectrum_size = spectrums_powers.shape
+    detected_tones_per_waveform: list[list[WaveformTone]] = [[] for _ in range(waveforms_count)]
+
+    if spectrum_size < 3 or tones_max_count == 0:
+        return detected_tones_per_waveform
+
+    # local maxima of spectrums, DC bin excluded
+    peaks_mask = numpy.zeros(spectrums_powers.shape, dtype=numpy.bool_)
+    peaks_mask[:, 1:-1] = (spectrums_powers[:, 1:-1] > spectrums_powers[:, :-2]) & (
+        spectrums_powers[:, 1:-1] >= spectrums_powers[:, 2:]
+    )
+    peaks_waveforms_indexes, peaks_bins_indexes = numpy.nonzero(peaks_mask)
+
+    # power and power weighted bin index of the main lobe around each peak
+    lobes_powers = numpy.zeros(peaks_bins_indexes.size, dtype=numpy.float64)
+    lobes_weighted_bins = numpy.zeros(peaks_bins_indexes.size, dtype=numpy.float64)
+    for bin_offset in range(-main_lobe_half_width, main_lobe_half_width + 1):
+        lobe_bins_indexes = peaks_bins_indexes + bin_offset
+        lobe_bins_are_valid = (lobe_bins_indexes >= 0) & (lobe_bins_indexes < spectrum_size)
+        lobe_bins_indexes = numpy.clip(lobe_bins_indexes, 0, spectrum_size - 1)
+        lobe_bins_powers = numpy.where(
+            lobe_bins_are_valid,
+            spectrums_powers[peaks_waveforms_indexes, lobe_bins_indexes],
+            0.0,
+        )
+        lobes_powers += lobe_bins_powers
+        lobes_weighted_bins += lobe_bins_powers * lobe_bins_indexes
+
+    # tone of peak amplitude A holds (A * window_sum / 2)^2 * ENBW power in its main lobe
+    tones_amplitudes = 2.0 * numpy.sqrt(lobes_powers / equivalent_noise_bandwidth_bins) / window_sum
+    tones_frequencies = numpy.divide(
+        lobes_weighted_bins,
+        lobes_powers,
+        out=peaks_bins_indexes.astype(numpy.float64),
+        where=lobes_powers > 0,
+    )
+    tones_frequencies *= frequency_resolution
+    tones_phases = spectrums_phases_radians[peaks_waveforms_indexes, peaks_bins_indexes]
+
+    tones_are_selected = (tones_amplitudes >= tones_selection_threshold_peak_amplitude) & (
+        tones_amplitudes > 0
+    )
+    peaks_waveforms_indexes = peaks_waveforms_indexes[tones_are_selected]
+    tones_amplitudes = tones_amplitudes[tones_are_selected]
+    tones_frequencies = tones_frequencies[tones_are_selected]
+    tones_phases = tones_phases[tones_are_selected]
+
+    # peaks are ordered by waveform, then by frequency
+    waveforms_tones_stop_indexes = numpy.cumsum(
+        numpy.bincount(peaks_waveforms_indexes, minlength=waveforms_count)
+    )
+    waveform_tones_start_index = 0
+    for waveform_index, waveform_tones_stop_index in enumerate(waveforms_tones_stop_indexes):
+        waveform_tones_indexes = numpy.arange(waveform_tones_start_index, waveform_tones_stop_index)
+        waveform_tones_start_index = waveform_tones_stop_index
+
+        # keep largest tones, then sort them as requested
+        waveform_tones_indexes = waveform_tones_indexes[
+            numpy.argsort(-tones_amplitudes[waveform_tones_indexes], kind="stable")
+        ]
+        if tones_max_count is not None:
+            waveform_tones_indexes = waveform_tones_indexes[:tones_max_count]
+        if tones_sorting_mode == 0:
+            # increasing frequencies
+            waveform_tones_indexes = numpy.sort(waveform_tones_indexes)
+
+        detected_tones_per_waveform[waveform_index] = [
+            WaveformTone(
+                frequency=float(tones_frequencies[tone_index]),
+                amplitude=float(tones_amplitudes[tone_index]),
+                phase_radians=float(tones_phases[tone_index]),
+            )
+            for tone_index in waveform_tones_indexes
+        ]
+
+    return detected_tones_per_waveform
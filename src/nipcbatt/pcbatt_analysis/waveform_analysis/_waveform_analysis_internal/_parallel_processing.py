@@ -0,0 +1,66 @@
+"""Private module that provides helper functions used to dispatch
+   processing of waveforms blocks across a pool of worker threads."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+def split_waveforms_indexes_ranges(
+    waveforms_count: int, workers_count: int
+) -> list[tuple[int, int]]:
+    """Splits waveforms indexes into contiguous ranges, one per worker.
+
+    Args:
+        waveforms_count (int): number of waveforms to process.
+        workers_count (int): number of workers processing the waveforms.
+
+    Returns:
+        list[tuple[int, int]]: (start, stop) indexes of each range, in waveforms order.
+    """
+    ranges_count = max(1, min(workers_count, waveforms_count))
+    range_size, remaining_waveforms_count = divmod(waveforms_count, ranges_count)
+
+    indexes_ranges = []
+    start_index = 0
+    for range_index in range(ranges_count):
+        stop_index = (
+            start_index + range_size + (1 if range_index < remaining_waveforms_count else 0)
+        )
+        indexes_ranges.append((start_index, stop_index))
+        start_index = stop_index
+
+    return indexes_ranges
+
+
+def process_waveforms_indexes_ranges(
+    waveforms_count: int,
+    workers_count: int,
+    process_waveforms_range: Callable[[int, int], None],
+):
+    """Calls `process_waveforms_range(start, stop)` for each range of waveforms indexes,
+    ranges are processed by a pool of `workers_count` threads when `workers_count` > 1.
+
+    Each range must write its results at the waveforms indexes it owns, so that results
+    are gathered in waveforms order, whatever the number of workers.
+    Exceptions raised by workers are propagated to the caller.
+
+    Args:
+        waveforms_count (int): number of waveforms to process.
+        workers_count (int): number of worker threads.
+        process_waveforms_range (Callable[[int, int], None]): function processing
+            waveforms whose indexes are in [start, stop).
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    indexes_ranges = split_waveforms_indexes_ranges(waveforms_count, workers_count)
+
+    if len(indexes_ranges) == 1:
+        start_index, stop_index = indexes_ranges[0]
+        process_waveforms_range(start_index, stop_index)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(indexes_ranges)) as executor:
+        futures = [
+            executor.submit(process_waveforms_range, start_index, stop_index)
+            for start_index, stop_index in indexes_ranges
+        ]
+        for future in futures:
+            future.result()
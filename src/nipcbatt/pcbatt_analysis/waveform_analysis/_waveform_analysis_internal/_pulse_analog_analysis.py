@@ -21,6 +21,10 @@ from nipcbatt.pcbatt_analysis.analysis_library_exceptions import (
 from nipcbatt.pcbatt_analysis.analysis_library_messages import (
     AnalysisLibraryExceptionMessage,
 )
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._waveform_samples import (
+    labview_as_native_samples_impl,
+    numpy_as_analysis_samples_impl,
+)
 
 
 def labview_get_last_error_message_impl() -> str:
@@ -40,25 +44,23 @@ def labview_get_last_error_message_impl() -> str:
     # size_t output_error_message_length)
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_GetLastErrorMessage.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_GetLastErrorMessage",
+            restype=c_int,
+            argtypes=[
+                # char* output_error_message
+                c_char_p,
+                # size_t output_error_message_length
+                c_size_t,
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_GetLastErrorMessage.argtypes = [
-            # char* output_error_message
-            c_char_p,
-            # size_t output_error_message_length
-            c_size_t,
-        ]
 
         string_buffer_length = 1024
         string_buffer = create_string_buffer(string_buffer_length)
 
         # call native code
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_GetLastErrorMessage(
-            string_buffer, c_size_t(string_buffer_length)
-        )
+        res_status = native_function(string_buffer, c_size_t(string_buffer_length))
 
         if res_status != 0:
             raise PCBATTAnalysisCallNativeLibraryFailedException(
@@ -146,43 +148,43 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_absolute_expor
     # double* outputActualReferenceLevelLow);
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels_ExportAll.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels_ExportAll",
+            restype=c_int,
+            argtypes=[
+                # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
+                c_int,
+                # double inputWaveformSamplingPeriod
+                c_double,
+                # size_t inputWaveformSamplesArrayLength
+                c_size_t,
+                # int inputPulseNumber
+                c_int,
+                # const double* inputWaveformSamplesArray
+                POINTER(c_double),
+                # double inputReferenceLevelHigh
+                c_double,
+                # double outputActualReferenceLevelMiddle
+                c_double,
+                # double inputReferenceLevelLow
+                c_double,
+                # double* outputProcessedPulseCenter,
+                POINTER(c_double),
+                # double* outputProcessedPulseDuration,
+                POINTER(c_double),
+                # double* outputProcessedPeriod,
+                POINTER(c_double),
+                # double* outputProcessedDutyCycle,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelHigh,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelMiddle,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelLow
+                POINTER(c_double),
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels_ExportAll.argtypes = [
-            # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
-            c_int,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # int inputPulseNumber
-            c_int,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double inputReferenceLevelHigh
-            c_double,
-            # double outputActualReferenceLevelMiddle
-            c_double,
-            # double inputReferenceLevelLow
-            c_double,
-            # double* outputProcessedPulseCenter,
-            POINTER(c_double),
-            # double* outputProcessedPulseDuration,
-            POINTER(c_double),
-            # double* outputProcessedPeriod,
-            POINTER(c_double),
-            # double* outputProcessedDutyCycle,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelHigh,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelMiddle,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelLow
-            POINTER(c_double),
-        ]
 
         # call native code
         output_processed_pulse_center = c_double()
@@ -195,6 +197,8 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_absolute_expor
 
         input_waveform_sampling_period = c_double(waveform_sampling_period_seconds)
         input_waveform_length = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         input_waveform_samples_array = waveform_samples.ctypes.data_as(POINTER(c_double))
         input_pulse_measurement_polarity = c_int(processing_polarity)
         input_pulse_number = c_int(pulse_number)
@@ -202,7 +206,7 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_absolute_expor
         input_reference_level_middle = c_double(reference_levels.reference_level_middle)
         input_reference_level_low = c_double(reference_levels.reference_level_low)
 
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels_ExportAll(
+        res_status = native_function(
             input_pulse_measurement_polarity,
             input_waveform_sampling_period,
             input_waveform_length,
@@ -284,47 +288,47 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
     # double* outputActualReferenceLevelLow);
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels_ExportAll.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels_ExportAll",
+            restype=c_int,
+            argtypes=[
+                # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod
+                c_int,
+                # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
+                c_int,
+                # double inputWaveformSamplingPeriod
+                c_double,
+                # size_t inputWaveformSamplesArrayLength
+                c_size_t,
+                # int inputPulseNumber
+                c_int,
+                # int inputHistogramSize,
+                c_int,
+                # const double* inputWaveformSamplesArray
+                POINTER(c_double),
+                # double inputReferenceLevelHigh
+                c_double,
+                # double outputActualReferenceLevelMiddle
+                c_double,
+                # double inputReferenceLevelLow
+                c_double,
+                # double* outputProcessedPulseCenter,
+                POINTER(c_double),
+                # double* outputProcessedPulseDuration,
+                POINTER(c_double),
+                # double* outputProcessedPeriod,
+                POINTER(c_double),
+                # double* outputProcessedDutyCycle,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelHigh,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelMiddle,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelLow
+                POINTER(c_double),
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels_ExportAll.argtypes = [
-            # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod
-            c_int,
-            # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
-            c_int,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # int inputPulseNumber
-            c_int,
-            # int inputHistogramSize,
-            c_int,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double inputReferenceLevelHigh
-            c_double,
-            # double outputActualReferenceLevelMiddle
-            c_double,
-            # double inputReferenceLevelLow
-            c_double,
-            # double* outputProcessedPulseCenter,
-            POINTER(c_double),
-            # double* outputProcessedPulseDuration,
-            POINTER(c_double),
-            # double* outputProcessedPeriod,
-            POINTER(c_double),
-            # double* outputProcessedDutyCycle,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelHigh,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelMiddle,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelLow
-            POINTER(c_double),
-        ]
 
         # call native code
         output_processed_pulse_center = c_double()
@@ -337,6 +341,8 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
 
         input_waveform_sampling_period = c_double(waveform_sampling_period_seconds)
         input_waveform_length = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         input_waveform_samples_array = waveform_samples.ctypes.data_as(POINTER(c_double))
         input_amplitude_and_levels_processing_method = c_int(amplitude_and_levels_processing_method)
         input_histogram_size = c_int(amplitude_and_levels_processing_histogram_size)
@@ -346,7 +352,7 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
         input_reference_level_middle = c_double(reference_levels.reference_level_middle)
         input_reference_level_low = c_double(reference_levels.reference_level_low)
 
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels_ExportAll(
+        res_status = native_function(
             input_amplitude_and_levels_processing_method,
             input_pulse_measurement_polarity,
             input_waveform_sampling_period,
@@ -424,39 +430,39 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_absolute_expor
     # double* outputActualReferenceLevelLow);
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels",
+            restype=c_int,
+            argtypes=[
+                # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
+                c_int,
+                # double inputWaveformSamplingPeriod
+                c_double,
+                # size_t inputWaveformSamplesArrayLength
+                c_size_t,
+                # int inputPulseNumber
+                c_int,
+                # const double* inputWaveformSamplesArray
+                POINTER(c_double),
+                # double inputReferenceLevelHigh
+                c_double,
+                # double outputActualReferenceLevelMiddle
+                c_double,
+                # double inputReferenceLevelLow
+                c_double,
+                # double* outputProcessedPulseCenter,
+                POINTER(c_double),
+                # double* outputProcessedPulseDuration,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelHigh,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelMiddle,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelLow
+                POINTER(c_double),
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels.argtypes = [
-            # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
-            c_int,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # int inputPulseNumber
-            c_int,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double inputReferenceLevelHigh
-            c_double,
-            # double outputActualReferenceLevelMiddle
-            c_double,
-            # double inputReferenceLevelLow
-            c_double,
-            # double* outputProcessedPulseCenter,
-            POINTER(c_double),
-            # double* outputProcessedPulseDuration,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelHigh,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelMiddle,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelLow
-            POINTER(c_double),
-        ]
 
         # call native code
         output_processed_pulse_center = c_double()
@@ -467,6 +473,8 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_absolute_expor
 
         input_waveform_sampling_period = c_double(waveform_sampling_period_seconds)
         input_waveform_length = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         input_waveform_samples_array = waveform_samples.ctypes.data_as(POINTER(c_double))
         input_pulse_measurement_polarity = c_int(processing_polarity)
         input_pulse_number = c_int(pulse_number)
@@ -474,7 +482,7 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_absolute_expor
         input_reference_level_middle = c_double(reference_levels.reference_level_middle)
         input_reference_level_low = c_double(reference_levels.reference_level_low)
 
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Absolute_ReferenceLevels(
+        res_status = native_function(
             input_pulse_measurement_polarity,
             input_waveform_sampling_period,
             input_waveform_length,
@@ -550,43 +558,43 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
     # double* outputActualReferenceLevelLow);
 
     try:
-        dll_entries = analysis_library_interop.load_interop_api_library_entries()
-        # specify signature
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels.restype = (
-            c_int
+        # resolve native function and bind its signature (done once)
+        native_function = analysis_library_interop.get_interop_api_function(
+            function_name="NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels",
+            restype=c_int,
+            argtypes=[
+                # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod
+                c_int,
+                # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
+                c_int,
+                # double inputWaveformSamplingPeriod
+                c_double,
+                # size_t inputWaveformSamplesArrayLength
+                c_size_t,
+                # int inputPulseNumber
+                c_int,
+                # int inputHistogramSize,
+                c_int,
+                # const double* inputWaveformSamplesArray
+                POINTER(c_double),
+                # double inputReferenceLevelHigh
+                c_double,
+                # double outputActualReferenceLevelMiddle
+                c_double,
+                # double inputReferenceLevelLow
+                c_double,
+                # double* outputProcessedPulseCenter,
+                POINTER(c_double),
+                # double* outputProcessedPulseDuration,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelHigh,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelMiddle,
+                POINTER(c_double),
+                # double* outputActualReferenceLevelLow
+                POINTER(c_double),
+            ],
         )
-        dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels.argtypes = [
-            # AmplitudeAndLevelsProcessingMethodEnum inputAmplitudeAndLevelsProcessingMethod
-            c_int,
-            # PulseAnalogMeasurementPolarityEnum inputPulseMeasurementPolarity
-            c_int,
-            # double inputWaveformSamplingPeriod
-            c_double,
-            # size_t inputWaveformSamplesArrayLength
-            c_size_t,
-            # int inputPulseNumber
-            c_int,
-            # int inputHistogramSize,
-            c_int,
-            # const double* inputWaveformSamplesArray
-            POINTER(c_double),
-            # double inputReferenceLevelHigh
-            c_double,
-            # double outputActualReferenceLevelMiddle
-            c_double,
-            # double inputReferenceLevelLow
-            c_double,
-            # double* outputProcessedPulseCenter,
-            POINTER(c_double),
-            # double* outputProcessedPulseDuration,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelHigh,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelMiddle,
-            POINTER(c_double),
-            # double* outputActualReferenceLevelLow
-            POINTER(c_double),
-        ]
 
         # call native code
         output_processed_pulse_center = c_double()
@@ -597,6 +605,8 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
 
         input_waveform_sampling_period = c_double(waveform_sampling_period_seconds)
         input_waveform_length = c_size_t(waveform_samples.size)
+        # native code only accepts contiguous float64 samples
+        waveform_samples = labview_as_native_samples_impl(waveform_samples)
         input_waveform_samples_array = waveform_samples.ctypes.data_as(POINTER(c_double))
         input_amplitude_and_levels_processing_method = c_int(amplitude_and_levels_processing_method)
         input_histogram_size = c_int(amplitude_and_levels_processing_histogram_size)
@@ -606,7 +616,7 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
         input_reference_level_middle = c_double(reference_levels.reference_level_middle)
         input_reference_level_low = c_double(reference_levels.reference_level_low)
 
-        res_status = dll_entries.NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels(
+        res_status = native_function(
             input_amplitude_and_levels_processing_method,
             input_pulse_measurement_polarity,
             input_waveform_sampling_period,
@@ -644,3 +654,242 @@ def labview_process_single_waveform_pulse_measurements_ref_levels_relative_expor
             message=f"{AnalysisLibraryExceptionMessage.NATIVE_LIBRARY_FUNCTION_CALL_FAILED}:"
             + "NI_PCBATT_InteropApi_LabVIEW_Analysis_ProcessSingleWaveformPulseAnalogMeasurement_Relative_ReferenceLevels"
         ) from e
+
+
+def numpy_find_waveform_edges_impl(
+    waveform_samples: numpy.ndarray[numpy.float64],
+    reference_levels: TuplePulseReferenceLevels,
+) -> tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.bool_]]:
+    """Finds, in a single pass, all edges of a waveform and the dates at which they cross
+    the middle reference level.
+
+    A rising edge goes from below the low reference level to above the high reference level,
+    a falling edge goes the other way. Samples between low and high reference levels keep
+    the state of the previous samples (hysteresis), so noise around the middle reference level
+    does not produce extra edges. The middle reference level crossing of an edge is the last
+    one before the edge reaches its new state, it is linearly interpolated between samples.
+
+    Args:
+        waveform_samples (numpy.ndarray[numpy.float64]): samples of the waveform.
+        reference_levels (TuplePulseReferenceLevels): absolute reference levels.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.bool_]]: dates of edges,
+        expressed as fractional samples indexes, and True for rising edges, False for falling
+        edges, gathered in a tuple. Edges alternate between rising and falling.
+
+    Raises:
+        ValueError: occurs when middle reference level is not between low and high ones.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    if not (
+        reference_levels.reference_level_low
+        <= reference_levels.reference_level_middle
+        <= reference_levels.reference_level_high
+    ):
+        raise ValueError("Pulse reference levels must verify low <= middle <= high")
+
+    samples = numpy_as_analysis_samples_impl(waveform_samples)
+
+    # -1 below low reference level, 1 above high reference level, 0 in between
+    states = (samples > reference_levels.reference_level_high).astype(numpy.int8) - (
+        samples < reference_levels.reference_level_low
+    ).astype(numpy.int8)
+
+    settled_indexes = numpy.flatnonzero(states)
+    settled_states = states[settled_indexes]
+    transitions = numpy.flatnonzero(settled_states[1:] != settled_states[:-1])
+
+    # each edge ends at the first sample reaching the new state
+    edges_stops = settled_indexes[transitions + 1]
+    edges_are_rising = settled_states[transitions + 1] > 0
+
+    # last middle reference level crossing before the end of each edge,
+    # it lies after the last sample of previous state, so it goes the same way as the edge
+    samples_are_above_middle = samples > reference_levels.reference_level_middle
+    middle_crossings = numpy.flatnonzero(
+        samples_are_above_middle[1:] != samples_are_above_middle[:-1]
+    )
+    edges_crossings = middle_crossings[numpy.searchsorted(middle_crossings, edges_stops) - 1]
+
+    # edges are dated in float64, whatever the precision of samples
+    crossings_first_samples = samples[edges_crossings].astype(numpy.float64)
+    crossings_second_samples = samples[edges_crossings + 1].astype(numpy.float64)
+    edges_dates = edges_crossings + (
+        reference_levels.reference_level_middle - crossings_first_samples
+    ) / (crossings_second_samples - crossings_first_samples)
+
+    return (edges_dates, edges_are_rising)
+
+
+def numpy_process_waveform_pulses_impl(
+    waveform_samples: numpy.ndarray[numpy.float64],
+    waveform_sampling_period_seconds: float,
+    processing_polarity: int,
+    reference_levels: TuplePulseReferenceLevels,
+) -> tuple[
+    numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]
+]:
+    """Processes all pulses of a waveform using numpy, from the edges found in a single pass.
+
+    A pulse starts at a leading edge (rising when polarity is high, falling when it is low)
+    and stops at the next edge. Period of a pulse is the time between its leading edge
+    and the leading edge of the next pulse.
+
+    Args:
+        waveform_samples (numpy.ndarray[numpy.float64]): samples of the waveform.
+        waveform_sampling_period_seconds (float): sampling period of the waveform.
+        processing_polarity (int): 0 for low pulses, 1 for high pulses.
+        reference_levels (TuplePulseReferenceLevels): absolute reference levels.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64],
+        numpy.ndarray[numpy.float64]]: centers from first sample, durations and periods
+        of pulses, in pulses order, gathered in a tuple. Period of the last pulse is NaN
+        when the waveform stops before the leading edge of a next pulse.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    edges_dates, edges_are_rising = numpy_find_waveform_edges_impl(
+        waveform_samples, reference_levels
+    )
+
+    # edges alternate, pulses start at the first leading edge
+    edges_are_leading = edges_are_rising if processing_polarity == 1 else ~edges_are_rising
+    first_leading_edge = (
+        numpy.argmax(edges_are_leading) if edges_are_leading.any() else edges_are_leading.size
+    )
+    edges_dates = edges_dates[first_leading_edge:] * waveform_sampling_period_seconds
+    pulses_count = edges_dates.size // 2
+
+    leading_edges_dates = edges_dates[0 : 2 * pulses_count : 2]
+    trailing_edges_dates = edges_dates[1 : 2 * pulses_count : 2]
+    next_leading_edges_dates = edges_dates[2::2]
+
+    periods = numpy.full(pulses_count, numpy.nan)
+    periods[: next_leading_edges_dates.size] = (
+        next_leading_edges_dates - leading_edges_dates[: next_leading_edges_dates.size]
+    )
+
+    return (
+        (leading_edges_dates + trailing_edges_dates) / 2,
+        trailing_edges_dates - leading_edges_dates,
+        periods,
+    )
+
+
+def numpy_process_waveforms_pulse_measurements_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    waveforms_sampling_period_seconds: float,
+    pulse_number: int,
+    processing_polarity: int,
+    reference_levels_high: numpy.ndarray[numpy.float64],
+    reference_levels_middle: numpy.ndarray[numpy.float64],
+    reference_levels_low: numpy.ndarray[numpy.float64],
+    periodicity_is_required: bool,
+) -> tuple[
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+    numpy.ndarray[numpy.float64],
+]:
+    """Processes pulse `pulse_number` of each waveform of a 2-D block of samples
+    (one waveform per row) using numpy, each waveform is processed in a single pass.
+
+    Args:
+        waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+        waveforms_sampling_period_seconds (float): common sampling period of all waveforms.
+        pulse_number (int): index of the pulse that will be processed (starts from 1).
+        processing_polarity (int): 0 for low pulses, 1 for high pulses.
+        reference_levels_high (numpy.ndarray[numpy.float64]): absolute high reference level
+        of each waveform.
+        reference_levels_middle (numpy.ndarray[numpy.float64]): absolute middle reference level
+        of each waveform.
+        reference_levels_low (numpy.ndarray[numpy.float64]): absolute low reference level
+        of each waveform.
+        periodicity_is_required (bool): True when only pulses followed by the leading edge
+        of a next pulse are counted, so that their period is known.
+
+    Returns:
+        tuple[numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64],
+        numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]]: pulse centers from first
+        sample, pulse durations, periods and duty cycles (one per waveform), gathered in a tuple.
+        Values are NaN for waveforms without the requested pulse.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    waveforms_count = samples.shape[0]
+
+    pulse_centers = numpy.full(waveforms_count, numpy.nan)
+    pulse_durations = numpy.full(waveforms_count, numpy.nan)
+    periods = numpy.full(waveforms_count, numpy.nan)
+
+    for waveform_index in range(waveforms_count):
+        waveform_pulse_centers, waveform_pulse_durations, waveform_periods = (
+            numpy_process_waveform_pulses_impl(
+                samples[waveform_index],
+                waveforms_sampling_period_seconds,
+                processing_polarity,
+                TuplePulseReferenceLevels(
+                    reference_level_high=reference_levels_high[waveform_index],
+                    reference_level_middle=reference_levels_middle[waveform_index],
+                    reference_level_low=reference_levels_low[waveform_index],
+                ),
+            )
+        )
+
+        pulses_count = (
+            numpy.count_nonzero(~numpy.isnan(waveform_periods))
+            if periodicity_is_required
+            else waveform_pulse_centers.size
+        )
+        if pulse_number <= pulses_count:
+            pulse_centers[waveform_index] = waveform_pulse_centers[pulse_number - 1]
+            pulse_durations[waveform_index] = waveform_pulse_durations[pulse_number - 1]
+            periods[waveform_index] = waveform_periods[pulse_number - 1]
+
+    return (pulse_centers, pulse_durations, periods, pulse_durations / periods)
+
+
+def numpy_resolve_percent_reference_levels_impl(
+    reference_level_percent: float,
+    high_state_levels: numpy.ndarray[numpy.float64],
+    low_state_levels: numpy.ndarray[numpy.float64],
+) -> numpy.ndarray[numpy.float64]:
+    """Resolves a reference level expressed as percentage of the amplitude of waveforms
+    to absolute levels, 0% being the low state level and 100% the high state level."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    return low_state_levels + (reference_level_percent / 100) * (
+        high_state_levels - low_state_levels
+    )
+
+
+def numpy_count_waveforms_leading_edges_impl(
+    waveforms_samples: numpy.ndarray[numpy.float64],
+    processing_polarity: int,
+    reference_levels_high: numpy.ndarray[numpy.float64],
+    reference_levels_low: numpy.ndarray[numpy.float64],
+) -> numpy.ndarray[numpy.int64]:
+    """Counts leading edges of each waveform of a 2-D block of samples (one waveform per row),
+    with the hysteresis used to find edges, but without dating them.
+
+    Args:
+        waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+        processing_polarity (int): 0 to count falling edges, 1 to count rising edges.
+        reference_levels_high (numpy.ndarray[numpy.float64]): absolute high reference level
+        of each waveform.
+        reference_levels_low (numpy.ndarray[numpy.float64]): absolute low reference level
+        of each waveform.
+
+    Returns:
+        numpy.ndarray[numpy.int64]: leading edges count of each waveform.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.atleast_2d(numpy_as_analysis_samples_impl(waveforms_samples))
+    leading_edges_counts = numpy.zeros(samples.shape[0], dtype=numpy.int64)
+    leading_state = 1 if processing_polarity == 1 else -1
+
+    for waveform_index, waveform_samples in enumerate(samples):
+        states = (waveform_samples > reference_levels_high[waveform_index]).astype(numpy.int8) - (
+            waveform_samples < reference_levels_low[waveform_index]
+        ).astype(numpy.int8)
+        settled_states = states[states != 0]
+        leading_edges_counts[waveform_index] = numpy.count_nonzero(
+            (settled_states[1:] == leading_state) & (settled_states[:-1] == -leading_state)
+        )
+
+    return leading_edges_counts
@@ -0,0 +1,62 @@
+"""Private module that provides helper functions used to get samples
+   of waveforms in a type suitable for numpy analysis."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+import numpy
+import scipy.fft
+
+# Types of samples processed natively by numpy analysis,
+# samples of other types are converted to numpy.float64.
+ANALYSIS_SAMPLES_TYPES = (numpy.float32, numpy.float64)
+
+
+def numpy_as_analysis_samples_impl(waveforms_samples: numpy.ndarray) -> numpy.ndarray:
+    """Gets samples of waveforms as an array of float32 or float64 samples, without copy
+    when samples are already of one of these types.
+
+    Samples of float32 waveforms are kept in float32 so that numpy analysis uses half
+    of the memory and memory bandwidth it uses for float64 waveforms.
+
+    Args:
+        waveforms_samples (numpy.ndarray): samples of one or several waveforms.
+
+    Returns:
+        numpy.ndarray: samples of waveforms, float32 or float64.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples = numpy.asarray(waveforms_samples)
+    if samples.dtype in ANALYSIS_SAMPLES_TYPES:
+        return samples
+
+    return samples.astype(numpy.float64)
+
+
+def labview_as_native_samples_impl(waveform_samples: numpy.ndarray) -> numpy.ndarray:
+    """Gets samples of a waveform as a contiguous array of float64 samples, the only samples
+    type accepted by native analysis functions, without copy when samples already are.
+
+    Args:
+        waveform_samples (numpy.ndarray): samples of a waveform.
+
+    Returns:
+        numpy.ndarray: contiguous float64 samples of the waveform.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    return numpy.ascontiguousarray(waveform_samples, dtype=numpy.float64)
+
+
+def numpy_rfft_impl(samples: numpy.ndarray, axis: int = -1) -> numpy.ndarray:
+    """Computes the real FFT of float32 or float64 samples in the precision of samples.
+
+    float32 samples are transformed in single precision by `scipy.fft`, since `numpy.fft`
+    always computes in double precision, float64 samples are still transformed by `numpy.fft`
+    so that results of float64 waveforms are unchanged.
+
+    Args:
+        samples (numpy.ndarray): samples to transform, float32 or float64.
+        axis (int, optional): axis over which the FFT is computed. Defaults to -1.
+
+    Returns:
+        numpy.ndarray: complex64 spectrum of float32 samples, complex128 otherwise.
+    """
+    if samples.dtype == numpy.float32:
+        return scipy.fft.rfft(samples, axis=axis)
+
+    return numpy.fft.rfft(samples, axis=axis)
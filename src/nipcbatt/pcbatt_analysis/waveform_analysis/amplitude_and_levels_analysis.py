@@ -1,7 +1,7 @@
 """Provides Amplitude And Levels analysis tools"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
 
 from enum import IntEnum
-from typing import Iterable
+from typing import Iterable, Optional
 
 import numpy
 from varname import nameof
@@ -74,9 +74,199 @@ class AmplitudeAndLevelsProcessingMethod(IntEnum):
     it is a combination of histogram and peak strategies."""
 
 
+class AmplitudeAndLevelsProcessingBackend(IntEnum):
+    """Defines the backend used to perform amplitude and levels processing."""
+
+    LABVIEW = 0
+    """Amplitude and levels are processed by LabVIEW Amplitude and Levels VI
+    through native library (Windows only)."""
+
+    NUMPY = 1
+    """Amplitude and levels are processed by numpy, available on all platforms."""
+
+
+class AmplitudeAndLevelsWaveformsHistograms(AnalysisLibraryElement):
+    """Defines histograms of several waveforms built by amplitude and levels processing,
+    one histogram per waveform, spanning minimum to maximum of the waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        bins_counts: numpy.ndarray[numpy.int64],
+        bins_sums: numpy.ndarray[numpy.float64],
+        minimums: numpy.ndarray[numpy.float64],
+        maximums: numpy.ndarray[numpy.float64],
+    ) -> None:
+        """Initialize an instance of histograms of several waveforms.
+
+        Args:
+            bins_counts (numpy.ndarray[numpy.int64]): samples count of each bin,
+                one row per waveform.
+            bins_sums (numpy.ndarray[numpy.float64]): sum of the samples of each bin,
+                one row per waveform.
+            minimums (numpy.ndarray[numpy.float64]): minimum of each waveform.
+            maximums (numpy.ndarray[numpy.float64]): maximum of each waveform.
+        """
+        self._bins_counts = bins_counts
+        self._bins_sums = bins_sums
+        self._minimums = minimums
+        self._maximums = maximums
+
+    @property
+    def bins_counts(self) -> numpy.ndarray[numpy.int64]:
+        """Gets samples count of each bin of histograms.
+
+        Returns:
+            numpy.ndarray[numpy.int64]: 2-D array of bins counts, one row per waveform.
+        """
+        return self._bins_counts
+
+    @property
+    def bins_sums(self) -> numpy.ndarray[numpy.float64]:
+        """Gets sum of the samples of each bin of histograms.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 2-D array of bins sums, one row per waveform.
+        """
+        return self._bins_sums
+
+    @property
+    def minimums(self) -> numpy.ndarray[numpy.float64]:
+        """Gets minimum of each waveform, lower edge of the first bin of its histogram.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: minimums, one per waveform.
+        """
+        return self._minimums
+
+    @property
+    def maximums(self) -> numpy.ndarray[numpy.float64]:
+        """Gets maximum of each waveform, upper edge of the last bin of its histogram.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: maximums, one per waveform.
+        """
+        return self._maximums
+
+    @property
+    def histogram_size(self) -> int:
+        """Gets the number of bins of each histogram.
+
+        Returns:
+            int: histogram bins count.
+        """
+        return self._bins_counts.shape[1]
+
+
+class AmplitudeAndLevelsMultipleWaveformsProcessingResult(AnalysisLibraryElement):
+    """Defines Amplitude and Levels processing results of several waveforms,
+    one value per waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        amplitudes: numpy.ndarray[numpy.float64],
+        high_state_levels: numpy.ndarray[numpy.float64],
+        low_state_levels: numpy.ndarray[numpy.float64],
+        histograms: AmplitudeAndLevelsWaveformsHistograms = None,
+    ) -> None:
+        """Initialize an instance of Amplitude and Levels processing result of several waveforms.
+
+        Args:
+            amplitudes (numpy.ndarray[numpy.float64]): Amplitude values obtained after processing waveforms.
+            high_state_levels (numpy.ndarray[numpy.float64]): High state levels obtained after processing waveforms.
+            low_state_levels (numpy.ndarray[numpy.float64]): Low state levels obtained after processing waveforms.
+            histograms (AmplitudeAndLevelsWaveformsHistograms, optional): Histograms of waveforms
+                built by processing, None when not available. Defaults to None.
+        """  # noqa: W505 - doc line too long (116 > 100 characters) (auto-generated noqa)
+        self._amplitudes = amplitudes
+        self._high_state_levels = high_state_levels
+        self._low_state_levels = low_state_levels
+        self._histograms = histograms
+
+    @property
+    def amplitudes(self) -> numpy.ndarray[numpy.float64]:
+        """Gets amplitude values obtained after processing waveforms.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: amplitude values, one per waveform.
+        """
+        return self._amplitudes
+
+    @property
+    def high_state_levels(self) -> numpy.ndarray[numpy.float64]:
+        """Gets high state levels obtained after processing waveforms.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: high state levels, one per waveform.
+        """
+        return self._high_state_levels
+
+    @property
+    def low_state_levels(self) -> numpy.ndarray[numpy.float64]:
+        """Gets low state levels obtained after processing waveforms.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: low state levels, one per waveform.
+        """
+        return self._low_state_levels
+
+    @property
+    def histograms(self) -> Optional[AmplitudeAndLevelsWaveformsHistograms]:
+        """Gets histograms of waveforms built by processing, they are only available
+        when numpy backend processed waveforms with histogram or auto select methods.
+
+        Returns:
+            Optional[AmplitudeAndLevelsWaveformsHistograms]: histograms of waveforms, can be None.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._histograms
+
+    def results_per_waveform(self) -> Iterable[AmplitudeAndLevelsProcessingResult]:
+        """Gets an iterable of Amplitude and Levels processing results, one per waveform.
+
+        Returns:
+            Iterable[AmplitudeAndLevelsProcessingResult]: processing result of each waveform.
+        """
+        for amplitude, high_state_level, low_state_level in zip(
+            self._amplitudes, self._high_state_levels, self._low_state_levels
+        ):
+            yield AmplitudeAndLevelsProcessingResult(
+                float(amplitude), float(high_state_level), float(low_state_level)
+            )
+
+
 class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
     """Provides Amplitude and Levels processing based on LabVIEW Amplitude and Levels VI"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (202 > 100 characters) (auto-generated noqa)
 
+    _default_processing_backend = AmplitudeAndLevelsProcessingBackend.LABVIEW
+
+    @staticmethod
+    def get_default_processing_backend() -> AmplitudeAndLevelsProcessingBackend:
+        """Gets the backend used by amplitude and levels processing when no backend
+        is given per call.
+
+        Returns:
+            AmplitudeAndLevelsProcessingBackend: default amplitude and levels processing backend.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return LabViewAmplitudeAndLevels._default_processing_backend
+
+    @staticmethod
+    def set_default_processing_backend(
+        amplitude_and_levels_processing_backend: AmplitudeAndLevelsProcessingBackend,
+    ):
+        """Sets the backend used by amplitude and levels processing when no backend
+        is given per call.
+
+        Args:
+            amplitude_and_levels_processing_backend (AmplitudeAndLevelsProcessingBackend):
+                default amplitude and levels processing backend.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none(
+            amplitude_and_levels_processing_backend,
+            nameof(amplitude_and_levels_processing_backend),
+        )
+        LabViewAmplitudeAndLevels._default_processing_backend = AmplitudeAndLevelsProcessingBackend(
+            amplitude_and_levels_processing_backend
+        )
+
     @staticmethod
     def get_last_error_message() -> str:
         """Gets the message content of the last occurred error of
@@ -93,6 +283,7 @@ class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
         waveform_sampling_period_seconds: float,
         amplitude_and_levels_processing_method: AmplitudeAndLevelsProcessingMethod,
         histogram_size: int,
+        amplitude_and_levels_processing_backend: AmplitudeAndLevelsProcessingBackend = None,
     ) -> AmplitudeAndLevelsProcessingResult:
         """Processes amplitude and levels of a given waveform samples using LabVIEW VI
 
@@ -103,6 +294,9 @@ class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
                 amplitude and levels processing method.
             histogram_size (int):
                 histogram bins count that will be used when labview decides to use histogram method.
+            amplitude_and_levels_processing_backend (AmplitudeAndLevelsProcessingBackend, optional):
+                amplitude and levels processing backend, when None the default processing backend
+                is used. Defaults to None.
 
         Raises:
             PCBATTAnalysisException:
@@ -119,7 +313,25 @@ class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
             waveform_sampling_period_seconds, nameof(waveform_sampling_period_seconds)
         )
         Guard.is_greater_than_zero(histogram_size, nameof(histogram_size))
+
+        if amplitude_and_levels_processing_backend is None:
+            amplitude_and_levels_processing_backend = (
+                LabViewAmplitudeAndLevels._default_processing_backend
+            )
+
         try:
+            if amplitude_and_levels_processing_backend == AmplitudeAndLevelsProcessingBackend.NUMPY:
+                amplitudes, high_state_levels, low_state_levels, _ = (
+                    _amplitude_and_levels_analysis.numpy_process_waveforms_amplitude_and_levels_impl(
+                        waveform_samples,
+                        amplitude_and_levels_processing_method,
+                        histogram_size,
+                    )
+                )
+                return AmplitudeAndLevelsProcessingResult(
+                    float(amplitudes[0]), float(high_state_levels[0]), float(low_state_levels[0])
+                )
+
             tuple_result = _amplitude_and_levels_analysis.labview_process_single_waveform_amplitude_and_levels_impl(
                 waveform_samples,
                 waveform_sampling_period_seconds,
@@ -142,6 +354,7 @@ class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
         waveforms_sampling_period_seconds: float,
         amplitude_and_levels_processing_method: AmplitudeAndLevelsProcessingMethod,
         histogram_size: int,
+        amplitude_and_levels_processing_backend: AmplitudeAndLevelsProcessingBackend = None,
     ) -> Iterable[AmplitudeAndLevelsProcessingResult]:
         """Processes amplitude and levels of given waveforms samples provided as iterable object using LabVIEW VI
 
@@ -150,6 +363,9 @@ class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
             waveforms_sampling_period_seconds (float): common sampling rate of all waveforms.
             amplitude_and_levels_processing_method (AmplitudeAndLevelsProcessingMethod): amplitude and levels processing method.
             histogram_size (int): histogram bins count that will be used when labview decides to use histogram method.
+            amplitude_and_levels_processing_backend (AmplitudeAndLevelsProcessingBackend, optional):
+                amplitude and levels processing backend, when None the default processing backend
+                is used. Defaults to None.
 
         Raises:
             PCBATTAnalysisException:
@@ -175,4 +391,87 @@ class LabViewAmplitudeAndLevels(AnalysisLibraryElement):
                 waveforms_sampling_period_seconds,
                 amplitude_and_levels_processing_method,
                 histogram_size,
+                amplitude_and_levels_processing_backend,
+            )
+
+    @staticmethod
+    def process_multiple_waveforms_block_amplitude_and_levels(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        amplitude_and_levels_processing_method: AmplitudeAndLevelsProcessingMethod,
+        histogram_size: int,
+        amplitude_and_levels_processing_backend: AmplitudeAndLevelsProcessingBackend = None,
+        workers_count: int = 1,
+    ) -> AmplitudeAndLevelsMultipleWaveformsProcessingResult:
+        """Processes amplitude and levels of all waveforms of a 2-D block of samples
+        (one waveform per row), such as the samples of a `MeasurementData`, in a single call.
+
+        Args:
+            waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (float): common sampling rate of all waveforms.
+            amplitude_and_levels_processing_method (AmplitudeAndLevelsProcessingMethod): amplitude and levels processing method.
+            histogram_size (int): histogram bins count that will be used when labview decides to use histogram method.
+            amplitude_and_levels_processing_backend (AmplitudeAndLevelsProcessingBackend, optional):
+                amplitude and levels processing backend, when None the default processing backend
+                is used. Defaults to None.
+            workers_count (int, optional): number of threads sharing the waveforms when
+            LabVIEW backend is used, results are identical whatever the value. Defaults to 1.
+
+        Raises:
+            PCBATTAnalysisException:
+                Occurs when amplitude and levels processing fails for some reason.
+
+        Returns:
+            AmplitudeAndLevelsMultipleWaveformsProcessingResult: An object that holds amplitudes,
+            high state levels and low state levels of all waveforms, in rows order,
+            and histograms of waveforms when numpy backend built them.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (128 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_greater_than_zero(histogram_size, nameof(histogram_size))
+        Guard.is_greater_than_zero(workers_count, nameof(workers_count))
+
+        if amplitude_and_levels_processing_backend is None:
+            amplitude_and_levels_processing_backend = (
+                LabViewAmplitudeAndLevels._default_processing_backend
+            )
+
+        try:
+            if amplitude_and_levels_processing_backend == AmplitudeAndLevelsProcessingBackend.NUMPY:
+                amplitudes, high_state_levels, low_state_levels, histograms = (
+                    _amplitude_and_levels_analysis.numpy_process_waveforms_amplitude_and_levels_impl(
+                        waveforms_samples,
+                        amplitude_and_levels_processing_method,
+                        histogram_size,
+                    )
+                )
+                return AmplitudeAndLevelsMultipleWaveformsProcessingResult(
+                    amplitudes,
+                    high_state_levels,
+                    low_state_levels,
+                    (
+                        None
+                        if histograms is None
+                        else AmplitudeAndLevelsWaveformsHistograms(*histograms)
+                    ),
+                )
+
+            tuple_result = _amplitude_and_levels_analysis.labview_process_multiple_waveforms_amplitude_and_levels_impl(
+                waveforms_samples,
+                waveforms_sampling_period_seconds,
+                amplitude_and_levels_processing_method,
+                histogram_size,
+                workers_count,
+            )
+
+            # Build object from tuple
+            return AmplitudeAndLevelsMultipleWaveformsProcessingResult(
+                tuple_result[0], tuple_result[1], tuple_result[2]
             )
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.AMPLITUDE_AND_LEVELS_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
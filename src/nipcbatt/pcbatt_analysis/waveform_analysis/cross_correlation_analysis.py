@@ -0,0 +1,203 @@
+"""Provides cross-correlation analysis tools, used to measure latency between waveforms"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_analysis.analysis_library_exceptions import PCBATTAnalysisException
+from nipcbatt.pcbatt_analysis.analysis_library_messages import (
+    AnalysisLibraryExceptionMessage,
+)
+from nipcbatt.pcbatt_analysis.common.base_types import AnalysisLibraryElement
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal import (
+    _cross_correlation_analysis,
+)
+from nipcbatt.pcbatt_utilities.guard_utilities import Guard
+
+
+class CrossCorrelationMultipleWaveformsProcessingResult(AnalysisLibraryElement):
+    """Defines cross-correlation processing results of several waveforms relative to
+    a reference waveform, one lag per waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        reference_waveform_index: int,
+        lags_samples_counts: numpy.ndarray[numpy.int64],
+        lags_seconds: numpy.ndarray[numpy.float64],
+        correlation_coefficients: numpy.ndarray[numpy.float64],
+    ) -> None:
+        """Initialize an instance of `CrossCorrelationMultipleWaveformsProcessingResult`.
+
+        Args:
+            reference_waveform_index (`int`): row of the reference waveform in processed block.
+            lags_samples_counts (`numpy.ndarray[numpy.int64]`): lags of waveforms, in samples.
+            lags_seconds (`numpy.ndarray[numpy.float64]`): lags of waveforms, in seconds.
+            correlation_coefficients (`numpy.ndarray[numpy.float64]`): normalized
+            cross-correlation coefficients of waveforms with the reference at their lags.
+
+        Raises:
+            ValueError: Occurs when input arrays are none.
+        """
+        Guard.is_not_none(lags_samples_counts, nameof(lags_samples_counts))
+        Guard.is_not_none(lags_seconds, nameof(lags_seconds))
+        Guard.is_not_none(correlation_coefficients, nameof(correlation_coefficients))
+
+        self._reference_waveform_index = reference_waveform_index
+        self._lags_samples_counts = lags_samples_counts
+        self._lags_seconds = lags_seconds
+        self._correlation_coefficients = correlation_coefficients
+
+    @property
+    def reference_waveform_index(self) -> int:
+        """Gets the row of the reference waveform in processed block.
+
+        Returns:
+            int: reference waveform index.
+        """
+        return self._reference_waveform_index
+
+    @property
+    def lags_samples_counts(self) -> numpy.ndarray[numpy.int64]:
+        """Gets lags of waveforms relative to the reference waveform, in samples,
+        positive when the waveform is delayed relative to the reference.
+
+        Returns:
+            numpy.ndarray[numpy.int64]: lags, one per waveform.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._lags_samples_counts
+
+    @property
+    def lags_seconds(self) -> numpy.ndarray[numpy.float64]:
+        """Gets lags of waveforms relative to the reference waveform, in seconds,
+        positive when the waveform is delayed relative to the reference.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: lags, one per waveform.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._lags_seconds
+
+    @property
+    def correlation_coefficients(self) -> numpy.ndarray[numpy.float64]:
+        """Gets normalized cross-correlation coefficients of waveforms with the reference
+        waveform at their lags, 1.0 when a waveform is a delayed and scaled reference.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: coefficients in [-1, 1], one per waveform.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._correlation_coefficients
+
+
+class WaveformsCrossCorrelation(AnalysisLibraryElement):
+    """Defines cross-correlation functions used to measure latency between waveforms,
+    such as the delay between a stimulus and its responses, and to align them."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    @staticmethod
+    def process_multiple_waveforms_block_lags(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        reference_waveform_index: int = 0,
+        max_lag_seconds: float = None,
+    ) -> CrossCorrelationMultipleWaveformsProcessingResult:
+        """Processes the lag of all waveforms of a 2-D block of samples (one waveform per row)
+        relative to the reference waveform of the block, from their cross-correlations.
+
+        Cross-correlations of all (reference, waveform) pairs are computed by one batched FFT,
+        in O(N.log(N)). Samples of `AnalogWaveform` instances acquired by one measurement
+        can be stacked with `numpy.stack`.
+
+        Args:
+            waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (`float`): common sampling period of all waveforms.
+            reference_waveform_index (`int`, optional): row of the reference waveform,
+            such as the stimulus, in `waveforms_samples`. Defaults to 0.
+            max_lag_seconds (`float`, optional): largest absolute lag searched, in seconds,
+            when None all lags are searched. Defaults to None.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid.
+            PCBATTAnalysisException:
+                Occurs when cross-correlation processing fails for some reason.
+
+        Returns:
+            CrossCorrelationMultipleWaveformsProcessingResult: lag and correlation coefficient
+            of each waveform, the reference waveform included.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_within_limits_included(
+            reference_waveform_index,
+            0,
+            numpy.atleast_2d(waveforms_samples).shape[0] - 1,
+            nameof(reference_waveform_index),
+        )
+        if max_lag_seconds is not None:
+            Guard.is_greater_than_or_equal_to_zero(max_lag_seconds, nameof(max_lag_seconds))
+
+        try:
+            lags, coefficients = (
+                _cross_correlation_analysis.numpy_process_waveforms_cross_correlation_lags_impl(
+                    waveforms_samples,
+                    reference_waveform_index,
+                    (
+                        None
+                        if max_lag_seconds is None
+                        else int(round(max_lag_seconds / waveforms_sampling_period_seconds))
+                    ),
+                )
+            )
+
+            return CrossCorrelationMultipleWaveformsProcessingResult(
+                reference_waveform_index=reference_waveform_index,
+                lags_samples_counts=lags,
+                lags_seconds=lags * waveforms_sampling_period_seconds,
+                correlation_coefficients=coefficients,
+            )
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.CROSS_CORRELATION_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
+    @staticmethod
+    def get_aligned_waveforms_block_views(
+        waveforms_samples: numpy.ndarray,
+        lags_samples_counts: numpy.ndarray[numpy.int64],
+    ) -> list[numpy.ndarray]:
+        """Gets views, without copy, of all waveforms of a 2-D block of samples shifted by
+        their lags, so that samples of same index in all views are aligned in time.
+
+        Views are restricted to the samples range shared by all shifted waveforms and have
+        the same length.
+
+        Args:
+            waveforms_samples (`numpy.ndarray`): 2-D array of waveforms samples.
+            lags_samples_counts (`numpy.ndarray[numpy.int64]`): lag of each waveform in samples,
+            such as `CrossCorrelationMultipleWaveformsProcessingResult.lags_samples_counts`.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid,
+                or when shifted waveforms do not overlap.
+
+        Returns:
+            list[numpy.ndarray]: aligned views, one per waveform, in rows order.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_none(lags_samples_counts, nameof(lags_samples_counts))
+        Guard.have_same_size(
+            first_iterable_instance=numpy.atleast_2d(waveforms_samples),
+            first_iterable_name=nameof(waveforms_samples),
+            second_iterable_instance=lags_samples_counts,
+            second_iterable_name=nameof(lags_samples_counts),
+        )
+
+        aligned_views = _cross_correlation_analysis.numpy_get_aligned_waveforms_views_impl(
+            waveforms_samples, lags_samples_counts
+        )
+        if aligned_views[0].size == 0:
+            raise ValueError(AnalysisLibraryExceptionMessage.ALIGNED_WAVEFORMS_DO_NOT_OVERLAP)
+
+        return aligned_views
@@ -62,9 +62,88 @@ class DcRmsProcessingWindow(IntEnum):
     """Low side lobe window is applied, see LabVIEW documentation for more details."""
 
 
+class DcRmsProcessingBackend(IntEnum):
+    """Defines the backend used to perform DC-RMS processing."""
+
+    LABVIEW = 0
+    """DC-RMS is processed by LabVIEW Basic DC-RMS VI through native library (Windows only)."""
+
+    NUMPY = 1
+    """DC-RMS is processed by numpy, without the native library.
+    Importing `nipcbatt` still requires the NI-DAQmx driver to be installed."""  # noqa: D205, D209 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa)
+
+
+class DcRmsMultipleWaveformsProcessingResult(AnalysisLibraryElement):
+    """Defines DC-RMS processing results of several waveforms, one value per waveform."""
+
+    def __init__(
+        self,
+        dc_values: numpy.ndarray[numpy.float64],
+        rms_values: numpy.ndarray[numpy.float64],
+    ) -> None:
+        """Initialize an instance of DC-RMS processing result of several waveforms.
+
+        Args:
+            dc_values (numpy.ndarray[numpy.float64]): DC values obtained after processing waveforms.
+            rms_values (numpy.ndarray[numpy.float64]): RMS values obtained after processing waveforms.
+        """  # noqa: W505 - doc line too long (103 > 100 characters) (auto-generated noqa)
+        self._dc_values = dc_values
+        self._rms_values = rms_values
+
+    @property
+    def dc_values(self) -> numpy.ndarray[numpy.float64]:
+        """Gets DC values obtained after processing waveforms.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: DC values, one per waveform.
+        """
+        return self._dc_values
+
+    @property
+    def rms_values(self) -> numpy.ndarray[numpy.float64]:
+        """Gets RMS values obtained after processing waveforms.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: RMS values, one per waveform.
+        """
+        return self._rms_values
+
+    def results_per_waveform(self) -> Iterable[DcRmsProcessingResult]:
+        """Gets an iterable of DC-RMS processing results, one per waveform.
+
+        Returns:
+            Iterable[DcRmsProcessingResult]: DC-RMS processing result of each waveform.
+        """
+        for dc_value, rms_value in zip(self._dc_values, self._rms_values):
+            yield DcRmsProcessingResult(float(dc_value), float(rms_value))
+
+
 class LabViewBasicDcRms(AnalysisLibraryElement):
     """Provides DC-RMS processing based on LabVIEW Basic DC-RMS VI"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (180 > 100 characters) (auto-generated noqa)
 
+    _default_processing_backend = DcRmsProcessingBackend.LABVIEW
+
+    @staticmethod
+    def get_default_processing_backend() -> DcRmsProcessingBackend:
+        """Gets the backend used by DC-RMS processing when no backend is given per call.
+
+        Returns:
+            DcRmsProcessingBackend: default DC-RMS processing backend.
+        """
+        return LabViewBasicDcRms._default_processing_backend
+
+    @staticmethod
+    def set_default_processing_backend(dc_rms_processing_backend: DcRmsProcessingBackend):
+        """Sets the backend used by DC-RMS processing when no backend is given per call.
+
+        Args:
+            dc_rms_processing_backend (DcRmsProcessingBackend): default DC-RMS processing backend.
+        """
+        Guard.is_not_none(dc_rms_processing_backend, nameof(dc_rms_processing_backend))
+        LabViewBasicDcRms._default_processing_backend = DcRmsProcessingBackend(
+            dc_rms_processing_backend
+        )
+
     @staticmethod
     def get_last_error_message() -> str:
         """Gets the message content of the last occured error of
@@ -80,6 +159,7 @@ class LabViewBasicDcRms(AnalysisLibraryElement):
         waveform_samples: numpy.ndarray[numpy.float64],
         waveform_sampling_period_seconds: float,
         dc_rms_processing_window: DcRmsProcessingWindow,
+        dc_rms_processing_backend: DcRmsProcessingBackend = None,
     ) -> DcRmsProcessingResult:
         """Processes DC-RMS of a given waveform samples using LabVIEW VI.
 
@@ -87,6 +167,8 @@ class LabViewBasicDcRms(AnalysisLibraryElement):
             waveform_samples (numpy.ndarray[numpy.float64]): single waveform samples.
             waveforms_sampling_period_seconds (float): sampling rate of the single waveform.
             dc_rms_processing_window (DcRmsProcessingWindow): DC-RMS processing window.
+            dc_rms_processing_backend (DcRmsProcessingBackend, optional): DC-RMS processing
+            backend, when None the default processing backend is used. Defaults to None.
 
         Returns:
             DcRmsProcessingResult: An object that holds result of DC-RMS
@@ -99,7 +181,17 @@ class LabViewBasicDcRms(AnalysisLibraryElement):
             waveform_sampling_period_seconds, nameof(waveform_sampling_period_seconds)
         )
 
+        if dc_rms_processing_backend is None:
+            dc_rms_processing_backend = LabViewBasicDcRms._default_processing_backend
+
         try:
+            if dc_rms_processing_backend == DcRmsProcessingBackend.NUMPY:
+                dc_values, rms_values = _dc_rms_analysis.numpy_process_waveforms_dc_rms_impl(
+                    waveform_samples,
+                    dc_rms_processing_window,
+                )
+                return DcRmsProcessingResult(float(dc_values[0]), float(rms_values[0]))
+
             tuple_result = _dc_rms_analysis.labview_process_single_waveform_dc_rms_impl(
                 waveform_samples,
                 waveform_sampling_period_seconds,
@@ -118,6 +210,7 @@ class LabViewBasicDcRms(AnalysisLibraryElement):
         waveforms_samples: Iterable[numpy.ndarray[numpy.float64]],
         waveforms_sampling_period_seconds: float,
         dc_rms_processing_window: DcRmsProcessingWindow,
+        dc_rms_processing_backend: DcRmsProcessingBackend = None,
     ) -> Iterable[DcRmsProcessingResult]:
         """Processes DC-RMS of given waveforms samples provided as iterable object using LabVIEW VI
 
@@ -125,6 +218,8 @@ class LabViewBasicDcRms(AnalysisLibraryElement):
             waveforms_samples (Iterable[numpy.ndarray[numpy.float64]]): iterable of single waveforms
             waveforms_sampling_period_seconds (float): common sampling rate of all waveforms
             dc_rms_processing_window (DcRmsProcessingWindow): DC-RMS processing window
+            dc_rms_processing_backend (DcRmsProcessingBackend, optional): DC-RMS processing
+            backend, when None the default processing backend is used. Defaults to None.
 
         Returns:
             Iterable[DcRmsProcessingResult]: An iterable of objects that hold result of
@@ -140,4 +235,193 @@ class LabViewBasicDcRms(AnalysisLibraryElement):
                 waveform_samples,
                 waveforms_sampling_period_seconds,
                 dc_rms_processing_window,
+                dc_rms_processing_backend,
+            )
+
+    @staticmethod
+    def process_multiple_waveforms_block_dc_rms(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        dc_rms_processing_window: DcRmsProcessingWindow,
+        dc_rms_processing_backend: DcRmsProcessingBackend = None,
+        workers_count: int = 1,
+    ) -> DcRmsMultipleWaveformsProcessingResult:
+        """Processes DC-RMS of all waveforms of a 2-D block of samples (one waveform per row),
+        such as the samples of a `MeasurementData`, in a single call.
+
+        Args:
+            waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (float): common sampling rate of all waveforms.
+            dc_rms_processing_window (DcRmsProcessingWindow): DC-RMS processing window.
+            dc_rms_processing_backend (DcRmsProcessingBackend, optional): DC-RMS processing
+            backend, when None the default processing backend is used. Defaults to None.
+            workers_count (int, optional): number of threads sharing the waveforms when
+            LabVIEW backend is used, results are identical whatever the value. Defaults to 1.
+
+        Returns:
+            DcRmsMultipleWaveformsProcessingResult: An object that holds DC values and RMS values
+            of all waveforms, in rows order.
+        """  # noqa: D202, D205, D415 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_greater_than_zero(workers_count, nameof(workers_count))
+
+        if dc_rms_processing_backend is None:
+            dc_rms_processing_backend = LabViewBasicDcRms._default_processing_backend
+
+        try:
+            if dc_rms_processing_backend == DcRmsProcessingBackend.NUMPY:
+                dc_values, rms_values = _dc_rms_analysis.numpy_process_waveforms_dc_rms_impl(
+                    waveforms_samples,
+                    dc_rms_processing_window,
+                )
+            else:
+                dc_values, rms_values = (
+                    _dc_rms_analysis.labview_process_multiple_waveforms_dc_rms_impl(
+                        waveforms_samples,
+                        waveforms_sampling_period_seconds,
+                        dc_rms_processing_window,
+                        workers_count,
+                    )
+                )
+
+            return DcRmsMultipleWaveformsProcessingResult(dc_values, rms_values)
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.DC_RMS_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
+
+class DcRmsStreamingAccumulator(AnalysisLibraryElement):
+    """Accumulates successive chunks of samples of one or several channels, such as the chunks
+    of a continuous acquisition, and keeps running DC, RMS, minimum and maximum per channel.
+
+    Memory use does not depend on the number of accumulated samples, DC and RMS values are
+    those Basic DC-RMS VI returns with a rectangular window on all accumulated samples.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(self, channels_count: int = 1) -> None:
+        """Initialize an instance of `DcRmsStreamingAccumulator`.
+
+        Args:
+            channels_count (int, optional): number of channels (waveforms) of each chunk.
+            Defaults to 1.
+
+        Raises:
+            ValueError: occurs when `channels_count` is less or equal zero.
+        """
+        Guard.is_greater_than_zero(channels_count, nameof(channels_count))
+
+        self._channels_count = channels_count
+        self.reset()
+
+    @property
+    def channels_count(self) -> int:
+        """Gets the number of channels of each accumulated chunk.
+
+        Returns:
+            int: channels count.
+        """
+        return self._channels_count
+
+    @property
+    def samples_count(self) -> int:
+        """Gets the number of samples per channel accumulated since creation or last reset.
+
+        Returns:
+            int: samples count.
+        """
+        return self._samples_count
+
+    @property
+    def minimums(self) -> numpy.ndarray[numpy.float64]:
+        """Gets the minimum of accumulated samples of each channel.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: minimums, one per channel.
+        """
+        self._check_samples_are_accumulated()
+        return self._minimums.copy()
+
+    @property
+    def maximums(self) -> numpy.ndarray[numpy.float64]:
+        """Gets the maximum of accumulated samples of each channel.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: maximums, one per channel.
+        """
+        self._check_samples_are_accumulated()
+        return self._maximums.copy()
+
+    def reset(self):
+        """Discards accumulated samples, next chunk starts a new accumulation."""
+        self._samples_count = 0
+        self._means = numpy.zeros(self._channels_count, dtype=numpy.float64)
+        self._squared_deviations_sums = numpy.zeros(self._channels_count, dtype=numpy.float64)
+        self._minimums = numpy.full(self._channels_count, numpy.inf, dtype=numpy.float64)
+        self._maximums = numpy.full(self._channels_count, -numpy.inf, dtype=numpy.float64)
+
+    def accumulate_waveforms_chunk(self, waveforms_samples: numpy.ndarray):
+        """Accumulates a chunk of samples of all channels.
+
+        Args:
+            waveforms_samples (numpy.ndarray): 2-D array of samples (one channel per row),
+            or 1-D array of samples when the accumulator has a single channel.
+
+        Raises:
+            ValueError: occurs when the number of waveforms of the chunk
+            is not the number of channels of the accumulator.
+        """
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+
+        samples = numpy.atleast_2d(waveforms_samples)
+        if samples.ndim != 2 or samples.shape[0] != self._channels_count:
+            raise ValueError(
+                AnalysisLibraryExceptionMessage.DC_RMS_STREAMING_ACCUMULATOR_CHANNELS_COUNT_MISMATCH
+            )
+
+        self._samples_count = _dc_rms_analysis.numpy_accumulate_waveforms_dc_rms_impl(
+            samples,
+            self._samples_count,
+            self._means,
+            self._squared_deviations_sums,
+            self._minimums,
+            self._maximums,
+        )
+
+    def get_multiple_waveforms_result(self) -> DcRmsMultipleWaveformsProcessingResult:
+        """Gets DC values and RMS values of all channels from accumulated samples.
+
+        Raises:
+            PCBATTAnalysisException: occurs when no sample is accumulated.
+
+        Returns:
+            DcRmsMultipleWaveformsProcessingResult: An object that holds DC values and RMS values
+            of all channels, in rows order.
+        """
+        self._check_samples_are_accumulated()
+        dc_values, rms_values = _dc_rms_analysis.numpy_get_accumulated_dc_rms_impl(
+            self._samples_count, self._means, self._squared_deviations_sums
+        )
+        return DcRmsMultipleWaveformsProcessingResult(dc_values, rms_values)
+
+    def results_per_waveform(self) -> Iterable[DcRmsProcessingResult]:
+        """Gets an iterable of DC-RMS processing results of accumulated samples, one per channel.
+
+        Raises:
+            PCBATTAnalysisException: occurs when no sample is accumulated.
+
+        Returns:
+            Iterable[DcRmsProcessingResult]: DC-RMS processing result of each channel.
+        """
+        return self.get_multiple_waveforms_result().results_per_waveform()
+
+    def _check_samples_are_accumulated(self):
+        if self._samples_count == 0:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.DC_RMS_STREAMING_ACCUMULATOR_HAS_NO_SAMPLES
             )
@@ -114,6 +114,17 @@ class LabViewFftSpectrumWindow(IntEnum):
     https://www.ni.com/docs/fr-FR/bundle/labview/page/lvanls/gaussian_window.html"""
 
 
+class FrequencyDomainProcessingBackend(IntEnum):
+    """Defines the backend used to perform frequency domain processing."""
+
+    LABVIEW = 0
+    """Spectrum and tones are processed by LabVIEW VIs through native library (Windows only)."""
+
+    NUMPY = 1
+    """Spectrum and tones are derived from a single windowed FFT computed by numpy,
+    available on all platforms."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+
 class MultipleTonesProcessingResult(AnalysisLibraryElement):
     """Defines multiple tones processing results"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (162 > 100 characters) (auto-generated noqa)
 
@@ -205,10 +216,235 @@ class MultipleTonesAmplitudePhaseSpectrumProcessingResult(AnalysisLibraryElement
         return self._amplitude_phase_spectrum
 
 
+class MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult(AnalysisLibraryElement):
+    """Defines multiple tones and spectrum processing results of several waveforms,
+    spectrums amplitudes and phases are gathered in 2-D arrays (one row per waveform)."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        spectrum_start_frequency: float,
+        spectrum_frequency_resolution: float,
+        spectrums_amplitudes: numpy.ndarray[numpy.float64],
+        spectrum_amplitude_type: SpectrumAmplitudeType,
+        spectrum_amplitude_unit_is_db: bool,
+        spectrums_phases: numpy.ndarray[numpy.float64],
+        spectrum_phase_unit: SpectrumPhaseUnit,
+        multiple_tones_results: list[MultipleTonesProcessingResult],
+    ) -> None:
+        """Initialize an instance of
+        `MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult`.
+
+        Args:
+            spectrum_start_frequency (`float`): start frequency of all spectrums.
+            spectrum_frequency_resolution (`float`): frequency resolution of all spectrums.
+            spectrums_amplitudes (`numpy.ndarray[numpy.float64]`): 2-D array of spectrums amplitudes.
+            spectrum_amplitude_type (`SpectrumAmplitudeType`): spectrums amplitude type.
+            spectrum_amplitude_unit_is_db (`bool`): spectrums amplitude is expressed as gain (db).
+            spectrums_phases (`numpy.ndarray[numpy.float64]`): 2-D array of spectrums phases.
+            spectrum_phase_unit (`SpectrumPhaseUnit`): unit of the spectrums phases.
+            multiple_tones_results (`list[MultipleTonesProcessingResult]`):
+                multiple tones processing results, one per waveform.
+
+        Raises:
+            ValueError: Occurs when input arrays are none or `multiple_tones_results` is none.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (104 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(spectrums_amplitudes, nameof(spectrums_amplitudes))
+        Guard.is_not_none(spectrums_phases, nameof(spectrums_phases))
+        Guard.is_not_none(multiple_tones_results, nameof(multiple_tones_results))
+
+        self._spectrum_start_frequency = spectrum_start_frequency
+        self._spectrum_frequency_resolution = spectrum_frequency_resolution
+        self._spectrums_amplitudes = spectrums_amplitudes
+        self._spectrum_amplitude_type = spectrum_amplitude_type
+        self._spectrum_amplitude_unit_is_db = spectrum_amplitude_unit_is_db
+        self._spectrums_phases = spectrums_phases
+        self._spectrum_phase_unit = spectrum_phase_unit
+        self._multiple_tones_results = multiple_tones_results
+
+    @property
+    def spectrum_start_frequency(self) -> float:
+        """Gets the start frequency of all spectrums.
+
+        Returns:
+            float: start frequency (Hz).
+        """
+        return self._spectrum_start_frequency
+
+    @property
+    def spectrum_frequency_resolution(self) -> float:
+        """Gets the frequency resolution of all spectrums.
+
+        Returns:
+            float: frequency resolution (Hz).
+        """
+        return self._spectrum_frequency_resolution
+
+    @property
+    def spectrums_amplitudes(self) -> numpy.ndarray[numpy.float64]:
+        """Gets amplitudes of spectrums, one row per waveform.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 2-D array of spectrums amplitudes.
+        """
+        return self._spectrums_amplitudes
+
+    @property
+    def spectrum_amplitude_type(self) -> SpectrumAmplitudeType:
+        """Gets the amplitude type of spectrums.
+
+        Returns:
+            SpectrumAmplitudeType: `RMS` or `PEAK`.
+        """
+        return self._spectrum_amplitude_type
+
+    @property
+    def spectrum_amplitude_unit_is_db(self) -> bool:
+        """Gets a value indicating whether spectrums amplitudes are expressed as gain (db).
+
+        Returns:
+            bool: True when amplitudes are expressed as db.
+        """
+        return self._spectrum_amplitude_unit_is_db
+
+    @property
+    def spectrums_phases(self) -> numpy.ndarray[numpy.float64]:
+        """Gets phases of spectrums, one row per waveform.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 2-D array of spectrums phases.
+        """
+        return self._spectrums_phases
+
+    @property
+    def spectrum_phase_unit(self) -> SpectrumPhaseUnit:
+        """Gets the unit of spectrums phases.
+
+        Returns:
+            SpectrumPhaseUnit: `RADIAN` or `DEGREE`.
+        """
+        return self._spectrum_phase_unit
+
+    @property
+    def multiple_tones_results(self) -> list[MultipleTonesProcessingResult]:
+        """Gets multiple tones processing results, one per waveform.
+
+        Returns:
+            list[MultipleTonesProcessingResult]: multiple tones processing results.
+        """
+        return self._multiple_tones_results
+
+
+class FrequencyResponseMultipleWaveformsProcessingResult(AnalysisLibraryElement):
+    """Defines frequency response processing results of several waveforms relative to
+    a stimulus waveform, gains and phase shifts are gathered in 2-D arrays
+    (one row per waveform, one column per tone)."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        tones_frequencies: numpy.ndarray[numpy.float64],
+        stimulus_waveform_index: int,
+        gains: numpy.ndarray[numpy.float64],
+        phases_shifts_radians: numpy.ndarray[numpy.float64],
+    ) -> None:
+        """Initialize an instance of `FrequencyResponseMultipleWaveformsProcessingResult`.
+
+        Args:
+            tones_frequencies (`numpy.ndarray[numpy.float64]`): frequencies of the tones (Hz).
+            stimulus_waveform_index (`int`): row of the stimulus waveform in processed block.
+            gains (`numpy.ndarray[numpy.float64]`): 2-D array of gains (V/V).
+            phases_shifts_radians (`numpy.ndarray[numpy.float64]`): 2-D array of phase shifts.
+
+        Raises:
+            ValueError: Occurs when input arrays are none.
+        """
+        Guard.is_not_none(tones_frequencies, nameof(tones_frequencies))
+        Guard.is_not_none(gains, nameof(gains))
+        Guard.is_not_none(phases_shifts_radians, nameof(phases_shifts_radians))
+
+        self._tones_frequencies = tones_frequencies
+        self._stimulus_waveform_index = stimulus_waveform_index
+        self._gains = gains
+        self._phases_shifts_radians = phases_shifts_radians
+
+    @property
+    def tones_frequencies(self) -> numpy.ndarray[numpy.float64]:
+        """Gets the frequencies of the tones at which responses are processed.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 1-D array of tones frequencies (Hz).
+        """
+        return self._tones_frequencies
+
+    @property
+    def stimulus_waveform_index(self) -> int:
+        """Gets the row of the stimulus waveform in processed block.
+
+        Returns:
+            int: stimulus waveform index.
+        """
+        return self._stimulus_waveform_index
+
+    @property
+    def gains(self) -> numpy.ndarray[numpy.float64]:
+        """Gets gains of waveforms relative to the stimulus waveform, one row per waveform.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 2-D array of gains (V/V).
+        """
+        return self._gains
+
+    @property
+    def gains_db(self) -> numpy.ndarray[numpy.float64]:
+        """Gets gains of waveforms relative to the stimulus waveform expressed as db.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 2-D array of gains (db).
+        """
+        with numpy.errstate(divide="ignore"):
+            return 20.0 * numpy.log10(self._gains)
+
+    @property
+    def phases_shifts_radians(self) -> numpy.ndarray[numpy.float64]:
+        """Gets phase shifts of waveforms relative to the stimulus waveform, one row per waveform.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: 2-D array of phase shifts, in [-PI, PI] radians.
+        """
+        return self._phases_shifts_radians
+
+
 class LabViewFrequencyDomainProcessing(AnalysisLibraryElement):
     """Defines frequency domain analysis functions such
     fft spectrum and multiple tones processing."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (343 > 100 characters) (auto-generated noqa)
 
+    _default_processing_backend = FrequencyDomainProcessingBackend.LABVIEW
+
+    @staticmethod
+    def get_default_processing_backend() -> FrequencyDomainProcessingBackend:
+        """Gets the backend used by frequency domain processing when no backend is given per call.
+
+        Returns:
+            FrequencyDomainProcessingBackend: default frequency domain processing backend.
+        """
+        return LabViewFrequencyDomainProcessing._default_processing_backend
+
+    @staticmethod
+    def set_default_processing_backend(
+        frequency_domain_processing_backend: FrequencyDomainProcessingBackend,
+    ):
+        """Sets the backend used by frequency domain processing when no backend is given per call.
+
+        Args:
+            frequency_domain_processing_backend (FrequencyDomainProcessingBackend):
+            default frequency domain processing backend.
+        """
+        Guard.is_not_none(
+            frequency_domain_processing_backend, nameof(frequency_domain_processing_backend)
+        )
+        LabViewFrequencyDomainProcessing._default_processing_backend = (
+            FrequencyDomainProcessingBackend(frequency_domain_processing_backend)
+        )
+
     @staticmethod
     def process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
         waveform_samples: numpy.ndarray[numpy.float64],
@@ -220,6 +456,7 @@ class LabViewFrequencyDomainProcessing(AnalysisLibraryElement):
         tones_selection_threshold_peak_amplitude: float,
         tones_max_count: int = None,
         fft_spectrum_window_advanced_parameter: float = None,
+        frequency_domain_processing_backend: FrequencyDomainProcessingBackend = None,
     ) -> MultipleTonesAmplitudePhaseSpectrumProcessingResult:
         """Processes `RMS` amplitude phase spectrum of a given waveform samples using LabVIEW VI
 
@@ -235,6 +472,9 @@ class LabViewFrequencyDomainProcessing(AnalysisLibraryElement):
             tones_selection_threshold_peak_amplitude (`float`): minimum amplitude peak of tone to be selected.
             tones_max_count (`int`): maximum tones count to extract from analyzed waveform,
             when not set, all tones will be extracted.
+            frequency_domain_processing_backend (`FrequencyDomainProcessingBackend`, optional):
+            frequency domain processing backend, when None the default processing backend is used.
+            Defaults to None.
 
         Raises:
             PCBATTAnalysisException:
@@ -244,7 +484,32 @@ class LabViewFrequencyDomainProcessing(AnalysisLibraryElement):
             FrequencyDomainProcessingResult: An object that holds result of fft spectrum
             processing result and multiple tones processing result using LabVIEW VIs.
         """  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (110 > 100 characters) (auto-generated noqa)
+        if frequency_domain_processing_backend is None:
+            frequency_domain_processing_backend = (
+                LabViewFrequencyDomainProcessing._default_processing_backend
+            )
+
         try:
+            if frequency_domain_processing_backend == FrequencyDomainProcessingBackend.NUMPY:
+                results_tuple = _frequency_domain_analysis.numpy_process_waveforms_multiple_tones_and_amplitude_phase_spectrum_impl(
+                    waveform_samples,
+                    waveform_sampling_period_seconds,
+                    spectrum_amplitude_must_be_db,
+                    spectrum_phase_unit,
+                    fft_spectrum_window,
+                    tones_sorting_mode,
+                    tones_selection_threshold_peak_amplitude,
+                    tones_max_count,
+                    fft_spectrum_window_advanced_parameter,
+                )
+
+                return MultipleTonesAmplitudePhaseSpectrumProcessingResult(
+                    multiple_tones_result=MultipleTonesProcessingResult(
+                        detected_tones=results_tuple[3][0], amplitude_type=results_tuple[4]
+                    ),
+                    amplitude_phase_spectrum=results_tuple[0],
+                )
+
             results_tuple = _frequency_domain_analysis.labview_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_impl(
                 waveform_samples,
                 waveform_sampling_period_seconds,
@@ -268,6 +533,371 @@ class LabViewFrequencyDomainProcessing(AnalysisLibraryElement):
                 AnalysisLibraryExceptionMessage.FREQUENCY_DOMAIN_PROCESSING_FAILED_FOR_SOME_REASON
             ) from e
 
+    @staticmethod
+    def process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        spectrum_amplitude_must_be_db: bool,
+        spectrum_phase_unit: SpectrumPhaseUnit,
+        fft_spectrum_window: LabViewFftSpectrumWindow,
+        tones_sorting_mode: LabViewTonesSortingMode,
+        tones_selection_threshold_peak_amplitude: float,
+        tones_max_count: int = None,
+        fft_spectrum_window_advanced_parameter: float = None,
+        workers_count: int = 1,
+        frequency_domain_processing_backend: FrequencyDomainProcessingBackend = None,
+    ) -> MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult:
+        """Processes `RMS` amplitude phase spectrum and multiple tones of all waveforms
+        of a 2-D block of samples (one waveform per row), such as the samples of a `MeasurementData`,
+        in a single call.
+
+        Args:
+            waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (`float`): common sampling period of all waveforms.
+            spectrum_amplitude_must_be_db (`bool`): amplitudes of the spectrum should
+            be expressed as db gain, instead of nominal unit.
+            spectrum_phase_unit (`FftSpectrumPhaseUnit`): can be `RADIAN` or `DEGREE`.
+            fft_spectrum_window (`LabViewFftSpectrumWindow`): fft processing window.
+            fft_spectrum_window_advanced_parameter (`float`): advanced parameter value,
+            only used when selected window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`.
+            tones_selection_threshold_peak_amplitude (`float`): minimum amplitude peak of tone to be selected.
+            tones_max_count (`int`): maximum tones count to extract from each waveform,
+            when not set, all tones will be extracted.
+            workers_count (`int`): number of threads sharing the waveforms when LabVIEW
+            backend is used, results are identical whatever the value. Defaults to 1.
+            frequency_domain_processing_backend (`FrequencyDomainProcessingBackend`, optional):
+            frequency domain processing backend, when None the default processing backend is used.
+            NumPy backend processes all waveforms through a single FFT call. Defaults to None.
+
+        Raises:
+            PCBATTAnalysisException:
+                Occurs when frequency domain processing fails for some reason.
+
+        Returns:
+            MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult: An object that
+            holds spectrums of all waveforms as 2-D arrays and multiple tones results, in rows order.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (110 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_greater_than_zero(workers_count, nameof(workers_count))
+
+        if frequency_domain_processing_backend is None:
+            frequency_domain_processing_backend = (
+                LabViewFrequencyDomainProcessing._default_processing_backend
+            )
+
+        try:
+            if frequency_domain_processing_backend == FrequencyDomainProcessingBackend.NUMPY:
+                results_tuple = _frequency_domain_analysis.numpy_process_waveforms_multiple_tones_and_amplitude_phase_spectrum_impl(
+                    waveforms_samples,
+                    waveforms_sampling_period_seconds,
+                    spectrum_amplitude_must_be_db,
+                    spectrum_phase_unit,
+                    fft_spectrum_window,
+                    tones_sorting_mode,
+                    tones_selection_threshold_peak_amplitude,
+                    tones_max_count,
+                    fft_spectrum_window_advanced_parameter,
+                )
+            else:
+                results_tuple = _frequency_domain_analysis.labview_process_multiple_waveforms_multiple_tones_and_amplitude_phase_spectrum_impl(
+                    waveforms_samples,
+                    waveforms_sampling_period_seconds,
+                    spectrum_amplitude_must_be_db,
+                    spectrum_phase_unit,
+                    fft_spectrum_window,
+                    tones_sorting_mode,
+                    tones_selection_threshold_peak_amplitude,
+                    tones_max_count,
+                    fft_spectrum_window_advanced_parameter,
+                    workers_count,
+                )
+
+            first_spectrum_result: AmplitudePhaseSpectrum = results_tuple[0]
+
+            return MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult(
+                spectrum_start_frequency=first_spectrum_result.spectrum_start_frequency,
+                spectrum_frequency_resolution=first_spectrum_result.spectrum_frequency_resolution,
+                spectrums_amplitudes=results_tuple[1],
+                spectrum_amplitude_type=first_spectrum_result.spectrum_amplitude_type,
+                spectrum_amplitude_unit_is_db=first_spectrum_result.spectrum_amplitude_unit_is_db,
+                spectrums_phases=results_tuple[2],
+                spectrum_phase_unit=first_spectrum_result.spectrum_phase_unit,
+                multiple_tones_results=[
+                    MultipleTonesProcessingResult(
+                        detected_tones=detected_tones, amplitude_type=results_tuple[4]
+                    )
+                    for detected_tones in results_tuple[3]
+                ],
+            )
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.FREQUENCY_DOMAIN_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
+    @staticmethod
+    def process_multiple_waveforms_block_averaged_multiple_tones_and_amplitude_spectrum(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        spectrum_amplitude_must_be_db: bool,
+        spectrum_phase_unit: SpectrumPhaseUnit,
+        fft_spectrum_window: LabViewFftSpectrumWindow,
+        tones_sorting_mode: LabViewTonesSortingMode,
+        tones_selection_threshold_peak_amplitude: float,
+        segment_samples_count: int,
+        segment_overlap_percent: float = 50.0,
+        averages_count: int = None,
+        tones_max_count: int = None,
+        fft_spectrum_window_advanced_parameter: float = None,
+    ) -> MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult:
+        """Processes `RMS` averaged amplitude spectrum and multiple tones of all waveforms
+        of a 2-D block of samples (one waveform per row), using Welch method.
+
+        Waveforms are split in overlapping segments, powers of the spectrums of windowed
+        segments are averaged, which lowers the noise floor without increasing FFT size.
+        Segments are processed one after the other with numpy, whatever the default backend,
+        phases of averaged spectrums are not defined and are all set to zero.
+
+        Args:
+            waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (`float`): common sampling period of all waveforms.
+            spectrum_amplitude_must_be_db (`bool`): amplitudes of the spectrum should
+            be expressed as db gain, instead of nominal unit.
+            spectrum_phase_unit (`FftSpectrumPhaseUnit`): can be `RADIAN` or `DEGREE`.
+            fft_spectrum_window (`LabViewFftSpectrumWindow`): fft processing window,
+            applied to each segment.
+            tones_selection_threshold_peak_amplitude (`float`): minimum amplitude peak of tone to be selected.
+            segment_samples_count (`int`): number of samples of each segment,
+            frequency resolution of spectrums is the inverse of the segment duration.
+            segment_overlap_percent (`float`, optional): overlap of successive segments,
+            in percent of the segment samples count, from 0 (included) to 100 (excluded).
+            Defaults to 50.
+            averages_count (`int`, optional): maximum number of averaged segments, when None,
+            all segments fitting in waveforms are averaged. Defaults to None.
+            tones_max_count (`int`): maximum tones count to extract from each waveform,
+            when not set, all tones will be extracted.
+            fft_spectrum_window_advanced_parameter (`float`): advanced parameter value,
+            only used when selected window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid.
+            PCBATTAnalysisException:
+                Occurs when frequency domain processing fails for some reason,
+                such as waveforms shorter than one segment.
+
+        Returns:
+            MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult: An object that
+            holds averaged spectrums of all waveforms as 2-D arrays and multiple tones results,
+            in rows order.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (110 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_greater_than_zero(segment_samples_count, nameof(segment_samples_count))
+        Guard.is_greater_than_or_equal_to_zero(
+            segment_overlap_percent, nameof(segment_overlap_percent)
+        )
+        Guard.is_less_than(segment_overlap_percent, 100, nameof(segment_overlap_percent))
+        if averages_count is not None:
+            Guard.is_greater_than_zero(averages_count, nameof(averages_count))
+
+        try:
+            results_tuple = _frequency_domain_analysis.numpy_process_waveforms_averaged_multiple_tones_and_amplitude_spectrum_impl(
+                waveforms_samples,
+                waveforms_sampling_period_seconds,
+                spectrum_amplitude_must_be_db,
+                spectrum_phase_unit,
+                fft_spectrum_window,
+                tones_sorting_mode,
+                tones_selection_threshold_peak_amplitude,
+                segment_samples_count,
+                segment_overlap_percent,
+                averages_count,
+                tones_max_count,
+                fft_spectrum_window_advanced_parameter,
+            )
+
+            first_spectrum_result: AmplitudePhaseSpectrum = results_tuple[0]
+
+            return MultipleTonesAmplitudePhaseSpectrumMultipleWaveformsProcessingResult(
+                spectrum_start_frequency=first_spectrum_result.spectrum_start_frequency,
+                spectrum_frequency_resolution=first_spectrum_result.spectrum_frequency_resolution,
+                spectrums_amplitudes=results_tuple[1],
+                spectrum_amplitude_type=first_spectrum_result.spectrum_amplitude_type,
+                spectrum_amplitude_unit_is_db=first_spectrum_result.spectrum_amplitude_unit_is_db,
+                spectrums_phases=results_tuple[2],
+                spectrum_phase_unit=first_spectrum_result.spectrum_phase_unit,
+                multiple_tones_results=[
+                    MultipleTonesProcessingResult(
+                        detected_tones=detected_tones, amplitude_type=results_tuple[4]
+                    )
+                    for detected_tones in results_tuple[3]
+                ],
+            )
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.FREQUENCY_DOMAIN_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
+    @staticmethod
+    def process_multiple_waveforms_block_targeted_tones(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        tones_frequencies: list[float],
+        fft_spectrum_window: LabViewFftSpectrumWindow,
+        fft_spectrum_window_advanced_parameter: float = None,
+    ) -> list[MultipleTonesProcessingResult]:
+        """Processes peak amplitude and phase of tones of known frequencies, such as the tones
+        of a generated stimulus, in all waveforms of a 2-D block of samples (one waveform per row).
+
+        Tones are not searched in spectrums, the windowed Fourier transform of waveforms is
+        evaluated with numpy at the given frequencies only, whatever the default backend,
+        and spectrums are not built.
+
+        Args:
+            waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (`float`): common sampling period of all waveforms.
+            tones_frequencies (`list[float]`): frequencies of the tones to measure, in Hertz.
+            fft_spectrum_window (`LabViewFftSpectrumWindow`): window applied to waveforms.
+            fft_spectrum_window_advanced_parameter (`float`): advanced parameter value,
+            only used when selected window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid.
+            PCBATTAnalysisException:
+                Occurs when frequency domain processing fails for some reason.
+
+        Returns:
+            list[MultipleTonesProcessingResult]: multiple tones result of each waveform,
+            in rows order, tones are in the order of `tones_frequencies`.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_not_none(tones_frequencies, nameof(tones_frequencies))
+        Guard.is_not_empty(tones_frequencies, nameof(tones_frequencies))
+        for tone_frequency in tones_frequencies:
+            Guard.is_greater_than_or_equal_to_zero(tone_frequency, nameof(tones_frequencies))
+
+        try:
+            tones_amplitudes, tones_phases = (
+                _frequency_domain_analysis.numpy_process_waveforms_targeted_tones_impl(
+                    waveforms_samples,
+                    waveforms_sampling_period_seconds,
+                    tones_frequencies,
+                    fft_spectrum_window,
+                    fft_spectrum_window_advanced_parameter,
+                )
+            )
+
+            return [
+                MultipleTonesProcessingResult(
+                    detected_tones=[
+                        WaveformTone(
+                            frequency=float(tone_frequency),
+                            amplitude=float(tone_amplitude),
+                            phase_radians=float(tone_phase),
+                        )
+                        for tone_frequency, tone_amplitude, tone_phase in zip(
+                            tones_frequencies, waveform_tones_amplitudes, waveform_tones_phases
+                        )
+                    ],
+                    amplitude_type=SpectrumAmplitudeType.PEAK,
+                )
+                for waveform_tones_amplitudes, waveform_tones_phases in zip(
+                    tones_amplitudes, tones_phases
+                )
+            ]
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.FREQUENCY_DOMAIN_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
+    @staticmethod
+    def process_multiple_waveforms_block_frequency_response(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        tones_frequencies: list[float],
+        stimulus_waveform_index: int,
+        fft_spectrum_window: LabViewFftSpectrumWindow,
+        fft_spectrum_window_advanced_parameter: float = None,
+    ) -> FrequencyResponseMultipleWaveformsProcessingResult:
+        """Processes gain and phase shift of all waveforms of a 2-D block of samples
+        (one waveform per row) relative to the stimulus waveform of the block, at the
+        frequencies of the tones of the stimulus.
+
+        Waveforms must be acquired by one synchronized acquisition, tones of all waveforms
+        are measured with numpy in one batched evaluation of their windowed Fourier transform,
+        whatever the default backend.
+
+        Args:
+            waveforms_samples (`numpy.ndarray[numpy.float64]`): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (`float`): common sampling period of all waveforms.
+            tones_frequencies (`list[float]`): frequencies of the tones of the stimulus, in Hertz.
+            stimulus_waveform_index (`int`): row of the stimulus waveform in `waveforms_samples`.
+            fft_spectrum_window (`LabViewFftSpectrumWindow`): window applied to waveforms.
+            fft_spectrum_window_advanced_parameter (`float`): advanced parameter value,
+            only used when selected window is `KAISER`, `DOLPH_TCHEBYCHEV` or `GAUSSIAN`.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid.
+            PCBATTAnalysisException:
+                Occurs when frequency domain processing fails for some reason.
+
+        Returns:
+            FrequencyResponseMultipleWaveformsProcessingResult: gains and phase shifts of
+            all waveforms, stimulus waveform included, tones are in the order of
+            `tones_frequencies`.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.is_not_none(tones_frequencies, nameof(tones_frequencies))
+        Guard.is_not_empty(tones_frequencies, nameof(tones_frequencies))
+        for tone_frequency in tones_frequencies:
+            Guard.is_greater_than_or_equal_to_zero(tone_frequency, nameof(tones_frequencies))
+        Guard.is_within_limits_included(
+            stimulus_waveform_index,
+            0,
+            numpy.atleast_2d(waveforms_samples).shape[0] - 1,
+            nameof(stimulus_waveform_index),
+        )
+
+        try:
+            gains, phases_shifts = (
+                _frequency_domain_analysis.numpy_process_waveforms_frequency_response_impl(
+                    waveforms_samples,
+                    waveforms_sampling_period_seconds,
+                    tones_frequencies,
+                    stimulus_waveform_index,
+                    fft_spectrum_window,
+                    fft_spectrum_window_advanced_parameter,
+                )
+            )
+
+            return FrequencyResponseMultipleWaveformsProcessingResult(
+                tones_frequencies=numpy.asarray(tones_frequencies, dtype=numpy.float64),
+                stimulus_waveform_index=stimulus_waveform_index,
+                gains=gains,
+                phases_shifts_radians=phases_shifts,
+            )
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.FREQUENCY_DOMAIN_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
 
 class LabViewFftSpectrumAmplitudePhase(AnalysisLibraryElement):
     """Provides Amplitude/Phase spectrum processing based on
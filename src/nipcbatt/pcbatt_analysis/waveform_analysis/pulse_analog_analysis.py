@@ -12,10 +12,17 @@ from nipcbatt.pcbatt_analysis.analysis_library_messages import (
 )
 from nipcbatt.pcbatt_analysis.common.base_types import AnalysisLibraryElement
 from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal import (
+    _amplitude_and_levels_analysis,
     _pulse_analog_analysis,
+    _waveform_samples,
+)
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal._parallel_processing import (
+    process_waveforms_indexes_ranges,
 )
 from nipcbatt.pcbatt_analysis.waveform_analysis.amplitude_and_levels_analysis import (
+    AmplitudeAndLevelsMultipleWaveformsProcessingResult,
     AmplitudeAndLevelsProcessingMethod,
+    AmplitudeAndLevelsProcessingResult,
 )
 from nipcbatt.pcbatt_utilities import numeric_utilities
 from nipcbatt.pcbatt_utilities.guard_utilities import Guard
@@ -212,6 +219,177 @@ class PulseAnalogProcessingExportMode(IntEnum):
     """All pulse characteristics are processed, except period, frequency and duty cycle elements."""
 
 
+class PulseAnalogProcessingBackend(IntEnum):
+    """Defines the backend used to perform pulse measurements processing."""
+
+    LABVIEW = 0
+    """Pulse measurements are processed by LabVIEW Pulse Measurements VI
+    through native library (Windows only), one native call per pulse."""
+
+    NUMPY = 1
+    """Pulse measurements are processed by numpy, available on all platforms,
+    all pulses of a waveform are found in a single pass."""
+
+
+class PulseAnalogMultipleWaveformsProcessingResult(AnalysisLibraryElement):
+    """Defines pulse measurements analog processing results of several waveforms,
+    one value per waveform, values are NaN for waveforms in which the pulse was not found."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        pulse_centers: numpy.ndarray[numpy.float64],
+        pulse_durations: numpy.ndarray[numpy.float64],
+        pulse_reference_levels_high: numpy.ndarray[numpy.float64],
+        pulse_reference_levels_middle: numpy.ndarray[numpy.float64],
+        pulse_reference_levels_low: numpy.ndarray[numpy.float64],
+        periods: numpy.ndarray[numpy.float64],
+        duty_cycles: numpy.ndarray[numpy.float64],
+    ) -> None:
+        """Initialize an instance of pulse analog processing result of several waveforms.
+
+        Args:
+            pulse_centers (numpy.ndarray[numpy.float64]): pulse center of each waveform.
+            pulse_durations (numpy.ndarray[numpy.float64]): pulse duration of each waveform.
+            pulse_reference_levels_high (numpy.ndarray[numpy.float64]):
+                absolute high reference level used for each waveform.
+            pulse_reference_levels_middle (numpy.ndarray[numpy.float64]):
+                absolute middle reference level used for each waveform.
+            pulse_reference_levels_low (numpy.ndarray[numpy.float64]):
+                absolute low reference level used for each waveform.
+            periods (numpy.ndarray[numpy.float64]): period of each waveform,
+                NaN when periodicity is not processed.
+            duty_cycles (numpy.ndarray[numpy.float64]): duty cycle of each waveform,
+                expressed as ratio [0,1], NaN when periodicity is not processed.
+        """
+        self._pulse_centers = pulse_centers
+        self._pulse_durations = pulse_durations
+        self._pulse_reference_levels_high = pulse_reference_levels_high
+        self._pulse_reference_levels_middle = pulse_reference_levels_middle
+        self._pulse_reference_levels_low = pulse_reference_levels_low
+        self._periods = periods
+        self._duty_cycles = duty_cycles
+
+    @property
+    def pulse_centers(self) -> numpy.ndarray[numpy.float64]:
+        """Gets center dates obtained after processing waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: pulse center dates in seconds, one per waveform.
+        """
+        return self._pulse_centers
+
+    @property
+    def pulse_durations(self) -> numpy.ndarray[numpy.float64]:
+        """Gets pulse widths obtained after processing waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: pulse widths in seconds, one per waveform.
+        """
+        return self._pulse_durations
+
+    @property
+    def pulse_reference_levels_high(self) -> numpy.ndarray[numpy.float64]:
+        """Gets high reference levels used when processed waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: high reference levels, one per waveform.
+        """
+        return self._pulse_reference_levels_high
+
+    @property
+    def pulse_reference_levels_middle(self) -> numpy.ndarray[numpy.float64]:
+        """Gets middle reference levels used when processed waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: middle reference levels, one per waveform.
+        """
+        return self._pulse_reference_levels_middle
+
+    @property
+    def pulse_reference_levels_low(self) -> numpy.ndarray[numpy.float64]:
+        """Gets low reference levels used when processed waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: low reference levels, one per waveform.
+        """
+        return self._pulse_reference_levels_low
+
+    @property
+    def periods(self) -> numpy.ndarray[numpy.float64]:
+        """Gets periods obtained after processing waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: periods in seconds, one per waveform.
+        """
+        return self._periods
+
+    @property
+    def frequencies(self) -> numpy.ndarray[numpy.float64]:
+        """Gets frequencies obtained after processing waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: frequencies in hertz, one per waveform.
+        """
+        return 1 / self._periods
+
+    @property
+    def duty_cycles(self) -> numpy.ndarray[numpy.float64]:
+        """Gets duty cycles obtained after processing waveforms pulses.
+
+        Returns:
+            numpy.ndarray[numpy.float64]: duty cycles as ratio in [0,1], one per waveform.
+        """
+        return self._duty_cycles
+
+    @property
+    def pulses_found(self) -> numpy.ndarray[numpy.bool_]:
+        """Gets whether the pulse was found in each waveform.
+
+        Returns:
+            numpy.ndarray[numpy.bool_]: True for waveforms in which the pulse was found.
+        """
+        return ~numpy.isnan(self._pulse_durations)
+
+    def results_per_waveform(self) -> Iterable[Optional[PulseAnalogProcessingResult]]:
+        """Gets an iterable of pulse analog processing results, one per waveform.
+
+        Returns:
+            Iterable[Optional[PulseAnalogProcessingResult]]: processing result of each waveform,
+            None for waveforms in which the pulse was not found.
+        """
+        for (
+            pulse_center,
+            pulse_duration,
+            pulse_reference_level_high,
+            pulse_reference_level_middle,
+            pulse_reference_level_low,
+            period,
+            duty_cycle,
+        ) in zip(
+            self._pulse_centers,
+            self._pulse_durations,
+            self._pulse_reference_levels_high,
+            self._pulse_reference_levels_middle,
+            self._pulse_reference_levels_low,
+            self._periods,
+            self._duty_cycles,
+        ):
+            if numpy.isnan(pulse_duration):
+                yield None
+                continue
+
+            periodicity_is_processed = not numpy.isnan(period)
+            yield PulseAnalogProcessingResult(
+                float(pulse_center),
+                float(pulse_duration),
+                float(pulse_reference_level_high),
+                float(pulse_reference_level_middle),
+                float(pulse_reference_level_low),
+                float(period) if periodicity_is_processed else None,
+                float(duty_cycle) if periodicity_is_processed else None,
+            )
+
+
 class PulseAnalogProcessingReferenceLevels(AnalysisLibraryElement):
     """Defines reference levels that will be used to locate pulse when
     analyzing waveform.
@@ -263,6 +441,7 @@ class PulseAnalogMeasurementPercentLevelsSettings(AnalysisLibraryElement):
         self,
         amplitude_and_levels_processing_method: AmplitudeAndLevelsProcessingMethod,
         histogram_size: int,
+        state_levels: AmplitudeAndLevelsProcessingResult = None,
     ) -> None:
         """Initialize an instance of `PulseAnalogMeasurementPercentLevelsSettings`.
 
@@ -272,11 +451,16 @@ class PulseAnalogMeasurementPercentLevelsSettings(AnalysisLibraryElement):
             histogram_size (int):
                 Number of bins of the histogram when amplitude and levels processing choose to use
                 histogram based algorithm.
+            state_levels (AmplitudeAndLevelsProcessingResult, optional):
+                Amplitude and levels already processed on the analyzed waveform, when provided
+                reference levels are resolved from its high and low state levels
+                and the waveform is not processed again to find them. Defaults to None.
         """
         Guard.is_greater_than_zero(value=histogram_size, value_name=nameof(histogram_size))
 
         self._amplitude_and_levels_processing_method = amplitude_and_levels_processing_method
         self._histogram_size = histogram_size
+        self._state_levels = state_levels
 
     @property
     def amplitude_and_levels_processing_method(self) -> int:
@@ -296,10 +480,47 @@ class PulseAnalogMeasurementPercentLevelsSettings(AnalysisLibraryElement):
         """
         return self._histogram_size
 
+    @property
+    def state_levels(self) -> Optional[AmplitudeAndLevelsProcessingResult]:
+        """Gets amplitude and levels already processed on the analyzed waveform, can be None.
+
+        Returns:
+            Optional[AmplitudeAndLevelsProcessingResult]: high and low state levels of waveform.
+        """
+        return self._state_levels
+
 
 class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
     """Provides pulse analog processing based on ``LabVIEW Pulse Measurements`` VI"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (196 > 100 characters) (auto-generated noqa)
 
+    _default_processing_backend = PulseAnalogProcessingBackend.LABVIEW
+
+    @staticmethod
+    def get_default_processing_backend() -> PulseAnalogProcessingBackend:
+        """Gets the backend used by pulse measurements processing when no backend
+        is given per call.
+
+        Returns:
+            PulseAnalogProcessingBackend: default pulse measurements processing backend.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return LabViewPulseAnalogMeasurements._default_processing_backend
+
+    @staticmethod
+    def set_default_processing_backend(
+        pulse_analog_processing_backend: PulseAnalogProcessingBackend,
+    ):
+        """Sets the backend used by pulse measurements processing when no backend
+        is given per call.
+
+        Args:
+            pulse_analog_processing_backend (PulseAnalogProcessingBackend):
+                default pulse measurements processing backend.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none(pulse_analog_processing_backend, nameof(pulse_analog_processing_backend))
+        LabViewPulseAnalogMeasurements._default_processing_backend = PulseAnalogProcessingBackend(
+            pulse_analog_processing_backend
+        )
+
     @staticmethod
     def get_last_error_message() -> str:
         """Gets the message content of the last occured error of
@@ -321,6 +542,7 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
         reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
         reference_levels: PulseAnalogProcessingReferenceLevels,
         percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+        pulse_analog_processing_backend: PulseAnalogProcessingBackend = None,
     ) -> Iterable[PulseAnalogProcessingResult]:
         """Processes multiple pulse measurements of a
         given single waveform samples using LabVIEW VI.
@@ -343,6 +565,9 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
                 reference levels that will be used to delimit pulse phases in waveform.
             percent_levels_settings (Optional[PulseAnalogMeasurementPercentLevelsSettings]):
                 state settings when reference levels unit is percent, igonred if absolute.
+            pulse_analog_processing_backend (PulseAnalogProcessingBackend, optional):
+                pulse measurements processing backend, when None the default processing backend
+                is used. Numpy backend processes all pulses in a single pass. Defaults to None.
 
         Raises:
             ValueError:
@@ -362,6 +587,33 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
             waveform_sampling_period_seconds, nameof(waveform_sampling_period_seconds)
         )
 
+        if pulse_analog_processing_backend is None:
+            pulse_analog_processing_backend = (
+                LabViewPulseAnalogMeasurements._default_processing_backend
+            )
+
+        if pulse_analog_processing_backend == PulseAnalogProcessingBackend.NUMPY:
+            try:
+                pulses_processing_results = (
+                    LabViewPulseAnalogMeasurements._numpy_process_single_waveform_pulses(
+                        waveform_samples,
+                        waveform_sampling_period_seconds,
+                        waveform_t0,
+                        export_mode,
+                        processing_polarity,
+                        reference_levels_unit,
+                        reference_levels,
+                        percent_levels_settings,
+                    )
+                )
+            except Exception as e:
+                raise PCBATTAnalysisException(
+                    AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_FAILED_FOR_SOME_REASON
+                ) from e
+
+            yield from pulses_processing_results
+            return
+
         pulse_number = 0
         stop_pulse_analysis = False
 
@@ -393,6 +645,7 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
         reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
         reference_levels: PulseAnalogProcessingReferenceLevels,
         percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+        pulse_analog_processing_backend: PulseAnalogProcessingBackend = None,
     ) -> PulseAnalogProcessingResult:
         """Processes pulse measurements of a given single waveform samples using LabVIEW VI.
 
@@ -415,6 +668,9 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
                 reference levels that will be used to delimit pulse phases in waveform.
             percent_levels_settings (Optional[PulseAnalogMeasurementPercentLevelsSettings]):
                 state settings when reference levels unit is percent, igonred if absolute.
+            pulse_analog_processing_backend (PulseAnalogProcessingBackend, optional):
+                pulse measurements processing backend, when None the default processing backend
+                is used. Defaults to None.
 
         Raises:
             ValueError:
@@ -435,7 +691,31 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
             waveform_sampling_period_seconds, nameof(waveform_sampling_period_seconds)
         )
 
+        if pulse_analog_processing_backend is None:
+            pulse_analog_processing_backend = (
+                LabViewPulseAnalogMeasurements._default_processing_backend
+            )
+
         try:
+            if pulse_analog_processing_backend == PulseAnalogProcessingBackend.NUMPY:
+                pulses_processing_results = (
+                    LabViewPulseAnalogMeasurements._numpy_process_single_waveform_pulses(
+                        waveform_samples,
+                        waveform_sampling_period_seconds,
+                        waveform_t0,
+                        export_mode,
+                        processing_polarity,
+                        reference_levels_unit,
+                        reference_levels,
+                        percent_levels_settings,
+                    )
+                )
+                if pulse_number > len(pulses_processing_results):
+                    raise PCBATTAnalysisException(
+                        AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_PULSE_IS_NOT_FOUND
+                    )
+                return pulses_processing_results[pulse_number - 1]
+
             if reference_levels_unit == PulseAnalogProcessingReferenceLevelsUnit.ABSOLUTE:
                 # hold absolute levels based analysis, percent settings is not required
                 if export_mode == PulseAnalogProcessingExportMode.ALL:
@@ -487,6 +767,55 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
                         AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_REFERENCE_LEVELS_UNIT_PERCENT_REQUIRES_STATES_SETTINGS
                     )
 
+                if percent_levels_settings.state_levels is not None:
+                    # states of waveform are already known, percent reference levels are resolved
+                    # to absolute ones, so that states are not processed a second time.
+                    state_levels = percent_levels_settings.state_levels
+                    absolute_reference_levels = _pulse_analog_analysis.TuplePulseReferenceLevels(
+                        reference_level_high=LabViewPulseAnalogMeasurements._resolve_percent_reference_level(
+                            reference_levels.reference_level_high, state_levels
+                        ),
+                        reference_level_middle=LabViewPulseAnalogMeasurements._resolve_percent_reference_level(
+                            reference_levels.reference_level_middle, state_levels
+                        ),
+                        reference_level_low=LabViewPulseAnalogMeasurements._resolve_percent_reference_level(
+                            reference_levels.reference_level_low, state_levels
+                        ),
+                    )
+
+                    if export_mode == PulseAnalogProcessingExportMode.ALL:
+                        processing_result_as_tuple = _pulse_analog_analysis.labview_process_single_waveform_pulse_measurements_ref_levels_absolute_export_all_impl(
+                            waveform_samples=waveform_samples,
+                            waveform_sampling_period_seconds=waveform_sampling_period_seconds,
+                            pulse_number=pulse_number,
+                            processing_polarity=processing_polarity,
+                            reference_levels=absolute_reference_levels,
+                        )
+                        return PulseAnalogProcessingResult(
+                            processing_result_as_tuple.pulse_center + waveform_t0,
+                            processing_result_as_tuple.pulse_duration,
+                            processing_result_as_tuple.pulse_reference_level_high,
+                            processing_result_as_tuple.pulse_reference_level_middle,
+                            processing_result_as_tuple.pulse_reference_level_low,
+                            processing_result_as_tuple.period,
+                            processing_result_as_tuple.duty_cycle,
+                        )
+
+                    processing_result_as_tuple = _pulse_analog_analysis.labview_process_single_waveform_pulse_measurements_ref_levels_absolute_export_no_periodicity_impl(
+                        waveform_samples=waveform_samples,
+                        waveform_sampling_period_seconds=waveform_sampling_period_seconds,
+                        pulse_number=pulse_number,
+                        processing_polarity=processing_polarity,
+                        reference_levels=absolute_reference_levels,
+                    )
+                    return PulseAnalogProcessingResult(
+                        processing_result_as_tuple.pulse_center + waveform_t0,
+                        processing_result_as_tuple.pulse_duration,
+                        processing_result_as_tuple.pulse_reference_level_high,
+                        processing_result_as_tuple.pulse_reference_level_middle,
+                        processing_result_as_tuple.pulse_reference_level_low,
+                    )
+
                 # hold relative levels based analysis, percent settings is not required
                 if export_mode == PulseAnalogProcessingExportMode.ALL:
                     processing_result_as_tuple = _pulse_analog_analysis.labview_process_single_waveform_pulse_measurements_ref_levels_relative_export_all_impl(
@@ -534,6 +863,421 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
                 AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_FAILED_FOR_SOME_REASON
             ) from e
 
+    @staticmethod
+    def _resolve_percent_reference_level(
+        reference_level_percent: float, state_levels: AmplitudeAndLevelsProcessingResult
+    ) -> float:
+        """Resolves a reference level expressed as percentage of the amplitude of a waveform
+        to an absolute level, 0% being the low state level and 100% the high state level."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return state_levels.low_state_level + numeric_utilities.percent_of(
+            reference_level_percent, state_levels.high_state_level - state_levels.low_state_level
+        )
+
+    @staticmethod
+    def _numpy_get_absolute_reference_levels(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
+        reference_levels: PulseAnalogProcessingReferenceLevels,
+        percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+        high_state_levels: Optional[numpy.ndarray[numpy.float64]] = None,
+        low_state_levels: Optional[numpy.ndarray[numpy.float64]] = None,
+    ) -> tuple[
+        numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64], numpy.ndarray[numpy.float64]
+    ]:
+        """Gets absolute high, middle and low reference levels of each waveform of a 2-D block,
+        percent reference levels are resolved from the states of waveforms, which are processed
+        with numpy when they are not provided."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        reference_levels_values = (
+            reference_levels.reference_level_high,
+            reference_levels.reference_level_middle,
+            reference_levels.reference_level_low,
+        )
+
+        if reference_levels_unit == PulseAnalogProcessingReferenceLevelsUnit.ABSOLUTE:
+            return tuple(
+                numpy.full(waveforms_samples.shape[0], reference_level_value, dtype=numpy.float64)
+                for reference_level_value in reference_levels_values
+            )
+
+        if reference_levels_unit != PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_REFERENCE_LEVELS_UNIT_IS_NOT_SUPPORTED
+            )
+        if percent_levels_settings is None:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_REFERENCE_LEVELS_UNIT_PERCENT_REQUIRES_STATES_SETTINGS
+            )
+
+        if high_state_levels is None or low_state_levels is None:
+            _, high_state_levels, low_state_levels, _ = (
+                _amplitude_and_levels_analysis.numpy_process_waveforms_amplitude_and_levels_impl(
+                    waveforms_samples,
+                    percent_levels_settings.amplitude_and_levels_processing_method,
+                    percent_levels_settings.histogram_size,
+                )
+            )
+
+        return tuple(
+            _pulse_analog_analysis.numpy_resolve_percent_reference_levels_impl(
+                reference_level_value,
+                numpy.asarray(high_state_levels, dtype=numpy.float64),
+                numpy.asarray(low_state_levels, dtype=numpy.float64),
+            )
+            for reference_level_value in reference_levels_values
+        )
+
+    @staticmethod
+    def _numpy_process_single_waveform_pulses(
+        waveform_samples: numpy.ndarray[numpy.float64],
+        waveform_sampling_period_seconds: float,
+        waveform_t0: float,
+        export_mode: PulseAnalogProcessingExportMode,
+        processing_polarity: PulseAnalogProcessingPolarity,
+        reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
+        reference_levels: PulseAnalogProcessingReferenceLevels,
+        percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+    ) -> list[PulseAnalogProcessingResult]:
+        """Processes all pulses of a single waveform using numpy, in pulses order,
+        when all characteristics are exported, only pulses whose period is known are kept."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        samples = numpy.atleast_2d(
+            _waveform_samples.numpy_as_analysis_samples_impl(waveform_samples)
+        )
+        state_levels = (
+            None if percent_levels_settings is None else percent_levels_settings.state_levels
+        )
+
+        reference_levels_high, reference_levels_middle, reference_levels_low = (
+            LabViewPulseAnalogMeasurements._numpy_get_absolute_reference_levels(
+                samples,
+                reference_levels_unit,
+                reference_levels,
+                percent_levels_settings,
+                None if state_levels is None else [state_levels.high_state_level],
+                None if state_levels is None else [state_levels.low_state_level],
+            )
+        )
+        absolute_reference_levels = _pulse_analog_analysis.TuplePulseReferenceLevels(
+            reference_level_high=float(reference_levels_high[0]),
+            reference_level_middle=float(reference_levels_middle[0]),
+            reference_level_low=float(reference_levels_low[0]),
+        )
+
+        pulse_centers, pulse_durations, periods = (
+            _pulse_analog_analysis.numpy_process_waveform_pulses_impl(
+                samples[0],
+                waveform_sampling_period_seconds,
+                processing_polarity,
+                absolute_reference_levels,
+            )
+        )
+
+        if export_mode == PulseAnalogProcessingExportMode.ALL:
+            return [
+                PulseAnalogProcessingResult(
+                    float(pulse_center) + waveform_t0,
+                    float(pulse_duration),
+                    *absolute_reference_levels,
+                    float(period),
+                    float(pulse_duration / period),
+                )
+                for pulse_center, pulse_duration, period in zip(
+                    pulse_centers, pulse_durations, periods
+                )
+                if not numpy.isnan(period)
+            ]
+
+        return [
+            PulseAnalogProcessingResult(
+                float(pulse_center) + waveform_t0,
+                float(pulse_duration),
+                *absolute_reference_levels,
+            )
+            for pulse_center, pulse_duration in zip(pulse_centers, pulse_durations)
+        ]
+
+    @staticmethod
+    def process_multiple_waveforms_block_pulse_measurements(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        waveforms_sampling_period_seconds: float,
+        waveforms_t0: Iterable[float],
+        pulse_number: int,
+        export_mode: PulseAnalogProcessingExportMode,
+        processing_polarity: PulseAnalogProcessingPolarity,
+        reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
+        reference_levels: PulseAnalogProcessingReferenceLevels,
+        percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+        waveforms_state_levels: AmplitudeAndLevelsMultipleWaveformsProcessingResult = None,
+        pulse_analog_processing_backend: PulseAnalogProcessingBackend = None,
+        workers_count: int = 1,
+    ) -> PulseAnalogMultipleWaveformsProcessingResult:
+        """Processes pulse measurement of all waveforms of a 2-D block of samples
+        (one waveform per row), such as the samples of a `MeasurementData`, in a single call.
+
+        Args:
+            waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+            waveforms_sampling_period_seconds (float): common sampling rate of all waveforms.
+            waveforms_t0 (Iterable[float]): for each waveform start date t0.
+            pulse_number (int): index of the pulse that will be analyzed (starts from 1).
+            export_mode (PulseAnalogProcessingExportMode): pulse analysis results exportation mode.
+            processing_polarity (PulseAnalogProcessingPolarity): pulse polarity that will
+                be analyzed (high or low).
+            reference_levels_unit (PulseAnalogProcessingReferenceLevelsUnit):
+                unit of the reference levels.
+            reference_levels (PulseAnalogProcessingReferenceLevels):
+                reference levels that will be used to delimit pulse phases in waveforms.
+            percent_levels_settings (Optional[PulseAnalogMeasurementPercentLevelsSettings]):
+                state settings when reference levels unit is percent, igonred if absolute.
+            waveforms_state_levels (AmplitudeAndLevelsMultipleWaveformsProcessingResult, optional):
+                amplitude and levels already processed on waveforms, when provided percent
+                reference levels are resolved from them and waveforms are not processed again
+                to find their states. Defaults to None.
+            pulse_analog_processing_backend (PulseAnalogProcessingBackend, optional):
+                pulse measurements processing backend, when None the default processing backend
+                is used. Defaults to None.
+            workers_count (int, optional): number of threads sharing the waveforms when
+            LabVIEW backend is used, results are identical whatever the value. Defaults to 1.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid.
+            PCBATTAnalysisException:
+                Occurs when analysis fails for some reason.
+
+        Returns:
+            PulseAnalogMultipleWaveformsProcessingResult: An object that holds pulse measurements
+            of all waveforms, in rows order, values are NaN for waveforms without the pulse.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_zero(
+            waveforms_sampling_period_seconds, nameof(waveforms_sampling_period_seconds)
+        )
+        Guard.have_same_size(
+            first_iterable_instance=numpy.atleast_2d(waveforms_samples),
+            first_iterable_name=nameof(waveforms_samples),
+            second_iterable_instance=waveforms_t0,
+            second_iterable_name=nameof(waveforms_t0),
+        )
+        Guard.is_greater_than_zero(pulse_number, nameof(pulse_number))
+        Guard.is_greater_than_zero(workers_count, nameof(workers_count))
+
+        if pulse_analog_processing_backend is None:
+            pulse_analog_processing_backend = (
+                LabViewPulseAnalogMeasurements._default_processing_backend
+            )
+
+        try:
+            samples = numpy.atleast_2d(
+                _waveform_samples.numpy_as_analysis_samples_impl(waveforms_samples)
+            )
+            waveforms_t0_values = numpy.asarray(list(waveforms_t0), dtype=numpy.float64)
+
+            if pulse_analog_processing_backend == PulseAnalogProcessingBackend.NUMPY:
+                reference_levels_high, reference_levels_middle, reference_levels_low = (
+                    LabViewPulseAnalogMeasurements._numpy_get_absolute_reference_levels(
+                        samples,
+                        reference_levels_unit,
+                        reference_levels,
+                        percent_levels_settings,
+                        (
+                            None
+                            if waveforms_state_levels is None
+                            else waveforms_state_levels.high_state_levels
+                        ),
+                        (
+                            None
+                            if waveforms_state_levels is None
+                            else waveforms_state_levels.low_state_levels
+                        ),
+                    )
+                )
+
+                periodicity_is_exported = export_mode == PulseAnalogProcessingExportMode.ALL
+                pulse_centers, pulse_durations, periods, duty_cycles = (
+                    _pulse_analog_analysis.numpy_process_waveforms_pulse_measurements_impl(
+                        samples,
+                        waveforms_sampling_period_seconds,
+                        pulse_number,
+                        processing_polarity,
+                        reference_levels_high,
+                        reference_levels_middle,
+                        reference_levels_low,
+                        periodicity_is_exported,
+                    )
+                )
+                if not periodicity_is_exported:
+                    periods = numpy.full_like(periods, numpy.nan)
+                    duty_cycles = numpy.full_like(duty_cycles, numpy.nan)
+
+                return PulseAnalogMultipleWaveformsProcessingResult(
+                    pulse_centers + waveforms_t0_values,
+                    pulse_durations,
+                    reference_levels_high,
+                    reference_levels_middle,
+                    reference_levels_low,
+                    periods,
+                    duty_cycles,
+                )
+
+            waveforms_count = samples.shape[0]
+            results_arrays = [numpy.full(waveforms_count, numpy.nan) for _ in range(7)]
+
+            def process_waveforms_range(start_index: int, stop_index: int):
+                for waveform_index in range(start_index, stop_index):
+                    waveform_percent_levels_settings = percent_levels_settings
+                    if percent_levels_settings is not None and waveforms_state_levels is not None:
+                        waveform_percent_levels_settings = (
+                            PulseAnalogMeasurementPercentLevelsSettings(
+                                percent_levels_settings.amplitude_and_levels_processing_method,
+                                percent_levels_settings.histogram_size,
+                                AmplitudeAndLevelsProcessingResult(
+                                    float(waveforms_state_levels.amplitudes[waveform_index]),
+                                    float(waveforms_state_levels.high_state_levels[waveform_index]),
+                                    float(waveforms_state_levels.low_state_levels[waveform_index]),
+                                ),
+                            )
+                        )
+
+                    try:
+                        pulse_processing_result = LabViewPulseAnalogMeasurements.process_single_waveform_pulse_measurements(
+                            samples[waveform_index],
+                            waveforms_sampling_period_seconds,
+                            waveforms_t0_values[waveform_index],
+                            pulse_number,
+                            export_mode,
+                            processing_polarity,
+                            reference_levels_unit,
+                            reference_levels,
+                            waveform_percent_levels_settings,
+                            PulseAnalogProcessingBackend.LABVIEW,
+                        )
+                    except PCBATTAnalysisException:
+                        # pulse is not found in waveform, its values remain NaN
+                        continue
+
+                    periodicity_processing_result = (
+                        pulse_processing_result.waveform_periodicity_processing_result
+                    )
+                    waveform_results = (
+                        pulse_processing_result.pulse_center,
+                        pulse_processing_result.pulse_duration,
+                        pulse_processing_result.pulse_reference_level_high,
+                        pulse_processing_result.pulse_reference_level_middle,
+                        pulse_processing_result.pulse_reference_level_low,
+                        (
+                            numpy.nan
+                            if periodicity_processing_result is None
+                            else periodicity_processing_result.period
+                        ),
+                        (
+                            numpy.nan
+                            if periodicity_processing_result is None
+                            else periodicity_processing_result.duty_cycle
+                        ),
+                    )
+                    for results_array, waveform_result in zip(results_arrays, waveform_results):
+                        results_array[waveform_index] = waveform_result
+
+            process_waveforms_indexes_ranges(
+                waveforms_count=waveforms_count,
+                workers_count=workers_count,
+                process_waveforms_range=process_waveforms_range,
+            )
+
+            return PulseAnalogMultipleWaveformsProcessingResult(*results_arrays)
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
+    @staticmethod
+    def detect_multiple_waveforms_block_periodicity(
+        waveforms_samples: numpy.ndarray[numpy.float64],
+        processing_polarity: PulseAnalogProcessingPolarity,
+        reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
+        reference_levels: PulseAnalogProcessingReferenceLevels,
+        percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+        waveforms_state_levels: AmplitudeAndLevelsMultipleWaveformsProcessingResult = None,
+        minimum_amplitude: float = 0.0,
+    ) -> numpy.ndarray[numpy.bool_]:
+        """Checks, with a fast numpy pre-screen, which waveforms of a 2-D block of samples
+        (one waveform per row) are periodic, so that pulse measurements are only processed
+        on them. A waveform is periodic when it holds at least two leading edges crossing
+        low, middle and high reference levels, that is a complete period, and when its
+        amplitude is at least `minimum_amplitude`.
+
+        Percent reference levels of a constant waveform lie within its noise, which crosses
+        them many times, so that noisy DC waveforms are only rejected by their amplitude.
+
+        Args:
+            waveforms_samples (numpy.ndarray[numpy.float64]): 2-D array of waveforms samples.
+            processing_polarity (PulseAnalogProcessingPolarity): pulse polarity that will
+                be analyzed (high or low).
+            reference_levels_unit (PulseAnalogProcessingReferenceLevelsUnit):
+                unit of the reference levels.
+            reference_levels (PulseAnalogProcessingReferenceLevels):
+                reference levels that will be used to delimit pulse phases in waveforms.
+            percent_levels_settings (Optional[PulseAnalogMeasurementPercentLevelsSettings]):
+                state settings when reference levels unit is percent, igonred if absolute.
+            waveforms_state_levels (AmplitudeAndLevelsMultipleWaveformsProcessingResult, optional):
+                amplitude and levels already processed on waveforms, when provided percent
+                reference levels are resolved from them. Defaults to None.
+            minimum_amplitude (float, optional): smallest amplitude of a periodic waveform,
+                difference of its high and low state levels when `waveforms_state_levels`
+                is provided, peak to peak amplitude otherwise. Defaults to 0.0.
+
+        Raises:
+            ValueError:
+                Occurs when one of provided input arguments is invalid.
+            PCBATTAnalysisException:
+                Occurs when analysis fails for some reason.
+
+        Returns:
+            numpy.ndarray[numpy.bool_]: True for periodic waveforms, in rows order.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_not_empty(waveforms_samples, nameof(waveforms_samples))
+        Guard.is_greater_than_or_equal_to_zero(minimum_amplitude, nameof(minimum_amplitude))
+
+        try:
+            samples = numpy.atleast_2d(
+                _waveform_samples.numpy_as_analysis_samples_impl(waveforms_samples)
+            )
+            if waveforms_state_levels is None:
+                waveforms_amplitudes = numpy.ptp(samples, axis=1)
+            else:
+                waveforms_amplitudes = numpy.asarray(
+                    waveforms_state_levels.high_state_levels, dtype=numpy.float64
+                ) - numpy.asarray(waveforms_state_levels.low_state_levels, dtype=numpy.float64)
+
+            reference_levels_high, _, reference_levels_low = (
+                LabViewPulseAnalogMeasurements._numpy_get_absolute_reference_levels(
+                    samples,
+                    reference_levels_unit,
+                    reference_levels,
+                    percent_levels_settings,
+                    (
+                        None
+                        if waveforms_state_levels is None
+                        else waveforms_state_levels.high_state_levels
+                    ),
+                    (
+                        None
+                        if waveforms_state_levels is None
+                        else waveforms_state_levels.low_state_levels
+                    ),
+                )
+            )
+
+            leading_edges_counts = _pulse_analog_analysis.numpy_count_waveforms_leading_edges_impl(
+                samples, processing_polarity, reference_levels_high, reference_levels_low
+            )
+            return (leading_edges_counts >= 2) & (waveforms_amplitudes >= minimum_amplitude)
+        except Exception as e:
+            raise PCBATTAnalysisException(
+                AnalysisLibraryExceptionMessage.PULSE_MEASUREMENTS_PROCESSING_FAILED_FOR_SOME_REASON
+            ) from e
+
     @staticmethod
     def process_multiple_waveforms_pulse_measurements(
         waveforms_samples: Iterable[numpy.ndarray[numpy.float64]],
@@ -545,6 +1289,7 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
         reference_levels_unit: PulseAnalogProcessingReferenceLevelsUnit,
         reference_levels: PulseAnalogProcessingReferenceLevels,
         percent_levels_settings: Optional[PulseAnalogMeasurementPercentLevelsSettings],
+        pulse_analog_processing_backend: PulseAnalogProcessingBackend = None,
     ) -> Iterable[PulseAnalogProcessingResult]:
         """Processes pulse measurement of a given multiple waveforms samples using LabVIEW VI.
 
@@ -562,6 +1307,9 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
                 reference levels that will be used to delimit pulse phases in waveforms.
             percent_levels_settings (Optional[PulseAnalogMeasurementPercentLevelsSettings]):
                 state settings when reference levels unit is percent, igonred if absolute.
+            pulse_analog_processing_backend (PulseAnalogProcessingBackend, optional):
+                pulse measurements processing backend, when None the default processing backend
+                is used. Defaults to None.
 
         Returns:
             Iterable[PulseAnalogProcessingResult]: An iterable of objects that hold result of
@@ -601,4 +1349,5 @@ class LabViewPulseAnalogMeasurements(AnalysisLibraryElement):
                 reference_levels_unit,
                 reference_levels,
                 percent_levels_settings,
+                pulse_analog_processing_backend,
             )
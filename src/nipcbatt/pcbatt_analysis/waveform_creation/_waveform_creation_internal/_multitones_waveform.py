@@ -1,17 +1,72 @@
-"""Private module that provides a set of helper functions 
+"""Private module that provides a set of helper functions
    for `multitones_waveform` module."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (332 > 100 characters) (auto-generated noqa)
 
-import math
+from typing import Iterator
 
 import numpy
 
 from nipcbatt.pcbatt_analysis.common.common_types import WaveformTone
-from nipcbatt.pcbatt_analysis.waveform_transformation import (  # noqa: F401 - 'nipcbatt.pcbatt_analysis.waveform_transformation.scale_and_offset_waveform' imported but unused (auto-generated noqa)
-    scale_and_offset_waveform,
-)
-from nipcbatt.pcbatt_utilities import (  # noqa: F401 - 'nipcbatt.pcbatt_utilities.numeric_utilities' imported but unused (auto-generated noqa)
-    numeric_utilities,
+from nipcbatt.pcbatt_analysis.waveform_creation._waveform_creation_internal import (
+    _waveform_buffers,
 )
+from nipcbatt.pcbatt_utilities import numeric_utilities
+
+
+def accumulate_tones_samples_impl(
+    waveform_tones: list[WaveformTone],
+    sampling_rate: float,
+    samples_array: numpy.ndarray,
+    first_sample_index: int = 0,
+) -> float:
+    """Fills `samples_array` with the sum of sine waves described by `waveform_tones`,
+    sum is built in float64 by chunks of samples, whatever the type of `samples_array`.
+
+    Sample `i` of the array is the sum of
+    `tone.amplitude * sin(tone.phase_radians + (first_sample_index + i) * w)`
+    where `w = 2 * PI * tone.frequency / sampling_rate`.
+
+    Returns:
+        float: maximum of the samples, computed while the sum is built.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    samples_count = samples_array.size
+    chunk_size = min(samples_count, _waveform_buffers.SAMPLES_CHUNK_SIZE)
+    chunk_indexes = numpy.arange(chunk_size, dtype=numpy.float64)
+    tone_buffer = numpy.empty(chunk_size, dtype=numpy.float64)
+    samples_are_float64 = samples_array.dtype == numpy.float64
+    sum_buffer = None if samples_are_float64 else numpy.empty(chunk_size, dtype=numpy.float64)
+
+    tones_numerators = [
+        2.0 * numpy.pi * waveform_tone.frequency / sampling_rate for waveform_tone in waveform_tones
+    ]
+    samples_max = -numpy.inf
+
+    for chunk_start in range(0, samples_count, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, samples_count)
+        chunk_length = chunk_stop - chunk_start
+        chunk_sum = (
+            samples_array[chunk_start:chunk_stop]
+            if samples_are_float64
+            else sum_buffer[:chunk_length]
+        )
+        chunk_tone = tone_buffer[:chunk_length]
+        chunk_sum.fill(0.0)
+
+        for waveform_tone, numerator in zip(waveform_tones, tones_numerators):
+            numpy.add(
+                chunk_indexes[:chunk_length], first_sample_index + chunk_start, out=chunk_tone
+            )
+            chunk_tone *= numerator
+            chunk_tone += waveform_tone.phase_radians
+            numpy.sin(chunk_tone, out=chunk_tone)
+            chunk_tone *= waveform_tone.amplitude
+            chunk_sum += chunk_tone
+
+        samples_max = max(samples_max, float(chunk_sum.max()))
+
+        if not samples_are_float64:
+            samples_array[chunk_start:chunk_stop] = chunk_sum
+
+    return samples_max
 
 
 def create_multitones_waveform_impl(
@@ -20,31 +75,48 @@ def create_multitones_waveform_impl(
     samples_count: int,
     sampling_rate: float,
     amplitude_normalization_threshold: float = 0.000001,
-) -> numpy.ndarray[numpy.float64]:
+    amplitude_normalization_enabled: bool = False,
+    out: numpy.ndarray = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> numpy.ndarray:
     """Creates samples of a multitones waveform described through its characteristics."""
-    result_waveform: numpy.ndarray[numpy.float64] = numpy.zeros(shape=samples_count)
-
-    # fill sum of sine waves
-    for waveform_tone in waveform_tones:
-        for sample_index in range(0, samples_count):
-            numerator = 2.0 * numpy.pi * waveform_tone.frequency / sampling_rate
-            result_waveform[sample_index] = result_waveform[sample_index] + (
-                waveform_tone.amplitude
-                * math.sin(waveform_tone.phase_radians + sample_index * numerator)
-            )
+    result_waveform = _waveform_buffers.get_output_buffer(samples_count, out, dtype)
 
-    # normalize resulting sum waveform
-    # samples_max: numpy.float64 = result_waveform.max()
+    # fill sum of sine waves, maximum of the sum is computed on the fly
+    samples_max = accumulate_tones_samples_impl(waveform_tones, sampling_rate, result_waveform)
 
-    # if samples_max > amplitude_normalization_threshold:
-    #     wanted_samples_max = amplitude
-    #     actual_samples_max = samples_max
-    #     normalization_factor = numeric_utilities.absolute_value(
-    #         wanted_samples_max
-    #     ) / numeric_utilities.absolute_value(actual_samples_max)
+    # normalize resulting sum waveform in place,
+    # using the maximum computed while the sum was built instead of a dedicated pass
+    if amplitude_normalization_enabled and samples_max > amplitude_normalization_threshold:
+        wanted_samples_max = amplitude
+        actual_samples_max = samples_max
+        normalization_factor = numeric_utilities.absolute_value(
+            wanted_samples_max
+        ) / numeric_utilities.absolute_value(actual_samples_max)
 
-    #     scale_and_offset_waveform.scale_inplace(
-    #         waveform_samples=result_waveform, scale_factor=normalization_factor
-    #     )
+        numpy.multiply(result_waveform, normalization_factor, out=result_waveform)
 
     return result_waveform
+
+
+def generate_multitones_waveform_chunks_impl(
+    waveform_tones: list[WaveformTone],
+    sampling_rate: float,
+    chunk_samples_count: int,
+    samples_count: int = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> Iterator[numpy.ndarray]:
+    """Yields successive chunks of samples of the sum of sine waves described by
+    `waveform_tones`, phase of each tone is carried across chunks through the index
+    of the first sample of each chunk."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    # tones are copied, later changes of the caller list do not alter the stream
+    waveform_tones = list(waveform_tones)
+
+    return _waveform_buffers.generate_samples_chunks_impl(
+        lambda samples_chunk, first_sample_index: accumulate_tones_samples_impl(
+            waveform_tones, sampling_rate, samples_chunk, first_sample_index
+        ),
+        chunk_samples_count,
+        samples_count,
+        dtype,
+    )
@@ -1,30 +1,76 @@
 """Private module that provides a set of helper functions
    for `sine_waveform` module."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (326 > 100 characters) (auto-generated noqa)
 
-import math
+from typing import Iterator
 
 import numpy
 
+from nipcbatt.pcbatt_analysis.waveform_creation._waveform_creation_internal import (
+    _waveform_buffers,
+)
 
-def create_cosine_waveform_impl(
+
+def fill_sinusoid_samples_impl(
+    sinusoid_function: numpy.ufunc,
     amplitude: float,
     frequency: float,
     phase: float,
     offset: float,
-    samples_count: int,
     sampling_rate: float,
-) -> numpy.ndarray[numpy.float64]:
-    """Creates samples of a cosine waveform described through its characteristics."""
-    phase = phase % (2.0 * numpy.pi)
-    samples_array = numpy.zeros(shape=samples_count)
+    samples_array: numpy.ndarray,
+    first_sample_index: int = 0,
+):
+    """Fills `samples_array` with samples of a sinusoid computed through `sinusoid_function`,
+    `numpy.sin` or `numpy.cos`, samples are computed in float64 by chunks,
+    whatever the type of `samples_array`.
 
+    Sample `i` of the array is `offset + amplitude * f(phase + (first_sample_index + i) * w)`
+    where `w = 2 * PI * frequency / sampling_rate`.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    phase = phase % (2.0 * numpy.pi)
     numerator = 2.0 * numpy.pi * frequency / sampling_rate
 
-    for sample_index in range(0, samples_count):
-        samples_array[sample_index] = offset + amplitude * math.cos(
-            phase + sample_index * numerator
+    samples_count = samples_array.size
+    chunk_size = min(samples_count, _waveform_buffers.SAMPLES_CHUNK_SIZE)
+    chunk_indexes = numpy.arange(chunk_size, dtype=numpy.float64)
+    samples_are_float64 = samples_array.dtype == numpy.float64
+    chunk_buffer = None if samples_are_float64 else numpy.empty(chunk_size, dtype=numpy.float64)
+
+    for chunk_start in range(0, samples_count, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, samples_count)
+        chunk_length = chunk_stop - chunk_start
+        chunk = (
+            samples_array[chunk_start:chunk_stop]
+            if samples_are_float64
+            else chunk_buffer[:chunk_length]
         )
 
+        numpy.add(chunk_indexes[:chunk_length], first_sample_index + chunk_start, out=chunk)
+        chunk *= numerator
+        chunk += phase
+        sinusoid_function(chunk, out=chunk)
+        chunk *= amplitude
+        chunk += offset
+
+        if not samples_are_float64:
+            samples_array[chunk_start:chunk_stop] = chunk
+
+
+def create_cosine_waveform_impl(
+    amplitude: float,
+    frequency: float,
+    phase: float,
+    offset: float,
+    samples_count: int,
+    sampling_rate: float,
+    out: numpy.ndarray = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> numpy.ndarray:
+    """Creates samples of a cosine waveform described through its characteristics."""
+    samples_array = _waveform_buffers.get_output_buffer(samples_count, out, dtype)
+    fill_sinusoid_samples_impl(
+        numpy.cos, amplitude, frequency, phase, offset, sampling_rate, samples_array
+    )
     return samples_array
 
 
@@ -35,16 +81,42 @@ def create_sine_waveform_impl(
     offset: float,
     samples_count: int,
     sampling_rate: float,
-) -> numpy.ndarray[numpy.float64]:
+    out: numpy.ndarray = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> numpy.ndarray:
     """Creates samples of a sine waveform described through its characteristics."""
-    phase = phase % (2.0 * numpy.pi)
-    samples_array = numpy.zeros(shape=samples_count)
-
-    numerator = 2.0 * numpy.pi * frequency / sampling_rate
+    samples_array = _waveform_buffers.get_output_buffer(samples_count, out, dtype)
+    fill_sinusoid_samples_impl(
+        numpy.sin, amplitude, frequency, phase, offset, sampling_rate, samples_array
+    )
+    return samples_array
 
-    for sample_index in range(0, samples_count):
-        samples_array[sample_index] = offset + amplitude * math.sin(
-            phase + sample_index * numerator
-        )
 
-    return samples_array
+def generate_sinusoid_chunks_impl(
+    sinusoid_function: numpy.ufunc,
+    amplitude: float,
+    frequency: float,
+    phase: float,
+    offset: float,
+    sampling_rate: float,
+    chunk_samples_count: int,
+    samples_count: int = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> Iterator[numpy.ndarray]:
+    """Yields successive chunks of samples of a sinusoid computed through `sinusoid_function`,
+    phase is carried across chunks through the index of the first sample of each chunk."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    return _waveform_buffers.generate_samples_chunks_impl(
+        lambda samples_chunk, first_sample_index: fill_sinusoid_samples_impl(
+            sinusoid_function,
+            amplitude,
+            frequency,
+            phase,
+            offset,
+            sampling_rate,
+            samples_chunk,
+            first_sample_index,
+        ),
+        chunk_samples_count,
+        samples_count,
+        dtype,
+    )
@@ -1,40 +1,136 @@
-"""Private module that provides a set of helper functions 
+"""Private module that provides a set of helper functions
    for `square_waveform` module."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (328 > 100 characters) (auto-generated noqa)
 
 import math
+from typing import Iterator
 
 import numpy
-import scipy.signal
 
+from nipcbatt.pcbatt_analysis.waveform_creation._waveform_creation_internal import (
+    _waveform_buffers,
+)
 from nipcbatt.pcbatt_utilities import numeric_utilities
 
 
-def create_square_waveform_impl(
+def fill_square_samples_impl(
     amplitude: float,
     frequency: float,
     duty_cycle: float,
-    phase: float,
     offset: float,
-    samples_count: int,
     sampling_rate: float,
-) -> numpy.ndarray[numpy.float64]:
-    """Creates samples of a square waveform described through its characteristics."""  # noqa: D202, W505 - No blank lines allowed after function docstring (auto-generated noqa), doc line too long (171 > 100 characters) (auto-generated noqa)
+    samples_array: numpy.ndarray,
+    first_sample_index: int,
+):
+    """Fills `samples_array` with samples of a square waveform starting at phase 0,
+    sample `i` of the array is the sample `first_sample_index + i` of the square waveform.
 
+    Samples are `offset + amplitude` while the phase, modulo 2*PI, is less than
+    `duty_cycle` * 2*PI, and `offset - amplitude` otherwise.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
     sampling_period = numeric_utilities.invert_value(sampling_rate)
+    pulsation = 2 * numpy.pi * frequency
+    high_state_phase_limit = duty_cycle * 2 * numpy.pi
+    high_state_level = amplitude + offset
+    low_state_level = -amplitude + offset
+
+    samples_count = samples_array.size
+    chunk_size = min(samples_count, _waveform_buffers.SAMPLES_CHUNK_SIZE)
+    chunk_indexes = numpy.arange(chunk_size, dtype=numpy.float64)
+    phases_buffer = numpy.empty(chunk_size, dtype=numpy.float64)
+    high_state_mask_buffer = numpy.empty(chunk_size, dtype=numpy.bool_)
+
+    for chunk_start in range(0, samples_count, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, samples_count)
+        chunk_length = chunk_stop - chunk_start
+        chunk_phases = phases_buffer[:chunk_length]
+        chunk_high_state_mask = high_state_mask_buffer[:chunk_length]
+        chunk_samples = samples_array[chunk_start:chunk_stop]
+
+        # phase of each sample, computed as (2*PI*f) * (sample_index * sampling_period)
+        numpy.add(chunk_indexes[:chunk_length], first_sample_index + chunk_start, out=chunk_phases)
+        chunk_phases *= sampling_period
+        chunk_phases *= pulsation
+        numpy.mod(chunk_phases, 2 * numpy.pi, out=chunk_phases)
+        numpy.less(chunk_phases, high_state_phase_limit, out=chunk_high_state_mask)
+
+        chunk_samples.fill(low_state_level)
+        numpy.copyto(chunk_samples, high_state_level, where=chunk_high_state_mask)
+
+
+def get_square_waveform_delay_impl(frequency: float, phase: float, sampling_rate: float) -> int:
+    """Gets the number of samples by which a square waveform is delayed by its phase."""
     waveform_period = numeric_utilities.invert_value(frequency)
 
     square_waveform_phase_rounded = phase % (2 * numpy.pi)
-    square_wave_delay_from_phase = math.floor(
+    return math.floor(
         sampling_rate * (square_waveform_phase_rounded * waveform_period / (2 * numpy.pi))
     )
 
-    x = numpy.fromiter(
-        map(lambda sample_index: sample_index * sampling_period, range(0, samples_count)),
-        dtype=numpy.float64,
+
+def create_square_waveform_impl(
+    amplitude: float,
+    frequency: float,
+    duty_cycle: float,
+    phase: float,
+    offset: float,
+    samples_count: int,
+    sampling_rate: float,
+    out: numpy.ndarray = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> numpy.ndarray:
+    """Creates samples of a square waveform described through its characteristics."""  # noqa: D202, W505 - No blank lines allowed after function docstring (auto-generated noqa), doc line too long (171 > 100 characters) (auto-generated noqa)
+
+    square_wave_delay_from_phase = get_square_waveform_delay_impl(frequency, phase, sampling_rate)
+
+    samples_array = _waveform_buffers.get_output_buffer(samples_count, out, dtype)
+
+    # phase delay is applied by index arithmetic, samples [delay, count) of the result
+    # are the first samples of the square waveform, samples [0, delay) are its last samples.
+    delay = square_wave_delay_from_phase % samples_count
+    fill_square_samples_impl(
+        amplitude, frequency, duty_cycle, offset, sampling_rate, samples_array[delay:], 0
     )
-    y = scipy.signal.square(t=(2 * numpy.pi * frequency) * x, duty=duty_cycle)
+    if delay > 0:
+        fill_square_samples_impl(
+            amplitude,
+            frequency,
+            duty_cycle,
+            offset,
+            sampling_rate,
+            samples_array[:delay],
+            samples_count - delay,
+        )
+
+    return samples_array
 
-    for sample_index in range(0, y.size):
-        y[sample_index] = amplitude * y[sample_index] + offset
 
-    return numpy.roll(y, square_wave_delay_from_phase)
+def generate_square_waveform_chunks_impl(
+    amplitude: float,
+    frequency: float,
+    duty_cycle: float,
+    phase: float,
+    offset: float,
+    sampling_rate: float,
+    chunk_samples_count: int,
+    samples_count: int = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> Iterator[numpy.ndarray]:
+    """Yields successive chunks of samples of a square waveform, sample `n` of the stream
+    is the sample `n - delay` of the square waveform starting at phase 0, where `delay`
+    is the number of samples by which the square waveform is delayed by its phase."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    delay = get_square_waveform_delay_impl(frequency, phase, sampling_rate)
+
+    return _waveform_buffers.generate_samples_chunks_impl(
+        lambda samples_chunk, first_sample_index: fill_square_samples_impl(
+            amplitude,
+            frequency,
+            duty_cycle,
+            offset,
+            sampling_rate,
+            samples_chunk,
+            first_sample_index - delay,
+        ),
+        chunk_samples_count,
+        samples_count,
+        dtype,
+    )
@@ -0,0 +1,96 @@
+"""Private module that provides helper functions used to allocate
+   or check buffers receiving created waveforms samples."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+from typing import Callable, Iterator
+
+import numpy
+
+from nipcbatt.pcbatt_analysis.analysis_library_messages import (
+    AnalysisLibraryExceptionMessage,
+)
+
+# Number of samples processed at once by chunked waveform creation engines,
+# bounds the size of temporary arrays whatever the samples count.
+SAMPLES_CHUNK_SIZE = 65536
+
+SUPPORTED_SAMPLES_TYPES = (numpy.float32, numpy.float64)
+
+
+def get_samples_type(
+    samples_count: int, out: numpy.ndarray = None, dtype: numpy.dtype = numpy.float64
+) -> numpy.dtype:
+    """Gets the type of samples of a created waveform, checking the caller supplied buffer.
+
+    Args:
+        samples_count (int): number of samples of the created waveform.
+        out (numpy.ndarray, optional): caller supplied buffer, None when no buffer is supplied.
+        dtype (numpy.dtype, optional): type of samples, float32 or float64,
+            ignored when `out` is supplied. Defaults to numpy.float64.
+
+    Raises:
+        ValueError: occurs when samples type is not float32 nor float64,
+            or when `out` is not a 1-D buffer of `samples_count` samples.
+
+    Returns:
+        numpy.dtype: type of samples, type of `out` when supplied.
+    """
+    samples_type = numpy.dtype(dtype) if out is None else out.dtype
+
+    if samples_type not in SUPPORTED_SAMPLES_TYPES:
+        raise ValueError(AnalysisLibraryExceptionMessage.WAVEFORM_SAMPLES_TYPE_IS_NOT_SUPPORTED)
+    if out is not None and (out.ndim != 1 or out.size != samples_count):
+        raise ValueError(
+            AnalysisLibraryExceptionMessage.WAVEFORM_OUTPUT_BUFFER_SIZE_IS_NOT_SAMPLES_COUNT
+        )
+    return samples_type
+
+
+def get_output_buffer(
+    samples_count: int, out: numpy.ndarray = None, dtype: numpy.dtype = numpy.float64
+) -> numpy.ndarray:
+    """Gets the buffer that will receive the samples of a created waveform.
+
+    Args:
+        samples_count (int): number of samples of the created waveform.
+        out (numpy.ndarray, optional): caller supplied buffer, when None a buffer is allocated.
+        dtype (numpy.dtype, optional): type of samples of allocated buffer,
+            float32 or float64, ignored when `out` is supplied. Defaults to numpy.float64.
+
+    Raises:
+        ValueError: occurs when samples type is not float32 nor float64,
+            or when `out` is not a 1-D buffer of `samples_count` samples.
+
+    Returns:
+        numpy.ndarray: 1-D buffer of `samples_count` samples.
+    """
+    samples_type = get_samples_type(samples_count, out, dtype)
+    if out is None:
+        return numpy.empty(shape=samples_count, dtype=samples_type)
+    return out
+
+
+def generate_samples_chunks_impl(
+    fill_samples_chunk: Callable[[numpy.ndarray, int], None],
+    chunk_samples_count: int,
+    samples_count: int = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> Iterator[numpy.ndarray]:
+    """Yields successive chunks of samples of a waveform, each chunk is a new buffer
+    filled through `fill_samples_chunk`, which receives the buffer and the index,
+    in the whole waveform, of the first sample of the chunk.
+
+    Chunks hold `chunk_samples_count` samples, except the last one when `samples_count`
+    is not a multiple of it. When `samples_count` is None, chunks are yielded endlessly.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    first_sample_index = 0
+
+    while samples_count is None or first_sample_index < samples_count:
+        chunk_length = (
+            chunk_samples_count
+            if samples_count is None
+            else min(chunk_samples_count, samples_count - first_sample_index)
+        )
+        samples_chunk = numpy.empty(shape=chunk_length, dtype=dtype)
+        fill_samples_chunk(samples_chunk, first_sample_index)
+        yield samples_chunk
+        first_sample_index += chunk_length
@@ -1,5 +1,7 @@
 """Provides multiple tones waveform creation API."""
 
+from typing import Iterator
+
 import numpy
 from varname import nameof
 
@@ -8,8 +10,10 @@ from nipcbatt.pcbatt_analysis.analysis_library_messages import (
     AnalysisLibraryExceptionMessage,
 )
 from nipcbatt.pcbatt_analysis.common.common_types import WaveformTone
+from nipcbatt.pcbatt_analysis.waveform_creation import waveform_cache
 from nipcbatt.pcbatt_analysis.waveform_creation._waveform_creation_internal import (
     _multitones_waveform,
+    _waveform_buffers,
 )
 from nipcbatt.pcbatt_utilities.guard_utilities import Guard
 
@@ -20,7 +24,10 @@ def create_multitones_waveform(
     samples_count: int,
     sampling_rate: float,
     amplitude_normalization_threshold: float = 0.000001,
-) -> numpy.ndarray[numpy.float64]:
+    amplitude_normalization_enabled: bool = False,
+    out: numpy.ndarray = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> numpy.ndarray:
     """Creates samples of a multi-tones waveform described through its characteristics.
 
     Args:
@@ -32,15 +39,25 @@ def create_multitones_waveform(
         sampling_rate (float): sampling rate of the multi-tones waveform.
         amplitude_normalization_threshold(float): when waveform maximum is greater than it,
             normalization of the amplitude is applied to match input `multitones_amplitude`.
+        amplitude_normalization_enabled(bool, optional): whether normalization of the amplitude
+            is applied, scaling is done in place using the maximum computed while tones are
+            summed. Defaults to False.
+        out (numpy.ndarray, optional): 1-D float32 or float64 buffer of `samples_count` samples
+            receiving created samples, when None a new buffer is allocated. Defaults to None.
+        dtype (numpy.dtype, optional): type of samples, float32 or float64,
+            ignored when `out` is supplied. Defaults to numpy.float64.
 
     Raises:
         PCBATTAnalysisException: occurs when waveform creation fails for some reason.
         ValueError: occurs when samples_count is less or equal zero,
             when sampling_rate is less or equal zero,
-            and when amplitude_normalization_threshold is less or equal zero.
+            when amplitude_normalization_threshold is less or equal zero,
+            when samples type is not float32 nor float64,
+            and when `out` does not hold `samples_count` samples.
 
     Returns:
-        numpy.ndarray[numpy.float64]: samples constituting created multi-tones waveform.
+        numpy.ndarray: samples constituting created multi-tones waveform, `out` when supplied.
+        Samples are read-only when they come from the enabled `waveform_cache`.
     """
     Guard.is_greater_than_zero(multitones_amplitude, nameof(multitones_amplitude))
     Guard.is_greater_than_zero(samples_count, nameof(samples_count))
@@ -48,16 +65,83 @@ def create_multitones_waveform(
     Guard.is_greater_than_zero(
         amplitude_normalization_threshold, nameof(amplitude_normalization_threshold)
     )
+    samples_type = _waveform_buffers.get_samples_type(samples_count, out, dtype)
 
     try:
-        return _multitones_waveform.create_multitones_waveform_impl(
-            multitones_amplitude,
-            waveform_tones,
-            samples_count,
-            sampling_rate,
-            amplitude_normalization_threshold,
+        return waveform_cache.get_or_create_waveform(
+            waveform_key=(
+                "multitones",
+                multitones_amplitude,
+                tuple(
+                    (waveform_tone.frequency, waveform_tone.amplitude, waveform_tone.phase_radians)
+                    for waveform_tone in waveform_tones
+                ),
+                sampling_rate,
+                amplitude_normalization_threshold,
+                amplitude_normalization_enabled,
+            ),
+            samples_count=samples_count,
+            samples_type=samples_type,
+            create_waveform=lambda samples_array: (
+                _multitones_waveform.create_multitones_waveform_impl(
+                    multitones_amplitude,
+                    waveform_tones,
+                    samples_count,
+                    sampling_rate,
+                    amplitude_normalization_threshold,
+                    amplitude_normalization_enabled,
+                    out=samples_array,
+                )
+            ),
+            out=out,
         )
     except Exception as e:
         raise PCBATTAnalysisException(
             AnalysisLibraryExceptionMessage.MULTIPLE_TONES_WAVEFORM_CREATION_FAILED_FOR_SOME_REASON
         ) from e
+
+
+def generate_multitones_waveform_chunks(
+    waveform_tones: list[WaveformTone],
+    chunk_samples_count: int,
+    sampling_rate: float,
+    samples_count: int = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> Iterator[numpy.ndarray]:
+    """Creates successive chunks of samples of a multi-tones waveform, phase of each tone
+    is continuous across chunks. Amplitude normalization requires the whole waveform,
+    so tones are summed with their own amplitudes, as `create_multitones_waveform` does
+    when `amplitude_normalization_enabled` is False.
+
+    Args:
+        waveform_tones (list[WaveformTone]): describes the distribution of tones
+        that will be contained in the created waveform.
+        chunk_samples_count (int): number of samples of each chunk.
+        sampling_rate (float): sampling rate of the multi-tones waveform.
+        samples_count (int, optional): total number of samples, the last chunk is shorter
+            when it is not a multiple of `chunk_samples_count`.
+            When None, chunks are created endlessly. Defaults to None.
+        dtype (numpy.dtype, optional): type of samples, float32 or float64.
+            Defaults to numpy.float64.
+
+    Raises:
+        ValueError: occurs when waveform_tones is None or empty,
+            when chunk_samples_count is less or equal zero,
+            when samples_count is not None and is less or equal zero,
+            when sampling_rate is less or equal zero,
+            and when samples type is not float32 nor float64.
+
+    Returns:
+        Iterator[numpy.ndarray]: chunks of samples, each chunk is a new array.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    Guard.is_not_none(waveform_tones, nameof(waveform_tones))
+    Guard.is_not_empty(waveform_tones, nameof(waveform_tones))
+    Guard.is_greater_than_zero(chunk_samples_count, nameof(chunk_samples_count))
+    if samples_count is not None:
+        Guard.is_greater_than_zero(samples_count, nameof(samples_count))
+    Guard.is_greater_than_zero(sampling_rate, nameof(sampling_rate))
+    samples_type = _waveform_buffers.get_samples_type(chunk_samples_count, dtype=dtype)
+
+    return _multitones_waveform.generate_multitones_waveform_chunks_impl(
+        waveform_tones, sampling_rate, chunk_samples_count, samples_count, samples_type
+    )
@@ -1,5 +1,7 @@
 """Provides square waveform creation API."""
 
+from typing import Iterator
+
 import numpy
 from varname import nameof
 
@@ -7,8 +9,10 @@ from nipcbatt.pcbatt_analysis.analysis_library_exceptions import PCBATTAnalysisE
 from nipcbatt.pcbatt_analysis.analysis_library_messages import (
     AnalysisLibraryExceptionMessage,
 )
+from nipcbatt.pcbatt_analysis.waveform_creation import waveform_cache
 from nipcbatt.pcbatt_analysis.waveform_creation._waveform_creation_internal import (
     _square_waveform,
+    _waveform_buffers,
 )
 from nipcbatt.pcbatt_utilities.guard_utilities import Guard
 
@@ -21,7 +25,9 @@ def create_square_waveform(
     offset: float,
     samples_count: int,
     sampling_rate: float,
-) -> numpy.ndarray[numpy.float64]:
+    out: numpy.ndarray = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> numpy.ndarray:
     """Creates samples of a square waveform described through its characteristics.
 
     Args:
@@ -33,16 +39,23 @@ def create_square_waveform(
         will be used to translated y-axis values.
         samples_count (int): number of samples that will be created for the square wave.
         sampling_rate (float): sampling rate of the square wave.
+        out (numpy.ndarray, optional): 1-D float32 or float64 buffer of `samples_count` samples
+            receiving created samples, when None a new buffer is allocated. Defaults to None.
+        dtype (numpy.dtype, optional): type of samples, float32 or float64,
+            ignored when `out` is supplied. Defaults to numpy.float64.
 
     Raises:
         PCBATTAnalysisException: occurs when waveform creation fails for some reason.
         ValueError: occurs when amplitude is less or equal zero,
             occurs when `frequency` is less or equal zero,
             occurs when `samples_count` is less or equal zero,
-            and occurs when `sampling_rate` is less or equal zero.
+            occurs when `sampling_rate` is less or equal zero,
+            occurs when samples type is not float32 nor float64,
+            and occurs when `out` does not hold `samples_count` samples.
 
     Returns:
-        numpy.ndarray[numpy.float64]: samples constituting created square waveform.
+        numpy.ndarray: samples constituting created square waveform, `out` when supplied.
+        Samples are read-only when they come from the enabled `waveform_cache`.
     """
     Guard.is_greater_than_zero(value=amplitude, value_name=nameof(amplitude))
     Guard.is_greater_than_zero(value=frequency, value_name=nameof(frequency))
@@ -51,18 +64,92 @@ def create_square_waveform(
     )
     Guard.is_greater_than_zero(value=samples_count, value_name=nameof(samples_count))
     Guard.is_greater_than_zero(value=sampling_rate, value_name=nameof(sampling_rate))
+    samples_type = _waveform_buffers.get_samples_type(samples_count, out, dtype)
 
     try:
-        return _square_waveform.create_square_waveform_impl(
-            amplitude,
-            frequency,
-            duty_cycle,
-            phase,
-            offset,
-            samples_count,
-            sampling_rate,
+        return waveform_cache.get_or_create_waveform(
+            waveform_key=("square", amplitude, frequency, duty_cycle, phase, offset, sampling_rate),
+            samples_count=samples_count,
+            samples_type=samples_type,
+            create_waveform=lambda samples_array: _square_waveform.create_square_waveform_impl(
+                amplitude,
+                frequency,
+                duty_cycle,
+                phase,
+                offset,
+                samples_count,
+                sampling_rate,
+                out=samples_array,
+            ),
+            out=out,
         )
     except Exception as e:
         raise PCBATTAnalysisException(
             AnalysisLibraryExceptionMessage.SQUARE_WAVEFORM_CREATION_FAILED_FOR_SOME_REASON
         ) from e
+
+
+def generate_square_waveform_chunks(
+    amplitude: float,
+    frequency: float,
+    duty_cycle: float,
+    phase: float,
+    offset: float,
+    chunk_samples_count: int,
+    sampling_rate: float,
+    samples_count: int = None,
+    dtype: numpy.dtype = numpy.float64,
+) -> Iterator[numpy.ndarray]:
+    """Creates successive chunks of samples of a square waveform, phase is continuous
+    across chunks. The phase delays the square wave by the same number of samples
+    as `create_square_waveform` does, but delayed samples are not wrapped around:
+    the stream starts with the end of the previous period of the square wave.
+
+    Args:
+        amplitude (float): amplitude of the square wave, must be greater than zero.
+        frequency (float): frequency of the square wave, must be greater than zero.
+        duty_cycle (float): duty cycle of the square wave, must be in [0,1].
+        phase (float): phase of the square wave, will be rounded modulo 2*PI.
+        offset (float): vertical offset of the square wave,
+        will be used to translated y-axis values.
+        chunk_samples_count (int): number of samples of each chunk.
+        sampling_rate (float): sampling rate of the square wave.
+        samples_count (int, optional): total number of samples, the last chunk is shorter
+            when it is not a multiple of `chunk_samples_count`.
+            When None, chunks are created endlessly. Defaults to None.
+        dtype (numpy.dtype, optional): type of samples, float32 or float64.
+            Defaults to numpy.float64.
+
+    Raises:
+        ValueError: occurs when amplitude is less or equal zero,
+            occurs when `frequency` is less or equal zero,
+            occurs when `chunk_samples_count` is less or equal zero,
+            occurs when `samples_count` is not None and is less or equal zero,
+            occurs when `sampling_rate` is less or equal zero,
+            and occurs when samples type is not float32 nor float64.
+
+    Returns:
+        Iterator[numpy.ndarray]: chunks of samples, each chunk is a new array.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    Guard.is_greater_than_zero(value=amplitude, value_name=nameof(amplitude))
+    Guard.is_greater_than_zero(value=frequency, value_name=nameof(frequency))
+    Guard.is_within_limits_included(
+        value=duty_cycle, lower_limit=0, upper_limit=1, value_name=nameof(duty_cycle)
+    )
+    Guard.is_greater_than_zero(value=chunk_samples_count, value_name=nameof(chunk_samples_count))
+    if samples_count is not None:
+        Guard.is_greater_than_zero(value=samples_count, value_name=nameof(samples_count))
+    Guard.is_greater_than_zero(value=sampling_rate, value_name=nameof(sampling_rate))
+    samples_type = _waveform_buffers.get_samples_type(chunk_samples_count, dtype=dtype)
+
+    return _square_waveform.generate_square_waveform_chunks_impl(
+        amplitude,
+        frequency,
+        duty_cycle,
+        phase,
+        offset,
+        sampling_rate,
+        chunk_samples_count,
+        samples_count,
+        samples_type,
+    )
@@ -0,0 +1,215 @@
+"""Provides an opt-in, size bounded, LRU cache of created waveforms."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_analysis.common.base_types import AnalysisLibraryElement
+from nipcbatt.pcbatt_utilities.guard_utilities import Guard
+
+DEFAULT_MAX_CACHED_WAVEFORMS_COUNT = 32
+
+# Cached waveforms are shared by all waveform creation calls,
+# they are ordered from least recently used to most recently used and protected by the lock.
+_waveform_cache_lock = threading.Lock()
+_waveform_cache_enabled = False
+_waveform_cache_max_cached_waveforms_count = DEFAULT_MAX_CACHED_WAVEFORMS_COUNT
+_cached_waveforms: "OrderedDict[Hashable, numpy.ndarray]" = OrderedDict()
+_waveform_cache_hits_count = 0
+_waveform_cache_misses_count = 0
+
+
+class WaveformCacheStatistics(AnalysisLibraryElement):
+    """Defines statistics about usage of the created waveforms cache."""
+
+    def __init__(
+        self,
+        hits_count: int,
+        misses_count: int,
+        cached_waveforms_count: int,
+        max_cached_waveforms_count: int,
+    ) -> None:
+        """Initialize an instance of `WaveformCacheStatistics`.
+
+        Args:
+            hits_count (int): number of waveforms returned from the cache.
+            misses_count (int): number of waveforms created and added to the cache.
+            cached_waveforms_count (int): number of waveforms currently held by the cache.
+            max_cached_waveforms_count (int): maximum number of waveforms held by the cache.
+        """
+        self._hits_count = hits_count
+        self._misses_count = misses_count
+        self._cached_waveforms_count = cached_waveforms_count
+        self._max_cached_waveforms_count = max_cached_waveforms_count
+
+    @property
+    def hits_count(self) -> int:
+        """Gets the number of waveforms returned from the cache.
+
+        Returns:
+            int: hits count.
+        """
+        return self._hits_count
+
+    @property
+    def misses_count(self) -> int:
+        """Gets the number of waveforms created and added to the cache.
+
+        Returns:
+            int: misses count.
+        """
+        return self._misses_count
+
+    @property
+    def cached_waveforms_count(self) -> int:
+        """Gets the number of waveforms currently held by the cache.
+
+        Returns:
+            int: cached waveforms count.
+        """
+        return self._cached_waveforms_count
+
+    @property
+    def max_cached_waveforms_count(self) -> int:
+        """Gets the maximum number of waveforms held by the cache.
+
+        Returns:
+            int: maximum cached waveforms count.
+        """
+        return self._max_cached_waveforms_count
+
+
+def enable_waveform_cache(
+    max_cached_waveforms_count: int = DEFAULT_MAX_CACHED_WAVEFORMS_COUNT,
+) -> None:
+    """Enables the cache of created waveforms, waveforms created with the same parameters
+    are then returned from the cache as read-only arrays.
+    When the cache is full, the least recently used waveform is evicted.
+
+    Args:
+        max_cached_waveforms_count (int, optional): maximum number of waveforms held by the cache.
+            Defaults to DEFAULT_MAX_CACHED_WAVEFORMS_COUNT.
+
+    Raises:
+        ValueError: occurs when `max_cached_waveforms_count` is less or equal zero.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    global _waveform_cache_enabled
+    global _waveform_cache_max_cached_waveforms_count
+
+    Guard.is_greater_than_zero(max_cached_waveforms_count, nameof(max_cached_waveforms_count))
+
+    with _waveform_cache_lock:
+        _waveform_cache_enabled = True
+        _waveform_cache_max_cached_waveforms_count = max_cached_waveforms_count
+        _evict_least_recently_used_waveforms()
+
+
+def disable_waveform_cache() -> None:
+    """Disables the cache of created waveforms and releases cached waveforms."""
+    global _waveform_cache_enabled
+
+    with _waveform_cache_lock:
+        _waveform_cache_enabled = False
+        _cached_waveforms.clear()
+
+
+def is_waveform_cache_enabled() -> bool:
+    """Checks whether the cache of created waveforms is enabled.
+
+    Returns:
+        bool: True if the cache is enabled.
+    """
+    return _waveform_cache_enabled
+
+
+def clear_waveform_cache() -> None:
+    """Releases cached waveforms and resets hits and misses counts."""
+    global _waveform_cache_hits_count
+    global _waveform_cache_misses_count
+
+    with _waveform_cache_lock:
+        _cached_waveforms.clear()
+        _waveform_cache_hits_count = 0
+        _waveform_cache_misses_count = 0
+
+
+def get_waveform_cache_statistics() -> WaveformCacheStatistics:
+    """Gets statistics about usage of the created waveforms cache.
+
+    Returns:
+        WaveformCacheStatistics: hits count, misses count and cached waveforms counts.
+    """
+    with _waveform_cache_lock:
+        return WaveformCacheStatistics(
+            hits_count=_waveform_cache_hits_count,
+            misses_count=_waveform_cache_misses_count,
+            cached_waveforms_count=len(_cached_waveforms),
+            max_cached_waveforms_count=_waveform_cache_max_cached_waveforms_count,
+        )
+
+
+def get_or_create_waveform(
+    waveform_key: Hashable,
+    samples_count: int,
+    samples_type: numpy.dtype,
+    create_waveform: Callable[[numpy.ndarray], numpy.ndarray],
+    out: numpy.ndarray = None,
+) -> numpy.ndarray:
+    """Gets a waveform from the cache, or creates it through `create_waveform`.
+
+    Args:
+        waveform_key (Hashable): full set of parameters describing the waveform.
+        samples_count (int): number of samples of the waveform.
+        samples_type (numpy.dtype): type of samples of the waveform.
+        create_waveform (Callable[[numpy.ndarray], numpy.ndarray]): function filling
+            the buffer it receives with the samples of the waveform.
+        out (numpy.ndarray, optional): caller supplied buffer receiving the samples.
+            Defaults to None.
+
+    Returns:
+        numpy.ndarray: `out` when supplied, otherwise a read-only array when the cache is enabled
+        and a newly created array when it is not.
+    """
+    global _waveform_cache_hits_count
+    global _waveform_cache_misses_count
+
+    if not _waveform_cache_enabled:
+        if out is None:
+            out = numpy.empty(shape=samples_count, dtype=samples_type)
+        return create_waveform(out)
+
+    cache_key = (waveform_key, samples_count, numpy.dtype(samples_type).str)
+
+    with _waveform_cache_lock:
+        cached_waveform = _cached_waveforms.get(cache_key)
+        if cached_waveform is not None:
+            _cached_waveforms.move_to_end(cache_key)
+            _waveform_cache_hits_count += 1
+        else:
+            _waveform_cache_misses_count += 1
+
+    if cached_waveform is None:
+        cached_waveform = create_waveform(numpy.empty(shape=samples_count, dtype=samples_type))
+        cached_waveform.flags.writeable = False
+
+        with _waveform_cache_lock:
+            if _waveform_cache_enabled:
+                _cached_waveforms[cache_key] = cached_waveform
+                _cached_waveforms.move_to_end(cache_key)
+                _evict_least_recently_used_waveforms()
+
+    if out is None:
+        return cached_waveform
+
+    numpy.copyto(out, cached_waveform)
+    return out
+
+
+def _evict_least_recently_used_waveforms() -> None:
+    """Evicts least recently used waveforms until the cache size is within bounds,
+    must be called while the lock is held."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+    while len(_cached_waveforms) > _waveform_cache_max_cached_waveforms_count:
+        _cached_waveforms.popitem(last=False)
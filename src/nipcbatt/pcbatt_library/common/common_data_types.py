@@ -8,6 +8,9 @@ import numpy
 from varname import nameof
 
 from nipcbatt.pcbatt_library_core.pcbatt_data_types import PCBATestToolkitData
+from nipcbatt.pcbatt_library_core.pcbatt_library_messages import (
+    PCBATTLibraryExceptionMessages,
+)
 from nipcbatt.pcbatt_utilities.guard_utilities import Guard
 
 MAXIMUM_NUMBER_OF_DIMENSIONS_IN_NUMPY_ARRAY = 2
@@ -290,22 +293,144 @@ class MeasurementData(PCBATestToolkitData):
             bool: True if equals to `value_to_compare`.
         """  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (109 > 100 characters) (auto-generated noqa)
         if isinstance(value_to_compare, self.__class__):
-            return numpy.allclose(self._data_samples, value_to_compare._data_samples)
+            return numpy.allclose(self.data_samples, value_to_compare.data_samples)
 
         return False
 
+    @property
+    def data_samples(self) -> numpy.ndarray:
+        """Gets the array containing the samples captured for measurement,
+        one row per channel when several channels are captured."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._data_samples
+
     @property
     def samples_per_channel(self) -> Iterable[numpy.ndarray[numpy.float64]]:
         """Gets a iterable instance on the samples array per channel."""  # noqa: D202, W505 - No blank lines allowed after function docstring (auto-generated noqa), doc line too long (158 > 100 characters) (auto-generated noqa)
 
-        if len(self._data_samples.shape) <= 1:
-            yield self._data_samples
+        data_samples = self.data_samples
+        if len(data_samples.shape) <= 1:
+            yield data_samples
             return
 
-        for samples_per_channel in self._data_samples:
+        for samples_per_channel in data_samples:
             yield samples_per_channel
 
 
+class RawMeasurementData(MeasurementData):
+    """Defines the data captured for measurement as raw, unscaled, int16 samples,
+    scaled to volts only when the samples in volts are needed."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(
+        self,
+        raw_samples: numpy.ndarray,
+        scaling_coefficients: numpy.ndarray,
+        samples_dtype: type = numpy.float64,
+    ) -> None:
+        """Initializes an instance of `RawMeasurementData`.
+
+        Args:
+            raw_samples (numpy.ndarray):
+                The array containing the int16 samples captured for measurement,
+                one row per channel when several channels are captured.
+            scaling_coefficients (numpy.ndarray):
+                The coefficients of the polynomials scaling raw samples to volts,
+                one row per channel, in increasing powers order.
+            samples_dtype (type, optional):
+                The type of samples scaled to volts, numpy.float32 or numpy.float64.
+                Defaults to numpy.float64.
+        Raises:
+            ValueError:
+                Raised when `raw_samples` is None or empty,
+                or when `scaling_coefficients` does not have one row per channel.
+            TypeError:
+                Raised when `raw_samples` is not of type int16.
+        """  # noqa: D411 - Missing blank line before section (auto-generated noqa)
+        Guard.is_not_none(raw_samples, nameof(raw_samples))
+        Guard.is_not_empty(raw_samples, nameof(raw_samples))
+        Guard.size_is_less_than_or_equal(
+            raw_samples.shape,
+            MAXIMUM_NUMBER_OF_DIMENSIONS_IN_NUMPY_ARRAY,
+            nameof(raw_samples.shape),
+        )
+        Guard.is_not_none(scaling_coefficients, nameof(scaling_coefficients))
+        Guard.is_not_empty(scaling_coefficients, nameof(scaling_coefficients))
+        Guard.have_same_size(
+            first_iterable_instance=numpy.atleast_2d(raw_samples),
+            first_iterable_name=nameof(raw_samples),
+            second_iterable_instance=numpy.atleast_2d(scaling_coefficients),
+            second_iterable_name=nameof(scaling_coefficients),
+        )
+        if raw_samples.dtype != numpy.int16:
+            raise TypeError(
+                PCBATTLibraryExceptionMessages.INVALID_NUMPY_ARRAY_TYPE_ARGS_1.format(numpy.int16)
+            )
+
+        self._raw_samples = raw_samples
+        self._scaling_coefficients = numpy.atleast_2d(scaling_coefficients).astype(numpy.float64)
+        self._samples_dtype = numpy.dtype(samples_dtype).type
+        self._data_samples = None
+
+    @property
+    def raw_samples(self) -> numpy.ndarray:
+        """Gets the array containing the raw int16 samples captured for measurement,
+        one row per channel when several channels are captured."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._raw_samples
+
+    @property
+    def scaling_coefficients(self) -> numpy.ndarray:
+        """Gets the coefficients of the polynomials scaling raw samples to volts,
+        one row per channel, in increasing powers order."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._scaling_coefficients
+
+    @property
+    def is_scaled(self) -> bool:
+        """Gets whether raw samples have already been scaled to volts."""
+        return self._data_samples is not None
+
+    @property
+    def data_samples(self) -> numpy.ndarray:
+        """Gets the array containing the samples captured for measurement, in volts,
+        raw samples are scaled on first access only."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        if self._data_samples is None:
+            self._data_samples = self.scale_samples()
+
+        return self._data_samples
+
+    def scale_samples(self, out: numpy.ndarray = None) -> numpy.ndarray:
+        """Scales raw samples of all channels to volts, in one vectorized evaluation
+        of the scaling polynomials (Horner's method).
+
+        Args:
+            out (numpy.ndarray, optional): float array of the shape of raw samples receiving
+            samples in volts, used to scale samples into a reused buffer.
+            When None, an array of type `samples_dtype` is allocated. Defaults to None.
+
+        Returns:
+            numpy.ndarray: samples in volts, `out` when provided.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        if out is None:
+            out = numpy.empty(shape=self._raw_samples.shape, dtype=self._samples_dtype)
+        else:
+            Guard.have_same_size(
+                first_iterable_instance=out.ravel(),
+                first_iterable_name=nameof(out),
+                second_iterable_instance=self._raw_samples.ravel(),
+                second_iterable_name=nameof(self._raw_samples),
+            )
+
+        # 1-D samples of one channel are processed as a 2-D view of one row
+        raw_samples = numpy.atleast_2d(self._raw_samples)
+        scaled_samples = numpy.atleast_2d(out)
+        coefficients = self._scaling_coefficients.astype(out.dtype)
+
+        scaled_samples[...] = coefficients[:, -1:]
+        for power in range(coefficients.shape[1] - 2, -1, -1):
+            numpy.multiply(scaled_samples, raw_samples, out=scaled_samples)
+            numpy.add(scaled_samples, coefficients[:, power : power + 1], out=scaled_samples)
+
+        return out
+
+
 class AnalogWaveform(PCBATestToolkitData):
     """Define the structure of a waveform."""
 
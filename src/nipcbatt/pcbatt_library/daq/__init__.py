@@ -153,11 +153,22 @@ from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_
 from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_data_types import (
     FrequencyDomainMeasurementConfiguration,
     FrequencyDomainMeasurementResultData,
+    FrequencyDomainSpectrumAveragingParameters,
     MultipleTonesMeasurementResultData,
 )
 from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_measurement import (
     FrequencyDomainMeasurement,
 )
+from nipcbatt.pcbatt_library.daq.frequency_response_measurements.frequency_response_constants import (
+    DEFAULT_FREQUENCY_RESPONSE_MEASUREMENT_CONFIGURATION,
+)
+from nipcbatt.pcbatt_library.daq.frequency_response_measurements.frequency_response_data_types import (
+    FrequencyResponseMeasurementConfiguration,
+    FrequencyResponseMeasurementResultData,
+)
+from nipcbatt.pcbatt_library.daq.frequency_response_measurements.frequency_response_measurement import (
+    FrequencyResponseMeasurement,
+)
 
 from nipcbatt.pcbatt_library.daq.power_supply_source_and_measurements.power_supply_source_and_measure import (
     PowerSupplySourceAndMeasure,
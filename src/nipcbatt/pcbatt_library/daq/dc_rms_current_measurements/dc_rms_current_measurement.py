@@ -5,8 +5,6 @@
 from typing import Union
 
 import nidaqmx.constants
-import nidaqmx.stream_readers
-import numpy
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis.waveform_analysis.dc_rms_analysis import LabViewBasicDcRms
@@ -50,6 +48,7 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
         if self.is_task_initialized:
             return
 
+        self.invalidate_task_properties()
         self.using_specific_channel = use_specific_channel
         # If using_specific_channel is True skip the initialization.
         # This is required as Current channels do not allow overwriting of min and max range values
@@ -109,6 +108,7 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
+            self.disarm()
             if self.using_specific_channel is True:
                 for specific_channel_parameters in configuration.specific_channels_parameters:
                     self.configure_specific_channel(specific_channel_parameters)
@@ -122,13 +122,13 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
-            self.task.start()
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(
                 data, configuration.measurement_options.measurement_analysis_requirement
             )
 
-        self.task.start()
+        self.arm()
         return None
 
     def configure_all_channels(
@@ -141,12 +141,20 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
                 An instance of `DcRmsCurrentMeasurementTerminalRangeParameters`
                 used to configure the channels.
         """
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         for channel in self.task.ai_channels:
             channel.ai_min = parameters.range_min_amperes
             channel.ai_max = parameters.range_max_amperes
             channel.ai_term_cfg = parameters.terminal_configuration
             channel.ai_current_shunt_resistance = parameters.shunt_resistor_ohms
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(
         self, parameters: DcRmsCurrentMeasurementChannelAndTerminalRangeParameters
     ) -> None:
@@ -158,6 +166,11 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
                 An instance of `DcRmsCurrentMeasurementChannelAndTerminalRangeParameters`
             used to configure the channels.
         """
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         if self.contains_only_global_virtual_channels(channel_expression=parameters.channel_name):
             # Global virtual channel
             self.add_global_channels(global_channel_expression=parameters.channel_name)
@@ -182,6 +195,10 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
                 ext_shunt_resistor_val=parameters.channel_parameters.shunt_resistor_ohms,
             )
 
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
+
     def configure_timing(self, parameters: SampleClockTimingParameters):
         """Configures the timing characteristics used for Current measurements.
         Args:
@@ -189,6 +206,10 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
             An instance of `SampleClockTimingParameters`
             used to configure the timing.
         """
+        if self.is_configuration_unchanged("timing", parameters):
+            return
+
+        self.invalidate_task_properties()
         self.task.timing.cfg_samp_clk_timing(
             rate=parameters.sampling_rate_hertz,
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
@@ -206,6 +227,8 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
         else:
             self.task.timing.samp_timing_engine = parameters.sample_timing_engine.value
 
+        self.save_applied_configuration("timing", parameters)
+
     def configure_trigger(self, parameters: DigitalStartTriggerParameters):
         """Configure the characteristics of triggers used for Current measurements.
 
@@ -214,6 +237,9 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
             An instance of `DigitalStartTriggerParameters`
             used to configure the channels.
         """
+        if self.is_configuration_unchanged("trigger", parameters):
+            return
+
         if parameters.trigger_select == StartTriggerType.NO_TRIGGER:
             self.task.triggers.start_trigger.disable_start_trig()
         else:
@@ -222,6 +248,8 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
                 trigger_edge=parameters.digital_start_trigger_edge,
             )
 
+        self.save_applied_configuration("trigger", parameters)
+
     def acquire_data_for_measurement_analysis(self) -> MeasurementData:
         """Acquires Data from DAQ channel for measurement of Current.
 
@@ -229,19 +257,8 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
             MeasurementData: An instance of `MeasurementData`
             that specifies the data acquired from DAQ channels.
         """
-        number_of_channels = len(self.task.in_stream.channels_to_read.channel_names)
-        number_of_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
-        data_to_read = numpy.zeros(
-            shape=(number_of_channels, number_of_samples_per_channel),
-            dtype=numpy.float64,
-        )
-        reader = nidaqmx.stream_readers.AnalogMultiChannelReader(self.task.in_stream)
-        reader.read_many_sample(
-            data=data_to_read,
-            number_of_samples_per_channel=number_of_samples_per_channel,
-        )
-
-        return MeasurementData(data_to_read)
+        # Reads samples of all channels, in the type of samples of the building block.
+        return MeasurementData(self.read_analog_samples())
 
     def analyze_measurement_data(
         self,
@@ -264,13 +281,14 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
             that specifies the measurement results.
         """
         # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
         Guard.is_greater_than_zero(
-            self.task.timing.samp_clk_rate, nameof(self.task.timing.samp_clk_rate)
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
         )
 
-        delta_time_seconds = invert_value(self.task.timing.samp_clk_rate)
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
         acquisition_duration = (
-            self.task.timing.samp_quant_samp_per_chan / self.task.timing.samp_clk_rate
+            task_properties.number_of_samples_per_channel / task_properties.sampling_rate_hertz
         )
 
         # Initialization for DcRmsCurrentMeasurementResultData instance creation.
@@ -278,11 +296,10 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
         calculated_dc_values = []
         calculated_rms_values = []
 
-        # Get the Analog Waveform and calculate the DC and RMS current measurements
-        # for every channel in the task.
+        # Get the Analog Waveform for every channel in the task.
         for samples_per_channel, channel_name_read in zip(
             measurement_data.samples_per_channel,
-            self.task.in_stream.channels_to_read.channel_names,
+            task_properties.channels_names,
         ):
             # Creates an instance of AnalogWaveform for a channel and add it to waveforms.
             current_waveforms.append(
@@ -293,22 +310,18 @@ class DcRmsCurrentMeasurement(BuildingBlockUsingDAQmx):
                 )
             )
 
-            if (
-                measurement_analysis_requirement
-                == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS
-            ):
-                # DC and RMS processing.
-                dc_rms_processing_result = LabViewBasicDcRms.process_single_waveform_dc_rms(
-                    waveform_samples=samples_per_channel,
-                    waveform_sampling_period_seconds=delta_time_seconds,
-                    dc_rms_processing_window=ConstantsForDcRmsCurrentMeasurement.DEFAULT_DC_RMS_PROCESSING_WINDOW,
-                )
-
-                # Obtains the DC value for the acquired samples for a channel and append to the list
-                calculated_dc_values.append(dc_rms_processing_result.dc_value)
+        if measurement_analysis_requirement == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS:
+            # DC and RMS processing of all channels in a single call.
+            dc_rms_processing_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+                waveforms_samples=measurement_data.data_samples,
+                waveforms_sampling_period_seconds=delta_time_seconds,
+                dc_rms_processing_window=ConstantsForDcRmsCurrentMeasurement.DEFAULT_DC_RMS_PROCESSING_WINDOW,
+                workers_count=self.analysis_workers_count,
+            )
 
-                # Obtains the RMS value for the acquired samples for a channel and append to the list
-                calculated_rms_values.append(dc_rms_processing_result.rms_value)
+            # Obtains the DC and RMS values for the acquired samples of every channel
+            calculated_dc_values = dc_rms_processing_results.dc_values.tolist()
+            calculated_rms_values = dc_rms_processing_results.rms_values.tolist()
 
         return DcRmsCurrentMeasurementResultData(
             waveforms=current_waveforms,
@@ -5,8 +5,6 @@
 from typing import Union
 
 import nidaqmx.constants
-import nidaqmx.stream_readers
-import numpy
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis.waveform_analysis.dc_rms_analysis import LabViewBasicDcRms
@@ -16,6 +14,7 @@ from nipcbatt.pcbatt_library.common.common_data_types import (
     MeasurementAnalysisRequirement,
     MeasurementData,
     MeasurementExecutionType,
+    RawMeasurementData,
     SampleClockTimingParameters,
     SampleTimingEngine,
     StartTriggerType,
@@ -53,6 +52,8 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
         if self.is_task_initialized:
             return
 
+        self.invalidate_task_properties()
+
         # If the input channel_expression contains global channel, then add them as global channels
         # and verify if the global channels are configured for current measurement.
         if self.contains_only_global_virtual_channels(
@@ -100,18 +101,19 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
-            self.task.stop()
+            self.disarm()
             self.configure_all_channels(configuration.global_channel_parameters)
             for specific_channel_parameters in configuration.specific_channels_parameters:
                 self.configure_specific_channel(specific_channel_parameters)
             self.configure_timing(configuration.sample_clock_timing_parameters)
             self.configure_trigger(configuration.digital_start_trigger_parameters)
-            self.task.start()
+            self.arm()
 
         if configuration.measurement_options.execution_option in (
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(
                 data, configuration.measurement_options.measurement_analysis_requirement
@@ -125,11 +127,19 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
             parameters (VoltageRangeAndTerminalParameters):
             An instance of `VoltageRangeAndTerminalParameters` used to configure the channels.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         for channel in self.task.ai_channels:
             channel.ai_term_cfg = parameters.terminal_configuration
             channel.ai_min = parameters.range_min_volts
             channel.ai_max = parameters.range_max_volts
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(
         self, parameters: VoltageMeasurementChannelAndTerminalRangeParameters
     ):
@@ -147,6 +157,11 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
         then he/she has to provide the Physical channel name in Specific channel parameters.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         if parameters.channel_name in (channel.name for channel in self.task.ai_channels):
             # if the specified channel is present in ai_channel_collection,
             # updates the voltage parameters of the channel
@@ -182,6 +197,10 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
                     units=ConstantsForVoltageMeasurement.INITIAL_AI_VOLTAGE_UNITS,
                 )
 
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
+
     def configure_timing(self, parameters: SampleClockTimingParameters):
         """Configures the timing characteristics used for voltage measurements.
 
@@ -191,6 +210,10 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
             used to configure the timing.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        if self.is_configuration_unchanged("timing", parameters):
+            return
+
+        self.invalidate_task_properties()
         self.task.timing.cfg_samp_clk_timing(
             rate=parameters.sampling_rate_hertz,
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
@@ -208,6 +231,8 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
         else:
             self.task.timing.samp_timing_engine = parameters.sample_timing_engine.value
 
+        self.save_applied_configuration("timing", parameters)
+
     def configure_trigger(self, parameters: DigitalStartTriggerParameters):
         """Configure the characteristics of triggers used for voltage measurements.
 
@@ -217,6 +242,9 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
             used to configure the channels.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        if self.is_configuration_unchanged("trigger", parameters):
+            return
+
         if parameters.trigger_select == StartTriggerType.NO_TRIGGER:
             self.task.triggers.start_trigger.disable_start_trig()
         else:
@@ -225,6 +253,8 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
                 trigger_edge=parameters.digital_start_trigger_edge,
             )
 
+        self.save_applied_configuration("trigger", parameters)
+
     def acquire_data_for_measurement_analysis(self) -> MeasurementData:
         """Acquires Data from DAQ channel for measurement of voltage.
 
@@ -232,19 +262,17 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
             MeasurementData: An instance of `MeasurementData`
             that specifies the data acquired from DAQ channels.
         """
-        number_of_channels = len(self.task.in_stream.channels_to_read.channel_names)
-        number_of_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
-        data_to_read = numpy.zeros(
-            shape=(number_of_channels, number_of_samples_per_channel),
-            dtype=numpy.float64,
-        )
-        reader = nidaqmx.stream_readers.AnalogMultiChannelReader(self.task.in_stream)
-        reader.read_many_sample(
-            data=data_to_read,
-            number_of_samples_per_channel=number_of_samples_per_channel,
-        )
+        # Raw samples are scaled to volts when analysis or the caller gets them in volts.
+        if self.raw_samples_enabled:
+            raw_samples, scaling_coefficients = self.read_analog_raw_samples()
+            return RawMeasurementData(
+                raw_samples=raw_samples,
+                scaling_coefficients=scaling_coefficients,
+                samples_dtype=self.samples_dtype,
+            )
 
-        return MeasurementData(data_to_read)
+        # Reads samples of all channels, in the type of samples of the building block.
+        return MeasurementData(self.read_analog_samples())
 
     def analyze_measurement_data(
         self,
@@ -267,10 +295,11 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
             that specifies the measurement results.
         """
         # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
         Guard.is_greater_than_zero(
-            self.task.timing.samp_clk_rate, nameof(self.task.timing.samp_clk_rate)
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
         )
-        delta_time_seconds = invert_value(self.task.timing.samp_clk_rate)
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
 
         # Initialization for DcRmsVoltageMeasurementResultData instance creation.
         voltage_waveforms = []
@@ -280,7 +309,7 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
 
         for samples_per_channel, channel_name in zip(
             measurement_data.samples_per_channel,
-            self.task.in_stream.channels_to_read.channel_names,
+            task_properties.channels_names,
         ):
             # Creates an instance of AnalogWaveform and add it to waveforms.
             voltage_waveforms.append(
@@ -295,15 +324,18 @@ class DcRmsVoltageMeasurement(BuildingBlockUsingDAQmx):
                 == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS
             ):
                 acquisition_duration_seconds += delta_time_seconds * len(samples_per_channel)
-                # DC and RMS processing.
-                dc_rms_processing_result = LabViewBasicDcRms.process_single_waveform_dc_rms(
-                    waveform_samples=samples_per_channel,
-                    waveform_sampling_period_seconds=delta_time_seconds,
-                    dc_rms_processing_window=ConstantsForDcRmsVoltageMeasurement.DEFAULT_DC_RMS_PROCESSING_WINDOW,
-                )
 
-                dc_values_volts.append(dc_rms_processing_result.dc_value)
-                rms_values_volts.append(dc_rms_processing_result.rms_value)
+        if measurement_analysis_requirement == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS:
+            # DC and RMS processing of all channels in a single call.
+            dc_rms_processing_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+                waveforms_samples=measurement_data.data_samples,
+                waveforms_sampling_period_seconds=delta_time_seconds,
+                dc_rms_processing_window=ConstantsForDcRmsVoltageMeasurement.DEFAULT_DC_RMS_PROCESSING_WINDOW,
+                workers_count=self.analysis_workers_count,
+            )
+
+            dc_values_volts = dc_rms_processing_results.dc_values.tolist()
+            rms_values_volts = dc_rms_processing_results.rms_values.tolist()
 
         return DcRmsVoltageMeasurementResultData(
             waveforms=voltage_waveforms,
@@ -148,8 +148,10 @@ class DigitalPwmMeasurement(BuildingBlockUsingDAQmx):
 
         num_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
 
-        # preallocate memory for samples
-        double_nparray = np.zeros(shape=(num_samples_per_channel,), dtype=np.double)
+        # get preallocated memory for samples
+        double_nparray = self.acquisition_buffers.get_buffer(
+            buffer_name="counter_samples", shape=(num_samples_per_channel,), dtype=np.double
+        )
 
         # read the counter line and populate memory
         reader = nidaqmx.stream_readers.CounterReader(self.task.in_stream)
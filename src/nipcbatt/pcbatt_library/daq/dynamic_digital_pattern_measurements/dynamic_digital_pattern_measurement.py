@@ -173,7 +173,8 @@ class DynamicDigitalPatternMeasurement(BuildingBlockUsingDAQmx):
         """  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (122 > 100 characters) (auto-generated noqa)
         number_of_channels = len(self.task.in_stream.channels_to_read.channel_names)
         number_of_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
-        data_to_read = np.zeros(
+        data_to_read = self.acquisition_buffers.get_buffer(
+            buffer_name="digital_port_samples",
             shape=(number_of_channels, number_of_samples_per_channel),
             dtype=np.uint32,
         )
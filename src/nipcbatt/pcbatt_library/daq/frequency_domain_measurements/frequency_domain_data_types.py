@@ -19,6 +19,75 @@ from nipcbatt.pcbatt_library_core.pcbatt_data_types import PCBATestToolkitData
 from nipcbatt.pcbatt_utilities.guard_utilities import Guard
 
 
+class FrequencyDomainSpectrumAveragingParameters(PCBATestToolkitData):
+    """Defines parameters used to average spectrums of Frequency domain measurement."""
+
+    def __init__(
+        self,
+        segment_samples_count: int,
+        segment_overlap_percent: float = 50.0,
+        averages_count: int = None,
+    ) -> None:
+        """Initializes an instance of
+        `FrequencyDomainSpectrumAveragingParameters` with specific values.
+
+        Acquired waveforms are split in overlapping segments, spectrums of segments are averaged
+        (Welch method), frequency resolution is the inverse of the duration of one segment.
+
+        Args:
+            segment_samples_count (int):
+                The number of samples of each segment.
+            segment_overlap_percent (float, optional):
+                The overlap of successive segments, in percent of the segment samples count.
+                Defaults to 50.
+            averages_count (int, optional):
+                The maximum number of averaged segments,
+                all segments fitting in acquired waveforms are averaged when None.
+                Defaults to None.
+
+        Raises:
+            ValueError:
+                Raised when `segment_samples_count` is less than or equal to zero,
+                `segment_overlap_percent` is not in [0, 100),
+                `averages_count` is less than or equal to zero.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_greater_than_zero(segment_samples_count, nameof(segment_samples_count))
+        Guard.is_greater_than_or_equal_to_zero(
+            segment_overlap_percent, nameof(segment_overlap_percent)
+        )
+        Guard.is_less_than(segment_overlap_percent, 100, nameof(segment_overlap_percent))
+        if averages_count is not None:
+            Guard.is_greater_than_zero(averages_count, nameof(averages_count))
+
+        self._segment_samples_count = segment_samples_count
+        self._segment_overlap_percent = segment_overlap_percent
+        self._averages_count = averages_count
+
+    @property
+    def segment_samples_count(self) -> int:
+        """
+        :type:`int`:
+            Gets the number of samples of each segment.
+        """  # noqa: D205, D212, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._segment_samples_count
+
+    @property
+    def segment_overlap_percent(self) -> float:
+        """
+        :type:`float`:
+            Gets the overlap of successive segments, in percent of the segment samples count.
+        """  # noqa: D205, D212, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._segment_overlap_percent
+
+    @property
+    def averages_count(self) -> int:
+        """
+        :type:`int`:
+            Gets the maximum number of averaged segments, None if all segments are averaged.
+        """  # noqa: D205, D212, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._averages_count
+
+
 class FrequencyDomainMeasurementConfiguration(PCBATestToolkitData):
     """Defines parameters used for configuration of Time domain measurement."""
 
@@ -29,6 +98,7 @@ class FrequencyDomainMeasurementConfiguration(PCBATestToolkitData):
         measurement_options: MeasurementOptions,
         sample_clock_timing_parameters: SampleClockTimingParameters,
         digital_start_trigger_parameters: DigitalStartTriggerParameters,
+        spectrum_averaging_parameters: FrequencyDomainSpectrumAveragingParameters = None,
     ) -> None:
         """Initializes an instance of
         `FrequencyDomainMeasurementConfiguration` with specific values.
@@ -44,6 +114,10 @@ class FrequencyDomainMeasurementConfiguration(PCBATestToolkitData):
                 An instance of `SampleClockTimingParameters` that represents the settings of timing.
             digital_start_trigger_parameters (DigitalStartTriggerParameters):
                 An instance of `DigitalStartTriggerParameters` that represents the settings of triggers.
+            spectrum_averaging_parameters (FrequencyDomainSpectrumAveragingParameters, optional):
+                An instance of `FrequencyDomainSpectrumAveragingParameters` that represents the settings
+                of spectrum averaging, one spectrum is computed over the whole record when None.
+                Defaults to None.
 
         Raises:
             TypeError:
@@ -73,6 +147,7 @@ class FrequencyDomainMeasurementConfiguration(PCBATestToolkitData):
         self._measurement_options = measurement_options
         self._sample_clock_timing_parameters = sample_clock_timing_parameters
         self._digital_start_trigger_parameters = digital_start_trigger_parameters
+        self._spectrum_averaging_parameters = spectrum_averaging_parameters
 
     @property
     def global_channel_parameters(
@@ -121,6 +196,15 @@ class FrequencyDomainMeasurementConfiguration(PCBATestToolkitData):
         """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
         return self._digital_start_trigger_parameters
 
+    @property
+    def spectrum_averaging_parameters(self) -> FrequencyDomainSpectrumAveragingParameters:
+        """
+        :class:`FrequencyDomainSpectrumAveragingParameters`:
+            Gets a `FrequencyDomainSpectrumAveragingParameters` instance
+            that represents the settings of spectrum averaging, None if spectrums are not averaged.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._spectrum_averaging_parameters
+
 
 class MultipleTonesMeasurementResultData(PCBATestToolkitData):
     """Defines multiple tones measurement results obtained after waveform analysis."""
@@ -129,6 +213,7 @@ class MultipleTonesMeasurementResultData(PCBATestToolkitData):
         self,
         tones_frequencies_hertz: List[float],
         tones_amplitudes_volts: List[float],
+        tones_phases_radians: List[float] = None,
     ) -> None:
         """Initializes an instance of "MultipleTonesMeasurementResultData" with specific values.
 
@@ -137,16 +222,20 @@ class MultipleTonesMeasurementResultData(PCBATestToolkitData):
                 A list of frequencies of detected tones for all analyzed waveforms.
             tones_amplitudes_volts (List[float]):
                 A list of voltage peak amplitudes of detected tones for all analyzed waveforms.
+            tones_phases_radians (List[float], optional):
+                A list of phases of detected tones, expressed in radians. Defaults to None.
 
         Raises:
             TypeError: Raised when,
                 `tones_frequencies_hertz` containes objects that are not `float',
-                `tones_amplitudes_volts` contains objects that are not `float'.
+                `tones_amplitudes_volts` contains objects that are not `float',
+                `tones_phases_radians` contains objects that are not `float'.
 
             ValueError: Raised when,
                 `tones_frequencies_hertz` is None,
                 `tones_amplitudes_volts` is None,
-                `tones_frequencies_hertz` and `tones_amplitudes_volts` lists have different lengths.
+                `tones_frequencies_hertz` and `tones_amplitudes_volts` lists have different lengths,
+                `tones_frequencies_hertz` and `tones_phases_radians` lists have different lengths.
         """
         Guard.is_not_none(tones_frequencies_hertz, nameof(tones_frequencies_hertz))
         Guard.is_not_none(tones_amplitudes_volts, nameof(tones_amplitudes_volts))
@@ -158,9 +247,20 @@ class MultipleTonesMeasurementResultData(PCBATestToolkitData):
             second_iterable_instance=tones_frequencies_hertz,
             second_iterable_name=nameof(tones_frequencies_hertz),
         )
+        if tones_phases_radians is not None:
+            Guard.all_elements_are_of_same_type(
+                input_list=tones_phases_radians, expected_type=float
+            )
+            Guard.have_same_size(
+                first_iterable_instance=tones_phases_radians,
+                first_iterable_name=nameof(tones_phases_radians),
+                second_iterable_instance=tones_frequencies_hertz,
+                second_iterable_name=nameof(tones_frequencies_hertz),
+            )
 
         self._tones_frequencies_hertz = tones_frequencies_hertz
         self._tones_amplitudes_volts = tones_amplitudes_volts
+        self._tones_phases_radians = tones_phases_radians
 
     @property
     def tones_frequencies_hertz(self) -> List[float]:
@@ -178,6 +278,14 @@ class MultipleTonesMeasurementResultData(PCBATestToolkitData):
         """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
         return self._tones_amplitudes_volts
 
+    @property
+    def tones_phases_radians(self) -> List[float]:
+        """
+        :class:`List[float]`:
+        Gets a list containing detected tones phases in radians, None if phases are not measured.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._tones_phases_radians
+
 
 class FrequencyDomainMeasurementResultData(PCBATestToolkitData):
     """Defines frequency domain measurement results obtained after waveform analysis."""
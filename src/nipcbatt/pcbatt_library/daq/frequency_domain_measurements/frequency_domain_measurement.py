@@ -3,17 +3,14 @@
 """  Defines class used for Frequency domain measurement on PCB points. """
 
 import math
-from typing import Union
+from typing import List, Union
 
 import nidaqmx.constants
-import nidaqmx.stream_readers
-import numpy
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis.waveform_analysis.frequency_domain_analysis import (
     LabViewFrequencyDomainProcessing,
 )
-from nipcbatt.pcbatt_analysis.waveform_transformation import scale_and_offset_waveform
 from nipcbatt.pcbatt_library.common.common_data_types import (
     AmplitudeSpectrum,
     AnalogWaveform,
@@ -21,6 +18,7 @@ from nipcbatt.pcbatt_library.common.common_data_types import (
     MeasurementAnalysisRequirement,
     MeasurementData,
     MeasurementExecutionType,
+    RawMeasurementData,
     SampleClockTimingParameters,
     SampleTimingEngine,
     StartTriggerType,
@@ -38,6 +36,7 @@ from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_
 from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_data_types import (
     FrequencyDomainMeasurementConfiguration,
     FrequencyDomainMeasurementResultData,
+    FrequencyDomainSpectrumAveragingParameters,
     MultipleTonesMeasurementResultData,
 )
 from nipcbatt.pcbatt_library_core.daq.pcbatt_building_blocks import BuildingBlockUsingDAQmx
@@ -59,6 +58,7 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
         if self.is_task_initialized:
             return
 
+        self.invalidate_task_properties()
         if self.contains_only_global_virtual_channels(
             channel_expression=analog_input_channel_expression
         ):
@@ -108,6 +108,7 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
+            self.disarm()
             self.configure_all_channels(configuration.global_channel_parameters)
             for specific_channel_parameters in configuration.specific_channels_parameters:
                 self.configure_specific_channel(specific_channel_parameters)
@@ -118,12 +119,64 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(
-                data, configuration.measurement_options.measurement_analysis_requirement
+                data,
+                configuration.measurement_options.measurement_analysis_requirement,
+                configuration.spectrum_averaging_parameters,
             )
 
-        self.task.start()
+        self.arm()
+        return None
+
+    def configure_and_measure_targeted_tones(
+        self,
+        configuration: FrequencyDomainMeasurementConfiguration,
+        tones_frequencies_hertz: List[float],
+    ) -> Union[None, List[MultipleTonesMeasurementResultData]]:
+        """Configures and/or performs a measurement of tones of known frequencies,
+           such as the tones of a generated stimulus, according to specific configuration parameters.
+
+        Amplitude and phase of each tone are measured directly, spectrums are not computed.
+
+        Args:
+            configuration (FrequencyDomainMeasurementConfiguration): An instance of
+            `FrequencyDomainMeasurementConfiguration` used to configure the measurement.
+            tones_frequencies_hertz (List[float]): The frequencies of the tones to measure.
+
+        Returns:
+            List[MultipleTonesMeasurementResultData] | None:
+                A list of `MultipleTonesMeasurementResultData`, one per channel,
+                an empty list if analysis was skipped,
+                or `None` if no measure was performed.
+        """  # noqa: D202, D205, D415, W505 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (287 > 100 characters) (auto-generated noqa)
+
+        if configuration.measurement_options.execution_option in (
+            MeasurementExecutionType.CONFIGURE_AND_MEASURE,
+            MeasurementExecutionType.CONFIGURE_ONLY,
+        ):
+            self.disarm()
+            self.configure_all_channels(configuration.global_channel_parameters)
+            for specific_channel_parameters in configuration.specific_channels_parameters:
+                self.configure_specific_channel(specific_channel_parameters)
+            self.configure_timing(configuration.sample_clock_timing_parameters)
+            self.configure_trigger(configuration.digital_start_trigger_parameters)
+
+        if configuration.measurement_options.execution_option in (
+            MeasurementExecutionType.CONFIGURE_AND_MEASURE,
+            MeasurementExecutionType.MEASURE_ONLY,
+        ):
+            self.arm()
+            data = self.acquire_data_for_measurement_analysis()
+            if (
+                configuration.measurement_options.measurement_analysis_requirement
+                == MeasurementAnalysisRequirement.SKIP_ANALYSIS
+            ):
+                return []
+            return self.analyze_targeted_tones_measurement_data(data, tones_frequencies_hertz)
+
+        self.arm()
         return None
 
     def configure_all_channels(self, parameters: VoltageRangeAndTerminalParameters):
@@ -133,6 +186,10 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             parameters (VoltageRangeAndTerminalParameters):
             An instance of `VoltageRangeAndTerminalParameters` used to configure the channels.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         # for each channel defined in analog input channels list,
         # set terminal configuration and voltage range.
         for channel in self.task.ai_channels:
@@ -140,6 +197,10 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             channel.ai_min = parameters.range_min_volts
             channel.ai_max = parameters.range_max_volts
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(
         self, parameters: VoltageMeasurementChannelAndTerminalRangeParameters
     ):
@@ -156,6 +217,11 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
         Similarly, if the user provides Physical channel name in Initialize(),
         then he/she has to provide the Physical channel name in Specific channel parameters.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         if parameters.channel_name in (channel.name for channel in self.task.ai_channels):
             # if the specified channel is present in ai_channel_collection,
             # update the voltage parameters of the channel
@@ -191,6 +257,10 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
                     units=ConstantsForVoltageMeasurement.INITIAL_AI_VOLTAGE_UNITS,
                 )
 
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
+
     def configure_timing(self, parameters: SampleClockTimingParameters):
         """Configures the timing characteristics used for voltage measurements.
 
@@ -200,6 +270,10 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             used to configure the timing.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        if self.is_configuration_unchanged("timing", parameters):
+            return
+
+        self.invalidate_task_properties()
         self.task.timing.cfg_samp_clk_timing(
             rate=parameters.sampling_rate_hertz,
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
@@ -217,6 +291,8 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
         else:
             self.task.timing.samp_timing_engine = parameters.sample_timing_engine.value
 
+        self.save_applied_configuration("timing", parameters)
+
     def configure_trigger(self, parameters: DigitalStartTriggerParameters):
         """Configure the characteristics of triggers used for voltage measurements.
 
@@ -226,6 +302,9 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             used to configure the channels.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        if self.is_configuration_unchanged("trigger", parameters):
+            return
+
         if parameters.trigger_select == StartTriggerType.NO_TRIGGER:
             self.task.triggers.start_trigger.disable_start_trig()
         else:
@@ -234,6 +313,8 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
                 trigger_edge=parameters.digital_start_trigger_edge,
             )
 
+        self.save_applied_configuration("trigger", parameters)
+
     def acquire_data_for_measurement_analysis(self) -> MeasurementData:
         """Acquires Data from DAQ channel for measurement of voltage.
 
@@ -241,29 +322,23 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             MeasurementData: An instance of `MeasurementData`
             that specifies the data acquired from DAQ channels.
         """
-        # Builds the shape of numpy array (number of channels, number of samples)
-        number_of_channels = len(self.task.in_stream.channels_to_read.channel_names)
-        number_of_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
-
-        # Build the numpy array.
-        samples_array = numpy.zeros(
-            shape=(number_of_channels, number_of_samples_per_channel),
-            dtype=numpy.float64,
-        )
-
-        # Reads data and fill numpy array.
-        reader = nidaqmx.stream_readers.AnalogMultiChannelReader(self.task.in_stream)
-        reader.read_many_sample(
-            data=samples_array,
-            number_of_samples_per_channel=number_of_samples_per_channel,
-        )
+        # Raw samples are scaled to volts when analysis or the caller gets them in volts.
+        if self.raw_samples_enabled:
+            raw_samples, scaling_coefficients = self.read_analog_raw_samples()
+            return RawMeasurementData(
+                raw_samples=raw_samples,
+                scaling_coefficients=scaling_coefficients,
+                samples_dtype=self.samples_dtype,
+            )
 
-        return MeasurementData(samples_array)
+        # Reads samples of all channels, in the type of samples of the building block.
+        return MeasurementData(self.read_analog_samples())
 
     def analyze_measurement_data(
         self,
         measurement_data: MeasurementData,
         measurement_analysis_requirement: MeasurementAnalysisRequirement,
+        spectrum_averaging_parameters: FrequencyDomainSpectrumAveragingParameters = None,
     ) -> FrequencyDomainMeasurementResultData:
         """Proceeds to the analysis of Voltages from the measurement.
 
@@ -274,6 +349,10 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             measurement_analysis_requirement (MeasurementAnalysisRequirement):
                 An instance of 'MeasurementAnalysisRequirement' that specifies
                 whether to Skip Analysis or Proceed to Analysis.
+            spectrum_averaging_parameters (FrequencyDomainSpectrumAveragingParameters, optional):
+                An instance of `FrequencyDomainSpectrumAveragingParameters` that specifies
+                how spectrums are averaged over segments of the acquired data,
+                one spectrum is computed over the whole record when None. Defaults to None.
 
         Returns:
             FrequencyDomainMeasurementResultData:
@@ -281,10 +360,11 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             that specifies the measurement results.
         """
         # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
         Guard.is_greater_than_zero(
-            self.task.timing.samp_clk_rate, nameof(self.task.timing.samp_clk_rate)
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
         )
-        delta_time_seconds = invert_value(self.task.timing.samp_clk_rate)
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
 
         # Initialization for DcRmsVoltageMeasurementResultData instance creation.
         voltage_waveforms: list[AnalogWaveform] = []
@@ -294,7 +374,7 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
 
         for channel_samples, channel_name in zip(
             measurement_data.samples_per_channel,
-            self.task.in_stream.channels_to_read.channel_names,
+            task_properties.channels_names,
         ):
             # Creates an instance of AnalogWaveform and add it to waveforms.
             voltage_waveforms.append(
@@ -305,14 +385,12 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
                 )
             )
 
-            if (
-                measurement_analysis_requirement
-                == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS
-            ):
-                # Frequency domain processing
-                fdvm_processing_results = LabViewFrequencyDomainProcessing.process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
-                    waveform_samples=channel_samples,
-                    waveform_sampling_period_seconds=delta_time_seconds,
+        if measurement_analysis_requirement == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS:
+            if spectrum_averaging_parameters is not None:
+                # Averaged frequency domain processing of all channels, segment by segment
+                fdvm_processing_results = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_averaged_multiple_tones_and_amplitude_spectrum(
+                    waveforms_samples=measurement_data.data_samples,
+                    waveforms_sampling_period_seconds=delta_time_seconds,
                     spectrum_amplitude_must_be_db=(
                         ConstantsForFrequencyDomainMeasurement.VIEW_RESULTS_dB_ON
                     ),
@@ -326,40 +404,73 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
                     tones_selection_threshold_peak_amplitude=(
                         ConstantsForFrequencyDomainMeasurement.DEFAULT_THRESHOLD_FOR_TONE_EXTRACTION
                     ),
+                    segment_samples_count=spectrum_averaging_parameters.segment_samples_count,
+                    segment_overlap_percent=spectrum_averaging_parameters.segment_overlap_percent,
+                    averages_count=spectrum_averaging_parameters.averages_count,
                     tones_max_count=(
                         ConstantsForFrequencyDomainMeasurement.DEFAULT_MAX_NUMBER_OF_TONES_TO_BE_EXTRACTED
                     ),
                 )
+            else:
+                # Frequency domain processing of all channels
+                fdvm_processing_results = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(
+                    waveforms_samples=measurement_data.data_samples,
+                    waveforms_sampling_period_seconds=delta_time_seconds,
+                    spectrum_amplitude_must_be_db=(
+                        ConstantsForFrequencyDomainMeasurement.VIEW_RESULTS_dB_ON
+                    ),
+                    spectrum_phase_unit=(
+                        ConstantsForFrequencyDomainMeasurement.VIEW_RESULTS_PHASE_UNIT
+                    ),
+                    fft_spectrum_window=ConstantsForFrequencyDomainMeasurement.FILTERING_WINDOW_FOR_FFT,
+                    tones_sorting_mode=(
+                        ConstantsForFrequencyDomainMeasurement.DEFAULT_SORTING_ORDER_OF_THE_EXTRACTED_TONES
+                    ),
+                    tones_selection_threshold_peak_amplitude=(
+                        ConstantsForFrequencyDomainMeasurement.DEFAULT_THRESHOLD_FOR_TONE_EXTRACTION
+                    ),
+                    tones_max_count=(
+                        ConstantsForFrequencyDomainMeasurement.DEFAULT_MAX_NUMBER_OF_TONES_TO_BE_EXTRACTED
+                    ),
+                    workers_count=self.analysis_workers_count,
+                )
 
-                fdvm_spectrum_result = fdvm_processing_results.amplitude_phase_spectrum
-                fdvm_tones_result = fdvm_processing_results.multiple_tones_result
-
+            # PEAK spectrum results are obtained by converting RMS amplitudes
+            spectrums_peak_amplitudes = fdvm_processing_results.spectrums_amplitudes * math.sqrt(2)
+
+            for (
+                channel_name,
+                spectrum_rms_amplitudes,
+                spectrum_peak_amplitudes,
+                fdvm_tones_result,
+            ) in zip(
+                task_properties.channels_names,
+                fdvm_processing_results.spectrums_amplitudes,
+                spectrums_peak_amplitudes,
+                fdvm_processing_results.multiple_tones_results,
+            ):
                 # RMS spectrum results is default output of analysis library
                 measured_magnitude_rms.append(
                     AmplitudeSpectrum(
                         channel_name=channel_name,
-                        spectrum_start_frequency_hertz=fdvm_spectrum_result.spectrum_start_frequency,
+                        spectrum_start_frequency_hertz=fdvm_processing_results.spectrum_start_frequency,
                         spectrum_frequency_resolution_hertz=(
-                            fdvm_spectrum_result.spectrum_frequency_resolution
+                            fdvm_processing_results.spectrum_frequency_resolution
                         ),
                         # RMS amplitudes
-                        amplitudes=fdvm_spectrum_result.spectrum_amplitudes,
+                        amplitudes=spectrum_rms_amplitudes,
                     )
                 )
 
-                # PEAK spectrum results are obtained by converting RMS amplitudes
                 measured_magtitude_peak.append(
                     AmplitudeSpectrum(
                         channel_name=channel_name,
-                        spectrum_start_frequency_hertz=fdvm_spectrum_result.spectrum_start_frequency,
+                        spectrum_start_frequency_hertz=fdvm_processing_results.spectrum_start_frequency,
                         spectrum_frequency_resolution_hertz=(
-                            fdvm_spectrum_result.spectrum_frequency_resolution
+                            fdvm_processing_results.spectrum_frequency_resolution
                         ),
                         # PEAK amplitudes
-                        amplitudes=scale_and_offset_waveform.scale(
-                            waveform_samples=fdvm_spectrum_result.spectrum_amplitudes,
-                            scale_factor=math.sqrt(2),
-                        ),
+                        amplitudes=spectrum_peak_amplitudes,
                     ),
                 )
 
@@ -388,3 +499,54 @@ class FrequencyDomainMeasurement(BuildingBlockUsingDAQmx):
             magnitude_peak=measured_magtitude_peak,
             detected_tones=measured_detected_tones,
         )
+
+    def analyze_targeted_tones_measurement_data(
+        self,
+        measurement_data: MeasurementData,
+        tones_frequencies_hertz: List[float],
+    ) -> List[MultipleTonesMeasurementResultData]:
+        """Proceeds to the analysis of tones of known frequencies from the measurement,
+           the spectrums of channels are not computed.
+
+        Args:
+            measurement_data (MeasurementData):
+                An instance of `MeasurementData`
+                that specifies the data acquired from DAQ channels.
+            tones_frequencies_hertz (List[float]):
+                The frequencies of the tones to measure.
+
+        Returns:
+            List[MultipleTonesMeasurementResultData]:
+            A list of `MultipleTonesMeasurementResultData`, one per channel,
+            holding frequency, peak amplitude and phase of each tone, in the order of
+            `tones_frequencies_hertz`.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
+        Guard.is_greater_than_zero(
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
+        )
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
+
+        # Targeted tones processing of all channels
+        tones_processing_results = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_targeted_tones(
+            waveforms_samples=measurement_data.data_samples,
+            waveforms_sampling_period_seconds=delta_time_seconds,
+            tones_frequencies=tones_frequencies_hertz,
+            fft_spectrum_window=ConstantsForFrequencyDomainMeasurement.FILTERING_WINDOW_FOR_FFT,
+        )
+
+        return [
+            MultipleTonesMeasurementResultData(
+                tones_frequencies_hertz=[
+                    waveform_tone.frequency for waveform_tone in tones_result.detected_tones
+                ],
+                tones_amplitudes_volts=[
+                    waveform_tone.amplitude for waveform_tone in tones_result.detected_tones
+                ],
+                tones_phases_radians=[
+                    waveform_tone.phase_radians for waveform_tone in tones_result.detected_tones
+                ],
+            )
+            for tones_result in tones_processing_results
+        ]
@@ -0,0 +1,16 @@
+""" Constants data types for Frequency response Measurements."""
+
+from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_constants import (
+    DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_CONFIGURATION,
+)
+from nipcbatt.pcbatt_library.daq.frequency_response_measurements.frequency_response_data_types import (
+    FrequencyResponseMeasurementConfiguration,
+)
+from nipcbatt.pcbatt_library.daq.signal_voltage_generations.signal_voltage_generation_constants import (
+    DEFAULT_MULTI_TONE_GENERATION_CONFIGURATION,
+)
+
+DEFAULT_FREQUENCY_RESPONSE_MEASUREMENT_CONFIGURATION = FrequencyResponseMeasurementConfiguration(
+    generation_configuration=DEFAULT_MULTI_TONE_GENERATION_CONFIGURATION,
+    measurement_configuration=DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_CONFIGURATION,
+)
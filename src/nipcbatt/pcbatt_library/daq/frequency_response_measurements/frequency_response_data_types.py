@@ -0,0 +1,198 @@
+""" Frequency response data types """  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (146 > 100 characters) (auto-generated noqa)
+
+from typing import List
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_library.common.common_data_types import AnalogWaveform
+from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_data_types import (
+    FrequencyDomainMeasurementConfiguration,
+)
+from nipcbatt.pcbatt_library.daq.signal_voltage_generations.signal_voltage_data_types import (
+    SignalVoltageGenerationMultipleTonesConfiguration,
+)
+from nipcbatt.pcbatt_library_core.pcbatt_data_types import PCBATestToolkitData
+from nipcbatt.pcbatt_utilities.guard_utilities import Guard
+
+
+class FrequencyResponseMeasurementConfiguration(PCBATestToolkitData):
+    """Defines parameters used for configuration of Frequency response measurement."""
+
+    def __init__(
+        self,
+        generation_configuration: SignalVoltageGenerationMultipleTonesConfiguration,
+        measurement_configuration: FrequencyDomainMeasurementConfiguration,
+    ) -> None:
+        """Initializes an instance of
+        `FrequencyResponseMeasurementConfiguration` with specific values.
+
+        Args:
+            generation_configuration (SignalVoltageGenerationMultipleTonesConfiguration):
+                An instance of `SignalVoltageGenerationMultipleTonesConfiguration` that represents
+                the settings of the multitone stimulus, its start trigger starts the measurement.
+            measurement_configuration (FrequencyDomainMeasurementConfiguration):
+                An instance of `FrequencyDomainMeasurementConfiguration` that represents
+                the settings of the acquisition of stimulus and response channels,
+                its start trigger settings are replaced by the start trigger of the stimulus.
+
+        Raises:
+            ValueError:
+                Raised when `generation_configuration` is None,
+                `measurement_configuration` is None.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
+        Guard.is_not_none(generation_configuration, nameof(generation_configuration))
+        Guard.is_not_none(measurement_configuration, nameof(measurement_configuration))
+
+        self._generation_configuration = generation_configuration
+        self._measurement_configuration = measurement_configuration
+
+    @property
+    def generation_configuration(self) -> SignalVoltageGenerationMultipleTonesConfiguration:
+        """
+        :class:`SignalVoltageGenerationMultipleTonesConfiguration`:
+            Gets a `SignalVoltageGenerationMultipleTonesConfiguration` instance
+            that represents the settings of the multitone stimulus.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._generation_configuration
+
+    @property
+    def measurement_configuration(self) -> FrequencyDomainMeasurementConfiguration:
+        """
+        :class:`FrequencyDomainMeasurementConfiguration`:
+            Gets a `FrequencyDomainMeasurementConfiguration` instance
+            that represents the settings of the acquisition of stimulus and response channels.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._measurement_configuration
+
+
+class FrequencyResponseMeasurementResultData(PCBATestToolkitData):
+    """Defines frequency response measurement results obtained after waveform analysis."""
+
+    def __init__(
+        self,
+        waveforms: List[AnalogWaveform],
+        stimulus_channel_name: str,
+        response_channels_names: List[str],
+        tones_frequencies_hertz: numpy.ndarray,
+        gains: numpy.ndarray,
+        phases_shifts_radians: numpy.ndarray,
+    ) -> None:
+        """Initializes an instance of "FrequencyResponseMeasurementResultData" with specific values.
+
+        Args:
+            waveforms (List[AnalogWaveform]):
+                A list of `AnalogWaveform` acquired from stimulus and response channels.
+            stimulus_channel_name (str):
+                The name of the channel acquiring the stimulus.
+            response_channels_names (List[str]):
+                The names of the channels acquiring the responses.
+            tones_frequencies_hertz (numpy.ndarray):
+                A 1-D array of frequencies of the tones of the stimulus.
+            gains (numpy.ndarray):
+                A 2-D array of gains (V/V) of responses relative to the stimulus,
+                one row per response channel and one column per tone.
+            phases_shifts_radians (numpy.ndarray):
+                A 2-D array of phase shifts of responses relative to the stimulus,
+                one row per response channel and one column per tone.
+
+        Raises:
+            TypeError: Raised when,
+                `waveforms` contains objects that are not `AnalogWaveform`,
+                `response_channels_names` contains objects that are not `str`.
+
+            ValueError: Raised when,
+                `waveforms` is None or empty,
+                `stimulus_channel_name` is None, empty or whitespace,
+                `response_channels_names` is None,
+                `tones_frequencies_hertz`, `gains` or `phases_shifts_radians` is None,
+                `gains` or `phases_shifts_radians` shape is not
+                (number of response channels, number of tones).
+        """
+        Guard.is_not_none(waveforms, nameof(waveforms))
+        Guard.is_not_empty(waveforms, nameof(waveforms))
+        Guard.all_elements_are_of_same_type(input_list=waveforms, expected_type=AnalogWaveform)
+        Guard.is_not_none_nor_empty_nor_whitespace(
+            stimulus_channel_name, nameof(stimulus_channel_name)
+        )
+        Guard.is_not_none(response_channels_names, nameof(response_channels_names))
+        Guard.all_elements_are_of_same_type(input_list=response_channels_names, expected_type=str)
+        Guard.is_not_none(tones_frequencies_hertz, nameof(tones_frequencies_hertz))
+        Guard.is_not_none(gains, nameof(gains))
+        Guard.is_not_none(phases_shifts_radians, nameof(phases_shifts_radians))
+
+        expected_shape = (len(response_channels_names), len(tones_frequencies_hertz))
+        if numpy.shape(gains) != expected_shape:
+            raise ValueError(f"{nameof(gains)} shape must be {expected_shape}.")
+        if numpy.shape(phases_shifts_radians) != expected_shape:
+            raise ValueError(f"{nameof(phases_shifts_radians)} shape must be {expected_shape}.")
+
+        self._waveforms = waveforms
+        self._stimulus_channel_name = stimulus_channel_name
+        self._response_channels_names = response_channels_names
+        self._tones_frequencies_hertz = tones_frequencies_hertz
+        self._gains = gains
+        self._phases_shifts_radians = phases_shifts_radians
+
+    @property
+    def waveforms(self) -> List[AnalogWaveform]:
+        """
+        :class:`List[AnalogWaveform]`:
+            Gets the list of waveforms acquired from stimulus and response channels,
+            the stimulus waveform comes first.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._waveforms
+
+    @property
+    def stimulus_channel_name(self) -> str:
+        """
+        :class:`str`:
+            Gets the name of the channel acquiring the stimulus.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._stimulus_channel_name
+
+    @property
+    def response_channels_names(self) -> List[str]:
+        """
+        :class:`List[str]`:
+            Gets the names of the channels acquiring the responses, in the order of rows of
+            `gains` and `phases_shifts_radians`.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._response_channels_names
+
+    @property
+    def tones_frequencies_hertz(self) -> numpy.ndarray:
+        """
+        :class:`numpy.ndarray`:
+            Gets the frequencies of the tones of the stimulus, in the order of columns of
+            `gains` and `phases_shifts_radians`.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._tones_frequencies_hertz
+
+    @property
+    def gains(self) -> numpy.ndarray:
+        """
+        :class:`numpy.ndarray`:
+            Gets the gains (V/V) of responses relative to the stimulus,
+            one row per response channel and one column per tone.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._gains
+
+    @property
+    def gains_db(self) -> numpy.ndarray:
+        """
+        :class:`numpy.ndarray`:
+            Gets the gains of responses relative to the stimulus expressed as db,
+            one row per response channel and one column per tone.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        with numpy.errstate(divide="ignore"):
+            return 20.0 * numpy.log10(self._gains)
+
+    @property
+    def phases_shifts_radians(self) -> numpy.ndarray:
+        """
+        :class:`numpy.ndarray`:
+            Gets the phase shifts of responses relative to the stimulus, in [-PI, PI] radians,
+            one row per response channel and one column per tone.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
+        return self._phases_shifts_radians
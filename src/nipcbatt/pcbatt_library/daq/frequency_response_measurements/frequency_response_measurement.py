@@ -0,0 +1,281 @@
+"""  Defines class used for single-shot Frequency response measurement on PCB points. """
+
+from typing import Union
+
+import nidaqmx.constants
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_analysis.waveform_analysis.frequency_domain_analysis import (
+    LabViewFrequencyDomainProcessing,
+)
+from nipcbatt.pcbatt_library.common.common_data_types import (
+    AnalogWaveform,
+    MeasurementAnalysisRequirement,
+    MeasurementData,
+    MeasurementExecutionType,
+)
+from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_constants import (
+    ConstantsForFrequencyDomainMeasurement,
+)
+from nipcbatt.pcbatt_library.daq.frequency_domain_measurements.frequency_domain_measurement import (
+    FrequencyDomainMeasurement,
+)
+from nipcbatt.pcbatt_library.daq.frequency_response_measurements.frequency_response_data_types import (
+    FrequencyResponseMeasurementConfiguration,
+    FrequencyResponseMeasurementResultData,
+)
+from nipcbatt.pcbatt_library.daq.signal_voltage_generations.signal_voltage_data_types import (
+    SignalVoltageGenerationMultipleTonesConfiguration,
+)
+from nipcbatt.pcbatt_library.daq.signal_voltage_generations.signal_voltage_generation import (
+    SignalVoltageGeneration,
+)
+from nipcbatt.pcbatt_utilities.guard_utilities import Guard
+from nipcbatt.pcbatt_utilities.numeric_utilities import invert_value
+
+
+class FrequencyResponseMeasurement(FrequencyDomainMeasurement):
+    """Defines a way that allows you to measure, in one acquisition, the gain and phase shift
+    of PCB points at the frequencies of the tones of a generated multitone stimulus.
+
+    The stimulus is generated by an internal `SignalVoltageGeneration` and acquired, with the
+    responses, by the analog input task of this instance, which starts on the start trigger
+    of the generation. Tones of all acquired channels are measured in one batched analysis.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    # Generation of the multitone stimulus, created by initialize.
+    _stimulus_generation: SignalVoltageGeneration = None
+
+    def initialize(
+        self,
+        analog_output_channel_expression: str,
+        stimulus_analog_input_channel_expression: str,
+        response_analog_input_channel_expression: str,
+    ):
+        """Initializes the measurement with the specific channels
+
+        Args:
+            analog_output_channel_expression (str):
+                Expression representing the name of the analog output physical channel,
+                or global channel, generating the stimulus.
+            stimulus_analog_input_channel_expression (str):
+                Expression representing the name of the analog input physical channel,
+                or global channel, acquiring the stimulus.
+            response_analog_input_channel_expression (str):
+                Expression representing the names of the analog input physical channels,
+                or global channels, acquiring the responses.
+        """  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (122 > 100 characters) (auto-generated noqa)
+        if self.is_task_initialized:
+            return
+
+        Guard.is_not_none_nor_empty_nor_whitespace(
+            analog_output_channel_expression, nameof(analog_output_channel_expression)
+        )
+        Guard.is_not_none_nor_empty_nor_whitespace(
+            stimulus_analog_input_channel_expression,
+            nameof(stimulus_analog_input_channel_expression),
+        )
+        Guard.is_not_none_nor_empty_nor_whitespace(
+            response_analog_input_channel_expression,
+            nameof(response_analog_input_channel_expression),
+        )
+
+        self._stimulus_generation = SignalVoltageGeneration(analog_output_channel_expression)
+
+        # stimulus channel is added first, it is the first row of acquired samples
+        super().initialize(
+            f"{stimulus_analog_input_channel_expression},"
+            + f"{response_analog_input_channel_expression}"
+        )
+
+    def close(self):
+        """Closes measurement procedure and releases internal resources."""
+        if self._stimulus_generation is not None:
+            self._stimulus_generation.close()
+
+        super().close()
+
+    @property
+    def stimulus_generation(self) -> SignalVoltageGeneration:
+        """Gets the generation of the multitone stimulus.
+
+        Returns:
+            SignalVoltageGeneration: the building block generating the stimulus.
+        """
+        return self._stimulus_generation
+
+    def configure_and_measure(
+        self, configuration: FrequencyResponseMeasurementConfiguration
+    ) -> Union[None, FrequencyResponseMeasurementResultData]:
+        """Configures and/or performs a measurement
+           according to specific configuration parameters.
+
+        Args:
+            configuration (FrequencyResponseMeasurementConfiguration): An instance of
+            `FrequencyResponseMeasurementConfiguration` used to configure the measurement.
+
+        Returns:
+            FrequencyResponseMeasurementResultData | None:
+                An instance of `FrequencyResponseMeasurementResultData`
+                or `None` if no measure was performed.
+        """  # noqa: D202, D205, D415, W505 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (287 > 100 characters) (auto-generated noqa)
+
+        measurement_configuration = configuration.measurement_configuration
+        generation_configuration = configuration.generation_configuration
+
+        if measurement_configuration.measurement_options.execution_option in (
+            MeasurementExecutionType.CONFIGURE_AND_MEASURE,
+            MeasurementExecutionType.CONFIGURE_ONLY,
+        ):
+            self.disarm()
+            self.configure_all_channels(measurement_configuration.global_channel_parameters)
+            for (
+                specific_channel_parameters
+            ) in measurement_configuration.specific_channels_parameters:
+                self.configure_specific_channel(specific_channel_parameters)
+            self.configure_timing(measurement_configuration.sample_clock_timing_parameters)
+            self.configure_stimulus_generation(generation_configuration)
+
+        if measurement_configuration.measurement_options.execution_option in (
+            MeasurementExecutionType.CONFIGURE_AND_MEASURE,
+            MeasurementExecutionType.MEASURE_ONLY,
+        ):
+            data = self.acquire_stimulus_and_response_data(generation_configuration)
+            return self.analyze_frequency_response_measurement_data(
+                data,
+                measurement_configuration.measurement_options.measurement_analysis_requirement,
+                [
+                    tone_parameters.tone_frequency_hertz
+                    for tone_parameters in (
+                        generation_configuration.waveform_parameters.multiple_tones_parameters
+                    )
+                ],
+            )
+
+        self.arm()
+        return None
+
+    def configure_stimulus_generation(
+        self, configuration: SignalVoltageGenerationMultipleTonesConfiguration
+    ):
+        """Configures the generation of the multitone stimulus and makes the acquisition
+        start on the start trigger of the generation.
+
+        Args:
+            configuration (SignalVoltageGenerationMultipleTonesConfiguration):
+            An instance of `SignalVoltageGenerationMultipleTonesConfiguration`
+            used to configure the generation of the stimulus.
+        """  # noqa: D205, D415, D417 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa)
+        self._stimulus_generation.configure_all_channels(
+            parameters=configuration.voltage_generation_range_parameters
+        )
+        self._stimulus_generation.configure_timing(parameters=configuration.timing_parameters)
+        self._stimulus_generation.configure_trigger(
+            parameters=configuration.digital_start_trigger_parameters
+        )
+
+        # acquisition starts with the generation, both tasks share the same start trigger
+        self.task.triggers.start_trigger.cfg_dig_edge_start_trig(
+            trigger_source=self._stimulus_generation.task.triggers.start_trigger.term,
+            trigger_edge=nidaqmx.constants.Edge.RISING,
+        )
+        # trigger was set directly on the task, the one saved by configure_trigger is stale
+        self.invalidate_applied_configurations("trigger")
+
+    def acquire_stimulus_and_response_data(
+        self, configuration: SignalVoltageGenerationMultipleTonesConfiguration
+    ) -> MeasurementData:
+        """Generates the multitone stimulus and acquires stimulus and response channels
+        in one synchronized acquisition.
+
+        Args:
+            configuration (SignalVoltageGenerationMultipleTonesConfiguration):
+            An instance of `SignalVoltageGenerationMultipleTonesConfiguration`
+            describing the stimulus to generate.
+
+        Returns:
+            MeasurementData: An instance of `MeasurementData`
+            that specifies the data acquired from DAQ channels, stimulus channel first.
+        """  # noqa: D205, D415, D417 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa)
+        # acquisition is armed before the generation starts and fires its start trigger
+        self.arm()
+        try:
+            self._stimulus_generation.generate_voltage_multi_tones_waveform(
+                signal_parameters=configuration.waveform_parameters,
+                timing_parameters=configuration.timing_parameters,
+            )
+            return self.acquire_data_for_measurement_analysis()
+        finally:
+            self._stimulus_generation.disarm()
+            self.disarm()
+
+    def analyze_frequency_response_measurement_data(
+        self,
+        measurement_data: MeasurementData,
+        measurement_analysis_requirement: MeasurementAnalysisRequirement,
+        tones_frequencies_hertz: list[float],
+    ) -> FrequencyResponseMeasurementResultData:
+        """Proceeds to the analysis of gains and phase shifts of responses relative to the
+        stimulus, at the frequencies of the tones of the stimulus.
+
+        Args:
+            measurement_data (MeasurementData):
+                An instance of `MeasurementData`
+                that specifies the data acquired from DAQ channels, stimulus channel first.
+            measurement_analysis_requirement (MeasurementAnalysisRequirement):
+                An instance of 'MeasurementAnalysisRequirement' that specifies
+                whether to Skip Analysis or Proceed to Analysis.
+            tones_frequencies_hertz (list[float]):
+                The frequencies of the tones of the stimulus.
+
+        Returns:
+            FrequencyResponseMeasurementResultData:
+            An instance of `FrequencyResponseMeasurementResultData`
+            that specifies the measurement results, gains and phase shifts have no column
+            when analysis is skipped.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
+        Guard.is_greater_than_zero(
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
+        )
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
+        channels_names = task_properties.channels_names
+
+        voltage_waveforms = [
+            AnalogWaveform(
+                channel_name=channel_name,
+                delta_time_seconds=delta_time_seconds,
+                samples=channel_samples,
+            )
+            for channel_samples, channel_name in zip(
+                measurement_data.samples_per_channel, channels_names
+            )
+        ]
+
+        if measurement_analysis_requirement == MeasurementAnalysisRequirement.SKIP_ANALYSIS:
+            tones_frequencies = numpy.empty(shape=0, dtype=numpy.float64)
+            gains = numpy.empty(shape=(len(channels_names) - 1, 0), dtype=numpy.float64)
+            phases_shifts = numpy.empty(shape=(len(channels_names) - 1, 0), dtype=numpy.float64)
+        else:
+            # gains and phases shifts of all channels, relative to the stimulus channel
+            frequency_response_result = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_frequency_response(
+                waveforms_samples=measurement_data.data_samples,
+                waveforms_sampling_period_seconds=delta_time_seconds,
+                tones_frequencies=tones_frequencies_hertz,
+                stimulus_waveform_index=0,
+                fft_spectrum_window=ConstantsForFrequencyDomainMeasurement.FILTERING_WINDOW_FOR_FFT,
+            )
+            tones_frequencies = frequency_response_result.tones_frequencies
+            gains = frequency_response_result.gains[1:]
+            phases_shifts = frequency_response_result.phases_shifts_radians[1:]
+
+        return FrequencyResponseMeasurementResultData(
+            waveforms=voltage_waveforms,
+            stimulus_channel_name=channels_names[0],
+            response_channels_names=list(channels_names[1:]),
+            tones_frequencies_hertz=tones_frequencies,
+            gains=gains,
+            phases_shifts_radians=phases_shifts,
+        )
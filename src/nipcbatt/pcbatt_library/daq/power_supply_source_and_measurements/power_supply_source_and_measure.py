@@ -131,6 +131,7 @@ class PowerSupplySourceAndMeasure(BuildingBlockUsingDAQmx):
             used to configure the timing.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        self.invalidate_task_properties()
         self.task.timing.cfg_samp_clk_timing(
             rate=parameters.sampling_rate_hertz,
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
@@ -172,14 +173,17 @@ class PowerSupplySourceAndMeasure(BuildingBlockUsingDAQmx):
             PowerSupplySourceAndMeasureData: An instance of `PowerSupplySourceAndMeasureData`
             that contains array of voltage and current samples acquired from DAQ channels.
         """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (210 > 100 characters) (auto-generated noqa)
-        number_of_samples_per_channel_to_read = self.task.timing.samp_quant_samp_per_chan
-        # Create pre-allocated numpy array to read the voltage samples from the daqmx buffer.
-        voltage_data_to_read = numpy.zeros(
+        task_properties = self.task_properties
+        number_of_samples_per_channel_to_read = task_properties.number_of_samples_per_channel
+        # Get pre-allocated numpy array to read the voltage samples from the daqmx buffer.
+        voltage_data_to_read = self.acquisition_buffers.get_buffer(
+            buffer_name="voltage_samples",
             shape=(number_of_samples_per_channel_to_read),
             dtype=numpy.float64,
         )
-        # Create pre-allocated numpy array to read the current samples from the daqmx buffer.
-        current_data_to_read = numpy.zeros(
+        # Get pre-allocated numpy array to read the current samples from the daqmx buffer.
+        current_data_to_read = self.acquisition_buffers.get_buffer(
+            buffer_name="current_samples",
             shape=(number_of_samples_per_channel_to_read),
             dtype=numpy.float64,
         )
@@ -207,7 +211,7 @@ class PowerSupplySourceAndMeasure(BuildingBlockUsingDAQmx):
             source_name=self.task.channel_names[0],
             voltage_samples=voltage_data_to_read,
             current_samples=current_data_to_read,
-            sampling_rate_hertz=self.task.timing.samp_clk_rate,
+            sampling_rate_hertz=task_properties.sampling_rate_hertz,
         )
 
     def analyze_measurement_data(
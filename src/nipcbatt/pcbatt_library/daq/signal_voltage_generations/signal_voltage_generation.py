@@ -145,18 +145,21 @@ class SignalVoltageGeneration(SynchronizationSignalRouting):
             generated_signal_duration_seconds=timing_parameters.generated_signal_duration_seconds,
         )
 
-        samples_to_write = sine_waveform.create_sine_waveform(
+        # build a numpy 2D array (number of row is the number of output channels),
+        # sine waveform is created in first row and copied into other rows
+        samples_to_write = np.empty(
+            shape=(self.task.out_stream.num_chans, waveform_samples_count), dtype=np.float64
+        )
+        sine_waveform.create_sine_waveform(
             amplitude=signal_parameters.generated_signal_tone_parameters.tone_amplitude_volts,
             frequency=signal_parameters.generated_signal_tone_parameters.tone_frequency_hertz,
             phase=signal_parameters.generated_signal_tone_parameters.tone_phase_radians,
             offset=signal_parameters.generated_signal_offset_volts,
             samples_count=waveform_samples_count,
             sampling_rate=timing_parameters.sampling_rate_hertz,
+            out=samples_to_write[0],
         )
-
-        # build a numpy 2D array (number of row is the number of output channels)
-        # from the numpy 1D array
-        samples_to_write = np.tile(samples_to_write, (self.task.out_stream.num_chans, 1))
+        samples_to_write[1:] = samples_to_write[0]
 
         writer = nidaqmx.stream_writers.AnalogMultiChannelWriter(
             self.task.out_stream, auto_start=True
@@ -184,7 +187,12 @@ class SignalVoltageGeneration(SynchronizationSignalRouting):
             generated_signal_duration_seconds=timing_parameters.generated_signal_duration_seconds,
         )
 
-        samples_to_write = square_waveform.create_square_waveform(
+        # build a numpy 2D array (number of row is the number of output channels),
+        # square waveform is created in first row and copied into other rows
+        samples_to_write = np.empty(
+            shape=(self.task.out_stream.num_chans, waveform_samples_count), dtype=np.float64
+        )
+        square_waveform.create_square_waveform(
             amplitude=signal_parameters.generated_signal_amplitude_volts,
             frequency=signal_parameters.generated_signal_frequency_hertz,
             duty_cycle=numeric_utilities.from_percent_to_decimal_ratio(
@@ -194,11 +202,9 @@ class SignalVoltageGeneration(SynchronizationSignalRouting):
             offset=signal_parameters.generated_signal_offset_volts,
             samples_count=waveform_samples_count,
             sampling_rate=timing_parameters.sampling_rate_hertz,
+            out=samples_to_write[0],
         )
-
-        # build a numpy 2D array (number of row is the number of output channels)
-        # from the numpy 1D array
-        samples_to_write = np.tile(samples_to_write, (self.task.out_stream.num_chans, 1))
+        samples_to_write[1:] = samples_to_write[0]
 
         writer = nidaqmx.stream_writers.AnalogMultiChannelWriter(
             self.task.out_stream, auto_start=True
@@ -238,16 +244,19 @@ class SignalVoltageGeneration(SynchronizationSignalRouting):
             )
         )
 
-        samples_to_write = multitones_waveform.create_multitones_waveform(
+        # build a numpy 2D array (number of row is the number of output channels),
+        # multi-tones waveform is created in first row and copied into other rows
+        samples_to_write = np.empty(
+            shape=(self.task.out_stream.num_chans, waveform_samples_count), dtype=np.float64
+        )
+        multitones_waveform.create_multitones_waveform(
             multitones_amplitude=signal_parameters.generated_signal_amplitude_volts,
             waveform_tones=waveform_tones_input,
             samples_count=waveform_samples_count,
             sampling_rate=timing_parameters.sampling_rate_hertz,
+            out=samples_to_write[0],
         )
-
-        # build a numpy 2D array (number of row is the number of output channels)
-        # from the numpy 1D array
-        samples_to_write = np.tile(samples_to_write, (self.task.out_stream.num_chans, 1))
+        samples_to_write[1:] = samples_to_write[0]
 
         writer = nidaqmx.stream_writers.AnalogMultiChannelWriter(
             self.task.out_stream, auto_start=True
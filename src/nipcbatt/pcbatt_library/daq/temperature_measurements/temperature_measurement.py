@@ -1,7 +1,6 @@
 """Defines class with common methods used for temperature measurements on PCB points."""
 
 import nidaqmx.constants
-import nidaqmx.stream_readers
 import numpy
 from varname import nameof
 
@@ -45,6 +44,10 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
             used to configure the timing.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        if self.is_configuration_unchanged("timing", parameters):
+            return
+
+        self.invalidate_task_properties()
         self.task.timing.cfg_samp_clk_timing(
             rate=parameters.sampling_rate_hertz,
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
@@ -62,6 +65,8 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
         else:
             self.task.timing.samp_timing_engine = parameters.sample_timing_engine.value
 
+        self.save_applied_configuration("timing", parameters)
+
     def configure_trigger(self, parameters: DigitalStartTriggerParameters):
         """Configure the characteristics of triggers used for temperature measurements.
 
@@ -71,6 +76,9 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
             used to configure the channels.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        if self.is_configuration_unchanged("trigger", parameters):
+            return
+
         if parameters.trigger_select == StartTriggerType.NO_TRIGGER:
             self.task.triggers.start_trigger.disable_start_trig()
         else:
@@ -79,6 +87,8 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
                 trigger_edge=parameters.digital_start_trigger_edge,
             )
 
+        self.save_applied_configuration("trigger", parameters)
+
     def acquire_data_for_measurement_analysis(self) -> MeasurementData:
         """Acquires Data from DAQ channel for measurement of temperature.
 
@@ -86,25 +96,8 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
             MeasurementData: An instance of `MeasurementData`
             that specifies the data acquired from DAQ channels.
         """  # noqa: D202 - No blank lines allowed after function docstring (auto-generated noqa)
-
-        # Builds the shape of numpy array (number of channels, number of samples per channel)
-        number_of_channels = len(self.task.in_stream.channels_to_read.channel_names)
-        number_of_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
-
-        # Build the numpy array.
-        data_to_read = numpy.zeros(
-            shape=(number_of_channels, number_of_samples_per_channel),
-            dtype=numpy.float64,
-        )
-
-        # Reads data and fill numpy array.
-        reader = nidaqmx.stream_readers.AnalogMultiChannelReader(self.task.in_stream)
-        reader.read_many_sample(
-            data=data_to_read,
-            number_of_samples_per_channel=number_of_samples_per_channel,
-        )
-
-        return MeasurementData(data_to_read)
+        # Reads samples of all channels, in the type of samples of the building block.
+        return MeasurementData(self.read_analog_samples())
 
     def analyze_measurement_data(
         self,
@@ -122,10 +115,11 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
             that specifies the measurement results.
         """
         # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
         Guard.is_greater_than_zero(
-            self.task.timing.samp_clk_rate, nameof(self.task.timing.samp_clk_rate)
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
         )
-        delta_time_seconds = invert_value(self.task.timing.samp_clk_rate)
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
 
         # Initialization for TemperatureMeasurementResultData instance creation.
         waveform = []
@@ -135,7 +129,7 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
 
         for samples_per_channel, channel_name in zip(
             measurement_data.samples_per_channel,
-            self.task.in_stream.channels_to_read.channel_names,
+            task_properties.channels_names,
         ):
             # samples_per_channel contains samples captured
             # from the channel which name is channel_name.
@@ -155,7 +149,7 @@ class TemperatureMeasurement(BuildingBlockUsingDAQmx):
                 )
             )
 
-            mean_temperature_celsius_degrees = numpy.mean(samples_per_channel)
+            mean_temperature_celsius_degrees = numpy.mean(samples_per_channel, dtype=numpy.float64)
             avg_temps_celsius_degrees.append(mean_temperature_celsius_degrees)
             avg_temps_kelvin.append(
                 mean_temperature_celsius_degrees
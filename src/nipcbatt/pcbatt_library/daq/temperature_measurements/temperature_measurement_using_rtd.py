@@ -33,6 +33,8 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
         if self.is_task_initialized:
             return
 
+        self.invalidate_task_properties()
+
         # If the input channel_expression contains global channel, then add them as global channels
         # and verify if the global channels are configured for current measurement.
         if self.contains_only_global_virtual_channels(channel_expression=channel_expression):
@@ -82,6 +84,7 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
+            self.disarm()
             self.configure_all_channels(configuration.global_channel_parameters)
             for specific_channel_parameters in configuration.specific_channels_parameters:
                 self.configure_specific_channel(specific_channel_parameters)
@@ -92,6 +95,7 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(data)
 
@@ -105,6 +109,10 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
             An instance of `TemperatureRtdMeasurementTerminalParameters`
             used to configure the channels.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         self.task.ai_channels.all.ai_adc_timing_mode = parameters.adc_timing_mode
         for channel in self.task.ai_channels:
             channel.ai_min = parameters.temperature_minimum_value_celsius_degrees
@@ -118,6 +126,10 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
             )
             channel.ai_resistance_cfg = parameters.resistance_configuration
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(self, parameters: TemperatureRtdMeasurementChannelParameters):
         """Configures the specific channels used for temperature measurements using RTD.
 
@@ -132,6 +144,11 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
         Similarly, if the user provides Physical channel name in Initialize(),
         then he/she has to provide the Physical channel name in Specific channel parameters.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         if parameters.channel_name in (channel.name for channel in self.task.ai_channels):
             # if the specified channel is present in ai_channel_collection,
             # updates the voltage parameters of the channel
@@ -197,3 +214,7 @@ class TemperatureMeasurementUsingRtd(TemperatureMeasurement):
                     current_excit_val=parameters.current_excitation_value_amperes,
                     r_0=parameters.sensor_resistance_ohms,
                 )
+
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
@@ -38,6 +38,8 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
         if self.is_task_initialized:
             return
 
+        self.invalidate_task_properties()
+
         # If the input channel_expression contains global channel, then add them as global channels
         # and verify if the global channels are configured for current measurement.
         if self.contains_only_global_virtual_channels(channel_expression=channel_expression):
@@ -89,6 +91,7 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
+            self.disarm()
             self.configure_all_channels(configuration.global_channel_parameters)
             for specific_channel_parameters in configuration.specific_channels_parameters:
                 self.configure_specific_channel(specific_channel_parameters)
@@ -99,6 +102,7 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(data)
 
@@ -112,6 +116,10 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
             An instance of `TemperatureThermistorRangeAndTerminalParameters`
             used to configure the channels.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         for channel in self.task.ai_channels:
             channel.ai_min = parameters.temperature_minimum_value_celsius_degrees
             channel.ai_max = parameters.temperature_maximum_value_celsius_degrees
@@ -125,6 +133,10 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
             channel.ai_thrmstr_b = stainhart_hart_coefficients.coefficient_steinhart_hart_b
             channel.ai_thrmstr_c = stainhart_hart_coefficients.coefficient_steinhart_hart_c
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(
         self, parameters: TemperatureThermistorChannelRangeAndTerminalParameters
     ):
@@ -141,6 +153,11 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
         Similarly, if the user provides Physical channel name in Initialize(),
         then he/she has to provide the Physical channel name in Specific channel parameters.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         stainhart_hart_coefficients = self._compute_steinhart_hart_coefficients_from_parameters(
             parameters.channel_parameters
         )
@@ -210,6 +227,10 @@ class TemperatureMeasurementUsingThermistor(TemperatureMeasurement):
                 self.task.control(action=nidaqmx.constants.TaskMode.TASK_VERIFY)
                 channel.ai_term_cfg = parameters.channel_parameters.terminal_configuration
 
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
+
     def _compute_steinhart_hart_coefficients_from_parameters(
         self, parameters: TemperatureThermistorRangeAndTerminalParameters
     ) -> CoefficientsSteinhartHartParameters:
@@ -41,6 +41,8 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
         """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (119 > 100 characters) (auto-generated noqa)
         if self.is_task_initialized:
             return
+        self.invalidate_task_properties()
+
         # If the input channel_expression contains global channel, then add them as global channels
         # and verify if the global channels are configured for temperature measurement.
         if self.contains_only_global_virtual_channels(channel_expression=channel_expression):
@@ -87,6 +89,7 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
+            self.disarm()
             self.configure_all_channels(configuration.global_channel_parameters)
             for specific_channel_parameters in configuration.specific_channels_parameters:
                 self.configure_specific_channel(specific_channel_parameters)
@@ -97,6 +100,7 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(data)
 
@@ -112,6 +116,10 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
             An instance of `TemperatureThermocoupleMeasurementTerminalParameters`
             used to configure the channels.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         for channel in self.task.ai_channels:
             channel.ai_min = parameters.temperature_minimum_value_celsius_degrees
             channel.ai_max = parameters.temperature_maximum_value_celsius_degrees
@@ -120,6 +128,10 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
             if parameters.perform_auto_zero_mode is True:
                 channel.ai_auto_zero_mode = parameters.auto_zero_mode
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(
         self, parameters: TemperatureThermocoupleChannelRangeAndTerminalParameters
     ):
@@ -137,6 +149,11 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
         then he/she has to provide the Physical channel name in Specific channel parameters.
         """  # noqa: D202, D417, W505 - No blank lines allowed after function docstring (auto-generated noqa), Missing argument descriptions in the docstring (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         if parameters.channel_name in (channel.name for channel in self.task.ai_channels):
             # if the specified channel is present in ai_channel_collection,
             # updates the thermocouple parameters of the channel
@@ -189,3 +206,7 @@ class TemperatureMeasurementUsingThermocouple(TemperatureMeasurement):
                     cjc_channel=parameters.channel_parameters.cold_junction_compensation_channel_name,
                 )
                 self.task.control(action=nidaqmx.constants.TaskMode.TASK_VERIFY)
+
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
@@ -69,6 +69,10 @@ class ConstantsForTimeDomainMeasurement:
     """Default pulse processing low reference level that will be used to evaluate periodicity 
     of waveforms."""
 
+    DEFAULT_PULSE_PROCESSING_MINIMUM_AMPLITUDE_VOLTS = 0.0
+    """Default smallest amplitude, in volts, of waveforms evaluated as periodic,
+    by default the periodicity of waveforms does not depend on their amplitude."""
+
 
 DEFAULT_TIME_DOMAIN_RANGE_AND_TERMINAL_PARAMETERS = VoltageRangeAndTerminalParameters(
     terminal_configuration=ConstantsForVoltageMeasurement.DEFAULT_AI_TERMINAL_CONFIGURATION,
@@ -29,6 +29,7 @@ class TimeDomainMeasurementConfiguration(PCBATestToolkitData):
         measurement_options: MeasurementOptions,
         sample_clock_timing_parameters: SampleClockTimingParameters,
         digital_start_trigger_parameters: DigitalStartTriggerParameters,
+        periodicity_minimum_amplitude_volts: float = 0.0,
     ) -> None:
         """Initializes an instance of
         `TimeDomainMeasurementConfiguration` with specific values.
@@ -44,6 +45,9 @@ class TimeDomainMeasurementConfiguration(PCBATestToolkitData):
                 An instance of `SampleClockTimingParameters` that represents the settings of timing.
             digital_start_trigger_parameters (DigitalStartTriggerParameters):
                 An instance of `DigitalStartTriggerParameters` that represents the settings of triggers.
+            periodicity_minimum_amplitude_volts (float):
+                The smallest amplitude, in volts, of waveforms evaluated as periodic,
+                so that noisy DC voltages are not periodic, defaults to 0.0 (no minimum).
 
         Raises:
             TypeError:
@@ -55,6 +59,7 @@ class TimeDomainMeasurementConfiguration(PCBATestToolkitData):
                 `measurement_options` is None,
                 `sample_clock_timing_parameters` is None,
                 `digital_start_trigger_parameters` is None,
+                `periodicity_minimum_amplitude_volts` is less than zero.
         """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
         Guard.is_not_none(global_channel_parameters, nameof(global_channel_parameters))
         Guard.is_not_none(specific_channels_parameters, nameof(specific_channels_parameters))
@@ -67,12 +72,16 @@ class TimeDomainMeasurementConfiguration(PCBATestToolkitData):
         Guard.is_not_none(
             digital_start_trigger_parameters, nameof(digital_start_trigger_parameters)
         )
+        Guard.is_greater_than_or_equal_to_zero(
+            periodicity_minimum_amplitude_volts, nameof(periodicity_minimum_amplitude_volts)
+        )
 
         self._global_channel_parameters = global_channel_parameters
         self._specific_channels_parameters = specific_channels_parameters
         self._measurement_options = measurement_options
         self._sample_clock_timing_parameters = sample_clock_timing_parameters
         self._digital_start_trigger_parameters = digital_start_trigger_parameters
+        self._periodicity_minimum_amplitude_volts = periodicity_minimum_amplitude_volts
 
     @property
     def global_channel_parameters(
@@ -121,6 +130,14 @@ class TimeDomainMeasurementConfiguration(PCBATestToolkitData):
         """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (299 > 100 characters) (auto-generated noqa)
         return self._digital_start_trigger_parameters
 
+    @property
+    def periodicity_minimum_amplitude_volts(self) -> float:
+        """
+        :class:`float`:
+            Gets the smallest amplitude, in volts, of waveforms evaluated as periodic.
+        """  # noqa: D205, D212, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        return self._periodicity_minimum_amplitude_volts
+
 
 class TimeDomainMeasurementResultData(PCBATestToolkitData):
     """Defines voltage Time domain measurement results obtained after waveform analysis."""
@@ -134,6 +151,7 @@ class TimeDomainMeasurementResultData(PCBATestToolkitData):
         voltage_waveforms_frequencies_hertz: List[float],
         voltage_waveforms_periods_seconds: List[float],
         voltage_waveforms_duty_cycles_percent: List[float],
+        voltage_waveforms_are_periodic: List[bool] = None,
     ) -> None:
         """Initializes an instance of
         `TimeDomainMeasurementResultData` with specific values.
@@ -153,6 +171,10 @@ class TimeDomainMeasurementResultData(PCBATestToolkitData):
                 The list of voltage waveforms periods computed for all configured channels, expressed in seconds.
             voltage_waveforms_duty_cycles_percent (List[float]):
                 The list of voltage waveforms duty cycles computed for all configured channels, expressed in %.
+            voltage_waveforms_are_periodic (List[bool], optional):
+                The list of flags telling, for each waveform, whether it is periodic.
+                Frequencies, periods and duty cycles are only computed for periodic waveforms.
+                Defaults to None.
 
         Raises:
             TypeError:
@@ -161,9 +183,11 @@ class TimeDomainMeasurementResultData(PCBATestToolkitData):
                 `vpp_amplitudes_volts` contains objects that are not `float`,
                 `voltage_waveforms_frequencies_hertz` contains objects that are not `float`,
                 `voltage_waveforms_periods_seconds` contains objects that are not `float`,
-                `voltage_waveforms_duty_cycles_percent` contains objects that are not `float`.
+                `voltage_waveforms_duty_cycles_percent` contains objects that are not `float`,
+                `voltage_waveforms_are_periodic` contains objects that are not `bool`.
             ValueError:
-                Raised when `waveforms` is None or empty.
+                Raised when `waveforms` is None or empty,
+                or when `voltage_waveforms_are_periodic` size is not the number of waveforms.
         """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (120 > 100 characters) (auto-generated noqa)
         Guard.is_not_none(waveforms, nameof(waveforms))
         Guard.is_not_empty(waveforms, nameof(waveforms))
@@ -194,6 +218,16 @@ class TimeDomainMeasurementResultData(PCBATestToolkitData):
         Guard.all_elements_are_of_same_type(
             input_list=voltage_waveforms_duty_cycles_percent, expected_type=float
         )
+        if voltage_waveforms_are_periodic is not None:
+            Guard.all_elements_are_of_same_type(
+                input_list=voltage_waveforms_are_periodic, expected_type=bool
+            )
+            Guard.have_same_size(
+                first_iterable_instance=waveforms,
+                first_iterable_name=nameof(waveforms),
+                second_iterable_instance=voltage_waveforms_are_periodic,
+                second_iterable_name=nameof(voltage_waveforms_are_periodic),
+            )
 
         self._waveforms = waveforms
         self._acquisition_duration_seconds = acquisition_duration_seconds
@@ -202,6 +236,7 @@ class TimeDomainMeasurementResultData(PCBATestToolkitData):
         self._voltage_waveforms_frequencies_hertz = voltage_waveforms_frequencies_hertz
         self._voltage_waveforms_periods_seconds = voltage_waveforms_periods_seconds
         self._voltage_waveforms_duty_cycles_percent = voltage_waveforms_duty_cycles_percent
+        self._voltage_waveforms_are_periodic = voltage_waveforms_are_periodic
 
     @property
     def waveforms(self) -> List[AnalogWaveform]:
@@ -259,3 +294,11 @@ class TimeDomainMeasurementResultData(PCBATestToolkitData):
             Gets the list of voltage waveforms duty cycles computed for all configured channels, expressed in %.
         """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (112 > 100 characters) (auto-generated noqa)
         return self._voltage_waveforms_duty_cycles_percent
+
+    @property
+    def voltage_waveforms_are_periodic(self) -> List[bool]:
+        """
+        :class:`List[bool]`:
+            Gets the list of flags telling, for each waveform, whether it is periodic, None if not computed.
+        """  # noqa: D205, D212, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring summary should start at the first line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (108 > 100 characters) (auto-generated noqa)
+        return self._voltage_waveforms_are_periodic
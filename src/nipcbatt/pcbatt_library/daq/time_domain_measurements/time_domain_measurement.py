@@ -1,12 +1,11 @@
 """ Defines class used for Time domain measurement on PCB points."""
 
 import nidaqmx.constants
-import nidaqmx.stream_readers
 import numpy
 from varname import nameof
 
-from nipcbatt.pcbatt_analysis.analysis_library_exceptions import PCBATTAnalysisException
 from nipcbatt.pcbatt_analysis.waveform_analysis.amplitude_and_levels_analysis import (
+    AmplitudeAndLevelsMultipleWaveformsProcessingResult,
     LabViewAmplitudeAndLevels,
 )
 from nipcbatt.pcbatt_analysis.waveform_analysis.dc_rms_analysis import LabViewBasicDcRms
@@ -21,6 +20,7 @@ from nipcbatt.pcbatt_library.common.common_data_types import (
     MeasurementAnalysisRequirement,
     MeasurementData,
     MeasurementExecutionType,
+    RawMeasurementData,
     SampleClockTimingParameters,
     SampleTimingEngine,
     StartTriggerType,
@@ -61,6 +61,7 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
         if self.is_task_initialized:
             return
 
+        self.invalidate_task_properties()
         if self.contains_only_global_virtual_channels(
             channel_expression=analog_input_channel_expression
         ):
@@ -105,6 +106,7 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.CONFIGURE_ONLY,
         ):
+            self.disarm()
             self.configure_all_channels(configuration.global_channel_parameters)
             for specific_channel_parameters in configuration.specific_channels_parameters:
                 self.configure_specific_channel(specific_channel_parameters)
@@ -115,12 +117,15 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             MeasurementExecutionType.CONFIGURE_AND_MEASURE,
             MeasurementExecutionType.MEASURE_ONLY,
         ):
+            self.arm()
             data = self.acquire_data_for_measurement_analysis()
             return self.analyze_measurement_data(
-                data, configuration.measurement_options.measurement_analysis_requirement
+                data,
+                configuration.measurement_options.measurement_analysis_requirement,
+                configuration.periodicity_minimum_amplitude_volts,
             )
 
-        self.task.start()
+        self.arm()
         return None
 
     def configure_all_channels(self, parameters: VoltageRangeAndTerminalParameters):
@@ -130,6 +135,10 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             parameters (VoltageRangeAndTerminalParameters):
             An instance of `VoltageRangeAndTerminalParameters` used to configure the channels.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        if self.is_configuration_unchanged("all_channels", parameters):
+            return
+
+        self.invalidate_task_properties()
         # for each channel defined in analog input channels list,
         # sets terminal configuration and voltage range.
         for channel in self.task.ai_channels:
@@ -137,6 +146,10 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             channel.ai_min = parameters.range_min_volts
             channel.ai_max = parameters.range_max_volts
 
+        # all channels settings override the settings of specific channels
+        self.invalidate_applied_configurations("specific_channel:")
+        self.save_applied_configuration("all_channels", parameters)
+
     def configure_specific_channel(
         self, parameters: VoltageMeasurementChannelAndTerminalRangeParameters
     ):
@@ -153,6 +166,11 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
         Similarly, if the user provides Physical channel name in Initialize(),
         then he/she has to provide the Physical channel name in Specific channel parameters.
         """  # noqa: D417 - Missing argument descriptions in the docstring (auto-generated noqa)
+        configuration_key = f"specific_channel:{parameters.channel_name}"
+        if self.is_configuration_unchanged(configuration_key, parameters):
+            return
+
+        self.invalidate_task_properties()
         if parameters.channel_name in (channel.name for channel in self.task.ai_channels):
             # if the specified channel is present in ai_channel_collection,
             # updates the voltage parameters of the channel
@@ -188,6 +206,10 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
                     units=ConstantsForVoltageMeasurement.INITIAL_AI_VOLTAGE_UNITS,
                 )
 
+        # specific channel settings override the settings of all channels
+        self.invalidate_applied_configurations("all_channels")
+        self.save_applied_configuration(configuration_key, parameters)
+
     def configure_timing(self, parameters: SampleClockTimingParameters) -> None:
         """Configures the timing characteristics used for time domain measurements.
 
@@ -195,6 +217,10 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             parameters:An instance of `SampleClockTimingParameters` used to configure the timing.
         """  # noqa: D202 - No blank lines allowed after function docstring (auto-generated noqa)
 
+        if self.is_configuration_unchanged("timing", parameters):
+            return
+
+        self.invalidate_task_properties()
         self.task.timing.cfg_samp_clk_timing(
             rate=parameters.sampling_rate_hertz,
             sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
@@ -212,6 +238,8 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
         else:
             self.task.timing.samp_timing_engine = parameters.sample_timing_engine.value
 
+        self.save_applied_configuration("timing", parameters)
+
     def configure_trigger(self, parameters: DigitalStartTriggerParameters) -> None:
         """Configures the characteristics of triggers used for time domain measurements.
 
@@ -221,6 +249,9 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
         configure the channels.
         """  # noqa: D202 - No blank lines allowed after function docstring (auto-generated noqa)
 
+        if self.is_configuration_unchanged("trigger", parameters):
+            return
+
         if parameters.trigger_select == StartTriggerType.NO_TRIGGER:
             self.task.triggers.start_trigger.disable_start_trig()
         else:
@@ -229,6 +260,8 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
                 trigger_edge=parameters.digital_start_trigger_edge,
             )
 
+        self.save_applied_configuration("trigger", parameters)
+
     def acquire_data_for_measurement_analysis(self) -> MeasurementData:
         """Acquires Data from DAQ channel for measurement of voltage.
 
@@ -236,29 +269,23 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             MeasurementData: An instance of `MeasurementData`
             that specifies the data acquired from DAQ channels.
         """
-        # Builds the shape of numpy array (number of channels, number of samples)
-        number_of_channels = len(self.task.in_stream.channels_to_read.channel_names)
-        number_of_samples_per_channel = self.task.timing.samp_quant_samp_per_chan
-
-        # Build the numpy array.
-        samples_array = numpy.zeros(
-            shape=(number_of_channels, number_of_samples_per_channel),
-            dtype=numpy.float64,
-        )
-
-        # Reads data and fill numpy array.
-        reader = nidaqmx.stream_readers.AnalogMultiChannelReader(self.task.in_stream)
-        reader.read_many_sample(
-            data=samples_array,
-            number_of_samples_per_channel=number_of_samples_per_channel,
-        )
+        # Raw samples are scaled to volts when analysis or the caller gets them in volts.
+        if self.raw_samples_enabled:
+            raw_samples, scaling_coefficients = self.read_analog_raw_samples()
+            return RawMeasurementData(
+                raw_samples=raw_samples,
+                scaling_coefficients=scaling_coefficients,
+                samples_dtype=self.samples_dtype,
+            )
 
-        return MeasurementData(samples_array)
+        # Reads samples of all channels, in the type of samples of the building block.
+        return MeasurementData(self.read_analog_samples())
 
     def analyze_measurement_data(
         self,
         measurement_data: MeasurementData,
         measurement_analysis_requirement: MeasurementAnalysisRequirement,
+        periodicity_minimum_amplitude_volts: float = ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_MINIMUM_AMPLITUDE_VOLTS,
     ) -> TimeDomainMeasurementResultData:
         """Proceeds to the analysis of Voltages from the measurement.
 
@@ -269,6 +296,9 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             measurement_analysis_requirement (MeasurementAnalysisRequirement):
                 An instance of 'MeasurementAnalysisRequirement' that specifies
                 whether to Skip Analysis or Proceed to Analysis.
+            periodicity_minimum_amplitude_volts (float):
+                The smallest amplitude, in volts, of waveforms evaluated as periodic,
+                defaults to 0.0 (no minimum).
 
         Returns:
             TimeDomainMeasurementResultData:
@@ -276,10 +306,11 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
                 that specifies the measurement results.
         """
         # Check if sampling rate is 0 and raise error to avoid divide by 0 error.
+        task_properties = self.task_properties
         Guard.is_greater_than_zero(
-            self.task.timing.samp_clk_rate, nameof(self.task.timing.samp_clk_rate)
+            task_properties.sampling_rate_hertz, nameof(task_properties.sampling_rate_hertz)
         )
-        delta_time_seconds = invert_value(self.task.timing.samp_clk_rate)
+        delta_time_seconds = invert_value(task_properties.sampling_rate_hertz)
 
         # Initialization for DcRmsVoltageMeasurementResultData instance creation.
         waveforms = []
@@ -289,10 +320,11 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
         voltage_waveforms_frequencies_hertz = []
         voltage_waveforms_periods_seconds = []
         voltage_waveforms_duty_cycles_percent = []
+        voltage_waveforms_are_periodic = None
 
         for channel_samples, channel_name in zip(
             measurement_data.samples_per_channel,
-            self.task.in_stream.channels_to_read.channel_names,
+            task_properties.channels_names,
         ):
             # Creates an instance of AnalogWaveform and add it to waveforms.
             waveforms.append(
@@ -303,63 +335,111 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
                 )
             )
 
-            if (
-                measurement_analysis_requirement
-                == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS
-            ):
-                acquisition_duration_seconds += delta_time_seconds * len(channel_samples)
+        if measurement_analysis_requirement == MeasurementAnalysisRequirement.PROCEED_TO_ANALYSIS:
+            # DC-RMS analysis of all channels
+            channels_samples_dc_rms = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+                waveforms_samples=measurement_data.data_samples,
+                waveforms_sampling_period_seconds=delta_time_seconds,
+                dc_rms_processing_window=ConstantsForTimeDomainMeasurement.DEFAULT_DC_RMS_PROCESSING_WINDOW,
+                workers_count=self.analysis_workers_count,
+            )
 
-                # DC-RMS analysis
-                current_channel_samples_dc_rms = LabViewBasicDcRms.process_single_waveform_dc_rms(
-                    waveform_samples=channel_samples,
-                    waveform_sampling_period_seconds=delta_time_seconds,
-                    dc_rms_processing_window=ConstantsForTimeDomainMeasurement.DEFAULT_DC_RMS_PROCESSING_WINDOW,
-                )
+            mean_dc_voltage_values_volts = channels_samples_dc_rms.dc_values.tolist()
 
-                mean_dc_voltage_values_volts.append(current_channel_samples_dc_rms.dc_value)
+            # Amplitude and levels analysis of all channels
+            channels_samples_amplitude_and_levels = LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels(
+                waveforms_samples=measurement_data.data_samples,
+                waveforms_sampling_period_seconds=delta_time_seconds,
+                amplitude_and_levels_processing_method=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_METHOD,
+                histogram_size=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_HISTOGRAM_SIZE,
+                workers_count=self.analysis_workers_count,
+            )
 
-                # Amplitude and levels analysis
-                current_channel_samples_amplitude_and_levels = LabViewAmplitudeAndLevels.process_single_waveform_amplitude_and_levels(
-                    waveform_samples=channel_samples,
-                    waveform_sampling_period_seconds=delta_time_seconds,
+            vpp_amplitudes_volts = channels_samples_amplitude_and_levels.amplitudes.tolist()
+
+            # Fast periodicity pre-check of all channels, pulse analysis is skipped on aperiodic channels
+            channels_are_periodic = LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity(
+                waveforms_samples=measurement_data.data_samples,
+                processing_polarity=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_POLARITY,
+                reference_levels_unit=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVELS_UNIT,
+                reference_levels=PulseAnalogProcessingReferenceLevels(
+                    reference_level_high=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_HIGH,
+                    reference_level_middle=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_MIDDLE,
+                    reference_level_low=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_LOW,
+                ),
+                percent_levels_settings=PulseAnalogMeasurementPercentLevelsSettings(
                     amplitude_and_levels_processing_method=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_METHOD,
                     histogram_size=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_HISTOGRAM_SIZE,
+                ),
+                waveforms_state_levels=channels_samples_amplitude_and_levels,
+                minimum_amplitude=periodicity_minimum_amplitude_volts,
+            )
+            # Periodic waveforms analysis (pulse + frequency + periods), shared by analysis workers,
+            # channels in which the pulse is not found are not periodic
+            periodic_channels_indexes = numpy.flatnonzero(channels_are_periodic)
+            channels_pulse_processing_results = [None] * len(channels_are_periodic)
+            if periodic_channels_indexes.size > 0:
+                periodic_channels_pulse_processing_results = LabViewPulseAnalogMeasurements.process_multiple_waveforms_block_pulse_measurements(
+                    waveforms_samples=measurement_data.data_samples[periodic_channels_indexes],
+                    waveforms_sampling_period_seconds=delta_time_seconds,
+                    waveforms_t0=[0.0] * periodic_channels_indexes.size,
+                    pulse_number=1,
+                    export_mode=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_EXPORT_MODE,
+                    processing_polarity=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_POLARITY,
+                    reference_levels_unit=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVELS_UNIT,
+                    reference_levels=PulseAnalogProcessingReferenceLevels(
+                        reference_level_high=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_HIGH,
+                        reference_level_middle=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_MIDDLE,
+                        reference_level_low=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_LOW,
+                    ),
+                    percent_levels_settings=PulseAnalogMeasurementPercentLevelsSettings(
+                        amplitude_and_levels_processing_method=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_METHOD,
+                        histogram_size=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_HISTOGRAM_SIZE,
+                    ),
+                    # states of the channels are already processed, they are not processed again
+                    waveforms_state_levels=AmplitudeAndLevelsMultipleWaveformsProcessingResult(
+                        amplitudes=channels_samples_amplitude_and_levels.amplitudes[
+                            periodic_channels_indexes
+                        ],
+                        high_state_levels=channels_samples_amplitude_and_levels.high_state_levels[
+                            periodic_channels_indexes
+                        ],
+                        low_state_levels=channels_samples_amplitude_and_levels.low_state_levels[
+                            periodic_channels_indexes
+                        ],
+                    ),
+                    workers_count=self.analysis_workers_count,
                 )
+                for channel_index, pulse_processing_result in zip(
+                    periodic_channels_indexes.tolist(),
+                    periodic_channels_pulse_processing_results.results_per_waveform(),
+                ):
+                    channels_pulse_processing_results[channel_index] = pulse_processing_result
+
+            voltage_waveforms_are_periodic = []
+            for channel_samples, pulse_processing_result in zip(
+                measurement_data.samples_per_channel,
+                channels_pulse_processing_results,
+            ):
+                acquisition_duration_seconds += delta_time_seconds * len(channel_samples)
+
+                if (
+                    pulse_processing_result is None
+                    or pulse_processing_result.waveform_periodicity_processing_result is None
+                ):
+                    voltage_waveforms_are_periodic.append(False)
+                    continue
 
-                vpp_amplitudes_volts.append(current_channel_samples_amplitude_and_levels.amplitude)
-
-                # Periodic waveform analysis (pulse + frequency + periods)
-                try:
-                    pulse_processing_result = LabViewPulseAnalogMeasurements.process_single_waveform_pulse_measurements(
-                        waveform_samples=channel_samples,
-                        waveform_sampling_period_seconds=delta_time_seconds,
-                        waveform_t0=0,
-                        pulse_number=1,
-                        processing_polarity=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_POLARITY,
-                        reference_levels_unit=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVELS_UNIT,
-                        reference_levels=PulseAnalogProcessingReferenceLevels(
-                            reference_level_high=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_HIGH,
-                            reference_level_middle=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_MIDDLE,
-                            reference_level_low=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_REFERENCE_LEVEL_LOW,
-                        ),
-                        export_mode=ConstantsForTimeDomainMeasurement.DEFAULT_PULSE_PROCESSING_EXPORT_MODE,
-                        percent_levels_settings=PulseAnalogMeasurementPercentLevelsSettings(
-                            amplitude_and_levels_processing_method=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_METHOD,
-                            histogram_size=ConstantsForTimeDomainMeasurement.DEFAULT_AMPLITUDE_AND_LEVELS_PROCESSING_HISTOGRAM_SIZE,
-                        ),
-                    )
-
-                    voltage_waveforms_frequencies_hertz.append(
-                        pulse_processing_result.waveform_periodicity_processing_result.frequency
-                    )
-                    voltage_waveforms_periods_seconds.append(
-                        pulse_processing_result.waveform_periodicity_processing_result.period
-                    )
-                    voltage_waveforms_duty_cycles_percent.append(
-                        pulse_processing_result.waveform_periodicity_processing_result.duty_cycle_percent
-                    )
-                except PCBATTAnalysisException:
-                    pass
+                voltage_waveforms_frequencies_hertz.append(
+                    pulse_processing_result.waveform_periodicity_processing_result.frequency
+                )
+                voltage_waveforms_periods_seconds.append(
+                    pulse_processing_result.waveform_periodicity_processing_result.period
+                )
+                voltage_waveforms_duty_cycles_percent.append(
+                    pulse_processing_result.waveform_periodicity_processing_result.duty_cycle_percent
+                )
+                voltage_waveforms_are_periodic.append(True)
 
         return TimeDomainMeasurementResultData(
             waveforms=waveforms,
@@ -369,4 +449,5 @@ class TimeDomainMeasurement(BuildingBlockUsingDAQmx):
             voltage_waveforms_frequencies_hertz=voltage_waveforms_frequencies_hertz,
             voltage_waveforms_periods_seconds=voltage_waveforms_periods_seconds,
             voltage_waveforms_duty_cycles_percent=voltage_waveforms_duty_cycles_percent,
+            voltage_waveforms_are_periodic=voltage_waveforms_are_periodic,
         )
@@ -0,0 +1,105 @@
+"""Defines the manager of buffers receiving samples acquired by DAQmx building blocks."""
+
+from typing import Union
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_utilities.guard_utilities import Guard
+
+# Largest number of buffers per acquired array, 2 for double buffering.
+ACQUISITION_BUFFERS_MAX_COUNT = 2
+
+
+class AcquisitionBuffersManager:
+    """Defines a manager of the buffers receiving samples acquired by a building block,
+    reused by successive acquisitions of samples of the same shape and type.
+
+    Each acquired array is identified by a name and held in `buffers_count` buffers used
+    in turn. With 0 buffers, the default, a new array is allocated by each acquisition.
+    With 1 buffer, the same array is filled by each acquisition, so that samples and results
+    of an acquisition are overwritten by the next one. With 2 buffers (double buffering),
+    samples and results of an acquisition stay valid while the next acquisition fills
+    the other buffer, they are overwritten by the acquisition after it.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def __init__(self, buffers_count: int = 0) -> None:
+        """Initializes an instance of `AcquisitionBuffersManager`.
+
+        Args:
+            buffers_count (int, optional): number of buffers used in turn for each acquired
+            array, 0 to allocate a new array for each acquisition. Defaults to 0.
+
+        Raises:
+            ValueError: raised when `buffers_count` is not within 0 and 2.
+        """
+        self._buffers: dict[str, list[numpy.ndarray]] = {}
+        self._next_buffers_indexes: dict[str, int] = {}
+        self._buffers_count = 0
+        self.buffers_count = buffers_count
+
+    @property
+    def buffers_count(self) -> int:
+        """Gets the number of buffers used in turn for each acquired array.
+
+        Returns:
+            int: 0 when a new array is allocated for each acquisition, 1 when the same buffer
+            is reused, 2 for double buffering.
+        """
+        return self._buffers_count
+
+    @buffers_count.setter
+    def buffers_count(self, val: int):
+        """Sets the number of buffers used in turn for each acquired array,
+        buffers held by the manager are released.
+
+        Args:
+            val (int): Specifies the number of buffers, 0 to allocate a new array
+            for each acquisition, 1 to reuse the same buffer, 2 for double buffering.
+
+        Raises:
+            ValueError: raised when the number of buffers is not within 0 and 2.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        Guard.is_int(val, nameof(val))
+        Guard.is_within_limits_included(val, 0, ACQUISITION_BUFFERS_MAX_COUNT, nameof(val))
+        self.release_buffers()
+        self._buffers_count = val
+
+    def get_buffer(
+        self, buffer_name: str, shape: Union[int, tuple[int, ...]], dtype: type
+    ) -> numpy.ndarray:
+        """Gets the next buffer used to acquire the array of the given name.
+
+        The buffer is reused when it has the requested shape and type, it is allocated,
+        filled with zeros, otherwise. Content of a reused buffer is the one of the acquisition
+        that last used it.
+
+        Args:
+            buffer_name (str): name of the acquired array, such as 'analog_samples'.
+            shape (int | tuple[int, ...]): shape of the acquired array.
+            dtype (type): type of the samples of the acquired array.
+
+        Returns:
+            numpy.ndarray: array of the requested shape and type.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        Guard.is_not_none_nor_empty_nor_whitespace(buffer_name, nameof(buffer_name))
+        if self._buffers_count == 0:
+            return numpy.zeros(shape=shape, dtype=dtype)
+
+        buffers = self._buffers.setdefault(buffer_name, [None] * self._buffers_count)
+        buffer_index = self._next_buffers_indexes.get(buffer_name, 0)
+        self._next_buffers_indexes[buffer_name] = (buffer_index + 1) % self._buffers_count
+
+        requested_shape = (shape,) if isinstance(shape, (int, numpy.integer)) else tuple(shape)
+        buffer = buffers[buffer_index]
+        if buffer is None or buffer.shape != requested_shape or buffer.dtype != numpy.dtype(dtype):
+            buffer = numpy.zeros(shape=requested_shape, dtype=dtype)
+            buffers[buffer_index] = buffer
+
+        return buffer
+
+    def release_buffers(self):
+        """Releases all buffers held by the manager,
+        arrays returned before remain valid."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        self._buffers.clear()
+        self._next_buffers_indexes.clear()
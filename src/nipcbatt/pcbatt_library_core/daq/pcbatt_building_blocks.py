@@ -4,16 +4,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from typing import Callable, Optional
 
 import nidaqmx
 import nidaqmx.constants
+import nidaqmx.stream_readers
 import nidaqmx.system
 import nidaqmx.system.storage.persisted_channel
 import nidaqmx.utils
 import pyvisa
 import niswitch
 import nidmm
+import numpy
+from varname import nameof
 
 from nipcbatt.pcbatt_communication_library.ni_845x_i2c_communication_devices import (
     Ni845xI2cDevicesHandler,
@@ -21,6 +25,7 @@ from nipcbatt.pcbatt_communication_library.ni_845x_i2c_communication_devices imp
 from nipcbatt.pcbatt_communication_library.ni_845x_spi_communication_devices import (
     Ni845xSpiDevicesHandler,
 )
+from nipcbatt.pcbatt_library_core.daq.acquisition_buffers import AcquisitionBuffersManager
 from nipcbatt.pcbatt_library_core.pcbatt_library_exceptions import (
     PCBATTLibraryChannelNotCompatibleWithGenerationException,
     PCBATTLibraryChannelNotCompatibleWithMeasurementException,
@@ -29,6 +34,18 @@ from nipcbatt.pcbatt_library_core.pcbatt_library_exceptions import (
 from nipcbatt.pcbatt_library_core.pcbatt_library_messages import (
     PCBATTLibraryExceptionMessages,
 )
+from nipcbatt.pcbatt_utilities.guard_utilities import Guard
+
+# Immutable snapshot of the timing and channels of a DAQmx task,
+# read by acquisition and analysis instead of querying the driver.
+DAQmxTaskPropertiesSnapshot = namedtuple(
+    typename="DAQmxTaskPropertiesSnapshot",
+    field_names=[
+        "sampling_rate_hertz",
+        "number_of_samples_per_channel",
+        "channels_names",
+    ],
+)
 
 
 class BuildingBlockUsingInstrument(ABC):
@@ -194,6 +211,388 @@ class BuildingBlockUsingDAQmx(BuildingBlockUsingInstrument):
         """
         return self._instrument
 
+    # Snapshot of task timing and channels, taken on first use after a configuration change.
+    _task_properties_snapshot: DAQmxTaskPropertiesSnapshot = None
+
+    @property
+    def task_properties(self) -> DAQmxTaskPropertiesSnapshot:
+        """Gets the snapshot of the timing and channels of the task, so that acquisition
+        and analysis do not query the driver for properties that did not change.
+        The snapshot is taken from the task on first use after `invalidate_task_properties`.
+
+        Returns:
+            DAQmxTaskPropertiesSnapshot: sampling rate, number of samples per channel
+            and names of the channels to read of the task.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        if self._task_properties_snapshot is None:
+            self._task_properties_snapshot = DAQmxTaskPropertiesSnapshot(
+                sampling_rate_hertz=self.task.timing.samp_clk_rate,
+                number_of_samples_per_channel=self.task.timing.samp_quant_samp_per_chan,
+                channels_names=tuple(self.task.in_stream.channels_to_read.channel_names),
+            )
+
+        return self._task_properties_snapshot
+
+    def invalidate_task_properties(self):
+        """Invalidates the snapshot of the timing and channels of the task,
+        called when the building block changes channels or timing of the task,
+        and to be called after changing them directly through `task`."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        self._task_properties_snapshot = None
+        self._raw_samples_scaling_coefficients = None
+        self._task_committed = False
+
+    # Configurations last applied to the task, by configuration key, created on first use.
+    _applied_configurations: dict = None
+
+    def is_configuration_unchanged(self, configuration_key: str, parameters: object) -> bool:
+        """Checks whether the parameters of a configuration are equal to the ones
+        last applied to the task, so that the configuration does not need to be applied again.
+
+        Args:
+            configuration_key (str): key of the configuration, such as 'timing'.
+            parameters (object): parameters of the configuration to apply.
+
+        Returns:
+            bool: True if the same parameters were last applied for `configuration_key`.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        if self._applied_configurations is None:
+            return False
+
+        applied_parameters = self._applied_configurations.get(configuration_key)
+        if applied_parameters is None:
+            return False
+        if applied_parameters is parameters:
+            return True
+
+        try:
+            return bool(applied_parameters == parameters)
+        except (TypeError, ValueError):
+            # parameters holding arrays cannot be compared, they are considered as changed
+            return False
+
+    def save_applied_configuration(self, configuration_key: str, parameters: object):
+        """Saves the parameters of a configuration applied to the task.
+
+        Args:
+            configuration_key (str): key of the configuration, such as 'timing'.
+            parameters (object): parameters of the applied configuration.
+        """
+        if self._applied_configurations is None:
+            self._applied_configurations = {}
+
+        self._applied_configurations[configuration_key] = parameters
+        self._task_committed = False
+
+    def invalidate_applied_configurations(self, configuration_key_prefix: str = ""):
+        """Invalidates the configurations saved as applied to the task, so that they are
+        applied again, to be called after changing the task directly through `task`.
+
+        Args:
+            configuration_key_prefix (str, optional): prefix of the keys of the configurations
+            to invalidate, all configurations are invalidated when empty. Defaults to "".
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        self._task_committed = False
+        if not self._applied_configurations:
+            return
+
+        for configuration_key in list(self._applied_configurations):
+            if configuration_key.startswith(configuration_key_prefix):
+                del self._applied_configurations[configuration_key]
+
+    # Whether the task is kept in the committed state between acquisitions, see `prepare`.
+    _task_kept_committed: bool = False
+    # Whether the task is in the committed state, reset when the task is configured.
+    _task_committed: bool = False
+    # Whether the task was started by `arm` and its acquisition was not read yet.
+    _task_armed: bool = False
+
+    @property
+    def is_task_prepared(self) -> bool:
+        """Gets whether the task is kept in the committed state between acquisitions.
+
+        Returns:
+            bool: True after `prepare` is called, until `unprepare` is called.
+        """
+        return self._task_kept_committed
+
+    def prepare(self):
+        """Verifies, reserves and commits the task, then keeps it in the committed state
+        between acquisitions, so that `arm` restarts the task from the committed state
+        instead of reserving and programming the hardware again for each acquisition.
+
+        The task is committed again by the next `arm` after a configuration change.
+        Resources of the task stay reserved until `unprepare` is called or the task is closed.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        self.task.stop()
+        self.task.control(action=nidaqmx.constants.TaskMode.TASK_COMMIT)
+        self._task_kept_committed = True
+        self._task_committed = True
+        self._task_armed = False
+
+    def unprepare(self):
+        """Stops the task, releases its reserved resources
+        and stops keeping it in the committed state between acquisitions."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        self.disarm()
+        self.task.control(action=nidaqmx.constants.TaskMode.TASK_UNRESERVE)
+        self._task_kept_committed = False
+        self._task_committed = False
+
+    def arm(self):
+        """Starts the task for a new acquisition, from the committed state when the task
+        is prepared, see `prepare`.
+
+        The task is not started again when it was armed and its acquisition was not read yet,
+        so that an acquisition armed by a configuration is the one read by the next measurement.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        if self._task_armed:
+            return
+
+        # stopping a task returns it to the state it had before it was started
+        self.task.stop()
+        if self._task_kept_committed and not self._task_committed:
+            self.task.control(action=nidaqmx.constants.TaskMode.TASK_COMMIT)
+            self._task_committed = True
+
+        self.task.start()
+        self._task_armed = True
+
+    def disarm(self):
+        """Stops the task, the task returns to the committed state when it is prepared."""
+        self.task.stop()
+        self._task_armed = False
+
+    # Number of threads used by measurements to analyze channels, 1 means serial analysis.
+    _analysis_workers_count: int = 1
+
+    @property
+    def analysis_workers_count(self) -> int:
+        """Gets the number of threads used by the building block to analyze acquired channels.
+
+        Returns:
+            int: The number of threads, 1 when channels are analyzed serially.
+        """
+        return self._analysis_workers_count
+
+    @analysis_workers_count.setter
+    def analysis_workers_count(self, val: int):
+        """Sets the number of threads used by the building block to analyze acquired channels.
+        Channels are shared by the threads, results are gathered in channels order
+        and are identical to the ones of serial analysis.
+
+        Args:
+            val (int): Specifies the number of threads, 1 to analyze channels serially.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        Guard.is_int(val, nameof(val))
+        Guard.is_greater_than_zero(val, nameof(val))
+        self._analysis_workers_count = val
+
+    # Manager of buffers receiving acquired samples, created on first use.
+    _acquisition_buffers: AcquisitionBuffersManager = None
+
+    @property
+    def acquisition_buffers(self) -> AcquisitionBuffersManager:
+        """Gets the manager of the buffers receiving samples acquired by the building block.
+        Set its `buffers_count` to reuse buffers from one acquisition to the next,
+        2 for double buffering.
+
+        Returns:
+            AcquisitionBuffersManager: The manager of the buffers of the building block.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        if self._acquisition_buffers is None:
+            self._acquisition_buffers = AcquisitionBuffersManager()
+
+        return self._acquisition_buffers
+
+    # Type of samples acquired by analog measurements, numpy.float32 or numpy.float64.
+    _samples_dtype: type = numpy.float64
+
+    # Number of samples per channel read at once when samples are not float64,
+    # bounds the size of the float64 buffer receiving samples read by DAQmx.
+    _SAMPLES_READ_CHUNK_SIZE: int = 65536
+
+    @property
+    def samples_dtype(self) -> type:
+        """Gets the type of samples acquired by the building block.
+
+        Returns:
+            type: numpy.float32 or numpy.float64.
+        """
+        return self._samples_dtype
+
+    @samples_dtype.setter
+    def samples_dtype(self, val: type):
+        """Sets the type of samples acquired by the building block.
+        float32 samples use half of the memory of float64 samples, which is enough
+        for the resolution of 16-bit and 24-bit ADCs, and are analyzed in float32.
+
+        Args:
+            val (type): Specifies the type of samples, numpy.float32 or numpy.float64.
+
+        Raises:
+            ValueError: raised when the type of samples is not supported.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        Guard.is_not_none(val, nameof(val))
+        if numpy.dtype(val) not in (numpy.float32, numpy.float64):
+            raise ValueError(
+                PCBATTLibraryExceptionMessages.SAMPLES_TYPE_NOT_SUPPORTED_ARGS_1.format(val)
+            )
+        self._samples_dtype = numpy.dtype(val).type
+
+    def read_analog_samples(self) -> numpy.ndarray:
+        """Reads the samples of all analog channels of the task, in the type of samples
+        of the building block, see `samples_dtype`.
+
+        DAQmx reads float64 samples, float32 samples are read by chunks into a float64 buffer
+        of bounded size, then converted, so that the whole acquisition is never held in float64.
+
+        Returns:
+            numpy.ndarray: 2-D array of samples, one row per channel.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        number_of_channels = len(self.task_properties.channels_names)
+        number_of_samples_per_channel = self.task_properties.number_of_samples_per_channel
+
+        samples = self.acquisition_buffers.get_buffer(
+            buffer_name="analog_samples",
+            shape=(number_of_channels, number_of_samples_per_channel),
+            dtype=self._samples_dtype,
+        )
+        reader = nidaqmx.stream_readers.AnalogMultiChannelReader(self.task.in_stream)
+
+        try:
+            if samples.dtype == numpy.float64:
+                reader.read_many_sample(
+                    data=samples,
+                    number_of_samples_per_channel=number_of_samples_per_channel,
+                )
+                return samples
+
+            chunk_size = min(number_of_samples_per_channel, self._SAMPLES_READ_CHUNK_SIZE)
+            chunk_buffer = numpy.zeros(number_of_channels * chunk_size, dtype=numpy.float64)
+            for chunk_start in range(0, number_of_samples_per_channel, chunk_size):
+                chunk_length = min(chunk_size, number_of_samples_per_channel - chunk_start)
+                # flat buffer is reshaped so that the last, shorter, chunk is contiguous too
+                chunk_samples = chunk_buffer[: number_of_channels * chunk_length].reshape(
+                    number_of_channels, chunk_length
+                )
+                reader.read_many_sample(
+                    data=chunk_samples,
+                    number_of_samples_per_channel=chunk_length,
+                )
+                samples[:, chunk_start : chunk_start + chunk_length] = chunk_samples
+
+            return samples
+        finally:
+            # acquisition of the armed task is read or failed, next `arm` starts a new acquisition
+            self._task_armed = False
+
+    # Whether analog measurements acquire raw ADC codes, scaled to volts only when needed.
+    _raw_samples_enabled: bool = False
+
+    @property
+    def raw_samples_enabled(self) -> bool:
+        """Gets whether the building block acquires raw, unscaled, samples of its channels.
+
+        Returns:
+            bool: True when raw int16 samples are acquired.
+        """
+        return self._raw_samples_enabled
+
+    @raw_samples_enabled.setter
+    def raw_samples_enabled(self, val: bool):
+        """Sets whether the building block acquires raw, unscaled, samples of its channels.
+        Raw samples are the int16 codes of the ADC, they use a quarter of the memory
+        of float64 samples and are scaled to volts only when volts are needed,
+        see `read_analog_raw_samples`.
+
+        Args:
+            val (bool): Specifies whether raw int16 samples are acquired.
+        """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+        Guard.is_not_none(val, nameof(val))
+        self._raw_samples_enabled = bool(val)
+
+    # Coefficients scaling raw samples of the channels to volts, read with the task properties.
+    _raw_samples_scaling_coefficients: numpy.ndarray = None
+
+    @property
+    def raw_samples_scaling_coefficients(self) -> numpy.ndarray:
+        """Gets the coefficients scaling raw samples of the analog channels of the task to volts.
+        Channels are checked and coefficients are read from the task on first use after
+        `invalidate_task_properties`, as for `task_properties`.
+
+        Coefficients of a channel are the coefficients of the polynomial used by DAQmx to scale
+        raw samples of the device to volts, in increasing powers order,
+        `volts = c[0] + c[1] * raw + c[2] * raw^2 + ...`.
+
+        Raises:
+            PCBATTLibraryException:
+                raised when a channel is not a voltage channel or when its raw samples
+                do not fit in 16 bits.
+
+        Returns:
+            numpy.ndarray: 2-D array of float64 scaling coefficients, one row per channel.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        if self._raw_samples_scaling_coefficients is None:
+            channels = list(self.task.in_stream.channels_to_read)
+            for channel in channels:
+                if (
+                    channel.ai_meas_type != nidaqmx.constants.UsageTypeAI.VOLTAGE
+                    or channel.ai_raw_samp_size > 16
+                ):
+                    raise PCBATTLibraryException(
+                        PCBATTLibraryExceptionMessages.RAW_SAMPLES_NOT_SUPPORTED_ARGS_1.format(
+                            channel.name
+                        )
+                    )
+
+            # devices may use polynomials of different orders, missing coefficients are zeros
+            channels_coefficients = [channel.ai_dev_scaling_coeff for channel in channels]
+            scaling_coefficients = numpy.zeros(
+                shape=(
+                    len(channels),
+                    max(len(coefficients) for coefficients in channels_coefficients),
+                ),
+                dtype=numpy.float64,
+            )
+            for channel_index, coefficients in enumerate(channels_coefficients):
+                scaling_coefficients[channel_index, : len(coefficients)] = coefficients
+
+            self._raw_samples_scaling_coefficients = scaling_coefficients
+
+        return self._raw_samples_scaling_coefficients
+
+    def read_analog_raw_samples(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Reads the raw, unscaled, int16 samples of all analog channels of the task
+        and gets the coefficients scaling them to volts, see `raw_samples_scaling_coefficients`.
+
+        Raises:
+            PCBATTLibraryException:
+                raised when a channel is not a voltage channel or when its raw samples
+                do not fit in 16 bits.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: 2-D array of int16 samples, one row per channel,
+            and 2-D array of float64 scaling coefficients, one row per channel.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        scaling_coefficients = self.raw_samples_scaling_coefficients
+
+        number_of_samples_per_channel = self.task_properties.number_of_samples_per_channel
+        raw_samples = self.acquisition_buffers.get_buffer(
+            buffer_name="analog_raw_samples",
+            shape=(len(self.task_properties.channels_names), number_of_samples_per_channel),
+            dtype=numpy.int16,
+        )
+        reader = nidaqmx.stream_readers.AnalogUnscaledReader(self.task.in_stream)
+        try:
+            reader.read_int16(
+                data=raw_samples,
+                number_of_samples_per_channel=number_of_samples_per_channel,
+            )
+        finally:
+            # acquisition of the armed task is read or failed, next `arm` starts a new acquisition
+            self._task_armed = False
+
+        return (raw_samples, scaling_coefficients)
+
     def contains_only_global_virtual_channels(self, channel_expression: str) -> bool:
         """Check whether the channel expression contains
            only global virtual channels defined in NI MAX.
@@ -265,6 +664,7 @@ class BuildingBlockUsingDAQmx(BuildingBlockUsingInstrument):
                 for global_channel_name in global_channels_names
             ]
         )
+        self.invalidate_task_properties()
 
 
 class BuildingBlockUsingNi845xI2cDevice(BuildingBlockUsingInstrument):
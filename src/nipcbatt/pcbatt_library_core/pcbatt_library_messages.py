@@ -24,6 +24,15 @@ class PCBATTLibraryExceptionMessages:
 
     INVALID_NUMPY_ARRAY_TYPE_ARGS_1 = "The type of the numpy array is not of {}."
 
+    SAMPLES_TYPE_NOT_SUPPORTED_ARGS_1 = (
+        "The type of samples {} is not supported, use numpy.float32 or numpy.float64."
+    )
+
+    RAW_SAMPLES_NOT_SUPPORTED_ARGS_1 = (
+        "Raw samples cannot be acquired from channel {}, "
+        + "only voltage channels with raw samples of 16 bits or less are supported."
+    )
+
     GLOBAL_CHANNEL_PORT_NOT_SUPPORTED_ARGS_3 = (
         "Global Channel Port is not supported. {} represents a port with a width of {}. "
         + "Specify a range of digital lines, such as '{}/line0:31' as the global channel"
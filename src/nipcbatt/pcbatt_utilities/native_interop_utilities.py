@@ -1,11 +1,10 @@
 """Provides a set of utilities functions related to native functions."""
 
-from ctypes import CDLL, WinDLL, c_int, cdll, windll
+from ctypes import CDLL, c_int, cdll
 from typing import List, Type
 
 from _ctypes import (
     FUNCFLAG_CDECL as _FUNCFLAG_CDECL,
-    FUNCFLAG_STDCALL as _FUNCFLAG_STDCALL,
     FUNCFLAG_USE_ERRNO as _FUNCFLAG_USE_ERRNO,
     CFuncPtr as _CFunctPtr,
 )
@@ -15,8 +14,22 @@ from nipcbatt.pcbatt_utilities import os_utilities
 from nipcbatt.pcbatt_utilities.file_utilities import file_exists
 from nipcbatt.pcbatt_utilities.guard_utilities import Guard
 
+try:
+    from ctypes import WinDLL, windll
+
+    from _ctypes import FUNCFLAG_STDCALL as _FUNCFLAG_STDCALL
+except ImportError:
+    # standard calling convention only exists on Windows,
+    # cdecl libraries can still be loaded on other platforms.
+    WinDLL = CDLL
+    windll = None
+    _FUNCFLAG_STDCALL = _FUNCFLAG_CDECL
+
 FUNCTION_CALL_FAILED_ARGS_2 = "Call of function '{}' failed ({})"
 FILE_NOT_FOUND_ARGS_1 = "file '{}' not found"
+STDCALL_NOT_SUPPORTED_ARGS_1 = (
+    "dll '{}' uses standard calling convention, only available on Windows"
+)
 
 
 class _StdCallFuncPtr(_CFunctPtr):
@@ -43,10 +56,13 @@ def load_stcall_win_dll(dll_path: str) -> WinDLL:
         FileNotFoundError:
             Raised when an error occured while loading the dll.
         OSError:
-            Raised when dll has invalid format.
+            Raised when dll has invalid format, or when the platform is not Windows.
     """
     Guard.is_not_none_nor_empty_nor_whitespace(dll_path, nameof(dll_path))
 
+    if windll is None:
+        raise OSError(STDCALL_NOT_SUPPORTED_ARGS_1.format(dll_path))
+
     return windll.LoadLibrary(dll_path)
 
 
@@ -0,0 +1,221 @@
+"""Defines unit tests related to nipcbatt.pcbatt_analysis.analysis_library_interop module."""
+
+import logging
+import platform
+import sys
+import threading
+import unittest
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_analysis import analysis_library_interop
+from nipcbatt.pcbatt_analysis.waveform_analysis.dc_rms_analysis import (
+    DcRmsProcessingBackend,
+    DcRmsProcessingWindow,
+    LabViewBasicDcRms,
+)
+
+
+class TestAnalysisLibraryInterop(unittest.TestCase):
+    """Defines a test fixture that checks functions of module
+    `pcbatt_analysis.analysis_library_interop`.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def setUp(self):
+        analysis_library_interop.reset_interop_api_functions_binding_statistics()
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_load_interop_api_library_entries_returns_same_object(self):
+        """Test of pcbatt_analysis.analysis_library_interop.load_interop_api_library_entries"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (105 > 100 characters) (auto-generated noqa)
+        # Act
+        dll_entries_1 = analysis_library_interop.load_interop_api_library_entries()
+        dll_entries_2 = analysis_library_interop.load_interop_api_library_entries()
+
+        # Assert
+        self.assertIs(dll_entries_1, dll_entries_2)
+
+    def test_native_function_is_bound_once_for_many_calls(self):
+        """Test of pcbatt_analysis.analysis_library_interop.get_interop_api_function
+        when the same analysis is called several times"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        calls_count = 20
+        samples = numpy.array(range(1, 11), dtype=numpy.float64)
+
+        # Bind DC-RMS function before counting
+        LabViewBasicDcRms.process_single_waveform_dc_rms(
+            waveform_samples=samples,
+            waveform_sampling_period_seconds=1.0,
+            dc_rms_processing_window=DcRmsProcessingWindow.RECTANGULAR,
+        )
+        analysis_library_interop.reset_interop_api_functions_binding_statistics()
+
+        # Act
+        for _ in range(calls_count):
+            LabViewBasicDcRms.process_single_waveform_dc_rms(
+                waveform_samples=samples,
+                waveform_sampling_period_seconds=1.0,
+                dc_rms_processing_window=DcRmsProcessingWindow.RECTANGULAR,
+            )
+
+        statistics = analysis_library_interop.get_interop_api_functions_binding_statistics()
+
+        logging.debug("%s = %s", nameof(statistics), repr(statistics))
+
+        # Assert
+        self.assertEqual(0, statistics.binds_count)
+        self.assertEqual(calls_count, statistics.calls_count)
+        self.assertGreaterEqual(statistics.bound_functions_count, 1)
+
+    def test_native_function_calls_are_counted_by_concurrent_workers(self):
+        """Test of pcbatt_analysis.analysis_library_interop.get_interop_api_functions_binding_statistics
+        when analysis of a block of waveforms is shared by several workers"""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (104 > 100 characters) (auto-generated noqa)
+        # Arrange
+        waveforms_samples = numpy.tile(numpy.array(range(1, 1001), dtype=numpy.float64), (64, 1))
+
+        LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1.0,
+            dc_rms_processing_window=DcRmsProcessingWindow.RECTANGULAR,
+            dc_rms_processing_backend=DcRmsProcessingBackend.LABVIEW,
+        )
+        serial_calls_count = (
+            analysis_library_interop.get_interop_api_functions_binding_statistics().calls_count
+        )
+        analysis_library_interop.reset_interop_api_functions_binding_statistics()
+
+        # Act
+        LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1.0,
+            dc_rms_processing_window=DcRmsProcessingWindow.RECTANGULAR,
+            dc_rms_processing_backend=DcRmsProcessingBackend.LABVIEW,
+            workers_count=8,
+        )
+
+        statistics = analysis_library_interop.get_interop_api_functions_binding_statistics()
+
+        # Assert
+        self.assertGreaterEqual(serial_calls_count, 64)
+        self.assertEqual(serial_calls_count, statistics.calls_count)
+
+    def test_bound_function_calls_are_counted_by_concurrent_threads(self):
+        """Test of pcbatt_analysis.analysis_library_interop._InteropApiBoundFunction
+        when it is called by several threads and its calls count is read several times"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        threads_count = 8
+        calls_count_per_thread = 1000
+        bound_function = analysis_library_interop._InteropApiBoundFunction(lambda value: value)
+
+        def call_bound_function():
+            for call_index in range(calls_count_per_thread):
+                bound_function(call_index)
+
+        threads = [threading.Thread(target=call_bound_function) for _ in range(threads_count)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(threads_count * calls_count_per_thread, bound_function.calls_count)
+        self.assertEqual(threads_count * calls_count_per_thread, bound_function.calls_count)
+
+        bound_function(0)
+
+        self.assertEqual(threads_count * calls_count_per_thread + 1, bound_function.calls_count)
+
+        bound_function.reset_calls_count()
+
+        self.assertEqual(0, bound_function.calls_count)
+
+    def test_output_buffer_is_reused_by_calls_of_same_thread(self):
+        """Test of pcbatt_analysis.analysis_library_interop.get_interop_api_output_buffer
+        when the same output is requested several times by one or several threads"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        analysis_library_interop.release_interop_api_output_buffers()
+        other_thread_buffers = []
+
+        # Act
+        output_buffer_1 = analysis_library_interop.get_interop_api_output_buffer(
+            "function", "output", 100
+        )
+        output_buffer_2 = analysis_library_interop.get_interop_api_output_buffer(
+            "function", "output", 100
+        )
+        other_length_buffer = analysis_library_interop.get_interop_api_output_buffer(
+            "function", "output", 50
+        )
+        other_output_buffer = analysis_library_interop.get_interop_api_output_buffer(
+            "function", "other_output", 100
+        )
+        other_thread = threading.Thread(
+            target=lambda: other_thread_buffers.append(
+                analysis_library_interop.get_interop_api_output_buffer("function", "output", 100)
+            )
+        )
+        other_thread.start()
+        other_thread.join()
+
+        # Assert
+        self.assertIs(output_buffer_1, output_buffer_2)
+        self.assertEqual((100,), output_buffer_1.shape)
+        self.assertEqual(numpy.float64, output_buffer_1.dtype)
+        self.assertTrue(output_buffer_1.flags.c_contiguous)
+        self.assertEqual((50,), other_length_buffer.shape)
+        self.assertIsNot(output_buffer_1, other_output_buffer)
+        self.assertIsNot(output_buffer_1, other_thread_buffers[0])
+
+    def test_output_buffers_count_is_bounded(self):
+        """Test of pcbatt_analysis.analysis_library_interop.get_interop_api_output_buffer
+        when more buffers than the maximum count are requested by a thread"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        analysis_library_interop.release_interop_api_output_buffers()
+        first_buffer = analysis_library_interop.get_interop_api_output_buffer(
+            "function", "output", 1
+        )
+
+        # Act
+        for length in range(2, analysis_library_interop.INTEROP_API_OUTPUT_BUFFERS_MAX_COUNT + 2):
+            analysis_library_interop.get_interop_api_output_buffer("function", "output", length)
+        last_buffer = analysis_library_interop.get_interop_api_output_buffer(
+            "function", "output", analysis_library_interop.INTEROP_API_OUTPUT_BUFFERS_MAX_COUNT + 1
+        )
+
+        # Assert
+        self.assertIsNot(
+            first_buffer,
+            analysis_library_interop.get_interop_api_output_buffer("function", "output", 1),
+        )
+        self.assertIs(
+            last_buffer,
+            analysis_library_interop.get_interop_api_output_buffer(
+                "function",
+                "output",
+                analysis_library_interop.INTEROP_API_OUTPUT_BUFFERS_MAX_COUNT + 1,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from varname import nameof
 
 from nipcbatt.pcbatt_analysis import analysis_library_info
 from nipcbatt.pcbatt_analysis.waveform_analysis.amplitude_and_levels_analysis import (
+    AmplitudeAndLevelsProcessingBackend,
     AmplitudeAndLevelsProcessingMethod,
     AmplitudeAndLevelsProcessingResult,
     LabViewAmplitudeAndLevels,
@@ -346,6 +347,204 @@ class TestLabViewAmplitudeAndLevels(unittest.TestCase):
             amplitude_and_levels_result.low_state_level,
         )
 
+    def test_process_multiple_waveforms_block_amplitude_and_levels(self):
+        """Test of pcbatt_analysis.amplitude_and_levels.LabViewAmplitudeAndLevels
+        process_multiple_waveforms_block_amplitude_and_levels method using peak analysis strategy.
+        """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (101 > 100 characters) (auto-generated noqa)
+        # Arrange
+        t = numpy.linspace(0, 1, 500, endpoint=False)
+        y = signal.sawtooth(2 * numpy.pi * 5 * t, 0.5)
+        waveforms_samples = numpy.stack([y, 2 * y, 0.5 * y + 1])
+
+        # Act
+        amplitude_and_levels_results = (
+            LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=1,
+                amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.PEAK,
+                histogram_size=1024,
+            )
+        )
+
+        logging.debug(
+            "%s = %s",
+            nameof(amplitude_and_levels_results),
+            repr(amplitude_and_levels_results),
+        )
+
+        # Assert
+        numpy.testing.assert_allclose([2, 4, 1], amplitude_and_levels_results.amplitudes)
+        numpy.testing.assert_allclose([1, 2, 1.5], amplitude_and_levels_results.high_state_levels)
+        numpy.testing.assert_allclose([-1, -2, 0.5], amplitude_and_levels_results.low_state_levels)
+
+
+class TestNumpyAmplitudeAndLevels(unittest.TestCase):
+    """Provides unit tests of `LabViewAmplitudeAndLevels` class
+    using numpy processing backend.
+
+    Args:
+        unittest (TestCase): test cases fixture.
+    """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        LabViewAmplitudeAndLevels.set_default_processing_backend(
+            AmplitudeAndLevelsProcessingBackend.LABVIEW
+        )
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_process_single_waveform_amplitude_and_levels_histogram_method(self):
+        """Test of `LabViewAmplitudeAndLevels.process_single_waveform_amplitude_and_levels`
+        using numpy backend and histogram method with a noisy square waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        t = numpy.linspace(0, 1, 5000, endpoint=False)
+        y = 2 * signal.square(2 * numpy.pi * 5 * t) + 0.5
+        # overshoots do not alter states found with histogram method
+        y[::250] += 0.4
+        y += numpy.random.default_rng(seed=1).normal(scale=0.001, size=y.size)
+
+        # Act
+        amplitude_and_levels_result = (
+            LabViewAmplitudeAndLevels.process_single_waveform_amplitude_and_levels(
+                waveform_samples=y,
+                waveform_sampling_period_seconds=0.0002,
+                amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.HISTOGRAM,
+                histogram_size=256,
+                amplitude_and_levels_processing_backend=AmplitudeAndLevelsProcessingBackend.NUMPY,
+            )
+        )
+
+        logging.debug(
+            "%s = %s", nameof(amplitude_and_levels_result), repr(amplitude_and_levels_result)
+        )
+
+        # Assert
+        self.assertAlmostEqual(4, amplitude_and_levels_result.amplitude, delta=0.01)
+        self.assertAlmostEqual(2.5, amplitude_and_levels_result.high_state_level, delta=0.01)
+        self.assertAlmostEqual(-1.5, amplitude_and_levels_result.low_state_level, delta=0.01)
+
+    def test_process_single_waveform_amplitude_and_levels_peak_method(self):
+        """Test of `LabViewAmplitudeAndLevels.process_single_waveform_amplitude_and_levels`
+        using numpy backend and peak method."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        t = numpy.linspace(0, 1, 500, endpoint=False)
+        y = signal.sawtooth(2 * numpy.pi * 5 * t, 0.5)
+        LabViewAmplitudeAndLevels.set_default_processing_backend(
+            AmplitudeAndLevelsProcessingBackend.NUMPY
+        )
+
+        # Act
+        amplitude_and_levels_result = (
+            LabViewAmplitudeAndLevels.process_single_waveform_amplitude_and_levels(
+                waveform_samples=y,
+                waveform_sampling_period_seconds=1,
+                amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.PEAK,
+                histogram_size=1024,
+            )
+        )
+
+        # Assert
+        self.assertEqual(
+            AmplitudeAndLevelsProcessingBackend.NUMPY,
+            LabViewAmplitudeAndLevels.get_default_processing_backend(),
+        )
+        self.assertEqual(2, amplitude_and_levels_result.amplitude)
+        self.assertEqual(1, amplitude_and_levels_result.high_state_level)
+        self.assertEqual(-1, amplitude_and_levels_result.low_state_level)
+
+    def test_process_multiple_waveforms_block_amplitude_and_levels_auto_select_method(self):
+        """Test of `LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels`
+        using numpy backend and auto select method, square waveforms use histogram states,
+        triangle and constant waveforms use peak states."""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (102 > 100 characters) (auto-generated noqa)
+        # Arrange
+        t = numpy.linspace(0, 1, 1000, endpoint=False)
+        square = signal.square(2 * numpy.pi * 5 * t)
+        square[::100] = 1.5
+        triangle = signal.sawtooth(2 * numpy.pi * 5 * t, 0.5)
+        constant = numpy.full(t.size, 0.25)
+        waveforms_samples = numpy.stack([square, 2 * triangle, constant])
+
+        # Act
+        amplitude_and_levels_results = LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=0.001,
+            amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.AUTO_SELECT,
+            histogram_size=256,
+            amplitude_and_levels_processing_backend=AmplitudeAndLevelsProcessingBackend.NUMPY,
+        )
+
+        logging.debug(
+            "%s = %s",
+            nameof(amplitude_and_levels_results.amplitudes),
+            amplitude_and_levels_results.amplitudes,
+        )
+
+        # Assert
+        numpy.testing.assert_allclose([2, 4, 0], amplitude_and_levels_results.amplitudes)
+        numpy.testing.assert_allclose([1, 2, 0.25], amplitude_and_levels_results.high_state_levels)
+        numpy.testing.assert_allclose([-1, -2, 0.25], amplitude_and_levels_results.low_state_levels)
+
+        histograms = amplitude_and_levels_results.histograms
+        self.assertEqual(256, histograms.histogram_size)
+        self.assertEqual((3, 256), histograms.bins_counts.shape)
+        numpy.testing.assert_array_equal([1000, 1000, 1000], histograms.bins_counts.sum(axis=1))
+        numpy.testing.assert_allclose([-1, -2, 0.25], histograms.minimums)
+        numpy.testing.assert_allclose([1.5, 2, 0.25], histograms.maximums)
+
+    def test_process_multiple_waveforms_block_amplitude_and_levels_matches_single_waveform(self):
+        """Test of `LabViewAmplitudeAndLevels` using numpy backend, block processing
+        gives the same results as processing each waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveforms_samples = numpy.random.default_rng(seed=2).normal(size=(8, 2000))
+        LabViewAmplitudeAndLevels.set_default_processing_backend(
+            AmplitudeAndLevelsProcessingBackend.NUMPY
+        )
+
+        # Act
+        block_results = (
+            LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=0.001,
+                amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.HISTOGRAM,
+                histogram_size=64,
+            )
+        )
+        single_results = list(
+            LabViewAmplitudeAndLevels.process_multiple_waveforms_amplitude_and_levels(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=0.001,
+                amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.HISTOGRAM,
+                histogram_size=64,
+            )
+        )
+
+        # Assert
+        numpy.testing.assert_allclose(
+            [result.amplitude for result in single_results], block_results.amplitudes
+        )
+        numpy.testing.assert_allclose(
+            [result.high_state_level for result in single_results],
+            block_results.high_state_levels,
+        )
+        numpy.testing.assert_allclose(
+            [result.low_state_level for result in single_results],
+            block_results.low_state_levels,
+        )
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
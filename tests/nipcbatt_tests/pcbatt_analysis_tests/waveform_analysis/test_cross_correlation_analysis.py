@@ -0,0 +1,177 @@
+"""Defines unit tests related to nipcbatt.pcbatt_analysis.cross_correlation_analysis module."""
+
+import argparse
+import logging
+import platform
+import sys
+import unittest
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_analysis.waveform_analysis.cross_correlation_analysis import (
+    WaveformsCrossCorrelation,
+)
+
+
+class TestWaveformsCrossCorrelation(unittest.TestCase):
+    """Defines a test fixture that checks class WaveformsCrossCorrelation of module
+    `pcbatt_analysis.cross_correlation_analysis`.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_process_multiple_waveforms_block_lags(self):
+        """Test of `WaveformsCrossCorrelation.process_multiple_waveforms_block_lags` method
+        with delayed, advanced and scaled copies of a noise reference waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        random_generator = numpy.random.default_rng(seed=1234)
+        source_samples = random_generator.standard_normal(5400)
+        expected_lags = numpy.array([0, 37, -12, 150])
+        waveforms_samples = numpy.stack(
+            [source_samples[200 - lag : 5200 - lag] for lag in expected_lags]
+        )
+        waveforms_samples[3] = 0.5 * waveforms_samples[3] + 2.0
+
+        # Act
+        cross_correlation_result = WaveformsCrossCorrelation.process_multiple_waveforms_block_lags(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=0.001,
+        )
+
+        logging.debug("%s = %s", nameof(cross_correlation_result), repr(cross_correlation_result))
+
+        # Assert
+        self.assertEqual(0, cross_correlation_result.reference_waveform_index)
+        numpy.testing.assert_array_equal(
+            expected_lags, cross_correlation_result.lags_samples_counts
+        )
+        numpy.testing.assert_allclose(expected_lags * 0.001, cross_correlation_result.lags_seconds)
+        self.assertTrue(numpy.all(cross_correlation_result.correlation_coefficients > 0.9))
+
+        # direct cross-correlation gives the same lag
+        direct_correlation = numpy.correlate(waveforms_samples[1], waveforms_samples[0], "full")
+        self.assertEqual(
+            expected_lags[1],
+            int(numpy.argmax(direct_correlation)) - (waveforms_samples.shape[1] - 1),
+        )
+
+    def test_process_multiple_waveforms_block_lags_float32_samples(self):
+        """Test of `WaveformsCrossCorrelation.process_multiple_waveforms_block_lags` method
+        gives the same lags for float32 samples as for float64 samples."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        random_generator = numpy.random.default_rng(seed=4321)
+        source_samples = random_generator.standard_normal(3400)
+        expected_lags = numpy.array([0, 12, -40])
+        waveforms_samples = numpy.stack(
+            [source_samples[200 - lag : 3200 - lag] for lag in expected_lags]
+        )
+
+        # Act
+        cross_correlation_result = WaveformsCrossCorrelation.process_multiple_waveforms_block_lags(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=0.001,
+        )
+        float32_cross_correlation_result = (
+            WaveformsCrossCorrelation.process_multiple_waveforms_block_lags(
+                waveforms_samples=waveforms_samples.astype(numpy.float32),
+                waveforms_sampling_period_seconds=0.001,
+            )
+        )
+
+        # Assert
+        numpy.testing.assert_array_equal(
+            expected_lags, float32_cross_correlation_result.lags_samples_counts
+        )
+        self.assertEqual(
+            numpy.float64, float32_cross_correlation_result.correlation_coefficients.dtype
+        )
+        numpy.testing.assert_allclose(
+            cross_correlation_result.correlation_coefficients,
+            float32_cross_correlation_result.correlation_coefficients,
+            rtol=1e-5,
+        )
+
+    def test_process_multiple_waveforms_block_lags_with_max_lag(self):
+        """Test of `WaveformsCrossCorrelation.process_multiple_waveforms_block_lags` method
+        when lags are searched in a limited range and reference is not the first waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        random_generator = numpy.random.default_rng(seed=5678)
+        source_samples = random_generator.standard_normal(2200)
+        waveforms_samples = numpy.stack(
+            [source_samples[100 - lag : 2100 - lag] for lag in [20, -5]]
+        )
+
+        # Act
+        cross_correlation_result = WaveformsCrossCorrelation.process_multiple_waveforms_block_lags(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=0.001,
+            reference_waveform_index=1,
+            max_lag_seconds=0.05,
+        )
+
+        # Assert
+        numpy.testing.assert_array_equal([25, 0], cross_correlation_result.lags_samples_counts)
+        with self.assertRaises(ValueError):
+            WaveformsCrossCorrelation.process_multiple_waveforms_block_lags(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=0.001,
+                reference_waveform_index=2,
+            )
+
+    def test_get_aligned_waveforms_block_views(self):
+        """Test of `WaveformsCrossCorrelation.get_aligned_waveforms_block_views` method"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        source_samples = numpy.arange(1200, dtype=numpy.float64)
+        lags = numpy.array([0, 37, -12])
+        waveforms_samples = numpy.stack([source_samples[100 - lag : 1100 - lag] for lag in lags])
+
+        # Act
+        aligned_views = WaveformsCrossCorrelation.get_aligned_waveforms_block_views(
+            waveforms_samples, lags
+        )
+
+        # Assert
+        self.assertEqual(3, len(aligned_views))
+        self.assertEqual(1000 - 37 - 12, aligned_views[0].size)
+        for aligned_view in aligned_views:
+            self.assertTrue(numpy.shares_memory(aligned_view, waveforms_samples))
+            numpy.testing.assert_array_equal(aligned_views[0], aligned_view)
+        with self.assertRaises(ValueError):
+            WaveformsCrossCorrelation.get_aligned_waveforms_block_views(
+                waveforms_samples, numpy.array([0, 1000, 0])
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", dest="repeat", help="repeat tests")
+    (args, unitargs) = parser.parse_known_args()
+    unitargs.insert(0, "placeholder")  # unittest ignores first arg
+
+    # add more arguments to unitargs here
+    repeat_count = int(vars(args)["repeat"] or 2)
+    for iteration in range(repeat_count):
+        was_successful = unittest.main(exit=False, argv=unitargs).result.wasSuccessful()
+        if not was_successful:
+            sys.exit(1)
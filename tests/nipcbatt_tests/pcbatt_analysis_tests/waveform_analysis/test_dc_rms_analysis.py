@@ -7,12 +7,16 @@ import sys
 import unittest
 
 import numpy
+from parameterized import parameterized
 from scipy import signal
 from varname import nameof
 
+from nipcbatt.pcbatt_analysis.analysis_library_exceptions import PCBATTAnalysisException
 from nipcbatt.pcbatt_analysis.waveform_analysis.dc_rms_analysis import (
+    DcRmsProcessingBackend,
     DcRmsProcessingResult,
     DcRmsProcessingWindow,
+    DcRmsStreamingAccumulator,
     LabViewBasicDcRms,
 )
 from nipcbatt.pcbatt_utilities import functional_utilities, numeric_utilities
@@ -353,6 +357,363 @@ class TestLabViewBasicDcRms(unittest.TestCase):
         self.assertGreaterEqual(dc_rms_result.dc_value, 5.5)
         self.assertGreaterEqual(dc_rms_result.rms_value, 6.2)
 
+    def test_process_multiple_waveforms_block_dc_rms_with_several_workers(self):
+        """Test of pcbatt_analysis.dc_rms_analysis.LabViewBasicDcRms
+        process_multiple_waveforms_block_dc_rms method when waveforms are shared by threads"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        time_points = numpy.arange(sampling_rate) / sampling_rate
+        waveforms_samples = numpy.stack(
+            [
+                (channel_index + 1) * numpy.sin(2 * numpy.pi * 50 * time_points) + channel_index
+                for channel_index in range(7)
+            ]
+        )
+
+        # Act
+        serial_dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            dc_rms_processing_window=DcRmsProcessingWindow.HANN,
+            dc_rms_processing_backend=DcRmsProcessingBackend.LABVIEW,
+        )
+        parallel_dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            dc_rms_processing_window=DcRmsProcessingWindow.HANN,
+            dc_rms_processing_backend=DcRmsProcessingBackend.LABVIEW,
+            workers_count=3,
+        )
+
+        logging.debug("%s = %s", nameof(parallel_dc_rms_results), repr(parallel_dc_rms_results))
+
+        # Assert
+        numpy.testing.assert_array_equal(
+            serial_dc_rms_results.dc_values, parallel_dc_rms_results.dc_values
+        )
+        numpy.testing.assert_array_equal(
+            serial_dc_rms_results.rms_values, parallel_dc_rms_results.rms_values
+        )
+        numpy.testing.assert_allclose(parallel_dc_rms_results.dc_values, range(7), atol=1e-6)
+
+
+# Numpy backend tests
+class TestNumpyBasicDcRms(unittest.TestCase):
+    """Provides unit tests of LabViewBasicDcRms class using numpy processing backend.
+
+    Args:
+        unittest (TestCase): test cases fixture.
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        LabViewBasicDcRms.set_default_processing_backend(DcRmsProcessingBackend.LABVIEW)
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    @parameterized.expand(
+        [
+            # RMS is normalized by the power of the 5 window samples, LabVIEW VI uses the
+            # closed-form power of the window and gives 20.20e-6, 0.0548 and 0.69635
+            (DcRmsProcessingWindow.LOW_SIDE_LOBE, 0, 13.45e-6, 20.45e-6),
+            (DcRmsProcessingWindow.LOW_SIDE_LOBE, 1, 0.03648, 0.05548),
+            (DcRmsProcessingWindow.LOW_SIDE_LOBE, 2, 0.46352, 0.70493),
+            (DcRmsProcessingWindow.HANN, 1, 0.13820, 0.25231),
+            (DcRmsProcessingWindow.HANN, 2, 0.36180, 0.66056),
+            (DcRmsProcessingWindow.HANN, 4, 0.13820, 0.25231),
+        ]
+    )
+    def test_process_single_waveform_dc_rms_matches_labview_results(
+        self,
+        dc_rms_processing_window: DcRmsProcessingWindow,
+        impulse_index: int,
+        expected_dc_value: float,
+        expected_rms_value: float,
+    ):
+        """Test of pcbatt_analysis.dc_rms_analysis.LabViewBasicDcRms
+        process_single_waveform_dc_rms method using numpy backend"""  # noqa: D202, D205, D209, D415 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+        # Arrange
+        tolerance_percent = 0.1
+
+        # Act
+        dc_rms_result = LabViewBasicDcRms.process_single_waveform_dc_rms(
+            waveform_samples=signal.unit_impulse(5, impulse_index),
+            waveform_sampling_period_seconds=1,
+            dc_rms_processing_window=dc_rms_processing_window,
+            dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+        )
+
+        logging.debug("%s = %s", nameof(dc_rms_result), repr(dc_rms_result))
+
+        # Assert
+        self.assertAlmostEqual(
+            expected_dc_value,
+            dc_rms_result.dc_value,
+            delta=numeric_utilities.percent_of(percent=tolerance_percent, value=expected_dc_value),
+        )
+        self.assertAlmostEqual(
+            expected_rms_value,
+            dc_rms_result.rms_value,
+            delta=numeric_utilities.percent_of(percent=tolerance_percent, value=expected_rms_value),
+        )
+
+    def test_process_single_waveform_dc_rms_uses_default_processing_backend(self):
+        """Test of pcbatt_analysis.dc_rms_analysis.LabViewBasicDcRms
+        process_single_waveform_dc_rms method when numpy backend is set as default"""  # noqa: D202, D205, D209, D415 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+        # Arrange
+        LabViewBasicDcRms.set_default_processing_backend(DcRmsProcessingBackend.NUMPY)
+        samples = numpy.array(range(1, 11), dtype=numpy.float64)
+
+        # Act
+        dc_rms_result = LabViewBasicDcRms.process_single_waveform_dc_rms(
+            waveform_samples=samples,
+            waveform_sampling_period_seconds=1.0,
+            dc_rms_processing_window=DcRmsProcessingWindow.RECTANGULAR,
+        )
+
+        # Assert
+        self.assertEqual(
+            DcRmsProcessingBackend.NUMPY, LabViewBasicDcRms.get_default_processing_backend()
+        )
+        self.assertAlmostEqual(5.5, dc_rms_result.dc_value)
+        self.assertAlmostEqual(numpy.sqrt(38.5), dc_rms_result.rms_value)
+
+    @parameterized.expand(
+        [
+            (DcRmsProcessingWindow.RECTANGULAR,),
+            (DcRmsProcessingWindow.HANN,),
+            (DcRmsProcessingWindow.LOW_SIDE_LOBE,),
+        ]
+    )
+    def test_process_multiple_waveforms_block_dc_rms(
+        self, dc_rms_processing_window: DcRmsProcessingWindow
+    ):
+        """Test of pcbatt_analysis.dc_rms_analysis.LabViewBasicDcRms
+        process_multiple_waveforms_block_dc_rms method using numpy backend"""  # noqa: D202, D205, D209, D415 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+        # Arrange
+        sampling_rate = 10000
+        time_points = numpy.arange(sampling_rate) / sampling_rate
+        waveforms_samples = numpy.stack(
+            [
+                amplitude * numpy.sin(2 * numpy.pi * 50 * time_points) + offset
+                for amplitude, offset in ((1.0, 0.0), (2.0, 1.0), (0.5, -3.0))
+            ]
+        )
+
+        # Act
+        dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            dc_rms_processing_window=dc_rms_processing_window,
+            dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+        )
+
+        logging.debug("%s = %s", nameof(dc_rms_results), repr(dc_rms_results))
+
+        # Assert
+        numpy.testing.assert_allclose(dc_rms_results.dc_values, [0.0, 1.0, -3.0], atol=1e-6)
+        numpy.testing.assert_allclose(
+            dc_rms_results.rms_values,
+            [numpy.sqrt(0.5), numpy.sqrt(3.0), numpy.sqrt(9.125)],
+            rtol=1e-6,
+        )
+
+        for waveform_samples, dc_rms_result in zip(
+            waveforms_samples, dc_rms_results.results_per_waveform()
+        ):
+            single_dc_rms_result = LabViewBasicDcRms.process_single_waveform_dc_rms(
+                waveform_samples=waveform_samples,
+                waveform_sampling_period_seconds=1 / sampling_rate,
+                dc_rms_processing_window=dc_rms_processing_window,
+                dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+            )
+            self.assertAlmostEqual(single_dc_rms_result.dc_value, dc_rms_result.dc_value)
+            self.assertAlmostEqual(single_dc_rms_result.rms_value, dc_rms_result.rms_value)
+
+    @parameterized.expand(
+        [
+            (DcRmsProcessingWindow.RECTANGULAR,),
+            (DcRmsProcessingWindow.HANN,),
+            (DcRmsProcessingWindow.LOW_SIDE_LOBE,),
+        ]
+    )
+    def test_process_multiple_waveforms_block_dc_rms_of_few_samples(
+        self, dc_rms_processing_window: DcRmsProcessingWindow
+    ):
+        """Test of pcbatt_analysis.dc_rms_analysis.LabViewBasicDcRms
+        process_multiple_waveforms_block_dc_rms method using numpy backend
+        when waveforms hold only a few samples"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        for samples_count in range(2, 8):
+            # Arrange
+            waveforms_samples = numpy.stack(
+                [numpy.full(samples_count, 2.5), numpy.full(samples_count, -1.5)]
+            )
+
+            # Act
+            dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=0.001,
+                dc_rms_processing_window=dc_rms_processing_window,
+                dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+            )
+
+            # Assert
+            numpy.testing.assert_allclose(dc_rms_results.dc_values, [2.5, -1.5], rtol=1e-12)
+            numpy.testing.assert_allclose(dc_rms_results.rms_values, [2.5, 1.5], rtol=1e-12)
+
+    def test_process_multiple_waveforms_block_dc_rms_float32_samples(self):
+        """Test of pcbatt_analysis.dc_rms_analysis.LabViewBasicDcRms
+        process_multiple_waveforms_block_dc_rms method using numpy backend
+        gives float64 results of float32 samples close to the ones of float64 samples"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        time_points = numpy.arange(sampling_rate) / sampling_rate
+        waveforms_samples = numpy.stack(
+            [
+                amplitude * numpy.sin(2 * numpy.pi * 50 * time_points) + offset
+                for amplitude, offset in ((1.0, 0.0), (2.0, 1.0), (0.5, -3.0))
+            ]
+        )
+
+        # Act
+        dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            dc_rms_processing_window=DcRmsProcessingWindow.HANN,
+            dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+        )
+        float32_dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples.astype(numpy.float32),
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            dc_rms_processing_window=DcRmsProcessingWindow.HANN,
+            dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+        )
+
+        # Assert
+        self.assertEqual(numpy.float64, float32_dc_rms_results.dc_values.dtype)
+        self.assertEqual(numpy.float64, float32_dc_rms_results.rms_values.dtype)
+        numpy.testing.assert_allclose(
+            dc_rms_results.dc_values, float32_dc_rms_results.dc_values, atol=1e-5
+        )
+        numpy.testing.assert_allclose(
+            dc_rms_results.rms_values, float32_dc_rms_results.rms_values, rtol=1e-5
+        )
+
+
+class TestDcRmsStreamingAccumulator(unittest.TestCase):
+    """Provides unit tests of DcRmsStreamingAccumulator class.
+
+    Args:
+        unittest (TestCase): test cases fixture.
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_accumulate_waveforms_chunks_matches_whole_waveforms_processing(self):
+        """Test of pcbatt_analysis.dc_rms_analysis.DcRmsStreamingAccumulator
+        when waveforms are accumulated by chunks of different sizes"""  # noqa: D202, D205, D209, D415 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+        # Arrange
+        sampling_rate = 10000
+        time_points = numpy.arange(3 * sampling_rate) / sampling_rate
+        # large DC offset, small ripple, checks accumulation stays accurate
+        waveforms_samples = numpy.stack(
+            [
+                amplitude * numpy.sin(2 * numpy.pi * 50 * time_points) + offset
+                for amplitude, offset in ((1.0, 0.0), (0.001, 1000.0), (0.5, -3.0))
+            ]
+        )
+        dc_rms_accumulator = DcRmsStreamingAccumulator(channels_count=3)
+
+        # Act
+        for chunk_start, chunk_stop in ((0, 1), (1, 7000), (7000, 7000), (7000, 30000)):
+            dc_rms_accumulator.accumulate_waveforms_chunk(
+                waveforms_samples[:, chunk_start:chunk_stop]
+            )
+        dc_rms_results = dc_rms_accumulator.get_multiple_waveforms_result()
+
+        logging.debug("%s = %s", nameof(dc_rms_results), repr(dc_rms_results))
+
+        # Assert
+        expected_dc_rms_results = LabViewBasicDcRms.process_multiple_waveforms_block_dc_rms(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            dc_rms_processing_window=DcRmsProcessingWindow.RECTANGULAR,
+            dc_rms_processing_backend=DcRmsProcessingBackend.NUMPY,
+        )
+        self.assertEqual(30000, dc_rms_accumulator.samples_count)
+        numpy.testing.assert_allclose(
+            dc_rms_results.dc_values, expected_dc_rms_results.dc_values, rtol=1e-12, atol=1e-12
+        )
+        numpy.testing.assert_allclose(
+            dc_rms_results.rms_values, expected_dc_rms_results.rms_values, rtol=1e-12
+        )
+        numpy.testing.assert_allclose(
+            dc_rms_accumulator.minimums, waveforms_samples.min(axis=1), rtol=1e-12
+        )
+        numpy.testing.assert_allclose(
+            dc_rms_accumulator.maximums, waveforms_samples.max(axis=1), rtol=1e-12
+        )
+        self.assertAlmostEqual(
+            expected_dc_rms_results.rms_values[2],
+            list(dc_rms_accumulator.results_per_waveform())[2].rms_value,
+        )
+
+    def test_accumulate_waveforms_chunk_after_reset(self):
+        """Test of pcbatt_analysis.dc_rms_analysis.DcRmsStreamingAccumulator
+        reset method"""  # noqa: D202, D205, D209, D415 - No blank lines allowed after function docstring (auto-generated noqa), 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+        # Arrange
+        dc_rms_accumulator = DcRmsStreamingAccumulator()
+        dc_rms_accumulator.accumulate_waveforms_chunk(numpy.full(100, 5.0))
+
+        # Act
+        dc_rms_accumulator.reset()
+
+        # Assert
+        with self.assertRaises(PCBATTAnalysisException):
+            dc_rms_accumulator.get_multiple_waveforms_result()
+
+        dc_rms_accumulator.accumulate_waveforms_chunk(numpy.array([-1.0, 1.0], numpy.float32))
+        dc_rms_result = next(dc_rms_accumulator.results_per_waveform())
+        self.assertAlmostEqual(0.0, dc_rms_result.dc_value)
+        self.assertAlmostEqual(1.0, dc_rms_result.rms_value)
+        with self.assertRaises(ValueError):
+            dc_rms_accumulator.accumulate_waveforms_chunk(numpy.zeros((2, 10)))
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
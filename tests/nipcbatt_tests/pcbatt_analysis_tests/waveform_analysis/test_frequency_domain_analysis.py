@@ -15,13 +15,18 @@ from parameterized import parameterized
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis import analysis_library_info
+from nipcbatt.pcbatt_analysis.analysis_library_exceptions import PCBATTAnalysisException
 from nipcbatt.pcbatt_analysis.common.common_types import (
     AmplitudePhaseSpectrum,
     SpectrumAmplitudeType,
     SpectrumPhaseUnit,
     WaveformTone,
 )
+from nipcbatt.pcbatt_analysis.waveform_analysis._waveform_analysis_internal import (
+    _frequency_domain_analysis,
+)
 from nipcbatt.pcbatt_analysis.waveform_analysis.frequency_domain_analysis import (
+    FrequencyDomainProcessingBackend,
     LabViewFftSpectrumAmplitudePhase,
     LabViewFftSpectrumWindow,
     LabViewFrequencyDomainProcessing,
@@ -529,6 +534,62 @@ class TestLabViewFrequencyDomainProcessing(unittest.TestCase):
         for detected_tone in waveform_multiple_tones.detected_tones:
             self.assertGreaterEqual(detected_tone.amplitude, wanted_tones_selection_threshold)
 
+    def test_process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(self):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum` method
+        gives same results as single waveform processing.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        waveforms_samples = numpy.stack(
+            [
+                sine_waveform.create_sine_waveform(
+                    amplitude=amplitude,
+                    frequency=frequency,
+                    phase=0,
+                    offset=0,
+                    samples_count=1000,
+                    sampling_rate=sampling_rate,
+                )
+                for amplitude, frequency in ((1.0, 100), (0.5, 250), (2.0, 1000))
+            ]
+        )
+
+        # Act
+        fdvm_results = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            spectrum_amplitude_must_be_db=False,
+            spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+            fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+            tones_selection_threshold_peak_amplitude=0.1,
+        )
+
+        # Assert
+        self.assertEqual(waveforms_samples.shape[0], fdvm_results.spectrums_amplitudes.shape[0])
+        self.assertEqual(waveforms_samples.shape[0], len(fdvm_results.multiple_tones_results))
+
+        for waveform_index, waveform_samples in enumerate(waveforms_samples):
+            single_fdvm_result = LabViewFrequencyDomainProcessing.process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
+                waveform_samples=waveform_samples,
+                waveform_sampling_period_seconds=1 / sampling_rate,
+                spectrum_amplitude_must_be_db=False,
+                spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+                tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+                tones_selection_threshold_peak_amplitude=0.1,
+            )
+
+            numpy.testing.assert_allclose(
+                single_fdvm_result.amplitude_phase_spectrum.spectrum_amplitudes,
+                fdvm_results.spectrums_amplitudes[waveform_index],
+            )
+            self.assertEqual(
+                len(single_fdvm_result.multiple_tones_result.detected_tones),
+                len(fdvm_results.multiple_tones_results[waveform_index].detected_tones),
+            )
+
 
 class TestLabViewFftSpectrumAmplitudePhase(unittest.TestCase):
     """Provides unit tests of `LabViewFftSpectrumAmplitudePhase` class.
@@ -894,6 +955,545 @@ class TestLabViewMultipleTonesMeasurement(unittest.TestCase):
             )
 
 
+# Numpy backend tests
+class TestNumpyFrequencyDomainProcessing(unittest.TestCase):
+    """Provides unit tests of `LabViewFrequencyDomainProcessing` class
+    using numpy processing backend.
+
+    Args:
+        unittest (TestCase): test cases fixture.
+    """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        LabViewFrequencyDomainProcessing.set_default_processing_backend(
+            FrequencyDomainProcessingBackend.LABVIEW
+        )
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    @parameterized.expand(
+        [
+            ("PEAK_AMPLITUDE", SpectrumAmplitudeType.PEAK, 1.0),
+            ("RMS_AMPLITUDE", SpectrumAmplitudeType.RMS, 0.707),
+        ]
+    )
+    def test_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_single_tone(
+        self, case_name: str, amplitude_type: SpectrumAmplitudeType, expected_max_amplitude: float
+    ):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_single_waveform_multiple_tones_and_amplitude_phase_spectrum` method
+        using numpy backend with a single tone waveform"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        logging.debug("%s = %s", nameof(case_name), case_name)
+
+        # Arrange
+        waveform_sampling_rate = 44100
+        waveform_samples = sine_waveform.create_sine_waveform(
+            amplitude=1,
+            frequency=440,
+            phase=math.radians(45),
+            offset=0,
+            samples_count=4410,
+            sampling_rate=waveform_sampling_rate,
+        )
+
+        # Act
+        fdvm_results = LabViewFrequencyDomainProcessing.process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
+            waveform_samples=waveform_samples,
+            waveform_sampling_period_seconds=1 / waveform_sampling_rate,
+            spectrum_amplitude_must_be_db=False,
+            spectrum_phase_unit=SpectrumPhaseUnit.DEGREE,
+            fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+            tones_selection_threshold_peak_amplitude=0.1,
+            frequency_domain_processing_backend=FrequencyDomainProcessingBackend.NUMPY,
+        )
+        spectrum = fdvm_results.amplitude_phase_spectrum
+        detected_tones = fdvm_results.multiple_tones_result.detected_tones
+        spectrum_amplitudes = spectrum.spectrum_amplitudes
+        if amplitude_type == SpectrumAmplitudeType.PEAK:
+            spectrum_amplitudes = spectrum_amplitudes * math.sqrt(2)
+
+        logging.debug("%s = %s", nameof(detected_tones), repr(detected_tones))
+
+        # Assert
+        self.assertEqual(2205, spectrum.spectrum_amplitudes.size)
+        self.assertEqual(2205, spectrum.spectrum_phases.size)
+        self.assertEqual(SpectrumAmplitudeType.RMS, spectrum.spectrum_amplitude_type)
+        self.assertEqual(SpectrumPhaseUnit.DEGREE, spectrum.spectrum_phase_unit)
+        self.assertAlmostEqual(10.0, spectrum.spectrum_frequency_resolution)
+        self.assertAlmostEqual(expected_max_amplitude, spectrum_amplitudes.max(), delta=0.001)
+        self.assertEqual(44, numpy.argmax(spectrum.spectrum_amplitudes))
+        # phase of the sine relative to a cosine is 45 - 90 degrees
+        self.assertAlmostEqual(-45.0, spectrum.spectrum_phases[44], delta=0.01)
+
+        self.assertEqual(
+            SpectrumAmplitudeType.PEAK, fdvm_results.multiple_tones_result.amplitude_type
+        )
+        self.assertEqual(1, len(detected_tones))
+        self.assertAlmostEqual(440.0, detected_tones[0].frequency, delta=0.01)
+        self.assertAlmostEqual(1.0, detected_tones[0].amplitude, delta=0.001)
+        self.assertAlmostEqual(math.radians(-45), detected_tones[0].phase_radians, delta=1e-4)
+
+    @parameterized.expand(
+        [
+            (LabViewTonesSortingMode.DECREASING_AMPLITUDES, None, [1, 3, 5, 7]),
+            (LabViewTonesSortingMode.INCREASING_FREQUENCIES, None, [1, 3, 5, 7]),
+            (LabViewTonesSortingMode.DECREASING_AMPLITUDES, 2, [1, 3]),
+            (LabViewTonesSortingMode.INCREASING_FREQUENCIES, 3, [1, 3, 5]),
+        ]
+    )
+    def test_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_square_waveform(
+        self,
+        tones_sorting_mode: LabViewTonesSortingMode,
+        tones_max_count: int,
+        expected_harmonics: list[int],
+    ):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_single_waveform_multiple_tones_and_amplitude_phase_spectrum` method
+        using numpy backend with a square waveform"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_sampling_rate = 44100
+        waveform_frequency = 440
+        wanted_tones_selection_threshold = 0.15
+        comparison_tolerance_percent = 0.1
+
+        square_waveform_samples = square_waveform.create_square_waveform(
+            amplitude=1,
+            frequency=waveform_frequency,
+            duty_cycle=0.5,
+            phase=0,
+            offset=0,
+            samples_count=4410,
+            sampling_rate=waveform_sampling_rate,
+        )
+
+        # Act
+        fdvm_results = LabViewFrequencyDomainProcessing.process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
+            waveform_samples=square_waveform_samples,
+            waveform_sampling_period_seconds=1 / waveform_sampling_rate,
+            spectrum_amplitude_must_be_db=False,
+            spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+            fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            tones_sorting_mode=tones_sorting_mode,
+            tones_selection_threshold_peak_amplitude=wanted_tones_selection_threshold,
+            tones_max_count=tones_max_count,
+            frequency_domain_processing_backend=FrequencyDomainProcessingBackend.NUMPY,
+        )
+        detected_tones = fdvm_results.multiple_tones_result.detected_tones
+
+        logging.debug("%s = %s", nameof(detected_tones), repr(detected_tones))
+
+        # Assert
+        self.assertEqual(len(expected_harmonics), len(detected_tones))
+
+        for detected_tone, harmonic in zip(detected_tones, expected_harmonics):
+            expected_tone_frequency = harmonic * waveform_frequency
+            # peak amplitude of odd harmonics of a square wave is 4 / (k * PI)
+            expected_tone_amplitude = 4 / (harmonic * math.pi)
+
+            self.assertGreaterEqual(detected_tone.amplitude, wanted_tones_selection_threshold)
+            self.assertAlmostEqual(
+                expected_tone_frequency,
+                detected_tone.frequency,
+                delta=numeric_utilities.percent_of(
+                    percent=comparison_tolerance_percent, value=expected_tone_frequency
+                ),
+            )
+            self.assertAlmostEqual(expected_tone_amplitude, detected_tone.amplitude, delta=0.001)
+
+    def test_process_single_waveform_multiple_tones_and_amplitude_phase_spectrum_amplitude_is_db(
+        self,
+    ):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_single_waveform_multiple_tones_and_amplitude_phase_spectrum` method
+        using numpy backend set as default, with amplitudes expressed as db"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        LabViewFrequencyDomainProcessing.set_default_processing_backend(
+            FrequencyDomainProcessingBackend.NUMPY
+        )
+        waveform_samples = sine_waveform.create_sine_waveform(
+            amplitude=2,
+            frequency=100,
+            phase=0,
+            offset=0,
+            samples_count=1000,
+            sampling_rate=10000,
+        )
+
+        # Act
+        fdvm_results = LabViewFrequencyDomainProcessing.process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
+            waveform_samples=waveform_samples,
+            waveform_sampling_period_seconds=1 / 10000,
+            spectrum_amplitude_must_be_db=True,
+            spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+            fft_spectrum_window=LabViewFftSpectrumWindow.FLAT_TOP,
+            tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+            tones_selection_threshold_peak_amplitude=0.5,
+        )
+        spectrum = fdvm_results.amplitude_phase_spectrum
+
+        # Assert
+        self.assertEqual(
+            FrequencyDomainProcessingBackend.NUMPY,
+            LabViewFrequencyDomainProcessing.get_default_processing_backend(),
+        )
+        self.assertTrue(spectrum.spectrum_amplitude_unit_is_db)
+        self.assertTrue(numpy.all(numpy.isfinite(spectrum.spectrum_amplitudes)))
+        # RMS amplitude of the tone is sqrt(2)
+        self.assertAlmostEqual(
+            20 * math.log10(math.sqrt(2)), spectrum.spectrum_amplitudes.max(), delta=0.01
+        )
+        self.assertEqual(1, len(fdvm_results.multiple_tones_result.detected_tones))
+        self.assertAlmostEqual(
+            2.0, fdvm_results.multiple_tones_result.detected_tones[0].amplitude, delta=0.001
+        )
+
+    def test_process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(self):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum` method
+        using numpy backend gives same results as single waveform processing.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        waveforms_samples = numpy.stack(
+            [
+                sine_waveform.create_sine_waveform(
+                    amplitude=amplitude,
+                    frequency=frequency,
+                    phase=0,
+                    offset=0,
+                    samples_count=1000,
+                    sampling_rate=sampling_rate,
+                )
+                for amplitude, frequency in ((1.0, 100), (0.5, 250), (2.0, 1000))
+            ]
+        )
+
+        # Act
+        fdvm_results = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            spectrum_amplitude_must_be_db=False,
+            spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+            fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+            tones_selection_threshold_peak_amplitude=0.1,
+            frequency_domain_processing_backend=FrequencyDomainProcessingBackend.NUMPY,
+        )
+
+        # Assert
+        self.assertEqual((3, 500), fdvm_results.spectrums_amplitudes.shape)
+        self.assertEqual((3, 500), fdvm_results.spectrums_phases.shape)
+
+        for waveform_index, waveform_samples in enumerate(waveforms_samples):
+            single_fdvm_result = LabViewFrequencyDomainProcessing.process_single_waveform_multiple_tones_and_amplitude_phase_spectrum(
+                waveform_samples=waveform_samples,
+                waveform_sampling_period_seconds=1 / sampling_rate,
+                spectrum_amplitude_must_be_db=False,
+                spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+                tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+                tones_selection_threshold_peak_amplitude=0.1,
+                frequency_domain_processing_backend=FrequencyDomainProcessingBackend.NUMPY,
+            )
+
+            numpy.testing.assert_allclose(
+                single_fdvm_result.amplitude_phase_spectrum.spectrum_amplitudes,
+                fdvm_results.spectrums_amplitudes[waveform_index],
+            )
+            self.assertEqual(
+                repr(single_fdvm_result.multiple_tones_result.detected_tones),
+                repr(fdvm_results.multiple_tones_results[waveform_index].detected_tones),
+            )
+
+    def test_process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum_float32(
+        self,
+    ):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum` method
+        using numpy backend gives float64 results of float32 samples close to the ones
+        of float64 samples.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        waveforms_samples = numpy.stack(
+            [
+                sine_waveform.create_sine_waveform(
+                    amplitude=amplitude,
+                    frequency=frequency,
+                    phase=0,
+                    offset=0,
+                    samples_count=1000,
+                    sampling_rate=sampling_rate,
+                )
+                for amplitude, frequency in ((1.0, 100), (0.5, 250), (2.0, 1000))
+            ]
+        )
+
+        # Act
+        fdvm_results, float32_fdvm_results = (
+            LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_multiple_tones_and_amplitude_phase_spectrum(
+                waveforms_samples=samples,
+                waveforms_sampling_period_seconds=1 / sampling_rate,
+                spectrum_amplitude_must_be_db=False,
+                spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+                tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+                tones_selection_threshold_peak_amplitude=0.1,
+                frequency_domain_processing_backend=FrequencyDomainProcessingBackend.NUMPY,
+            )
+            for samples in (waveforms_samples, waveforms_samples.astype(numpy.float32))
+        )
+
+        # Assert
+        self.assertEqual(numpy.float64, float32_fdvm_results.spectrums_amplitudes.dtype)
+        numpy.testing.assert_allclose(
+            fdvm_results.spectrums_amplitudes,
+            float32_fdvm_results.spectrums_amplitudes,
+            atol=1e-5,
+        )
+        for tones_result, float32_tones_result in zip(
+            fdvm_results.multiple_tones_results, float32_fdvm_results.multiple_tones_results
+        ):
+            self.assertEqual(
+                len(tones_result.detected_tones), len(float32_tones_result.detected_tones)
+            )
+            for tone, float32_tone in zip(
+                tones_result.detected_tones, float32_tones_result.detected_tones
+            ):
+                self.assertAlmostEqual(tone.frequency, float32_tone.frequency, places=3)
+                self.assertAlmostEqual(tone.amplitude, float32_tone.amplitude, places=5)
+
+    def test_process_multiple_waveforms_block_averaged_multiple_tones_and_amplitude_spectrum(
+        self,
+    ):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_multiple_waveforms_block_averaged_multiple_tones_and_amplitude_spectrum` method
+        gives Welch averaged spectrums and detects tones of noisy waveforms.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        segment_samples_count = 1000
+        waveforms_samples = numpy.stack(
+            [
+                sine_waveform.create_sine_waveform(
+                    amplitude=amplitude,
+                    frequency=frequency,
+                    phase=0,
+                    offset=0,
+                    samples_count=50000,
+                    sampling_rate=sampling_rate,
+                )
+                for amplitude, frequency in ((1.0, 1000), (0.5, 250))
+            ]
+        ) + numpy.random.default_rng(seed=1).normal(scale=0.1, size=(2, 50000))
+
+        # Act
+        fdvm_results = LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_averaged_multiple_tones_and_amplitude_spectrum(
+            waveforms_samples=waveforms_samples,
+            waveforms_sampling_period_seconds=1 / sampling_rate,
+            spectrum_amplitude_must_be_db=False,
+            spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+            fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+            tones_selection_threshold_peak_amplitude=0.2,
+            segment_samples_count=segment_samples_count,
+            segment_overlap_percent=50,
+        )
+
+        # Assert
+        _, expected_spectrums_powers = scipy.signal.welch(
+            waveforms_samples,
+            fs=sampling_rate,
+            window="hann",
+            nperseg=segment_samples_count,
+            noverlap=segment_samples_count // 2,
+            detrend=False,
+            scaling="spectrum",
+            axis=1,
+        )
+        self.assertEqual((2, 500), fdvm_results.spectrums_amplitudes.shape)
+        self.assertAlmostEqual(10.0, fdvm_results.spectrum_frequency_resolution)
+        numpy.testing.assert_allclose(
+            fdvm_results.spectrums_amplitudes[:, 1:],
+            numpy.sqrt(expected_spectrums_powers[:, 1:500]),
+            rtol=1e-9,
+        )
+        numpy.testing.assert_array_equal(0.0, fdvm_results.spectrums_phases)
+
+        for (expected_amplitude, expected_frequency), multiple_tones_result in zip(
+            ((1.0, 1000), (0.5, 250)), fdvm_results.multiple_tones_results
+        ):
+            self.assertEqual(1, len(multiple_tones_result.detected_tones))
+            self.assertAlmostEqual(
+                expected_frequency, multiple_tones_result.detected_tones[0].frequency, delta=1
+            )
+            self.assertAlmostEqual(
+                expected_amplitude,
+                multiple_tones_result.detected_tones[0].amplitude,
+                delta=numeric_utilities.percent_of(2, expected_amplitude),
+            )
+
+        with self.assertRaises(PCBATTAnalysisException):
+            LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_averaged_multiple_tones_and_amplitude_spectrum(
+                waveforms_samples=waveforms_samples[:, :500],
+                waveforms_sampling_period_seconds=1 / sampling_rate,
+                spectrum_amplitude_must_be_db=False,
+                spectrum_phase_unit=SpectrumPhaseUnit.RADIAN,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+                tones_sorting_mode=LabViewTonesSortingMode.DECREASING_AMPLITUDES,
+                tones_selection_threshold_peak_amplitude=0.2,
+                segment_samples_count=segment_samples_count,
+            )
+
+    def test_process_multiple_waveforms_block_targeted_tones(self):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_multiple_waveforms_block_targeted_tones` method measures amplitudes and phases
+        of tones of known frequencies, including frequencies between FFT bins.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        time_points = numpy.arange(100000) / sampling_rate
+        tones_frequencies = [100.0, 333.3, 1000.0]
+        tones_amplitudes = numpy.array([[1.0, 0.5, 0.25], [0.1, 2.0, 1.0]])
+        tones_phases = numpy.array([[0.0, 1.0, -2.0], [0.5, -0.5, 3.0]])
+        waveforms_samples = numpy.stack(
+            [
+                sum(
+                    amplitude * numpy.cos(2 * numpy.pi * frequency * time_points + phase)
+                    for frequency, amplitude, phase in zip(
+                        tones_frequencies, waveform_amplitudes, waveform_phases
+                    )
+                )
+                for waveform_amplitudes, waveform_phases in zip(tones_amplitudes, tones_phases)
+            ]
+        )
+
+        # Act
+        tones_results = (
+            LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_targeted_tones(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=1 / sampling_rate,
+                tones_frequencies=tones_frequencies,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            )
+        )
+
+        logging.debug("%s = %s", nameof(tones_results), repr(tones_results))
+
+        # Assert
+        self.assertEqual(2, len(tones_results))
+        for tones_result, waveform_amplitudes, waveform_phases in zip(
+            tones_results, tones_amplitudes, tones_phases
+        ):
+            self.assertEqual(SpectrumAmplitudeType.PEAK, tones_result.amplitude_type)
+            self.assertListEqual(
+                tones_frequencies,
+                [waveform_tone.frequency for waveform_tone in tones_result.detected_tones],
+            )
+            numpy.testing.assert_allclose(
+                waveform_amplitudes,
+                [waveform_tone.amplitude for waveform_tone in tones_result.detected_tones],
+                rtol=1e-3,
+            )
+            numpy.testing.assert_allclose(
+                waveform_phases,
+                [waveform_tone.phase_radians for waveform_tone in tones_result.detected_tones],
+                atol=1e-3,
+            )
+
+    def test_process_multiple_waveforms_block_frequency_response(self):
+        """Test of `LabViewFrequencyDomainProcessing`
+        `process_multiple_waveforms_block_frequency_response` method measures gains and phase
+        shifts of response waveforms relative to the stimulus waveform of the same block.
+        """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        sampling_rate = 10000
+        time_points = numpy.arange(50000) / sampling_rate
+        tones_frequencies = [100.0, 333.3, 1000.0]
+        stimulus_phases = numpy.array([0.0, 1.0, -2.0])
+        expected_gains = numpy.array([[1.0, 1.0, 1.0], [2.0, 0.5, 0.1]])
+        expected_phases_shifts = numpy.array([[0.0, 0.0, 0.0], [-0.25, -1.5, 3.0]])
+        waveforms_samples = numpy.stack(
+            [
+                sum(
+                    gain * numpy.cos(2 * numpy.pi * frequency * time_points + phase + shift)
+                    for frequency, gain, phase, shift in zip(
+                        tones_frequencies, waveform_gains, stimulus_phases, waveform_shifts
+                    )
+                )
+                for waveform_gains, waveform_shifts in zip(expected_gains, expected_phases_shifts)
+            ]
+        )
+
+        # Act
+        frequency_response_result = (
+            LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_frequency_response(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=1 / sampling_rate,
+                tones_frequencies=tones_frequencies,
+                stimulus_waveform_index=0,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            )
+        )
+
+        logging.debug("%s = %s", nameof(frequency_response_result), repr(frequency_response_result))
+
+        # Assert
+        self.assertEqual(0, frequency_response_result.stimulus_waveform_index)
+        numpy.testing.assert_array_equal(
+            tones_frequencies, frequency_response_result.tones_frequencies
+        )
+        numpy.testing.assert_allclose(expected_gains, frequency_response_result.gains, rtol=1e-3)
+        numpy.testing.assert_allclose(
+            20 * numpy.log10(expected_gains), frequency_response_result.gains_db, atol=1e-2
+        )
+        numpy.testing.assert_allclose(
+            expected_phases_shifts, frequency_response_result.phases_shifts_radians, atol=1e-3
+        )
+
+        with self.assertRaises(ValueError):
+            LabViewFrequencyDomainProcessing.process_multiple_waveforms_block_frequency_response(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=1 / sampling_rate,
+                tones_frequencies=tones_frequencies,
+                stimulus_waveform_index=2,
+                fft_spectrum_window=LabViewFftSpectrumWindow.HANNING,
+            )
+
+    @parameterized.expand([(window,) for window in LabViewFftSpectrumWindow])
+    def test_fft_spectrum_window_is_cached(self, fft_spectrum_window: LabViewFftSpectrumWindow):
+        """Test of numpy FFT spectrum windows creation and cache"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Act
+        window, window_sum, equivalent_noise_bandwidth_bins, _ = (
+            _frequency_domain_analysis.numpy_get_fft_spectrum_window_impl(1000, fft_spectrum_window)
+        )
+        same_window = _frequency_domain_analysis.numpy_get_fft_spectrum_window_impl(
+            1000, fft_spectrum_window
+        )[0]
+
+        # Assert
+        self.assertIs(window, same_window)
+        self.assertFalse(window.flags.writeable)
+        self.assertEqual(1000, window.size)
+        self.assertAlmostEqual(window_sum, window.sum())
+        self.assertGreaterEqual(equivalent_noise_bandwidth_bins, 1.0)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-r", "--repeat", dest="repeat", help="repeat tests")
@@ -14,12 +14,16 @@ import scipy
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis import analysis_library_info
+from nipcbatt.pcbatt_analysis.analysis_library_exceptions import PCBATTAnalysisException
 from nipcbatt.pcbatt_analysis.waveform_analysis.amplitude_and_levels_analysis import (
+    AmplitudeAndLevelsProcessingBackend,
     AmplitudeAndLevelsProcessingMethod,
+    LabViewAmplitudeAndLevels,
 )
 from nipcbatt.pcbatt_analysis.waveform_analysis.pulse_analog_analysis import (
     LabViewPulseAnalogMeasurements,
     PulseAnalogMeasurementPercentLevelsSettings,
+    PulseAnalogProcessingBackend,
     PulseAnalogProcessingExportMode,
     PulseAnalogProcessingPolarity,
     PulseAnalogProcessingReferenceLevels,
@@ -27,6 +31,7 @@ from nipcbatt.pcbatt_analysis.waveform_analysis.pulse_analog_analysis import (
     PulseAnalogProcessingResult,
     WaveformPeriodicityAnalogProcessingResult,
 )
+from nipcbatt.pcbatt_analysis.waveform_creation import square_waveform
 from nipcbatt.pcbatt_utilities import (
     csv_utilities,
     functional_utilities,
@@ -1104,6 +1109,331 @@ class TestLabViewPulseAnalogMeasurements(unittest.TestCase):
         )
 
 
+class TestNumpyPulseAnalogMeasurements(unittest.TestCase):
+    """Provides unit tests of `LabViewPulseAnalogMeasurements` class
+    using numpy processing backend.
+
+    Args:
+        unittest (TestCase): test cases fixture.
+    """  # noqa: D205 - 1 blank line required between summary line and description (auto-generated noqa)
+
+    def setUp(self):
+        # 1 Hz square waveform, high from 0 to 0.5s, low from 0.5s to 1s, over 3.2 seconds
+        self.waveform_sampling_period = 0.001
+        self.waveform_samples = square_waveform.create_square_waveform(
+            amplitude=1.0,
+            frequency=1.0,
+            duty_cycle=0.5,
+            phase=0.0,
+            offset=1.0,
+            samples_count=3200,
+            sampling_rate=1000,
+        ) + numpy.random.default_rng(seed=1).normal(scale=0.01, size=3200)
+        self.reference_levels = PulseAnalogProcessingReferenceLevels(
+            reference_level_high=90, reference_level_middle=50, reference_level_low=10
+        )
+        self.percent_levels_settings = PulseAnalogMeasurementPercentLevelsSettings(
+            amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.HISTOGRAM,
+            histogram_size=256,
+        )
+
+    def tearDown(self):
+        LabViewPulseAnalogMeasurements.set_default_processing_backend(
+            PulseAnalogProcessingBackend.LABVIEW
+        )
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_process_single_waveform_pulse_measurements_export_all_relative_percent_reference_levels(
+        self,
+    ):
+        """Test of `LabViewPulseAnalogMeasurements.process_single_waveform_pulse_measurements`
+        using numpy backend."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        tolerance_percent = 1
+        waveform_t0 = 10.0
+        expected_pulse_centers_per_polarity = {
+            PulseAnalogProcessingPolarity.HIGH: 11.25,
+            PulseAnalogProcessingPolarity.LOW: 10.75,
+        }
+
+        for processing_polarity in expected_pulse_centers_per_polarity:
+            # Act
+            pulse_measurements_result = (
+                LabViewPulseAnalogMeasurements.process_single_waveform_pulse_measurements(
+                    waveform_samples=self.waveform_samples,
+                    waveform_sampling_period_seconds=self.waveform_sampling_period,
+                    waveform_t0=waveform_t0,
+                    pulse_number=1,
+                    export_mode=PulseAnalogProcessingExportMode.ALL,
+                    processing_polarity=processing_polarity,
+                    reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                    reference_levels=self.reference_levels,
+                    percent_levels_settings=self.percent_levels_settings,
+                    pulse_analog_processing_backend=PulseAnalogProcessingBackend.NUMPY,
+                )
+            )
+
+            logging.debug(
+                "%s = %s", nameof(pulse_measurements_result), repr(pulse_measurements_result)
+            )
+
+            # Assert
+            periodicity_result = pulse_measurements_result.waveform_periodicity_processing_result
+            self.assertAlmostEqual(
+                expected_pulse_centers_per_polarity[processing_polarity],
+                pulse_measurements_result.pulse_center,
+                delta=numeric_utilities.percent_of(tolerance_percent, 1.0),
+            )
+            self.assertAlmostEqual(
+                0.5,
+                pulse_measurements_result.pulse_duration,
+                delta=numeric_utilities.percent_of(tolerance_percent, 0.5),
+            )
+            self.assertAlmostEqual(1.8, pulse_measurements_result.pulse_reference_level_high, 1)
+            self.assertAlmostEqual(1.0, pulse_measurements_result.pulse_reference_level_middle, 1)
+            self.assertAlmostEqual(0.2, pulse_measurements_result.pulse_reference_level_low, 1)
+            self.assertAlmostEqual(
+                1.0, periodicity_result.period, delta=numeric_utilities.percent_of(1, 1.0)
+            )
+            self.assertAlmostEqual(
+                1.0, periodicity_result.frequency, delta=numeric_utilities.percent_of(1, 1.0)
+            )
+            self.assertAlmostEqual(
+                0.5, periodicity_result.duty_cycle, delta=numeric_utilities.percent_of(1, 0.5)
+            )
+
+    def test_process_single_waveform_multiple_pulse_measurements_ignores_glitches(self):
+        """Test of
+        `LabViewPulseAnalogMeasurements.process_single_waveform_multiple_pulse_measurements`
+        using numpy backend, glitches not reaching the high reference level are not pulses."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_samples = self.waveform_samples.copy()
+        # ringing around middle level while waveform is low
+        waveform_samples[700:710] = [0.0, 1.2, 0.8, 1.3, 0.7, 1.1, 0.9, 1.05, 0.95, 0.0]
+        LabViewPulseAnalogMeasurements.set_default_processing_backend(
+            PulseAnalogProcessingBackend.NUMPY
+        )
+
+        # Act
+        pulse_measurements_results = list(
+            LabViewPulseAnalogMeasurements.process_single_waveform_multiple_pulse_measurements(
+                waveform_samples=waveform_samples,
+                waveform_sampling_period_seconds=self.waveform_sampling_period,
+                waveform_t0=0,
+                export_mode=PulseAnalogProcessingExportMode.IGNORE_WAVEFORM_PERIODICITY_ANALYSIS,
+                processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.ABSOLUTE,
+                reference_levels=PulseAnalogProcessingReferenceLevels(
+                    reference_level_high=1.8, reference_level_middle=1.0, reference_level_low=0.2
+                ),
+                percent_levels_settings=None,
+            )
+        )
+
+        # Assert, last high state is not a pulse, waveform stops before its falling edge
+        self.assertEqual(2, len(pulse_measurements_results))
+        numpy.testing.assert_allclose(
+            [1.25, 2.25],
+            [result.pulse_center for result in pulse_measurements_results],
+            atol=0.002,
+        )
+        numpy.testing.assert_allclose(
+            [0.5, 0.5],
+            [result.pulse_duration for result in pulse_measurements_results],
+            atol=0.002,
+        )
+        for pulse_measurements_result in pulse_measurements_results:
+            self.assertIsNone(pulse_measurements_result.waveform_periodicity_processing_result)
+
+    def test_process_single_waveform_pulse_measurements_pulse_is_not_found(self):
+        """Test of `LabViewPulseAnalogMeasurements.process_single_waveform_pulse_measurements`
+        using numpy backend when requested pulse is not in waveform."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # the third pulse has no following pulse, its period is unknown
+        with self.assertRaises(PCBATTAnalysisException):
+            LabViewPulseAnalogMeasurements.process_single_waveform_pulse_measurements(
+                waveform_samples=self.waveform_samples,
+                waveform_sampling_period_seconds=self.waveform_sampling_period,
+                waveform_t0=0,
+                pulse_number=3,
+                export_mode=PulseAnalogProcessingExportMode.ALL,
+                processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                reference_levels=self.reference_levels,
+                percent_levels_settings=self.percent_levels_settings,
+                pulse_analog_processing_backend=PulseAnalogProcessingBackend.NUMPY,
+            )
+
+    def test_process_multiple_waveforms_block_pulse_measurements(self):
+        """Test of
+        `LabViewPulseAnalogMeasurements.process_multiple_waveforms_block_pulse_measurements`
+        using numpy backend, with states of waveforms already processed."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveforms_samples = numpy.stack(
+            [self.waveform_samples, numpy.full(3200, 0.5), 2 - self.waveform_samples]
+        )
+        waveforms_state_levels = (
+            LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=self.waveform_sampling_period,
+                amplitude_and_levels_processing_method=AmplitudeAndLevelsProcessingMethod.HISTOGRAM,
+                histogram_size=256,
+                amplitude_and_levels_processing_backend=AmplitudeAndLevelsProcessingBackend.NUMPY,
+            )
+        )
+
+        # Act
+        pulse_measurements_results = (
+            LabViewPulseAnalogMeasurements.process_multiple_waveforms_block_pulse_measurements(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=self.waveform_sampling_period,
+                waveforms_t0=[0, 0, 0],
+                pulse_number=1,
+                export_mode=PulseAnalogProcessingExportMode.ALL,
+                processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                reference_levels=self.reference_levels,
+                percent_levels_settings=self.percent_levels_settings,
+                waveforms_state_levels=waveforms_state_levels,
+                pulse_analog_processing_backend=PulseAnalogProcessingBackend.NUMPY,
+            )
+        )
+        results_per_waveform = list(pulse_measurements_results.results_per_waveform())
+
+        # Assert
+        numpy.testing.assert_array_equal(
+            [True, False, True], pulse_measurements_results.pulses_found
+        )
+        numpy.testing.assert_allclose(
+            [1.25, 0.75],
+            pulse_measurements_results.pulse_centers[[0, 2]],
+            atol=0.002,
+        )
+        numpy.testing.assert_allclose(
+            [1, 1], pulse_measurements_results.periods[[0, 2]], atol=0.002
+        )
+        numpy.testing.assert_allclose(
+            [0.5, 0.5], pulse_measurements_results.duty_cycles[[0, 2]], atol=0.002
+        )
+        self.assertIsNone(results_per_waveform[1])
+        self.assertAlmostEqual(
+            pulse_measurements_results.pulse_durations[0], results_per_waveform[0].pulse_duration
+        )
+        self.assertAlmostEqual(
+            1.0, results_per_waveform[2].waveform_periodicity_processing_result.frequency, 2
+        )
+
+    def test_detect_multiple_waveforms_block_periodicity(self):
+        """Test of `LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity`,
+        constant waveforms and single steps are not periodic."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        single_step_samples = numpy.zeros(3200)
+        single_step_samples[1600:] = 2.0
+        waveforms_samples = numpy.vstack(
+            [
+                self.waveform_samples,
+                numpy.full(3200, 1.5),
+                single_step_samples,
+                2.0 - self.waveform_samples,
+            ]
+        )
+
+        # Act
+        waveforms_are_periodic = (
+            LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity(
+                waveforms_samples=waveforms_samples,
+                processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                reference_levels=self.reference_levels,
+                percent_levels_settings=self.percent_levels_settings,
+            )
+        )
+
+        # Assert
+        numpy.testing.assert_array_equal([True, False, False, True], waveforms_are_periodic)
+
+    def test_detect_multiple_waveforms_block_periodicity_of_noisy_dc_waveforms(self):
+        """Test of `LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity`,
+        noisy DC waveforms are not periodic whatever the method processing their states."""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        # four 3.3 V rails with 2 mV noise, then the square waveform
+        waveforms_samples = numpy.vstack(
+            [
+                3.3 + numpy.random.default_rng(seed=2).normal(scale=0.002, size=(4, 3200)),
+                self.waveform_samples,
+            ]
+        )
+
+        for amplitude_and_levels_processing_method in (
+            AmplitudeAndLevelsProcessingMethod.HISTOGRAM,
+            AmplitudeAndLevelsProcessingMethod.PEAK,
+            AmplitudeAndLevelsProcessingMethod.AUTO_SELECT,
+        ):
+            percent_levels_settings = PulseAnalogMeasurementPercentLevelsSettings(
+                amplitude_and_levels_processing_method=amplitude_and_levels_processing_method,
+                histogram_size=256,
+            )
+            waveforms_state_levels = LabViewAmplitudeAndLevels.process_multiple_waveforms_block_amplitude_and_levels(
+                waveforms_samples=waveforms_samples,
+                waveforms_sampling_period_seconds=self.waveform_sampling_period,
+                amplitude_and_levels_processing_method=amplitude_and_levels_processing_method,
+                histogram_size=256,
+                amplitude_and_levels_processing_backend=AmplitudeAndLevelsProcessingBackend.NUMPY,
+            )
+
+            # Act
+            waveforms_are_periodic = (
+                LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity(
+                    waveforms_samples=waveforms_samples,
+                    processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                    reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                    reference_levels=self.reference_levels,
+                    percent_levels_settings=percent_levels_settings,
+                    waveforms_state_levels=waveforms_state_levels,
+                    minimum_amplitude=0.05,
+                )
+            )
+            waveforms_are_periodic_from_peak_to_peak = (
+                LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity(
+                    waveforms_samples=waveforms_samples,
+                    processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                    reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                    reference_levels=self.reference_levels,
+                    percent_levels_settings=percent_levels_settings,
+                    minimum_amplitude=0.05,
+                )
+            )
+
+            # Assert
+            numpy.testing.assert_array_equal(
+                [False, False, False, False, True], waveforms_are_periodic
+            )
+            numpy.testing.assert_array_equal(
+                [False, False, False, False, True], waveforms_are_periodic_from_peak_to_peak
+            )
+
+        with self.assertRaises(ValueError):
+            LabViewPulseAnalogMeasurements.detect_multiple_waveforms_block_periodicity(
+                waveforms_samples=waveforms_samples,
+                processing_polarity=PulseAnalogProcessingPolarity.HIGH,
+                reference_levels_unit=PulseAnalogProcessingReferenceLevelsUnit.RELATIVE_PERCENT,
+                reference_levels=self.reference_levels,
+                percent_levels_settings=self.percent_levels_settings,
+                minimum_amplitude=-1.0,
+            )
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-r", "--repeat", dest="repeat", help="repeat tests")
@@ -1,12 +1,14 @@
 """Provides unit tests related to multitones_waveform.py module"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (177 > 100 characters) (auto-generated noqa)
 
 import logging
+import math
 import os
 import platform
 import sys
 import unittest
 from pathlib import Path
 
+import numpy
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis.waveform_creation import multitones_waveform
@@ -139,6 +141,7 @@ class TestMultitonesWaveform(unittest.TestCase):
             ],
             samples_count=tones_samples_count,
             sampling_rate=tones_sampling_rate,
+            amplitude_normalization_enabled=True,
         )
 
         multiple_tones_samples_max = multiple_tones_samples.max()
@@ -171,6 +174,109 @@ class TestMultitonesWaveform(unittest.TestCase):
             delta=numeric_utilities.percent_of(tolerance_percent, multiple_tones_amplitude),
         )
 
+    def test_create_multitones_waveform_matches_per_sample_computation(self):
+        """Test of `multitones_waveform.create_multitones_waveform` function
+        against a per-sample computation, over several samples chunks"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_tones = [
+            multitones_waveform.WaveformTone(frequency=1000, amplitude=1.0, phase_radians=0.0),
+            multitones_waveform.WaveformTone(frequency=3100, amplitude=0.5, phase_radians=1.0),
+            multitones_waveform.WaveformTone(frequency=7900, amplitude=0.2, phase_radians=2.5),
+            multitones_waveform.WaveformTone(frequency=12000, amplitude=0.1, phase_radians=4.0),
+        ]
+        samples_count, sampling_rate = 150001, 100000
+
+        expected_samples = numpy.array(
+            [
+                sum(
+                    waveform_tone.amplitude
+                    * math.sin(
+                        waveform_tone.phase_radians
+                        + sample_index * 2.0 * math.pi * waveform_tone.frequency / sampling_rate
+                    )
+                    for waveform_tone in waveform_tones
+                )
+                for sample_index in range(samples_count)
+            ]
+        )
+
+        # Act
+        multiple_tones_samples = multitones_waveform.create_multitones_waveform(
+            multitones_amplitude=1,
+            waveform_tones=waveform_tones,
+            samples_count=samples_count,
+            sampling_rate=sampling_rate,
+        )
+
+        # Assert
+        numpy.testing.assert_allclose(multiple_tones_samples, expected_samples, rtol=0, atol=1e-9)
+
+    def test_create_multitones_waveform_normalized_into_float32_buffer(self):
+        """Test of `multitones_waveform.create_multitones_waveform` function
+        with amplitude normalization and caller supplied float32 buffer"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        multiple_tones_amplitude = 2.0
+        waveform_tones = [
+            multitones_waveform.WaveformTone(frequency=440, amplitude=1.0, phase_radians=0.0),
+            multitones_waveform.WaveformTone(frequency=880, amplitude=1.0, phase_radians=0.0),
+        ]
+        samples_buffer = numpy.zeros(shape=100000, dtype=numpy.float32)
+
+        # Act
+        multiple_tones_samples = multitones_waveform.create_multitones_waveform(
+            multitones_amplitude=multiple_tones_amplitude,
+            waveform_tones=waveform_tones,
+            samples_count=samples_buffer.size,
+            sampling_rate=44100,
+            amplitude_normalization_enabled=True,
+            out=samples_buffer,
+        )
+        not_normalized_samples = multitones_waveform.create_multitones_waveform(
+            multitones_amplitude=multiple_tones_amplitude,
+            waveform_tones=waveform_tones,
+            samples_count=samples_buffer.size,
+            sampling_rate=44100,
+        )
+
+        # Assert
+        self.assertIs(samples_buffer, multiple_tones_samples)
+        self.assertAlmostEqual(multiple_tones_amplitude, float(samples_buffer.max()), places=5)
+        numpy.testing.assert_allclose(
+            samples_buffer,
+            not_normalized_samples * (multiple_tones_amplitude / not_normalized_samples.max()),
+            atol=1e-5,
+        )
+
+    def test_generate_multitones_waveform_chunks_is_phase_continuous(self):
+        """Test of `multitones_waveform.generate_multitones_waveform_chunks` function
+        against samples created at once"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_tones = [
+            multitones_waveform.WaveformTone(frequency=100.0, amplitude=1.0, phase_radians=0.0),
+            multitones_waveform.WaveformTone(frequency=230.0, amplitude=0.4, phase_radians=1.2),
+            multitones_waveform.WaveformTone(frequency=470.0, amplitude=0.1, phase_radians=-0.5),
+        ]
+        expected_samples = multitones_waveform.create_multitones_waveform(
+            multitones_amplitude=1.0,
+            waveform_tones=waveform_tones,
+            samples_count=10000,
+            sampling_rate=10000.0,
+        )
+
+        # Act
+        samples_chunks = list(
+            multitones_waveform.generate_multitones_waveform_chunks(
+                waveform_tones=waveform_tones,
+                chunk_samples_count=3333,
+                sampling_rate=10000.0,
+                samples_count=10000,
+            )
+        )
+
+        # Assert
+        self.assertEqual(4, len(samples_chunks))
+        numpy.testing.assert_array_equal(numpy.concatenate(samples_chunks), expected_samples)
+
 
 if __name__ == "__main__":
     unittest.main()
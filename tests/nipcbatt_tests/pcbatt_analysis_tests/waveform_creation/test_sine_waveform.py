@@ -1,18 +1,25 @@
 """Provides unit tests related to sine_waveform.py module"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (171 > 100 characters) (auto-generated noqa)
 
 import logging
+import math
 import os
 import platform
 import sys
+import time
 import unittest
+from itertools import islice
 from pathlib import Path
 
+import numpy
 from parameterized import parameterized
 from varname import nameof
 
 from nipcbatt.pcbatt_analysis.waveform_creation import sine_waveform
 from nipcbatt.pcbatt_utilities import csv_utilities
 
+# Benchmarks compare durations, they are skipped unless this environment variable is set.
+BENCHMARKS_ENVIRONMENT_VARIABLE_NAME = "NIPCBATT_RUN_BENCHMARKS"
+
 
 class TestSineWaveform(unittest.TestCase):
     """Defines a test fixture that checks creation functions of module
@@ -147,6 +154,278 @@ class TestSineWaveform(unittest.TestCase):
         # Assert
         self.assertEqual(first=expected_samples_count, second=waveform_samples.size)
 
+    @parameterized.expand([("sine", math.sin), ("cosine", math.cos)])
+    def test_create_sinusoid_waveform_matches_per_sample_computation(
+        self, sinusoid_name: str, math_sinusoid_function
+    ):
+        """Test of `sin_waveform.create_sine_waveform` and `sin_waveform.create_cosine_waveform`
+        functions against a per-sample computation, over several samples chunks"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        amplitude, frequency, phase, offset = 2.5, 1234.5, 7.0, -0.5
+        samples_count, sampling_rate = 200003, 100000.0
+        create_waveform = getattr(sine_waveform, f"create_{sinusoid_name}_waveform")
+
+        expected_samples = numpy.array(
+            [
+                offset
+                + amplitude
+                * math_sinusoid_function(
+                    phase % (2.0 * math.pi)
+                    + sample_index * 2.0 * math.pi * frequency / sampling_rate
+                )
+                for sample_index in range(samples_count)
+            ]
+        )
+
+        # Act
+        waveform_samples = create_waveform(
+            amplitude=amplitude,
+            frequency=frequency,
+            phase=phase,
+            offset=offset,
+            samples_count=samples_count,
+            sampling_rate=sampling_rate,
+        )
+
+        # Assert
+        self.assertEqual(numpy.float64, waveform_samples.dtype)
+        numpy.testing.assert_allclose(waveform_samples, expected_samples, rtol=0, atol=1e-9)
+
+    def test_create_sine_waveform_into_float32_buffer(self):
+        """Test of `sin_waveform.create_sine_waveform` function with caller supplied buffer"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        samples_buffer = numpy.zeros(shape=100000, dtype=numpy.float32)
+
+        # Act
+        waveform_samples = sine_waveform.create_sine_waveform(
+            amplitude=1.0,
+            frequency=60.0,
+            phase=0.0,
+            offset=1.0,
+            samples_count=samples_buffer.size,
+            sampling_rate=10000.0,
+            out=samples_buffer,
+        )
+        float64_waveform_samples = sine_waveform.create_sine_waveform(
+            amplitude=1.0,
+            frequency=60.0,
+            phase=0.0,
+            offset=1.0,
+            samples_count=samples_buffer.size,
+            sampling_rate=10000.0,
+        )
+        float32_waveform_samples = sine_waveform.create_sine_waveform(
+            amplitude=1.0,
+            frequency=60.0,
+            phase=0.0,
+            offset=1.0,
+            samples_count=samples_buffer.size,
+            sampling_rate=10000.0,
+            dtype=numpy.float32,
+        )
+
+        # Assert
+        self.assertIs(samples_buffer, waveform_samples)
+        self.assertEqual(numpy.float32, float32_waveform_samples.dtype)
+        numpy.testing.assert_array_equal(samples_buffer, float32_waveform_samples)
+        numpy.testing.assert_allclose(samples_buffer, float64_waveform_samples, atol=1e-6)
+
+    @parameterized.expand(
+        [
+            ("Buffer_Too_Small", numpy.zeros(shape=99, dtype=numpy.float64), None),
+            ("Buffer_Of_Integers", numpy.zeros(shape=100, dtype=numpy.int32), None),
+            ("Type_Not_Supported", None, numpy.int16),
+        ]
+    )
+    def test_create_sine_waveform_with_invalid_buffer(
+        self, case_name: str, samples_buffer: numpy.ndarray, samples_type
+    ):
+        """Test of `sin_waveform.create_sine_waveform` function with invalid buffer or type"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        logging.debug("%s = %s", nameof(case_name), case_name)
+
+        with self.assertRaises(ValueError):
+            sine_waveform.create_sine_waveform(
+                amplitude=1.0,
+                frequency=60.0,
+                phase=0.0,
+                offset=0.0,
+                samples_count=100,
+                sampling_rate=6000.0,
+                out=samples_buffer,
+                dtype=numpy.float64 if samples_type is None else samples_type,
+            )
+
+    def test_create_sine_waveform_matches_per_sample_loop(self):
+        """Test of `sin_waveform.create_sine_waveform` function against
+        samples computed by a per-sample loop"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        amplitude, frequency, phase, offset = 1.0, 1000.0, 0.25, 0.0
+        samples_count, sampling_rate = 100000, 1000000.0
+
+        # Act
+        per_sample_loop_samples = TestSineWaveform._create_sine_waveform_per_sample_loop(
+            amplitude, frequency, phase, offset, samples_count, sampling_rate
+        )
+        waveform_samples = sine_waveform.create_sine_waveform(
+            amplitude=amplitude,
+            frequency=frequency,
+            phase=phase,
+            offset=offset,
+            samples_count=samples_count,
+            sampling_rate=sampling_rate,
+        )
+
+        # Assert
+        numpy.testing.assert_allclose(waveform_samples, per_sample_loop_samples, rtol=0, atol=1e-9)
+
+    @unittest.skipUnless(
+        os.environ.get(BENCHMARKS_ENVIRONMENT_VARIABLE_NAME),
+        f"benchmarks run only when {BENCHMARKS_ENVIRONMENT_VARIABLE_NAME} is set",
+    )
+    def test_create_sine_waveform_benchmark(self):
+        """Benchmark of `sin_waveform.create_sine_waveform` function against
+        a per-sample loop, for 1 s of samples at 1 MS/s, vectorized creation must be
+        more than 5 times faster"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        amplitude, frequency, phase, offset = 1.0, 1000.0, 0.25, 0.0
+        samples_count, sampling_rate = 1000000, 1000000.0
+        minimum_speedup_factor = 5
+
+        # Act
+        start_time = time.perf_counter()
+        TestSineWaveform._create_sine_waveform_per_sample_loop(
+            amplitude, frequency, phase, offset, samples_count, sampling_rate
+        )
+        per_sample_loop_duration_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        sine_waveform.create_sine_waveform(
+            amplitude=amplitude,
+            frequency=frequency,
+            phase=phase,
+            offset=offset,
+            samples_count=samples_count,
+            sampling_rate=sampling_rate,
+        )
+        vectorized_duration_seconds = time.perf_counter() - start_time
+
+        logging.debug(
+            "%s = %s", nameof(per_sample_loop_duration_seconds), per_sample_loop_duration_seconds
+        )
+        logging.debug("%s = %s", nameof(vectorized_duration_seconds), vectorized_duration_seconds)
+
+        # Assert
+        self.assertLess(
+            vectorized_duration_seconds * minimum_speedup_factor, per_sample_loop_duration_seconds
+        )
+
+    @staticmethod
+    def _create_sine_waveform_per_sample_loop(
+        amplitude: float,
+        frequency: float,
+        phase: float,
+        offset: float,
+        samples_count: int,
+        sampling_rate: float,
+    ) -> numpy.ndarray:
+        samples_buffer = numpy.empty(shape=samples_count, dtype=numpy.float64)
+        numerator = 2.0 * math.pi * frequency / sampling_rate
+        for sample_index in range(samples_count):
+            samples_buffer[sample_index] = offset + amplitude * math.sin(
+                phase + sample_index * numerator
+            )
+
+        return samples_buffer
+
+    @parameterized.expand(
+        [
+            (sine_waveform.create_sine_waveform, sine_waveform.generate_sine_waveform_chunks),
+            (sine_waveform.create_cosine_waveform, sine_waveform.generate_cosine_waveform_chunks),
+        ]
+    )
+    def test_generate_sinusoid_waveform_chunks_is_phase_continuous(
+        self, create_waveform_function, generate_waveform_chunks_function
+    ):
+        """Test of `sine_waveform` chunks generation functions
+        against samples created at once"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        expected_samples = create_waveform_function(
+            amplitude=1.5,
+            frequency=61.3,
+            phase=0.7,
+            offset=0.2,
+            samples_count=10000,
+            sampling_rate=6000.0,
+        )
+
+        # Act
+        samples_chunks = list(
+            generate_waveform_chunks_function(
+                amplitude=1.5,
+                frequency=61.3,
+                phase=0.7,
+                offset=0.2,
+                chunk_samples_count=3000,
+                sampling_rate=6000.0,
+                samples_count=10000,
+            )
+        )
+
+        # Assert
+        self.assertEqual([3000, 3000, 3000, 1000], [chunk.size for chunk in samples_chunks])
+        numpy.testing.assert_array_equal(numpy.concatenate(samples_chunks), expected_samples)
+
+    def test_generate_sine_waveform_chunks_endlessly(self):
+        """Test of `sine_waveform.generate_sine_waveform_chunks` function
+        when no samples count is given"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        expected_samples = sine_waveform.create_sine_waveform(
+            amplitude=1.0,
+            frequency=50.0,
+            phase=0.0,
+            offset=0.0,
+            samples_count=5000,
+            sampling_rate=1000.0,
+            dtype=numpy.float32,
+        )
+
+        # Act
+        samples_chunks = list(
+            islice(
+                sine_waveform.generate_sine_waveform_chunks(
+                    amplitude=1.0,
+                    frequency=50.0,
+                    phase=0.0,
+                    offset=0.0,
+                    chunk_samples_count=1000,
+                    sampling_rate=1000.0,
+                    dtype=numpy.float32,
+                ),
+                5,
+            )
+        )
+
+        # Assert
+        self.assertTrue(all(chunk.dtype == numpy.float32 for chunk in samples_chunks))
+        numpy.testing.assert_array_equal(numpy.concatenate(samples_chunks), expected_samples)
+
+    @parameterized.expand([(0, None), (1000, 0), (1000, -10)])
+    def test_generate_sine_waveform_chunks_with_invalid_samples_counts(
+        self, chunk_samples_count, samples_count
+    ):
+        """Test of `sine_waveform.generate_sine_waveform_chunks` function
+        with invalid samples counts"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        with self.assertRaises(ValueError):
+            sine_waveform.generate_sine_waveform_chunks(
+                amplitude=1.0,
+                frequency=50.0,
+                phase=0.0,
+                offset=0.0,
+                chunk_samples_count=chunk_samples_count,
+                sampling_rate=1000.0,
+                samples_count=samples_count,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 """Provides unit tests related to square_waveform.py module"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (173 > 100 characters) (auto-generated noqa)
 
 import logging
+import math
 import os
 import platform
 import sys
@@ -8,6 +9,7 @@ import unittest
 from pathlib import Path
 
 import numpy
+import scipy.signal
 from parameterized import parameterized
 from varname import nameof
 
@@ -178,6 +180,127 @@ class TestSquareWaveform(unittest.TestCase):
         self.assertEqual(first=expected_waveform_max, second=actual_waveform_max)
         self.assertEqual(first=expected_waveform_min, second=actual_waveform_min)
 
+    @parameterized.expand(
+        [
+            ("Phase=0.0", 0.0, 0.25),
+            ("Phase=0.5_PI", 0.5 * numpy.pi, 0.5),
+            ("Phase=1.5_PI", 1.5 * numpy.pi, 0.75),
+            ("Phase=-3.0", -3.0, 0.1),
+        ]
+    )
+    def test_create_square_waveform_matches_rolled_reference(
+        self, case_name: str, phase: float, duty_cycle: float
+    ):
+        """Test of `square_waveform.create_square_waveform` function
+        against a reference built with scipy.signal.square and numpy.roll"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        logging.debug("%s = %s", nameof(case_name), case_name)
+
+        # Arrange
+        amplitude, frequency, offset = 2.0, 1000.0, 0.5
+        samples_count, sampling_rate = 150001, 1000000.0
+
+        delay = math.floor(
+            sampling_rate * ((phase % (2 * numpy.pi)) * (1 / frequency) / (2 * numpy.pi))
+        )
+        expected_samples = numpy.roll(
+            amplitude
+            * scipy.signal.square(
+                t=(2 * numpy.pi * frequency) * (numpy.arange(samples_count) * (1 / sampling_rate)),
+                duty=duty_cycle,
+            )
+            + offset,
+            delay,
+        )
+
+        # Act
+        waveform_samples = square_waveform.create_square_waveform(
+            amplitude=amplitude,
+            frequency=frequency,
+            duty_cycle=duty_cycle,
+            phase=phase,
+            offset=offset,
+            samples_count=samples_count,
+            sampling_rate=sampling_rate,
+        )
+
+        # Assert
+        numpy.testing.assert_array_equal(waveform_samples, expected_samples)
+
+    def test_create_square_waveform_into_float32_buffer(self):
+        """Test of `square_waveform.create_square_waveform` function
+        with caller supplied float32 buffer"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        samples_buffer = numpy.zeros(shape=10000, dtype=numpy.float32)
+
+        # Act
+        waveform_samples = square_waveform.create_square_waveform(
+            amplitude=1.0,
+            frequency=60.0,
+            duty_cycle=0.5,
+            phase=numpy.pi,
+            offset=1.0,
+            samples_count=samples_buffer.size,
+            sampling_rate=6000.0,
+            out=samples_buffer,
+        )
+        float64_waveform_samples = square_waveform.create_square_waveform(
+            amplitude=1.0,
+            frequency=60.0,
+            duty_cycle=0.5,
+            phase=numpy.pi,
+            offset=1.0,
+            samples_count=samples_buffer.size,
+            sampling_rate=6000.0,
+        )
+
+        # Assert
+        self.assertIs(samples_buffer, waveform_samples)
+        numpy.testing.assert_array_equal(samples_buffer, float64_waveform_samples)
+
+    @parameterized.expand([(0.0,), (numpy.pi / 2,), (4.0,)])
+    def test_generate_square_waveform_chunks_is_phase_continuous(self, phase: float):
+        """Test of `square_waveform.generate_square_waveform_chunks` function
+        against samples created at once"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        frequency = 60.0
+        sampling_rate = 6000.0
+        expected_samples = square_waveform.create_square_waveform(
+            amplitude=1.0,
+            frequency=frequency,
+            duty_cycle=0.3,
+            phase=phase,
+            offset=0.5,
+            samples_count=10000,
+            sampling_rate=sampling_rate,
+        )
+        # delayed samples are wrapped around by creation at once, not by chunks generation
+        delay = math.floor(sampling_rate * (phase % (2 * numpy.pi)) / (2 * numpy.pi * frequency))
+
+        # Act
+        samples_chunks = list(
+            square_waveform.generate_square_waveform_chunks(
+                amplitude=1.0,
+                frequency=frequency,
+                duty_cycle=0.3,
+                phase=phase,
+                offset=0.5,
+                chunk_samples_count=4096,
+                sampling_rate=sampling_rate,
+                samples_count=10000,
+            )
+        )
+        generated_samples = numpy.concatenate(samples_chunks)
+
+        # Assert
+        self.assertEqual(10000, generated_samples.size)
+        numpy.testing.assert_array_equal(generated_samples[delay:], expected_samples[delay:])
+        # samples before the delay are the end of the previous period of the square wave
+        samples_per_period = int(sampling_rate / frequency)
+        numpy.testing.assert_array_equal(
+            generated_samples[:delay],
+            generated_samples[samples_per_period : samples_per_period + delay],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,183 @@
+"""Provides unit tests related to waveform_cache.py module"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+import logging
+import platform
+import sys
+import unittest
+
+import numpy
+from varname import nameof
+
+from nipcbatt.pcbatt_analysis.waveform_creation import (
+    multitones_waveform,
+    sine_waveform,
+    square_waveform,
+    waveform_cache,
+)
+
+
+class TestWaveformCache(unittest.TestCase):
+    """Defines a test fixture that checks functions of module
+    `waveform_cache`.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def setUp(self):
+        waveform_cache.clear_waveform_cache()
+
+    def tearDown(self):
+        waveform_cache.disable_waveform_cache()
+        waveform_cache.clear_waveform_cache()
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+        logging.debug("platform architecture = %s", platform.architecture())
+        logging.debug("current script path = %s", __file__)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_waveform_cache_is_disabled_by_default(self):
+        """Test of `sine_waveform.create_sine_waveform` function when cache is disabled"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Act
+        first_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        second_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        statistics = waveform_cache.get_waveform_cache_statistics()
+
+        # Assert
+        self.assertFalse(waveform_cache.is_waveform_cache_enabled())
+        self.assertIsNot(first_samples, second_samples)
+        self.assertTrue(first_samples.flags.writeable)
+        self.assertEqual(0, statistics.hits_count)
+        self.assertEqual(0, statistics.misses_count)
+        self.assertEqual(0, statistics.cached_waveforms_count)
+
+    def test_waveform_cache_returns_read_only_cached_waveform(self):
+        """Test of `waveform_cache` when same waveform is created several times"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_cache.enable_waveform_cache()
+        waveform_tones = [
+            multitones_waveform.WaveformTone(frequency=100, amplitude=1.0, phase_radians=0.0),
+            multitones_waveform.WaveformTone(frequency=300, amplitude=0.5, phase_radians=0.0),
+        ]
+
+        # Act
+        first_sine_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        second_sine_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        first_multitones_samples = multitones_waveform.create_multitones_waveform(
+            1.0, waveform_tones, 1000, 10000.0
+        )
+        second_multitones_samples = multitones_waveform.create_multitones_waveform(
+            1.0, list(waveform_tones), 1000, 10000.0
+        )
+        statistics = waveform_cache.get_waveform_cache_statistics()
+
+        logging.debug("%s = %s", nameof(statistics), repr(statistics))
+
+        # Assert
+        self.assertIs(first_sine_samples, second_sine_samples)
+        self.assertIs(first_multitones_samples, second_multitones_samples)
+        self.assertFalse(first_sine_samples.flags.writeable)
+        with self.assertRaises(ValueError):
+            first_sine_samples[0] = 1.0
+        self.assertEqual(2, statistics.hits_count)
+        self.assertEqual(2, statistics.misses_count)
+        self.assertEqual(2, statistics.cached_waveforms_count)
+
+    def test_waveform_cache_distinguishes_parameters(self):
+        """Test of `waveform_cache` when waveforms parameters differ"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_cache.enable_waveform_cache()
+
+        # Act
+        sine_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        cosine_samples = sine_waveform.create_cosine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        offset_sine_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 1.0, 1000, 6000.0)
+        float32_sine_samples = sine_waveform.create_sine_waveform(
+            1.0, 60.0, 0.0, 0.0, 1000, 6000.0, dtype=numpy.float32
+        )
+        square_samples = square_waveform.create_square_waveform(
+            1.0, 60.0, 0.5, 0.0, 0.0, 1000, 6000.0
+        )
+        statistics = waveform_cache.get_waveform_cache_statistics()
+
+        # Assert
+        self.assertEqual(0, statistics.hits_count)
+        self.assertEqual(5, statistics.misses_count)
+        self.assertEqual(numpy.float32, float32_sine_samples.dtype)
+        numpy.testing.assert_allclose(offset_sine_samples, sine_samples + 1.0)
+        self.assertFalse(numpy.array_equal(sine_samples, cosine_samples))
+        self.assertFalse(numpy.array_equal(sine_samples, square_samples))
+
+    def test_waveform_cache_copies_cached_waveform_into_supplied_buffer(self):
+        """Test of `waveform_cache` when a buffer is supplied by the caller"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_cache.enable_waveform_cache()
+        samples_buffer = numpy.zeros(shape=1000, dtype=numpy.float64)
+        cached_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+
+        # Act
+        samples = sine_waveform.create_sine_waveform(
+            1.0, 60.0, 0.0, 0.0, 1000, 6000.0, out=samples_buffer
+        )
+        samples[0] = 10.0
+
+        # Assert
+        self.assertIs(samples_buffer, samples)
+        self.assertEqual(1, waveform_cache.get_waveform_cache_statistics().hits_count)
+        numpy.testing.assert_array_equal(samples_buffer[1:], cached_samples[1:])
+        self.assertEqual(0.0, cached_samples[0])
+
+    def test_waveform_cache_evicts_least_recently_used_waveform(self):
+        """Test of `waveform_cache` when cache is full"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_cache.enable_waveform_cache(max_cached_waveforms_count=2)
+
+        # Act
+        sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        sine_waveform.create_sine_waveform(2.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        # use first waveform, second one becomes least recently used
+        sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        sine_waveform.create_sine_waveform(3.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        sine_waveform.create_sine_waveform(2.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        statistics = waveform_cache.get_waveform_cache_statistics()
+
+        # Assert
+        self.assertEqual(2, statistics.hits_count)
+        self.assertEqual(4, statistics.misses_count)
+        self.assertEqual(2, statistics.cached_waveforms_count)
+        self.assertEqual(2, statistics.max_cached_waveforms_count)
+
+    def test_clear_waveform_cache(self):
+        """Test of `waveform_cache.clear_waveform_cache` function"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        # Arrange
+        waveform_cache.enable_waveform_cache()
+        first_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+
+        # Act
+        waveform_cache.clear_waveform_cache()
+        second_samples = sine_waveform.create_sine_waveform(1.0, 60.0, 0.0, 0.0, 1000, 6000.0)
+        statistics = waveform_cache.get_waveform_cache_statistics()
+
+        # Assert
+        self.assertIsNot(first_samples, second_samples)
+        self.assertEqual(0, statistics.hits_count)
+        self.assertEqual(1, statistics.misses_count)
+        self.assertEqual(1, statistics.cached_waveforms_count)
+
+    def test_enable_waveform_cache_with_invalid_size(self):
+        """Test of `waveform_cache.enable_waveform_cache` function with invalid size"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        with self.assertRaises(ValueError):
+            waveform_cache.enable_waveform_cache(max_cached_waveforms_count=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Defines unit tests related to nipcbatt.pcbatt_library_core.daq.acquisition_buffers module."""
+
+import logging
+import sys
+import unittest
+
+import numpy
+
+from nipcbatt.pcbatt_library_core.daq.acquisition_buffers import (
+    AcquisitionBuffersManager,
+)
+
+
+class TestAcquisitionBuffersManager(unittest.TestCase):
+    """Defines a test fixture that checks `AcquisitionBuffersManager` class is ready to use.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_buffers_are_not_reused_by_default(self):
+        manager = AcquisitionBuffersManager()
+
+        first_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+        second_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+
+        self.assertEqual(first=0, second=manager.buffers_count)
+        self.assertIsNot(first_buffer, second_buffer)
+
+    def test_buffer_is_reused_when_shape_and_type_are_unchanged(self):
+        manager = AcquisitionBuffersManager(buffers_count=1)
+
+        first_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+        second_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+        float32_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float32)
+        other_shape_buffer = manager.get_buffer("analog_samples", 200, numpy.float32)
+
+        self.assertIs(first_buffer, second_buffer)
+        self.assertEqual(numpy.float32, float32_buffer.dtype)
+        self.assertEqual((200,), other_shape_buffer.shape)
+        self.assertIs(other_shape_buffer, manager.get_buffer("analog_samples", 200, numpy.float32))
+        self.assertIsNot(
+            other_shape_buffer, manager.get_buffer("current_samples", 200, numpy.float32)
+        )
+
+    def test_double_buffering_alternates_buffers(self):
+        manager = AcquisitionBuffersManager(buffers_count=2)
+
+        first_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+        first_buffer[:] = 1.0
+        second_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+        second_buffer[:] = 2.0
+        third_buffer = manager.get_buffer("analog_samples", (2, 100), numpy.float64)
+
+        self.assertIsNot(first_buffer, second_buffer)
+        self.assertIs(first_buffer, third_buffer)
+        numpy.testing.assert_array_equal(2.0, second_buffer)
+
+    def test_buffers_count_change_releases_buffers(self):
+        manager = AcquisitionBuffersManager(buffers_count=1)
+        first_buffer = manager.get_buffer("analog_samples", 100, numpy.float64)
+
+        manager.buffers_count = 2
+
+        self.assertIsNot(first_buffer, manager.get_buffer("analog_samples", 100, numpy.float64))
+        with self.assertRaises(ValueError):
+            manager.buffers_count = 3
+
+
+if __name__ == "__main__":
+    unittest.main()
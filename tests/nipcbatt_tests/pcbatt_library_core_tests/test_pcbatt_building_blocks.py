@@ -9,6 +9,7 @@ from dataclasses import (  # noqa: F401 - 'dataclasses.dataclass' imported but u
     dataclass,
 )
 from enum import Enum  # noqa: F401 - 'enum.Enum' imported but unused (auto-generated noqa)
+from types import SimpleNamespace
 
 import nidaqmx
 from nidaqmx import utils  # noqa: F401 - 'nidaqmx.utils' imported but unused (auto-generated noqa)
@@ -30,15 +31,24 @@ from nidaqmx._task_modules.in_stream import InStream
 from nidaqmx._task_modules.out_stream import OutStream
 from nidaqmx._task_modules.timing import Timing
 from nidaqmx._task_modules.triggers import Triggers
-from nidaqmx.constants import ChannelType, Edge, UsageTypeAI
+from nidaqmx.constants import ChannelType, Edge, TerminalConfiguration, UsageTypeAI
 from nidaqmx.errors import DaqError
+import numpy
 from varname import nameof
 
 import nipcbatt.pcbatt_utilities.reflection_utilities
+from nipcbatt.pcbatt_library.daq.common.voltage_data_types import (
+    VoltageMeasurementChannelAndTerminalRangeParameters,
+    VoltageRangeAndTerminalParameters,
+)
+from nipcbatt.pcbatt_library.daq.dc_rms_voltage_measurements.dc_rms_voltage_measurement import (
+    DcRmsVoltageMeasurement,
+)
 from nipcbatt.pcbatt_library_core.daq.pcbatt_building_blocks import (
     BuildingBlockUsingDAQmx,
     BuildingBlockUsingInstrument,
 )
+from nipcbatt.pcbatt_library_core.pcbatt_library_exceptions import PCBATTLibraryException
 
 
 class TestInstrument:
@@ -519,6 +529,57 @@ class TestBuildingBlockUsingInstrument(unittest.TestCase):
         self.assertEqual(first=expected, second=actual)
 
 
+class MockRawSamplesChannel:
+    """Defines a voltage channel counting the reads of its scaling coefficients."""
+
+    def __init__(self, name: str, scaling_coefficients: list[float]):
+        """Initializes a voltage channel with 16 bits raw samples."""
+        self.name = name
+        self.ai_meas_type = UsageTypeAI.VOLTAGE
+        self.ai_raw_samp_size = 16
+        self.scaling_coefficients = scaling_coefficients
+        self.scaling_coefficients_reads_count = 0
+        self.ai_term_cfg = None
+        self.ai_min = None
+        self._ai_max = None
+
+    @property
+    def ai_dev_scaling_coeff(self) -> list[float]:
+        self.scaling_coefficients_reads_count += 1
+        return self.scaling_coefficients
+
+    @property
+    def ai_max(self) -> float:
+        return self._ai_max
+
+    @ai_max.setter
+    def ai_max(self, value: float):
+        # the device scales a full range of 16 bits samples to the maximum of the range
+        self._ai_max = value
+        self.scaling_coefficients = [0.0, value / 32768.0]
+
+
+class MockRawSamplesChannelCollection(list):
+    """Defines a collection of channels that can be indexed by channel name."""
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return next(channel for channel in self if channel.name == index)
+        return super().__getitem__(index)
+
+
+class MockRawSamplesTask:
+    """Defines a task reading raw samples of the given channels."""
+
+    def __init__(self, channels: list[MockRawSamplesChannel]):
+        """Initializes a task with the channels to read."""
+        self.in_stream = SimpleNamespace(channels_to_read=channels)
+        self.ai_channels = MockRawSamplesChannelCollection(channels)
+
+    def close(self):
+        pass
+
+
 def instrument_factory() -> MockDAQmxTask:
     """Creates an instance of MockDAQmxTask."""
     return MockDAQmxTask()
@@ -574,6 +635,239 @@ class TestBuildingBlockUsingDAQmx(unittest.TestCase):
         self.assertIsInstance(block, BuildingBlockUsingDAQmxForTests)
         self.assertIsInstance(block.task, MockDAQmxTask)
 
+    def test_analysis_workers_count_defaults_to_serial_analysis(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        self.assertEqual(first=1, second=block.analysis_workers_count)
+
+    def test_analysis_workers_count_is_set(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        block.analysis_workers_count = 8
+
+        self.assertEqual(first=8, second=block.analysis_workers_count)
+        self.assertEqual(first=1, second=BuildingBlockUsingDAQmxForTests().analysis_workers_count)
+
+    def test_analysis_workers_count_must_be_greater_than_zero(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        with self.assertRaises(ValueError):
+            block.analysis_workers_count = 0
+
+    def test_raw_samples_are_disabled_by_default(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        self.assertFalse(block.raw_samples_enabled)
+
+    def test_raw_samples_enabled_is_set(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        block.raw_samples_enabled = True
+
+        self.assertTrue(block.raw_samples_enabled)
+        self.assertFalse(BuildingBlockUsingDAQmxForTests().raw_samples_enabled)
+
+    def test_task_properties_snapshot_is_kept_until_invalidated(self):
+        block = BuildingBlockUsingDAQmxForTests()
+
+        task_properties = block.task_properties
+
+        self.assertEqual(first=1, second=task_properties.sampling_rate_hertz)
+        self.assertEqual(first=1, second=task_properties.number_of_samples_per_channel)
+        self.assertEqual(first=("x", "x", "x"), second=task_properties.channels_names)
+        self.assertIs(task_properties, block.task_properties)
+
+        block.invalidate_task_properties()
+
+        self.assertIsNot(task_properties, block.task_properties)
+        self.assertEqual(first=task_properties, second=block.task_properties)
+
+    def test_raw_samples_scaling_coefficients_are_kept_until_invalidated(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        channels = [
+            MockRawSamplesChannel("Dev1/ai0", [0.0, 1.0]),
+            MockRawSamplesChannel("Dev1/ai1", [0.5, 2.0, 3.0]),
+        ]
+        block._instrument = MockRawSamplesTask(channels)
+
+        scaling_coefficients = block.raw_samples_scaling_coefficients
+
+        numpy.testing.assert_array_equal(
+            scaling_coefficients, numpy.array([[0.0, 1.0, 0.0], [0.5, 2.0, 3.0]])
+        )
+        self.assertIs(scaling_coefficients, block.raw_samples_scaling_coefficients)
+        self.assertEqual(
+            first=[1, 1], second=[c.scaling_coefficients_reads_count for c in channels]
+        )
+
+        block.invalidate_task_properties()
+        block.raw_samples_scaling_coefficients
+
+        self.assertEqual(
+            first=[2, 2], second=[c.scaling_coefficients_reads_count for c in channels]
+        )
+
+    def test_raw_samples_scaling_coefficients_follow_range_of_all_channels(self):
+        block = DcRmsVoltageMeasurement()
+        channels = [MockRawSamplesChannel("Dev1/ai0", [0.0, 1.0])]
+        block._instrument = MockRawSamplesTask(channels)
+
+        block.configure_all_channels(
+            VoltageRangeAndTerminalParameters(TerminalConfiguration.RSE, -10.0, 10.0)
+        )
+        first_scaling_coefficients = block.raw_samples_scaling_coefficients
+        block.configure_all_channels(
+            VoltageRangeAndTerminalParameters(TerminalConfiguration.RSE, -1.0, 1.0)
+        )
+        second_scaling_coefficients = block.raw_samples_scaling_coefficients
+
+        numpy.testing.assert_array_equal(
+            first_scaling_coefficients, numpy.array([[0.0, 10.0 / 32768.0]])
+        )
+        numpy.testing.assert_array_equal(
+            second_scaling_coefficients, numpy.array([[0.0, 1.0 / 32768.0]])
+        )
+
+    def test_raw_samples_scaling_coefficients_of_non_voltage_channel_are_rejected(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        channel = MockRawSamplesChannel("Dev1/ai0", [0.0, 1.0])
+        channel.ai_meas_type = UsageTypeAI.CURRENT
+        block._instrument = MockRawSamplesTask([channel])
+
+        with self.assertRaises(PCBATTLibraryException):
+            block.raw_samples_scaling_coefficients
+
+    def test_configuration_is_unchanged_only_when_equal_to_applied_one(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        self.assertFalse(block.is_configuration_unchanged("timing", (1000.0, 100)))
+
+        block.save_applied_configuration("timing", (1000.0, 100))
+
+        self.assertTrue(block.is_configuration_unchanged("timing", (1000.0, 100)))
+        self.assertFalse(block.is_configuration_unchanged("timing", (2000.0, 100)))
+        self.assertFalse(block.is_configuration_unchanged("trigger", (1000.0, 100)))
+
+    def test_configuration_holding_arrays_is_considered_as_changed(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        block.save_applied_configuration("waveform", numpy.zeros(10))
+
+        self.assertFalse(block.is_configuration_unchanged("waveform", numpy.zeros(10)))
+
+    def test_applied_configurations_are_invalidated_by_prefix(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        block.save_applied_configuration("specific_channel:Dev1/ai0", 1)
+        block.save_applied_configuration("specific_channel:Dev1/ai1", 2)
+        block.save_applied_configuration("timing", 3)
+
+        block.invalidate_applied_configurations("specific_channel:")
+
+        self.assertFalse(block.is_configuration_unchanged("specific_channel:Dev1/ai0", 1))
+        self.assertFalse(block.is_configuration_unchanged("specific_channel:Dev1/ai1", 2))
+        self.assertTrue(block.is_configuration_unchanged("timing", 3))
+
+        block.invalidate_applied_configurations()
+
+        self.assertFalse(block.is_configuration_unchanged("timing", 3))
+
+    def test_all_channels_configuration_is_applied_again_after_specific_channel_one(self):
+        block = DcRmsVoltageMeasurement()
+        channel = MockRawSamplesChannel("Dev1/ai0", [0.0, 1.0])
+        block._instrument = MockRawSamplesTask([channel])
+        all_channels_parameters = VoltageRangeAndTerminalParameters(
+            TerminalConfiguration.RSE, -10.0, 10.0
+        )
+
+        block.configure_all_channels(all_channels_parameters)
+        block.configure_specific_channel(
+            VoltageMeasurementChannelAndTerminalRangeParameters(
+                "Dev1/ai0",
+                VoltageRangeAndTerminalParameters(TerminalConfiguration.DIFF, -1.0, 1.0),
+            )
+        )
+        block.configure_all_channels(all_channels_parameters)
+
+        self.assertEqual(first=TerminalConfiguration.RSE, second=channel.ai_term_cfg)
+        self.assertEqual(first=-10.0, second=channel.ai_min)
+        self.assertEqual(first=10.0, second=channel.ai_max)
+
+    def test_task_is_not_prepared_by_default(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        self.assertFalse(block.is_task_prepared)
+
+        block.prepare()
+
+        self.assertTrue(block.is_task_prepared)
+
+        block.unprepare()
+
+        self.assertFalse(block.is_task_prepared)
+
+    def test_prepared_task_is_committed_again_after_configuration_change(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        task_controls = []
+        block.task.control = lambda action: task_controls.append(action)
+        block.prepare()
+
+        block.arm()
+        block.disarm()
+        block.arm()
+
+        self.assertEqual(first=[nidaqmx.constants.TaskMode.TASK_COMMIT], second=task_controls)
+
+        block.disarm()
+        block.save_applied_configuration("timing", (1000.0, 100))
+        block.arm()
+
+        self.assertEqual(first=[nidaqmx.constants.TaskMode.TASK_COMMIT] * 2, second=task_controls)
+
+    def test_armed_task_is_not_started_again_until_disarmed(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        task_starts = []
+        block.task.start = lambda: task_starts.append(True)
+
+        block.arm()
+        block.arm()
+
+        self.assertEqual(first=1, second=len(task_starts))
+
+        block.disarm()
+        block.arm()
+
+        self.assertEqual(first=2, second=len(task_starts))
+
+    def test_armed_task_is_started_again_after_failed_read(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        task_starts = []
+        block.task.start = lambda: task_starts.append(True)
+        read_analog_f64 = MockDAQmxTask.Interpreter.read_analog_f64
+
+        def read_analog_f64_failing(self, one, two, three, four, five):
+            raise DaqError("read timed out", 1)
+
+        block.arm()
+        nipcbatt.pcbatt_utilities.reflection_utilities.substitute_method(
+            cls=MockDAQmxTask.Interpreter,
+            method=read_analog_f64_failing,
+            method_name="read_analog_f64",
+        )
+        try:
+            with self.assertRaises(DaqError):
+                block.read_analog_samples()
+        finally:
+            nipcbatt.pcbatt_utilities.reflection_utilities.substitute_method(
+                cls=MockDAQmxTask.Interpreter,
+                method=read_analog_f64,
+                method_name="read_analog_f64",
+            )
+        block.arm()
+
+        self.assertEqual(first=2, second=len(task_starts))
+
+    def test_acquisition_buffers_are_owned_by_each_block(self):
+        block = BuildingBlockUsingDAQmxForTests()
+        block.acquisition_buffers.buffers_count = 2
+
+        self.assertIs(block.acquisition_buffers, block.acquisition_buffers)
+        self.assertEqual(first=2, second=block.acquisition_buffers.buffers_count)
+        self.assertEqual(
+            first=0, second=BuildingBlockUsingDAQmxForTests().acquisition_buffers.buffers_count
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
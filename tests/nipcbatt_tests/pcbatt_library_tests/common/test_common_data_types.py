@@ -391,6 +391,100 @@ class TestMeasurementData(unittest.TestCase):
                 )
 
 
+class TestRawMeasurementData(unittest.TestCase):
+    """Defines a test fixture that checks
+    `RawMeasurementData` class is ready to use.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+
+        used_numpy_version = importlib.metadata.version("numpy")
+        logging.debug("%s = %s", nameof(used_numpy_version), used_numpy_version)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_raw_measurement_data_init_fails_when_raw_samples_are_not_int16(self):
+        """Unit test of nipcbatt.pcbatt_library.common.common_data_types.RawMeasurementData."""
+        with self.assertRaises(TypeError):
+            print(
+                nipcbatt.RawMeasurementData(
+                    raw_samples=numpy.zeros(shape=(2, 10), dtype=numpy.int32),
+                    scaling_coefficients=numpy.zeros(shape=(2, 2)),
+                )
+            )
+
+    def test_raw_measurement_data_init_fails_when_coefficients_do_not_match_channels(self):
+        """Unit test of nipcbatt.pcbatt_library.common.common_data_types.RawMeasurementData."""
+        with self.assertRaises(ValueError):
+            print(
+                nipcbatt.RawMeasurementData(
+                    raw_samples=numpy.zeros(shape=(2, 10), dtype=numpy.int16),
+                    scaling_coefficients=numpy.zeros(shape=(3, 2)),
+                )
+            )
+
+    def test_raw_measurement_data(self):
+        """Unit test of nipcbatt.pcbatt_library.common.common_data_types.RawMeasurementData."""
+        raw_samples = numpy.array([[-32768, 0, 16384, 32767], [-100, 0, 100, 200]], numpy.int16)
+        scaling_coefficients = numpy.array([[0.001, 3.0e-4, 0.0], [0.0, 1.0e-3, 1.0e-8]])
+        expected_samples = numpy.stack(
+            [
+                numpy.polynomial.polynomial.polyval(channel_raw_samples, channel_coefficients)
+                for channel_raw_samples, channel_coefficients in zip(
+                    raw_samples.astype(numpy.float64), scaling_coefficients
+                )
+            ]
+        )
+
+        instance = nipcbatt.RawMeasurementData(
+            raw_samples=raw_samples,
+            scaling_coefficients=scaling_coefficients,
+        )
+
+        self.assertFalse(instance.is_scaled)
+        numpy.testing.assert_array_equal(raw_samples, instance.raw_samples)
+        numpy.testing.assert_allclose(expected_samples, instance.data_samples)
+        self.assertTrue(instance.is_scaled)
+        self.assertIs(instance.data_samples, instance.data_samples)
+        for expected_channel_samples, channel_samples in zip(
+            expected_samples, instance.samples_per_channel
+        ):
+            numpy.testing.assert_allclose(expected_channel_samples, channel_samples)
+
+    def test_raw_measurement_data_scales_samples_into_provided_buffer(self):
+        """Unit test of nipcbatt.pcbatt_library.common.common_data_types.RawMeasurementData."""
+        raw_samples = numpy.arange(-500, 500, dtype=numpy.int16)
+        instance = nipcbatt.RawMeasurementData(
+            raw_samples=raw_samples,
+            scaling_coefficients=numpy.array([0.5, 0.01]),
+            samples_dtype=numpy.float32,
+        )
+        scaled_samples_buffer = numpy.zeros(shape=raw_samples.shape, dtype=numpy.float32)
+
+        scaled_samples = instance.scale_samples(out=scaled_samples_buffer)
+
+        self.assertIs(scaled_samples_buffer, scaled_samples)
+        self.assertFalse(instance.is_scaled)
+        self.assertEqual(numpy.float32, instance.data_samples.dtype)
+        numpy.testing.assert_allclose(0.5 + 0.01 * raw_samples, scaled_samples, atol=1e-6)
+
+
 class TestAnalogWaveform(unittest.TestCase):
     """Defines a test fixture that checks
     `AnalogWaveform` class is ready to use.
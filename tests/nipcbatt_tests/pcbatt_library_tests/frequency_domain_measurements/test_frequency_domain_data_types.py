@@ -296,6 +296,71 @@ class TestFrequencyDomainMeasurementConfiguration(unittest.TestCase):
         )
 
 
+class TestFrequencyDomainSpectrumAveragingParameters(unittest.TestCase):
+    """Defines a test fixture that checks
+    `FrequencyDomainSpectrumAveragingParameters` class is ready to use.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_frequency_domain_spectrum_averaging_parameters_init_fails_when_overlap_is_100_percent(
+        self,
+    ):
+        """unit test of FrequencyDomainSpectrumAveragingParameters."""  # noqa: D403 - First word of the first line should be properly capitalized (auto-generated noqa)
+        with self.assertRaises(ValueError):
+            print(
+                daq.FrequencyDomainSpectrumAveragingParameters(
+                    segment_samples_count=1000, segment_overlap_percent=100
+                )
+            )
+
+    def test_frequency_domain_spectrum_averaging_parameters(self):
+        """Test for proper functioning of `FrequencyDomainSpectrumAveragingParameters` class"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        spectrum_averaging_parameters = daq.FrequencyDomainSpectrumAveragingParameters(
+            segment_samples_count=1024, segment_overlap_percent=25.0, averages_count=10
+        )
+
+        configuration = daq.FrequencyDomainMeasurementConfiguration(
+            global_channel_parameters=daq.DEFAULT_FREQUENCY_DOMAIN_RANGE_AND_TERMINAL_PARAMETERS,
+            specific_channels_parameters=[],
+            measurement_options=daq.DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_OPTIONS,
+            sample_clock_timing_parameters=(
+                daq.DEFAULT_FREQUENCY_DOMAIN_SAMPLE_CLOCK_TIMING_PARAMETERS
+            ),
+            digital_start_trigger_parameters=(
+                daq.DEFAULT_FREQUENCY_DOMAIN_DIGITAL_START_TRIGGER_PARAMETERS
+            ),
+            spectrum_averaging_parameters=spectrum_averaging_parameters,
+        )
+
+        logging.debug("%s = %s", nameof(configuration), configuration)
+
+        self.assertEqual(1024, spectrum_averaging_parameters.segment_samples_count)
+        self.assertEqual(25.0, spectrum_averaging_parameters.segment_overlap_percent)
+        self.assertEqual(10, spectrum_averaging_parameters.averages_count)
+        self.assertIs(spectrum_averaging_parameters, configuration.spectrum_averaging_parameters)
+        self.assertIsNone(
+            daq.DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_CONFIGURATION.spectrum_averaging_parameters
+        )
+
 class TestMultipleTonesMeasurementResultData(unittest.TestCase):
     """Defines a test fixture that checks
     `MultipleTonesMeasurementResultData` class is ready to use.
@@ -423,6 +488,27 @@ class TestMultipleTonesMeasurementResultData(unittest.TestCase):
 
         self.assertListEqual(expected_tones_amplitude, actual_tones_amplitude)
         self.assertListEqual(expected_tones_frequencies, actual_tones_frequencies)
+        self.assertIsNone(instance.tones_phases_radians)
+
+    def test_multiple_tones_measurement_result_data_with_phases(self):
+        """Test for proper functioning of TestMultipleTonesMeasurementResultData with phases"""  # noqa: D415 - First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        expected_tones_phases = [0.5, -1.0]
+
+        instance = daq.MultipleTonesMeasurementResultData(
+            tones_frequencies_hertz=[100.0, 200.0],
+            tones_amplitudes_volts=[1.0, 2.0],
+            tones_phases_radians=expected_tones_phases,
+        )
+
+        self.assertListEqual(expected_tones_phases, instance.tones_phases_radians)
+        with self.assertRaises(ValueError):
+            print(
+                daq.MultipleTonesMeasurementResultData(
+                    tones_frequencies_hertz=[100.0, 200.0],
+                    tones_amplitudes_volts=[1.0, 2.0],
+                    tones_phases_radians=[0.5],
+                )
+            )
 
 
 class TestFrequencyDomainMeasurementResultData(unittest.TestCase):
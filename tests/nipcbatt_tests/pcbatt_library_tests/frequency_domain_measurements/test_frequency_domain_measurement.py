@@ -59,6 +59,54 @@ class TestFrequencyDomainMeasurement(unittest.TestCase):
             )
             measurement.close()
 
+    def test_frequency_domain_measurement_of_targeted_tones_when_analysis_is_skipped(self):
+        """Checks that FrequencyDomainMeasurement.configure_and_measure_targeted_tones
+        returns an empty list when analysis is skipped and None when no measure is performed"""  # noqa: D205, D209, D415 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa)
+        default_configuration = nipcbatt.daq.DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_CONFIGURATION
+
+        def configuration_with_options(
+            execution_option: nipcbatt.MeasurementExecutionType,
+            measurement_analysis_requirement: nipcbatt.MeasurementAnalysisRequirement,
+        ) -> nipcbatt.daq.FrequencyDomainMeasurementConfiguration:
+            return nipcbatt.daq.FrequencyDomainMeasurementConfiguration(
+                global_channel_parameters=default_configuration.global_channel_parameters,
+                specific_channels_parameters=default_configuration.specific_channels_parameters,
+                measurement_options=nipcbatt.MeasurementOptions(
+                    execution_option=execution_option,
+                    measurement_analysis_requirement=measurement_analysis_requirement,
+                ),
+                sample_clock_timing_parameters=default_configuration.sample_clock_timing_parameters,
+                digital_start_trigger_parameters=(
+                    default_configuration.digital_start_trigger_parameters
+                ),
+            )
+
+        with nipcbatt.daq.FrequencyDomainMeasurement() as measurement:
+            measurement.initialize(
+                analog_input_channel_expression=(
+                    "NI_PCBA_Measurement_Simulated_TestScale_TS1Mod2/ai0"
+                )
+            )
+
+            skipped_analysis_result = measurement.configure_and_measure_targeted_tones(
+                configuration=configuration_with_options(
+                    nipcbatt.MeasurementExecutionType.CONFIGURE_AND_MEASURE,
+                    nipcbatt.MeasurementAnalysisRequirement.SKIP_ANALYSIS,
+                ),
+                tones_frequencies_hertz=[1000.0],
+            )
+            configure_only_result = measurement.configure_and_measure_targeted_tones(
+                configuration=configuration_with_options(
+                    nipcbatt.MeasurementExecutionType.CONFIGURE_ONLY,
+                    nipcbatt.MeasurementAnalysisRequirement.SKIP_ANALYSIS,
+                ),
+                tones_frequencies_hertz=[1000.0],
+            )
+            measurement.close()
+
+        self.assertEqual([], skipped_analysis_result)
+        self.assertIsNone(configure_only_result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,2 @@
+"""Provides a set of unit tests for 
+   nipcbatt.pcbatt_library.frequency_response_measurements package"""  # noqa: D205, D209, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), Multi-line docstring closing quotes should be on a separate line (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (360 > 100 characters) (auto-generated noqa)
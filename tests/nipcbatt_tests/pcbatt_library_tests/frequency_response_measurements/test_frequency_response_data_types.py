@@ -0,0 +1,153 @@
+"""This module provides Frequency response data types check."""
+
+import importlib.metadata
+import logging
+import sys
+import unittest
+
+import numpy
+from varname import nameof
+
+import nipcbatt
+from nipcbatt import daq
+
+
+class TestFrequencyResponseMeasurementConfiguration(unittest.TestCase):
+    """Defines a test fixture that checks
+    `FrequencyResponseMeasurementConfiguration` class is ready to use.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+
+        used_nidaqmx_version = importlib.metadata.version("nidaqmx")
+        logging.debug("%s = %s", nameof(used_nidaqmx_version), used_nidaqmx_version)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_frequency_response_measurement_configuration_init_fails_when_configuration_is_none(
+        self,
+    ):
+        """unit test of FrequencyResponseMeasurementConfiguration."""  # noqa: D403 - First word of the first line should be properly capitalized (auto-generated noqa)
+        with self.assertRaises(ValueError):
+            daq.FrequencyResponseMeasurementConfiguration(
+                generation_configuration=None,
+                measurement_configuration=daq.DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_CONFIGURATION,
+            )
+        with self.assertRaises(ValueError):
+            daq.FrequencyResponseMeasurementConfiguration(
+                generation_configuration=daq.DEFAULT_MULTI_TONE_GENERATION_CONFIGURATION,
+                measurement_configuration=None,
+            )
+
+    def test_frequency_response_measurement_configuration(self):
+        """Test for proper functioning of `FrequencyResponseMeasurementConfiguration` class"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (183 > 100 characters) (auto-generated noqa)
+        configuration = daq.DEFAULT_FREQUENCY_RESPONSE_MEASUREMENT_CONFIGURATION
+
+        logging.debug("%s = %s", nameof(configuration), configuration)
+
+        self.assertIs(
+            daq.DEFAULT_MULTI_TONE_GENERATION_CONFIGURATION,
+            configuration.generation_configuration,
+        )
+        self.assertIs(
+            daq.DEFAULT_FREQUENCY_DOMAIN_MEASUREMENT_CONFIGURATION,
+            configuration.measurement_configuration,
+        )
+
+
+class TestFrequencyResponseMeasurementResultData(unittest.TestCase):
+    """Defines a test fixture that checks
+    `FrequencyResponseMeasurementResultData` class is ready to use.
+
+    Args:
+        unittest.TestCase: Base class from which this class inherits.
+    """  # noqa: D205, D415, W505 - 1 blank line required between summary line and description (auto-generated noqa), First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (206 > 100 characters) (auto-generated noqa)
+
+    def setUp(self):
+        self._expected_waveforms = [
+            nipcbatt.AnalogWaveform(
+                channel_name=channel_name,
+                delta_time_seconds=0.001,
+                samples=numpy.zeros(shape=100),
+            )
+            for channel_name in ["Dev1/ai0", "Dev1/ai1", "Dev1/ai2"]
+        ]
+        self._expected_tones_frequencies_hertz = numpy.array([100.0, 200.0])
+        self._expected_gains = numpy.array([[1.0, 0.5], [0.1, 0.01]])
+        self._expected_phases_shifts_radians = numpy.array([[0.0, -0.5], [1.0, -1.5]])
+
+    def tearDown(self):
+        pass
+
+    @classmethod
+    def setUpClass(cls):
+        print("Setup test fixture")
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+        logging.debug("python version = %s", str(sys.version))
+        logging.debug("python path = %s", sys.executable)
+
+        used_nidaqmx_version = importlib.metadata.version("nidaqmx")
+        logging.debug("%s = %s", nameof(used_nidaqmx_version), used_nidaqmx_version)
+
+    @classmethod
+    def tearDownClass(cls):
+        print("Teardown fixture")
+
+    def test_frequency_response_measurement_result_data_with_gains_of_invalid_shape(self):
+        """unit test of FrequencyResponseMeasurementResultData."""  # noqa: D403 - First word of the first line should be properly capitalized (auto-generated noqa)
+        with self.assertRaises(ValueError):
+            daq.FrequencyResponseMeasurementResultData(
+                waveforms=self._expected_waveforms,
+                stimulus_channel_name="Dev1/ai0",
+                response_channels_names=["Dev1/ai1", "Dev1/ai2"],
+                tones_frequencies_hertz=self._expected_tones_frequencies_hertz,
+                gains=self._expected_gains[:1],
+                phases_shifts_radians=self._expected_phases_shifts_radians,
+            )
+
+    def test_frequency_response_measurement_result_data(self):
+        """Test for proper functioning of `FrequencyResponseMeasurementResultData` class"""  # noqa: D415, W505 - First line should end with a period, question mark, or exclamation point (auto-generated noqa), doc line too long (183 > 100 characters) (auto-generated noqa)
+        result_data = daq.FrequencyResponseMeasurementResultData(
+            waveforms=self._expected_waveforms,
+            stimulus_channel_name="Dev1/ai0",
+            response_channels_names=["Dev1/ai1", "Dev1/ai2"],
+            tones_frequencies_hertz=self._expected_tones_frequencies_hertz,
+            gains=self._expected_gains,
+            phases_shifts_radians=self._expected_phases_shifts_radians,
+        )
+
+        logging.debug("%s = %s", nameof(result_data), result_data)
+
+        self.assertListEqual(self._expected_waveforms, result_data.waveforms)
+        self.assertEqual("Dev1/ai0", result_data.stimulus_channel_name)
+        self.assertListEqual(["Dev1/ai1", "Dev1/ai2"], result_data.response_channels_names)
+        numpy.testing.assert_array_equal(
+            self._expected_tones_frequencies_hertz, result_data.tones_frequencies_hertz
+        )
+        numpy.testing.assert_array_equal(self._expected_gains, result_data.gains)
+        numpy.testing.assert_allclose(
+            [[0.0, -6.0206], [-20.0, -40.0]], result_data.gains_db, atol=1e-4
+        )
+        numpy.testing.assert_array_equal(
+            self._expected_phases_shifts_radians, result_data.phases_shifts_radians
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -148,6 +148,68 @@ class TestTimeDomainMeasurementConfiguration(unittest.TestCase):
         # Assert
         self.assertEqual("The object digital_start_trigger_parameters is None.", str(ctx.exception))
 
+    def test_time_domain_measurement_configuration_periodicity_minimum_amplitude_volts_defaults_to_zero(
+        self,
+    ):
+        """unit test of TimeDomainMeasurementConfiguration."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (160 > 100 characters) (auto-generated noqa)
+        # Arrange
+
+        # Act
+        time_domain_measurement_configuration = daq.TimeDomainMeasurementConfiguration(
+            global_channel_parameters=daq.DEFAULT_TIME_DOMAIN_RANGE_AND_TERMINAL_PARAMETERS,
+            specific_channels_parameters=[],
+            measurement_options=daq.DEFAULT_TIME_DOMAIN_MEASUREMENT_OPTIONS,
+            sample_clock_timing_parameters=daq.DEFAULT_TIME_DOMAIN_SAMPLE_CLOCK_TIMING_PARAMETERS,
+            digital_start_trigger_parameters=daq.DEFAULT_TIME_DOMAIN_DIGITAL_START_TRIGGER_PARAMETERS,
+        )
+
+        # Assert
+        self.assertEqual(
+            0.0, time_domain_measurement_configuration.periodicity_minimum_amplitude_volts
+        )
+        self.assertEqual(
+            0.0,
+            daq.DEFAULT_TIME_DOMAIN_MEASUREMENT_CONFIGURATION.periodicity_minimum_amplitude_volts,
+        )
+
+    def test_time_domain_measurement_configuration_periodicity_minimum_amplitude_volts(self):
+        """unit test of TimeDomainMeasurementConfiguration."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (160 > 100 characters) (auto-generated noqa)
+        # Arrange
+
+        # Act
+        time_domain_measurement_configuration = daq.TimeDomainMeasurementConfiguration(
+            global_channel_parameters=daq.DEFAULT_TIME_DOMAIN_RANGE_AND_TERMINAL_PARAMETERS,
+            specific_channels_parameters=[],
+            measurement_options=daq.DEFAULT_TIME_DOMAIN_MEASUREMENT_OPTIONS,
+            sample_clock_timing_parameters=daq.DEFAULT_TIME_DOMAIN_SAMPLE_CLOCK_TIMING_PARAMETERS,
+            digital_start_trigger_parameters=daq.DEFAULT_TIME_DOMAIN_DIGITAL_START_TRIGGER_PARAMETERS,
+            periodicity_minimum_amplitude_volts=0.05,
+        )
+
+        # Assert
+        self.assertEqual(
+            0.05, time_domain_measurement_configuration.periodicity_minimum_amplitude_volts
+        )
+
+    def test_time_domain_measurement_configuration_init_fails_when_periodicity_minimum_amplitude_volts_is_less_than_zero(
+        self,
+    ):
+        """unit test of TimeDomainMeasurementConfiguration."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (160 > 100 characters) (auto-generated noqa)
+        # Arrange
+
+        # Act
+        with self.assertRaises(ValueError):
+            print(
+                daq.TimeDomainMeasurementConfiguration(
+                    global_channel_parameters=daq.DEFAULT_TIME_DOMAIN_RANGE_AND_TERMINAL_PARAMETERS,
+                    specific_channels_parameters=[],
+                    measurement_options=daq.DEFAULT_TIME_DOMAIN_MEASUREMENT_OPTIONS,
+                    sample_clock_timing_parameters=daq.DEFAULT_TIME_DOMAIN_SAMPLE_CLOCK_TIMING_PARAMETERS,
+                    digital_start_trigger_parameters=daq.DEFAULT_TIME_DOMAIN_DIGITAL_START_TRIGGER_PARAMETERS,
+                    periodicity_minimum_amplitude_volts=-0.05,
+                )
+            )
+
     def test_time_domain_measurement_configuration(self):
         """unit test of TimeDomainMeasurementConfiguration."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (160 > 100 characters) (auto-generated noqa)
         # Arrange
@@ -893,6 +955,125 @@ class TestTimeDomainMeasurementResultData(unittest.TestCase):
             str(ctx.exception),
         )
 
+    def test_time_domain_measurement_result_data_init_voltage_waveforms_are_periodic_defaults_to_none(
+        self,
+    ):
+        """unit test of TestTimeDomainMeasurementResultData."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
+        # Arrange
+        self._initialize_waveforms()
+        expected_acquisition_duration_seconds = 0.3
+        expected_mean_dc_voltage_values_volts = [1.0, 1.0, 1.0]
+        expected_vpp_amplitudes_volts = [1.0, 1.0, 1.0]
+        expected_voltage_waveforms_frequencies_hertz = [1.0, 1.0]
+        expected_voltage_waveforms_periods_seconds = [0.01, 0.01]
+        expected_voltage_waveforms_duty_cycles_percent = [0.5, 0.5]
+
+        # Act
+        time_domain_result = daq.TimeDomainMeasurementResultData(
+            waveforms=self._expected_waveforms,
+            acquisition_duration_seconds=expected_acquisition_duration_seconds,
+            mean_dc_voltage_values_volts=expected_mean_dc_voltage_values_volts,
+            vpp_amplitudes_volts=expected_vpp_amplitudes_volts,
+            voltage_waveforms_frequencies_hertz=expected_voltage_waveforms_frequencies_hertz,
+            voltage_waveforms_periods_seconds=expected_voltage_waveforms_periods_seconds,
+            voltage_waveforms_duty_cycles_percent=expected_voltage_waveforms_duty_cycles_percent,
+        )
+
+        # Assert
+        self.assertIsNone(time_domain_result.voltage_waveforms_are_periodic)
+
+    def test_time_domain_measurement_result_data_init_fails_when_voltage_waveforms_are_periodic_contains_object_that_are_not_of_bool(
+        self,
+    ):
+        """unit test of TestTimeDomainMeasurementResultData."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
+        # Arrange
+        self._initialize_waveforms()
+        expected_acquisition_duration_seconds = 0.3
+        expected_mean_dc_voltage_values_volts = [1.0, 1.0, 1.0]
+        expected_vpp_amplitudes_volts = [1.0, 1.0, 1.0]
+        expected_voltage_waveforms_frequencies_hertz = [1.0, 1.0]
+        expected_voltage_waveforms_periods_seconds = [0.01, 0.01]
+        expected_voltage_waveforms_duty_cycles_percent = [0.5, 0.5]
+
+        # Act
+        with self.assertRaises(TypeError) as ctx:
+            print(
+                daq.TimeDomainMeasurementResultData(
+                    waveforms=self._expected_waveforms,
+                    acquisition_duration_seconds=expected_acquisition_duration_seconds,
+                    mean_dc_voltage_values_volts=expected_mean_dc_voltage_values_volts,
+                    vpp_amplitudes_volts=expected_vpp_amplitudes_volts,
+                    voltage_waveforms_frequencies_hertz=expected_voltage_waveforms_frequencies_hertz,
+                    voltage_waveforms_periods_seconds=expected_voltage_waveforms_periods_seconds,
+                    voltage_waveforms_duty_cycles_percent=expected_voltage_waveforms_duty_cycles_percent,
+                    voltage_waveforms_are_periodic=[True, 1, True],
+                )
+            )
+
+        # Assert
+        self.assertEqual(
+            "Not all elements of the list are of the type (bool).",
+            str(ctx.exception),
+        )
+
+    def test_time_domain_measurement_result_data_init_fails_when_voltage_waveforms_are_periodic_size_is_not_waveforms_count(
+        self,
+    ):
+        """unit test of TestTimeDomainMeasurementResultData."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
+        # Arrange
+        self._initialize_waveforms()
+        expected_acquisition_duration_seconds = 0.3
+        expected_mean_dc_voltage_values_volts = [1.0, 1.0, 1.0]
+        expected_vpp_amplitudes_volts = [1.0, 1.0, 1.0]
+        expected_voltage_waveforms_frequencies_hertz = [1.0, 1.0]
+        expected_voltage_waveforms_periods_seconds = [0.01, 0.01]
+        expected_voltage_waveforms_duty_cycles_percent = [0.5, 0.5]
+
+        # Act and Assert
+        with self.assertRaises(ValueError):
+            print(
+                daq.TimeDomainMeasurementResultData(
+                    waveforms=self._expected_waveforms,
+                    acquisition_duration_seconds=expected_acquisition_duration_seconds,
+                    mean_dc_voltage_values_volts=expected_mean_dc_voltage_values_volts,
+                    vpp_amplitudes_volts=expected_vpp_amplitudes_volts,
+                    voltage_waveforms_frequencies_hertz=expected_voltage_waveforms_frequencies_hertz,
+                    voltage_waveforms_periods_seconds=expected_voltage_waveforms_periods_seconds,
+                    voltage_waveforms_duty_cycles_percent=expected_voltage_waveforms_duty_cycles_percent,
+                    voltage_waveforms_are_periodic=[True, True],
+                )
+            )
+
+    def test_time_domain_measurement_result_data_voltage_waveforms_are_periodic(self):
+        """unit test of TestTimeDomainMeasurementResultData."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
+        # Arrange
+        self._initialize_waveforms()
+        expected_acquisition_duration_seconds = 0.3
+        expected_mean_dc_voltage_values_volts = [1.0, 1.0, 1.0]
+        expected_vpp_amplitudes_volts = [1.0, 1.0, 1.0]
+        expected_voltage_waveforms_frequencies_hertz = [1.0, 1.0]
+        expected_voltage_waveforms_periods_seconds = [0.01, 0.01]
+        expected_voltage_waveforms_duty_cycles_percent = [0.5, 0.5]
+        expected_voltage_waveforms_are_periodic = [True, False, True]
+
+        # Act
+        time_domain_result = daq.TimeDomainMeasurementResultData(
+            waveforms=self._expected_waveforms,
+            acquisition_duration_seconds=expected_acquisition_duration_seconds,
+            mean_dc_voltage_values_volts=expected_mean_dc_voltage_values_volts,
+            vpp_amplitudes_volts=expected_vpp_amplitudes_volts,
+            voltage_waveforms_frequencies_hertz=expected_voltage_waveforms_frequencies_hertz,
+            voltage_waveforms_periods_seconds=expected_voltage_waveforms_periods_seconds,
+            voltage_waveforms_duty_cycles_percent=expected_voltage_waveforms_duty_cycles_percent,
+            voltage_waveforms_are_periodic=expected_voltage_waveforms_are_periodic,
+        )
+
+        # Assert
+        self.assertListEqual(
+            expected_voltage_waveforms_are_periodic,
+            time_domain_result.voltage_waveforms_are_periodic,
+        )
+
     def test_time_domain_measurement_result_data(self):
         """unit test of TestTimeDomainMeasurementResultData."""  # noqa: D403, W505 - First word of the first line should be properly capitalized (auto-generated noqa), doc line too long (161 > 100 characters) (auto-generated noqa)
         self._initialize_waveforms()